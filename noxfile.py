@@ -45,7 +45,7 @@ def mypy(session: nox.Session) -> None:
         session: Noxセッション
 
     """
-    session.install(".", "mypy", "pytest-mypy-plugins")
+    session.install(".[numpy]", "mypy", "pytest-mypy-plugins")
     session.run("mypy", "src", "tests")
     session.run("mypy", f"--python-executable={sys.executable}", "noxfile.py")
 
@@ -58,7 +58,7 @@ def pytest(session: nox.Session) -> None:
         session: Noxセッション
 
     """
-    session.install(".", "pytest")
+    session.install(".[numpy]", "pytest")
     session.run("pytest", "-v", *session.posargs)
 
 
@@ -70,7 +70,7 @@ def pytest_coverage(session: nox.Session) -> None:
         session: Noxセッション
 
     """
-    session.install(".", "pytest", "pytest-cov")
+    session.install(".[numpy]", "pytest", "pytest-cov")
     session.run(
         "pytest",
         "-v",
@@ -1,9 +1,12 @@
 """IPアドレスからネットワーク, AS番号, 国, 組織を取得するPythonモジュール."""
 
+from .async_ipinfo import AsyncIPInfo
 from .exceptions import (
+    AddressNotFoundError,
     ConfigurationError,
     GeoIPClientError,
     IPInfoError,
+    RateLimitError,
     RedisClientError,
     ValidationError,
 )
@@ -14,10 +17,13 @@ __author__ = "mahori"
 __email__ = "4198737+mahori@users.noreply.github.com"
 
 __all__ = [
+    "AddressNotFoundError",
+    "AsyncIPInfo",
     "ConfigurationError",
     "GeoIPClientError",
     "IPInfo",
     "IPInfoError",
+    "RateLimitError",
     "RedisClientError",
     "ValidationError",
 ]
@@ -0,0 +1,258 @@
+"""コマンドラインから実行するエントリポイント.
+
+ipinfo-geoip enrich [--field NAME] [--key NAME] [--batch-size N] [--max-workers N] [--windows N]
+ipinfo-geoip warm [FILE ...] [--budget N] [--max-workers N]
+ipinfo-geoip logs [FILE ...] [--format FORMAT] [--output line|columns] [--batch-size N] [--max-workers N]
+(python -m ipinfo_geoipでも実行できる)
+"""
+
+import argparse
+import os
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+
+from .cache_warmer import CacheWarmer
+from .constants import (
+    ENRICH_BATCH_SIZE,
+    ENRICH_FIELD,
+    ENRICH_KEY,
+    ENRICH_WINDOWS,
+    GEOIP_MAX_WORKERS,
+    LOG_FORMAT_COMBINED,
+    LOG_OUTPUT_LINE,
+    LOG_OUTPUTS,
+    LOG_PATTERNS,
+)
+from .enricher import Enricher
+from .exceptions import IPInfoError
+from .log_enricher import LogEnricher
+
+
+def _read_lines(paths: Sequence[str]) -> Iterator[str]:
+    """ファイルまたは標準入力から行を読み込む.
+
+    Args:
+        paths: 読み込むファイルのパス, 空または"-"の場合は標準入力
+
+    Yields:
+        読み込んだ行
+
+    """
+    for path in paths or ["-"]:
+        if path == "-":
+            yield from sys.stdin
+            continue
+        with open(path, encoding="utf-8", errors="replace") as file:  # noqa: PTH123
+            yield from file
+
+
+def _read_ip_addresses(paths: Sequence[str]) -> Iterator[str]:
+    """ファイルまたは標準入力からIPアドレスを読み込む.
+
+    1行に1つのIPアドレスを読み込み, 空行と#で始まる行は無視する
+    行に空白が含まれる場合は最初の列をIPアドレスとする
+
+    Args:
+        paths: 読み込むファイルのパス, 空または"-"の場合は標準入力
+
+    Yields:
+        IPアドレス
+
+    """
+    yield from _parse_lines(_read_lines(paths))
+
+
+def _parse_lines(lines: Iterable[str]) -> Iterator[str]:
+    """行からIPアドレスを取り出す.
+
+    Args:
+        lines: 読み込む行
+
+    Yields:
+        IPアドレス
+
+    """
+    for line in lines:
+        fields = line.split()
+        if fields and not fields[0].startswith("#"):
+            yield fields[0]
+
+
+def _positive(value: str) -> int:
+    """正の整数の引数を変換する.
+
+    Args:
+        value: 引数の文字列
+
+    Returns:
+        変換された整数
+
+    Raises:
+        ArgumentTypeError: 正の整数でない場合
+
+    """
+    try:
+        number = int(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from e
+
+    if number < 1:
+        msg = f"must be positive: {value}"
+        raise argparse.ArgumentTypeError(msg)
+
+    return number
+
+
+def _parser() -> argparse.ArgumentParser:
+    """引数のパーサーを作成する.
+
+    Returns:
+        引数のパーサー
+
+    """
+    parser = argparse.ArgumentParser(prog="ipinfo-geoip")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    enrich = commands.add_parser(
+        "enrich", help="標準入力のIPアドレスまたはJSONレコードにIPアドレス情報を付加してNDJSONで出力する"
+    )
+    enrich.add_argument("--field", default=ENRICH_FIELD, help=f"JSONレコードのIPアドレスのキー (既定値: {ENRICH_FIELD})")
+    enrich.add_argument("--key", default=ENRICH_KEY, help=f"JSONレコードに付加するIPアドレス情報のキー (既定値: {ENRICH_KEY})")
+    enrich.add_argument(
+        "--batch-size",
+        type=_positive,
+        default=ENRICH_BATCH_SIZE,
+        help=f"まとめて検索する行数 (既定値: {ENRICH_BATCH_SIZE})",
+    )
+    enrich.add_argument(
+        "--max-workers",
+        type=_positive,
+        default=GEOIP_MAX_WORKERS,
+        help=f"同時に発行するリクエストの最大数 (既定値: {GEOIP_MAX_WORKERS})",
+    )
+    enrich.add_argument(
+        "--windows",
+        type=_positive,
+        default=ENRICH_WINDOWS,
+        help=f"同時に検索するバッチの最大数 (既定値: {ENRICH_WINDOWS})",
+    )
+
+    warm = commands.add_parser("warm", help="IPアドレスの一覧をRedisキャッシュに事前に読み込む")
+    warm.add_argument("files", nargs="*", metavar="FILE", help="1行に1つのIPアドレスを記載したファイル (省略時は標準入力)")
+    warm.add_argument("--budget", type=_positive, help="GeoLite2 Web Serviceへの問い合わせ数の上限 (省略時は制限しない)")
+    warm.add_argument(
+        "--max-workers",
+        type=_positive,
+        default=GEOIP_MAX_WORKERS,
+        help=f"同時に発行するリクエストの最大数 (既定値: {GEOIP_MAX_WORKERS})",
+    )
+
+    logs = commands.add_parser("logs", help="アクセスログの各行にクライアントのIPアドレス情報を付加して出力する")
+    logs.add_argument("files", nargs="*", metavar="FILE", help="アクセスログのファイル (省略時は標準入力)")
+    logs.add_argument(
+        "--format",
+        default=LOG_FORMAT_COMBINED,
+        help=f"ログ形式 ({', '.join(LOG_PATTERNS)}), またはipグループを含む正規表現 (既定値: {LOG_FORMAT_COMBINED})",
+    )
+    logs.add_argument("--output", choices=LOG_OUTPUTS, default=LOG_OUTPUT_LINE, help=f"出力形式 (既定値: {LOG_OUTPUT_LINE})")
+    logs.add_argument(
+        "--batch-size",
+        type=_positive,
+        default=ENRICH_BATCH_SIZE,
+        help=f"まとめて検索する行数 (既定値: {ENRICH_BATCH_SIZE})",
+    )
+    logs.add_argument(
+        "--max-workers",
+        type=_positive,
+        default=GEOIP_MAX_WORKERS,
+        help=f"同時に発行するリクエストの最大数 (既定値: {GEOIP_MAX_WORKERS})",
+    )
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """コマンドを実行する.
+
+    Args:
+        argv: コマンドライン引数, Noneの場合はsys.argv
+
+    Returns:
+        終了コード
+
+    """
+    args = _parser().parse_args(argv)
+
+    try:
+        if args.command == "enrich":
+            _enrich(args)
+        elif args.command == "logs":
+            _logs(args)
+        else:
+            _warm(args)
+    except BrokenPipeError:
+        # 出力先が閉じられた場合は終了時のフラッシュで再び送出されないよう出力を捨てる
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    except (IPInfoError, OSError) as e:
+        sys.stderr.write(f"error: {e}\n")
+        return 1
+
+    return 0
+
+
+def _enrich(args: argparse.Namespace) -> None:
+    """標準入力の各行にIPアドレス情報を付加してNDJSONで標準出力に書き込む.
+
+    出力はバッチごとにフラッシュし, 出力先が読み込むまで次の入力を読み込まない
+
+    Args:
+        args: コマンドライン引数
+
+    Raises:
+        ConfigurationError: 設定が不正な場合
+
+    """
+    enricher = Enricher(field=args.field, key=args.key)
+    for chunk in enricher.enrich(sys.stdin, args.batch_size, args.max_workers, args.windows):
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
+
+
+def _logs(args: argparse.Namespace) -> None:
+    """アクセスログの各行にIPアドレス情報を付加して標準出力に書き込む.
+
+    出力はウィンドウごとにフラッシュする
+
+    Args:
+        args: コマンドライン引数
+
+    Raises:
+        ConfigurationError: 設定が不正な場合
+        OSError: ファイルを読み込めない場合
+        ValidationError: ログ形式が不正な場合
+
+    """
+    enricher = LogEnricher(log_format=args.format, output=args.output)
+    for chunk in enricher.enrich(_read_lines(args.files), args.batch_size, args.max_workers):
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
+
+
+def _warm(args: argparse.Namespace) -> None:
+    """IPアドレスの一覧をRedisキャッシュに読み込み, 件数を標準出力に書き込む.
+
+    Args:
+        args: コマンドライン引数
+
+    Raises:
+        ConfigurationError: 設定が不正な場合
+        OSError: ファイルを読み込めない場合
+        RedisClientError: Redisでエラーが発生した場合
+
+    """
+    stats = CacheWarmer().warm(_read_ip_addresses(args.files), args.budget, args.max_workers)
+    sys.stdout.write("".join(f"{name}: {count}\n" for name, count in stats.items()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,269 @@
+"""GeoLite2 Web Service非同期クライアント."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable
+from functools import partial
+
+import geoip2.errors
+
+from .constants import GEOIP_MAX_WORKERS
+from .exceptions import AddressNotFoundError, ConfigurationError, GeoIPClientError, RateLimitError, ValidationError
+from .geoip_client import _backoff, _is_transient, _retry_error, _to_ip_data
+from .geoip_config import GeoIPConfig
+from .geoip_response import AsyncProjectionClient, GeoIPResponse
+from .ipdata import IPData
+from .latency_tracker import LatencyTracker
+from .rate_limiter import _get_rate_limiter
+from .to_address import _to_address
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGeoIPClient:
+    """GeoLite2 Web Service非同期クライアント.
+
+    問い合わせ数は同じアカウントのクライアントで共有するレートリミッターで制限する
+    一時的なエラーはジッター付きの指数バックオフで再試行する
+    hedgeを有効にすると, 応答が直近のp95より遅い場合に同じリクエストをもう1つ発行し, 先に返った応答を使用する
+    レスポンスはgeoip2.modelsのモデルを作成せず, 必要なフィールドのみをGeoIPResponseに取り出す
+    """
+
+    def __init__(self) -> None:
+        """AsyncGeoIPClientインスタンスを初期化する.
+
+        Raises:
+            ConfigurationError: 必要な認証情報が不足している場合
+
+        """
+        try:
+            config = GeoIPConfig.from_env()
+            self.limiter = _get_rate_limiter(config)
+        except ValidationError as e:
+            msg = "GeoIP configuration error"
+            raise ConfigurationError(msg, {"error": str(e)}) from e
+
+        self.client = AsyncProjectionClient(
+            config.account_id,
+            config.license_key,
+            config.host,
+            timeout=config.timeout,
+        )
+        self.endpoint = config.endpoint
+        self.retries = config.retries
+        self.backoff = config.backoff
+        self.hedge = config.hedge
+        self.hedge_delay = config.hedge_delay
+        self.latency = LatencyTracker()
+
+    async def get(self, ip_address: str) -> IPData | None:
+        """指定されたIPアドレス情報を取得する.
+
+        Args:
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            GeoLite2 Web Serviceから取得したIPアドレス情報
+            見つからない場合はNone
+
+        Raises:
+            AddressNotFoundError: IPアドレスが見つからない場合
+            GeoIPClientError: 再試行しても一時的なエラーが続いた場合
+            RateLimitError: 問い合わせ数が上限に達した場合
+            ValidationError: ip_addressが不正な場合
+
+        """
+        try:
+            _ = _to_address(ip_address)
+        except ValueError as e:
+            msg = f"Invalid IP address: {ip_address}"
+            raise ValidationError(msg, {"error": str(e)}) from e
+
+        return await self._fetch(ip_address)
+
+    async def _fetch(self, ip_address: str, *, batch: bool = False) -> IPData | None:
+        """GeoLite2 Web ServiceからIPアドレス情報を取得する.
+
+        レスポンスに含まれる残りの問い合わせ数をレートリミッターに記録する
+
+        Args:
+            ip_address: 検索するIPアドレス
+            batch: 一括取得の場合True
+
+        Returns:
+            GeoLite2 Web Serviceから取得したIPアドレス情報
+            見つからない場合はNone
+
+        Raises:
+            AddressNotFoundError: IPアドレスが見つからない場合
+            GeoIPClientError: 再試行しても一時的なエラーが続いた場合
+            RateLimitError: 問い合わせ数が上限に達した場合
+
+        """
+        try:
+            response = await self._request_with_retries(ip_address, batch=batch)
+        except geoip2.errors.AddressNotFoundError as e:
+            msg = f"Address not found: {ip_address}"
+            raise AddressNotFoundError(msg, {"ip_address": ip_address, "error": str(e)}) from e
+
+        if response is not None:
+            self.limiter.update(response.queries_remaining)
+        return _to_ip_data(ip_address, response)
+
+    async def _request_with_retries(self, ip_address: str, *, batch: bool) -> GeoIPResponse:
+        """一時的なエラーを再試行しながらリクエストを発行する.
+
+        再試行のリクエストも問い合わせ数の制限を受ける
+
+        Args:
+            ip_address: 検索するIPアドレス
+            batch: 一括取得の場合True
+
+        Returns:
+            GeoLite2 Web Serviceのレスポンス
+
+        Raises:
+            GeoIPClientError: 再試行しても一時的なエラーが続いた場合
+            RateLimitError: 問い合わせ数が上限に達した場合
+
+        """
+        attempt = 0
+        while True:
+            await self.limiter.acquire_async(batch=batch)
+            try:
+                return await (self._hedged(ip_address, batch=batch) if self.hedge else self._request(ip_address))
+            except Exception as e:
+                if not _is_transient(e):
+                    raise
+                if attempt >= self.retries:
+                    raise _retry_error(ip_address, attempt + 1, e) from e
+            await asyncio.sleep(_backoff(attempt, self.backoff))
+            attempt += 1
+
+    async def _request(self, ip_address: str) -> GeoIPResponse:
+        """リクエストを1回発行し, 所要時間を記録する.
+
+        Args:
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            GeoLite2 Web Serviceのレスポンス
+
+        """
+        started = time.monotonic()
+        response = await self.client.lookup(self.endpoint, ip_address)
+        self.latency.record(time.monotonic() - started)
+        return response
+
+    async def _hedged(self, ip_address: str, *, batch: bool) -> GeoIPResponse:
+        """応答が遅い場合に同じリクエストをもう1つ発行し, 先に成功した応答を返す.
+
+        2つ目のリクエストは直近の所要時間のp95(記録が少ない間はhedge_delay)が経過しても応答がない場合に発行する
+        問い合わせ数の制限を待たずに発行できない場合は発行しない
+        先に成功した応答を返した時点で, もう一方のリクエストはキャンセルする
+
+        Args:
+            ip_address: 検索するIPアドレス
+            batch: 一括取得の場合True
+
+        Returns:
+            GeoLite2 Web Serviceのレスポンス
+
+        """
+        primary = asyncio.ensure_future(self._request(ip_address))
+        done, _ = await asyncio.wait([primary], timeout=self.latency.percentile(self.hedge_delay))
+        if done or not await self._hedge_allowed(batch=batch):
+            return await primary
+
+        tasks = {primary, asyncio.ensure_future(self._request(ip_address))}
+        try:
+            while True:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded or not tasks:
+                    return (succeeded or list(done))[0].result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _hedge_allowed(self, *, batch: bool) -> bool:
+        """2つ目のリクエストを待たずに発行できるか判定する.
+
+        共有するカウンターへの問い合わせはイベントループを止めないよう別スレッドで行う
+
+        Args:
+            batch: 一括取得の場合True
+
+        Returns:
+            問い合わせ数の制限内で発行できる場合True
+
+        """
+        reserve = partial(self.limiter.reserve, batch=batch)
+        try:
+            wait = reserve() if self.limiter.counter is None else await asyncio.to_thread(reserve)
+        except RateLimitError:
+            return False
+
+        return wait == 0
+
+    async def get_many(self, ip_addresses: Iterable[str], max_workers: int = GEOIP_MAX_WORKERS) -> dict[str, IPData | None]:
+        """複数のIPアドレス情報を並行に取得する.
+
+        同時に発行するリクエスト数はmax_workersで制限される
+        見つからないIPアドレスはNoneとなる
+        再試行しても取得に失敗したIPアドレスはログに記録して結果に含めず, 他のIPアドレスの取得は続ける
+        一括取得として問い合わせ数の制限を待ち, 1件ずつの取得のために残しておく問い合わせ数は使用しない
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+            max_workers: 同時に発行するリクエストの最大数
+
+        Returns:
+            IPアドレスをキーとするIPアドレス情報の辞書(取得に失敗したIPアドレスは含まない)
+
+        Raises:
+            RateLimitError: 問い合わせ数が上限に達した場合
+                (detailsのip_addressesに取得しなかったIPアドレス, resultsに取得したIPアドレス情報の辞書)
+            ValidationError: ip_addressesに不正なIPアドレスが含まれる場合
+
+        """
+        targets = list(dict.fromkeys(ip_addresses))
+        for ip_address in targets:
+            try:
+                _ = _to_address(ip_address)
+            except ValueError as e:
+                msg = f"Invalid IP address: {ip_address}"
+                raise ValidationError(msg, {"error": str(e)}) from e
+
+        semaphore = asyncio.Semaphore(max_workers)
+        deferred: list[str] = []
+        failed: list[str] = []
+
+        async def get_or_none(ip_address: str) -> IPData | None:
+            async with semaphore:
+                try:
+                    return await self._fetch(ip_address, batch=True)
+                except AddressNotFoundError:
+                    return None
+                except RateLimitError:
+                    deferred.append(ip_address)
+                    return None
+                except GeoIPClientError as e:
+                    logger.warning("Failed to get %s: %s", ip_address, e.message)
+                    failed.append(ip_address)
+                    return None
+
+        results = dict(zip(targets, await asyncio.gather(*(get_or_none(ip_address) for ip_address in targets)), strict=True))
+
+        unresolved = {*deferred, *failed}
+        found = {ip_address: ip_data for ip_address, ip_data in results.items() if ip_address not in unresolved}
+        if deferred:
+            msg = "GeoIP query quota exhausted"
+            raise RateLimitError(msg, {"ip_addresses": deferred, "results": found})
+
+        return found
+
+    async def close(self) -> None:
+        """HTTPセッションを閉じる."""
+        await self.client.close()
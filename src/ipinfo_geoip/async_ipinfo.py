@@ -0,0 +1,277 @@
+"""IPアドレスからネットワーク, AS番号, 国, 組織を非同期に取得するメインクラス."""
+
+import asyncio
+from collections.abc import Iterable, Sequence
+from enum import Enum
+from types import TracebackType
+from typing import Final, Self
+
+from .async_geoip_client import AsyncGeoIPClient
+from .async_redis_client import AsyncRedisClient
+from .async_resolver import AsyncResolver, AsyncResolverChain
+from .async_resolvers import AsyncMemoryResolver, AsyncMMDBResolver, AsyncRedisResolver, AsyncWebServiceResolver
+from .cache import TTLCache
+from .cache_config import CacheConfig
+from .constants import GEOIP_MAX_WORKERS, RESOLVER_MEMORY, RESOLVER_MMDB, RESOLVER_REDIS
+from .exceptions import ConfigurationError, RateLimitError, ValidationError
+from .ipdata import IPData
+from .mmdb_client import MMDBClient
+from .network_index import NetworkIndex
+from .resolver_config import ResolverConfig
+from .to_address import _to_address
+
+
+class _Missing(Enum):
+    """プロセス内キャッシュにIPアドレスが存在しないことを表す値."""
+
+    MISSING = "missing"
+
+
+_MISSING: Final = _Missing.MISSING
+
+
+class AsyncIPInfo:
+    """IPアドレスからネットワーク, AS番号, 国, 組織を非同期に取得するメインクラス.
+
+    取得結果は最大エントリ数と有効期限を持つプロセス内キャッシュに保存される
+    IPアドレス情報が存在しないこともnegative_ttlの間キャッシュされる
+    同じIPアドレスに対する同時の検索は1回に集約される
+    プロセス内キャッシュにないIPアドレスはIPInfoと同じ設定の検索階層を順に検索する
+    Redisが利用できない場合はRedisを飛ばして次の階層から取得する
+
+    Attributes:
+        resolvers: 検索階層
+
+    """
+
+    def __init__(self, resolvers: Sequence[AsyncResolver] | None = None) -> None:
+        """AsyncIPInfoインスタンスを初期化する.
+
+        検索階層を指定しない場合は環境変数の設定から作成する
+
+        Args:
+            resolvers: 検索順の検索階層
+
+        Raises:
+            ConfigurationError: 設定が不正な場合
+
+        """
+        try:
+            config = CacheConfig.from_env()
+        except ValidationError as e:
+            msg = "Cache configuration error"
+            raise ConfigurationError(msg, {"error": str(e)}) from e
+
+        self.data: TTLCache[str, dict[str, str] | None] = TTLCache(config.max_entries, config.ttl)
+        self.negative_ttl = config.negative_ttl
+        self.resolvers = AsyncResolverChain(self._create_resolvers(config) if resolvers is None else resolvers)
+        self._inflight: dict[str, asyncio.Task[dict[str, str] | None]] = {}
+
+    @staticmethod
+    def _create_resolvers(config: CacheConfig) -> list[AsyncResolver]:
+        """環境変数の設定から検索階層を作成する.
+
+        Args:
+            config: プロセス内キャッシュの設定
+
+        Returns:
+            検索順の検索階層
+
+        Raises:
+            ConfigurationError: 設定が不正な場合
+
+        """
+        try:
+            names = ResolverConfig.from_env().resolvers
+        except ValidationError as e:
+            msg = "Resolver configuration error"
+            raise ConfigurationError(msg, {"error": str(e)}) from e
+
+        resolvers: list[AsyncResolver] = []
+        for name in names:
+            if name == RESOLVER_MEMORY:
+                resolvers.append(AsyncMemoryResolver(NetworkIndex(config.max_entries, config.ttl)))
+            elif name == RESOLVER_MMDB:
+                resolvers.append(AsyncMMDBResolver(MMDBClient()))
+            elif name == RESOLVER_REDIS:
+                resolvers.append(AsyncRedisResolver(AsyncRedisClient()))
+            else:
+                resolvers.append(AsyncWebServiceResolver(AsyncGeoIPClient()))
+
+        return resolvers
+
+    async def __aenter__(self) -> Self:
+        """非同期コンテキストマネージャを開始する.
+
+        Returns:
+            AsyncIPInfoインスタンス
+
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """非同期コンテキストマネージャを終了し, 接続を閉じる.
+
+        Args:
+            exc_type: 例外の型
+            exc_value: 例外
+            traceback: トレースバック
+
+        """
+        await self.close()
+
+    async def get(self, ip_address: str) -> dict[str, str] | None:
+        """指定されたIPアドレス情報を取得する.
+
+        検索階層を順に検索する
+        見つかったIPアドレス情報はそれより前の階層に保存される
+        取得したデータに不備があればどこにも保存されない
+        IPアドレス情報が存在しない場合はそのことがキャッシュされる
+        同じIPアドレスを検索中のタスクがあればその結果を待つ
+
+        Args:
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            IPアドレス情報
+            見つからない場合はNone
+
+        Raises:
+            GeoIPClientError: 再試行しても一時的なエラーが続いた場合
+            RateLimitError: GeoLite2 Web Serviceへの問い合わせ数が上限に達した場合
+            ValidationError: ip_addressが不正な場合
+
+        """
+        try:
+            _ = _to_address(ip_address)
+        except ValueError as e:
+            msg = f"Invalid IP address: {ip_address}"
+            raise ValidationError(msg, {"error": str(e)}) from e
+
+        cached = self.data.get(ip_address, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
+        task = self._inflight.get(ip_address)
+        if task is None:
+            task = asyncio.ensure_future(self._resolve(ip_address))
+            self._inflight[ip_address] = task
+            task.add_done_callback(lambda _: self._inflight.pop(ip_address, None))
+
+        return await asyncio.shield(task)
+
+    async def _resolve(self, ip_address: str) -> dict[str, str] | None:
+        """検索階層を順に検索してIPアドレス情報を取得する.
+
+        Args:
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            IPアドレス情報
+            見つからない場合はNone
+
+        """
+        return self._remember(ip_address, await self.resolvers.get(ip_address))
+
+    async def get_many(
+        self,
+        ip_addresses: Iterable[str],
+        max_workers: int = GEOIP_MAX_WORKERS,
+    ) -> dict[str, dict[str, str] | None]:
+        """複数のIPアドレス情報をまとめて取得する.
+
+        プロセス内キャッシュにないIPアドレスのみ重複を除いて検索階層を順に検索する
+        各階層にはその前の階層で見つからなかったIPアドレスのみをまとめて問い合わせる
+        (Redisは1回のパイプライン, GeoLite2 Web Serviceは並行のリクエスト)
+        見つかったIPアドレス情報と存在しないことはそれより前の階層にまとめて保存される
+        GeoLite2 Web Serviceへは一括取得として問い合わせ, 1件ずつの取得のために残しておく問い合わせ数は使用しない
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+            max_workers: GeoLite2 Web Serviceへ同時に発行するリクエストの最大数
+
+        Returns:
+            IPアドレスをキーとするIPアドレス情報の辞書
+            見つからないIPアドレスと取得に失敗したIPアドレスはNone(取得に失敗したIPアドレスはキャッシュしない)
+            再試行しても一時的なエラーが続いたIPアドレスはGeoIPClientErrorを送出せず, 取得に失敗したものとする
+
+        Raises:
+            RateLimitError: GeoLite2 Web Serviceへの問い合わせ数が上限に達した場合
+                (detailsのip_addressesに検索できなかったIPアドレス, resultsにそれ以外のIPアドレス情報の辞書)
+                検索できたIPアドレス情報はキャッシュされるため, 後で同じIPアドレスを再度検索できる
+            ValidationError: ip_addressesに不正なIPアドレスが含まれる場合
+
+        """
+        targets = list(dict.fromkeys(ip_addresses))
+        for ip_address in targets:
+            try:
+                _ = _to_address(ip_address)
+            except ValueError as e:
+                msg = f"Invalid IP address: {ip_address}"
+                raise ValidationError(msg, {"error": str(e)}) from e
+
+        results = self._cached(targets)
+        misses = [ip_address for ip_address in targets if ip_address not in results]
+        if misses:
+            try:
+                found = await self.resolvers.get_many(misses, max_workers)
+            except RateLimitError as e:
+                for ip_address, ip_data in e.details["results"].items():
+                    results[ip_address] = self._remember(ip_address, ip_data)
+                raise RateLimitError(e.message, {"ip_addresses": e.details["ip_addresses"], "results": results}) from e
+            for ip_address, ip_data in found.items():
+                results[ip_address] = self._remember(ip_address, ip_data)
+
+        return {ip_address: results.get(ip_address) for ip_address in targets}
+
+    def _cached(self, ip_addresses: Iterable[str]) -> dict[str, dict[str, str] | None]:
+        """プロセス内キャッシュからIPアドレス情報を取得する.
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+
+        Returns:
+            キャッシュに存在したIPアドレスをキーとするIPアドレス情報の辞書
+
+        """
+        results: dict[str, dict[str, str] | None] = {}
+        for ip_address in ip_addresses:
+            ip_data = self.data.get(ip_address, _MISSING)
+            if ip_data is not _MISSING:
+                results[ip_address] = ip_data
+
+        return results
+
+    def _remember(self, ip_address: str, ip_data: IPData) -> dict[str, str] | None:
+        """IPアドレス情報をプロセス内キャッシュに保存する.
+
+        IPアドレス情報が存在しない場合はnegative_ttlの間そのことを保存する
+        不備のあるIPアドレス情報は保存しない
+
+        Args:
+            ip_address: IPアドレス
+            ip_data: 保存するIPアドレス情報
+
+        Returns:
+            IPアドレス情報の辞書
+            存在しない場合はNone
+
+        """
+        if ip_data.is_empty():
+            self.data.set(ip_address, None, self.negative_ttl)
+            return None
+
+        result = ip_data.to_dict()
+        if ip_data.is_complete():
+            self.data[ip_address] = result
+
+        return result
+
+    async def close(self) -> None:
+        """各検索階層の接続やファイルを閉じる."""
+        await self.resolvers.close()
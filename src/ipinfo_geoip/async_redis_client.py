@@ -0,0 +1,243 @@
+"""Redis非同期クライアント."""
+
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from typing import TypeVar
+
+import redis
+import redis.asyncio
+import redis.asyncio.cluster
+
+from .constants import REDIS_STORAGE_BINARY, REDIS_STORAGE_NETWORK
+from .exceptions import ConfigurationError, ValidationError
+from .ipdata import IPData
+from .redis_client import (
+    _breaker_open_error,
+    _flatten_responses,
+    _is_unavailable,
+    _legacy_targets,
+    _legacy_to_ip_data,
+    _queue_expired,
+    _queue_get_many,
+    _queue_prune,
+    _queue_set,
+    _queue_set_not_found,
+    _response_to_ip_data,
+    _to_client_error,
+)
+from .redis_config import RedisConfig
+from .redis_pool import _get_async_client, _get_breaker
+from .to_address import _to_address
+
+T = TypeVar("T")
+
+
+class AsyncRedisClient:
+    """Redis非同期クライアント.
+
+    コネクションプールはイベントループに結び付くため, インスタンスごとに作成する
+    最大接続数に達した場合は同期クライアントと同様に空きを待ち, エラーにしない
+    Redis Clusterではハッシュスロットをまたぐためトランザクションを使用しない
+    redis-pyの非同期クライアントは対応していないため, クライアントサイドキャッシュは使用しない
+    接続URIごとに共有するサーキットブレーカーが開いている間はRedisに接続せずにRedisClientErrorを送出する
+    バイナリ形式ではバイト列のまま読み書きするため応答をデコードしない
+    バイナリ形式で見つからないIPアドレスは移行前のハッシュから読み込む
+    """
+
+    def __init__(self) -> None:
+        """AsyncRedisClientインスタンスを初期化する.
+
+        Raises:
+            ConfigurationError: 必要な認証情報が不足している場合
+
+        """
+        try:
+            config = RedisConfig.from_env()
+        except ValidationError as e:
+            msg = "Redis configuration error"
+            raise ConfigurationError(msg, {"error": str(e)}) from e
+
+        self.client = _get_async_client(config, decode_responses=config.storage != REDIS_STORAGE_BINARY)
+        self.ttl = config.ttl
+        self.storage = config.storage
+        self.negative_ttl = config.negative_ttl
+        self.cluster = config.cluster
+        self.breaker = _get_breaker(config)
+
+    async def _call(self, function: Callable[[], Awaitable[T]]) -> T:
+        """サーキットブレーカーを通してRedisのコマンドを実行する.
+
+        Redisが利用できないことを表すエラーはサーキットブレーカーに失敗として記録する
+
+        Args:
+            function: Redisのコマンドを実行するコルーチン関数
+
+        Returns:
+            コルーチンの戻り値
+
+        Raises:
+            RedisClientError: サーキットブレーカーが開いている場合, またはRedisでエラーが発生した場合
+
+        """
+        if not self.breaker.allow():
+            raise _breaker_open_error()
+
+        try:
+            result = await function()
+        except redis.RedisError as e:
+            if _is_unavailable(e):
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            raise _to_client_error(e) from e
+
+        self.breaker.record_success()
+        return result
+
+    async def get(self, ip_address: str) -> IPData | None:
+        """RedisからIPアドレス情報を取得する.
+
+        Args:
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            Redisから取得したIPアドレス情報
+            存在しないことがキャッシュされている場合は空のIPアドレス情報
+            見つからない場合はNone
+
+        Raises:
+            RedisClientError: Redisでエラーが発生した場合
+            ValidationError: ip_addressが不正な場合
+
+        """
+        results = await self.get_many([ip_address])
+
+        return results[ip_address]
+
+    async def get_many(self, ip_addresses: Iterable[str]) -> dict[str, IPData | None]:
+        """複数のIPアドレス情報を1回のパイプラインでRedisから取得する.
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+
+        Returns:
+            IPアドレスをキーとするIPアドレス情報の辞書
+            存在しないことがキャッシュされているIPアドレスは空のIPアドレス情報
+            見つからないIPアドレスはNone
+
+        Raises:
+            RedisClientError: Redisでエラーが発生した場合
+            ValidationError: ip_addressesに不正なIPアドレスが含まれる場合
+
+        """
+        targets = list(dict.fromkeys(ip_addresses))
+        for ip_address in targets:
+            try:
+                _ = _to_address(ip_address)
+            except ValueError as e:
+                msg = f"Invalid IP address: {ip_address}"
+                raise ValidationError(msg, {"error": str(e)}) from e
+
+        if not targets:
+            return {}
+
+        pipeline = self.client.pipeline(transaction=False)
+        ordered = _queue_get_many(pipeline, targets, self.storage, cluster=self.cluster)
+
+        responses = _flatten_responses(await self._call(pipeline.execute), self.storage)
+
+        results = {
+            ip_address: _response_to_ip_data(ip_address, response, self.storage)
+            for ip_address, response in zip(ordered, responses, strict=True)
+        }
+        results.update(await self._get_legacy(_legacy_targets(results, self.storage)))
+
+        return {ip_address: results[ip_address] for ip_address in targets}
+
+    async def _get_legacy(self, ip_addresses: list[str]) -> dict[str, IPData | None]:
+        """移行前のハッシュから複数のIPアドレス情報を1回のパイプラインで取得する.
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+
+        Returns:
+            IPアドレスをキーとするIPアドレス情報の辞書
+
+        Raises:
+            RedisClientError: Redisでエラーが発生した場合
+
+        """
+        if not ip_addresses:
+            return {}
+
+        pipeline = self.client.pipeline(transaction=False)
+        for ip_address in ip_addresses:
+            pipeline.hgetall(f"ipinfo:{ip_address}")
+
+        responses = await self._call(pipeline.execute)
+
+        return {
+            ip_address: _legacy_to_ip_data(ip_address, response)
+            for ip_address, response in zip(ip_addresses, responses, strict=True)
+        }
+
+    async def set_many(self, items: Mapping[str, IPData | None], not_found: Iterable[str] = ()) -> None:
+        """複数のIPアドレス情報を1回のパイプラインでRedisに保存する.
+
+        不完全なIPアドレス情報は保存されない
+
+        Args:
+            items: IPアドレスをキーとするIPアドレス情報の辞書
+            not_found: IPアドレス情報が存在しないIPアドレス
+
+        Raises:
+            RedisClientError: サーキットブレーカーが開いている場合, またはRedisでエラーが発生した場合
+            ValidationError: itemsまたはnot_foundに不正なIPアドレスが含まれる場合
+
+        """
+        not_found = list(dict.fromkeys(not_found))
+        for ip_address in [*items, *not_found]:
+            try:
+                _ = _to_address(ip_address)
+            except ValueError as e:
+                msg = f"Invalid IP address: {ip_address}"
+                raise ValidationError(msg, {"error": str(e)}) from e
+
+        complete = {
+            ip_address: ip_data for ip_address, ip_data in items.items() if ip_data is not None and ip_data.is_complete()
+        }
+        if not complete and not not_found:
+            return
+
+        pipeline = self.client.pipeline(transaction=not self.cluster)
+        for ip_address, ip_data in complete.items():
+            _queue_set(pipeline, ip_address, ip_data, self.storage, self.ttl)
+        for ip_address in not_found:
+            _queue_set_not_found(pipeline, ip_address, self.storage, self.negative_ttl)
+        await self._execute_set(pipeline)
+
+    async def _execute_set(self, pipeline: redis.asyncio.client.Pipeline | redis.asyncio.cluster.ClusterPipeline) -> None:
+        """保存するコマンドを追加したパイプラインを実行する.
+
+        ネットワーク範囲キャッシュでは有効期限切れのメンバーを同じパイプラインで取得し, 存在する場合は削除する
+
+        Args:
+            pipeline: 保存するコマンドを追加したパイプライン
+
+        Raises:
+            RedisClientError: サーキットブレーカーが開いている場合, またはRedisでエラーが発生した場合
+
+        """
+        if self.storage != REDIS_STORAGE_NETWORK:
+            await self._call(pipeline.execute)
+            return
+
+        _queue_expired(pipeline)
+        responses = await self._call(pipeline.execute)
+
+        pipeline = self.client.pipeline(transaction=False)
+        if _queue_prune(pipeline, responses):
+            await self._call(pipeline.execute)
+
+    async def close(self) -> None:
+        """Redis接続を閉じる."""
+        await self.client.aclose()
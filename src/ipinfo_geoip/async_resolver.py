@@ -0,0 +1,202 @@
+"""IPアドレス情報の非同期の検索階層."""
+
+from collections.abc import Sequence
+from typing import Protocol
+
+from .constants import GEOIP_MAX_WORKERS
+from .exceptions import GeoIPClientError, RateLimitError
+from .ipdata import IPData
+from .resolver import _is_storable, _not_found
+
+
+class AsyncResolver(Protocol):
+    """IPアドレス情報の非同期の検索階層のインターフェース.
+
+    各メソッドの結果と例外はResolverと同じで, 加えてcloseで接続やファイルを閉じる
+    """
+
+    async def get(self, ip_address: str) -> IPData | None:
+        """IPアドレス情報を取得する.
+
+        Args:
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            IPアドレス情報
+            見つからない場合はNone
+
+        """
+        ...
+
+    async def get_many(self, ip_addresses: list[str], max_workers: int = GEOIP_MAX_WORKERS) -> dict[str, IPData]:
+        """複数のIPアドレス情報を取得する.
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+            max_workers: 同時に発行するリクエストの最大数
+
+        Returns:
+            見つかったIPアドレスをキーとするIPアドレス情報の辞書
+
+        """
+        ...
+
+    async def put(self, ip_address: str, ip_data: IPData) -> None:
+        """IPアドレス情報を保存する.
+
+        Args:
+            ip_address: IPアドレス
+            ip_data: 保存するIPアドレス情報
+
+        """
+        ...
+
+    async def put_many(self, items: dict[str, IPData]) -> None:
+        """複数のIPアドレス情報を保存する.
+
+        Args:
+            items: IPアドレスをキーとする保存するIPアドレス情報の辞書
+
+        """
+        ...
+
+    async def close(self) -> None:
+        """接続やファイルを閉じる."""
+        ...
+
+
+class AsyncResolverChain:
+    """IPアドレス情報の非同期の検索階層を順に検索するクラス.
+
+    検索と保存の規則はResolverChainと同じ
+
+    Attributes:
+        resolvers: 検索順の階層
+
+    """
+
+    def __init__(self, resolvers: Sequence[AsyncResolver]) -> None:
+        """AsyncResolverChainインスタンスを初期化する.
+
+        Args:
+            resolvers: 検索順の階層
+
+        """
+        self.resolvers = list(resolvers)
+
+    async def get(self, ip_address: str) -> IPData:
+        """各階層を順に検索してIPアドレス情報を取得する.
+
+        Args:
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            IPアドレス情報
+            見つからない場合はIPアドレス以外のフィールドが空のIPData
+
+        Raises:
+            GeoIPClientError: 再試行しても一時的なエラーが続いた場合
+            RateLimitError: 問い合わせ数が上限に達した場合
+
+        """
+        for position, resolver in enumerate(self.resolvers):
+            ip_data = await resolver.get(ip_address)
+            if ip_data is not None:
+                await self._put(self.resolvers[:position], ip_address, ip_data)
+                return ip_data
+
+        not_found = _not_found(ip_address)
+        await self._put(self.resolvers, ip_address, not_found)
+
+        return not_found
+
+    async def get_many(self, ip_addresses: list[str], max_workers: int = GEOIP_MAX_WORKERS) -> dict[str, IPData]:
+        """各階層を順に検索して複数のIPアドレス情報を取得する.
+
+        各階層にはその前の階層で見つからなかったIPアドレスのみをまとめて問い合わせる
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+            max_workers: 同時に発行するリクエストの最大数
+
+        Returns:
+            IPアドレスをキーとするIPアドレス情報の辞書
+            見つからないIPアドレスはIPアドレス以外のフィールドが空のIPData
+            取得に失敗したIPアドレスは含まない
+
+        Raises:
+            RateLimitError: 問い合わせ数の上限により検索できなかったIPアドレスがある場合
+                (detailsのip_addressesに検索できなかったIPアドレス, resultsにそれ以外のIPアドレス情報の辞書)
+                取得に失敗したIPアドレスはどちらにも含まない
+
+        """
+        results: dict[str, IPData] = {}
+        misses = list(dict.fromkeys(ip_addresses))
+        error: RateLimitError | None = None
+        deferred: list[str] = []
+        failed: list[str] = []
+        for position, resolver in enumerate(self.resolvers):
+            if not misses:
+                break
+            try:
+                found = await resolver.get_many(misses, max_workers)
+            except RateLimitError as e:
+                error = e
+                found = e.details["results"]
+                deferred.extend(e.details["ip_addresses"])
+            except GeoIPClientError as e:
+                found = e.details["results"]
+                failed.extend(e.details["ip_addresses"])
+            await self._put_many(self.resolvers[:position], found)
+            results.update(found)
+            misses = [
+                ip_address
+                for ip_address in misses
+                if ip_address not in found and ip_address not in deferred and ip_address not in failed
+            ]
+
+        not_found = {ip_address: _not_found(ip_address) for ip_address in misses}
+        await self._put_many(self.resolvers, not_found)
+        results.update(not_found)
+
+        if error is not None:
+            raise RateLimitError(error.message, {"ip_addresses": deferred, "results": results}) from error
+
+        return results
+
+    async def close(self) -> None:
+        """各階層の接続やファイルを閉じる."""
+        for resolver in self.resolvers:
+            await resolver.close()
+
+    @staticmethod
+    async def _put(resolvers: Sequence[AsyncResolver], ip_address: str, ip_data: IPData) -> None:
+        """不備のないIPアドレス情報, または存在しないことを各階層に保存する.
+
+        Args:
+            resolvers: 保存先の階層
+            ip_address: IPアドレス
+            ip_data: 保存するIPアドレス情報
+
+        """
+        if not _is_storable(ip_data):
+            return
+
+        for resolver in resolvers:
+            await resolver.put(ip_address, ip_data)
+
+    @staticmethod
+    async def _put_many(resolvers: Sequence[AsyncResolver], items: dict[str, IPData]) -> None:
+        """不備のない複数のIPアドレス情報, または存在しないことを各階層に保存する.
+
+        Args:
+            resolvers: 保存先の階層
+            items: IPアドレスをキーとする保存するIPアドレス情報の辞書
+
+        """
+        items = {ip_address: ip_data for ip_address, ip_data in items.items() if _is_storable(ip_data)}
+        if not items:
+            return
+
+        for resolver in resolvers:
+            await resolver.put_many(items)
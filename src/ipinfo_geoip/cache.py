@@ -0,0 +1,121 @@
+"""有効期限と最大エントリ数を持つプロセス内キャッシュ."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator, MutableMapping
+from typing import TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(MutableMapping[K, V]):
+    """有効期限と最大エントリ数を持つLRUキャッシュクラス.
+
+    最大エントリ数を超えた場合は最も長く参照されていないエントリから削除する
+    有効期限を過ぎたエントリは参照時に削除する
+    各操作はロックで保護されるため, 複数のスレッドから共有できる
+
+    Attributes:
+        maxsize: 最大エントリ数
+        ttl: エントリの有効期限(秒)
+
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """TTLCacheインスタンスを初期化する.
+
+        Args:
+            maxsize: 最大エントリ数
+            ttl: エントリの有効期限(秒)
+
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: K) -> V:
+        """有効期限内のエントリを取得する.
+
+        Args:
+            key: キー
+
+        Returns:
+            エントリの値
+
+        Raises:
+            KeyError: エントリが存在しない場合, または有効期限を過ぎている場合
+
+        """
+        with self._lock:
+            value, expires_at = self._entries[key]
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                raise KeyError(key)
+
+            self._entries.move_to_end(key)
+
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """既定の有効期限でエントリを保存する.
+
+        Args:
+            key: キー
+            value: エントリの値
+
+        """
+        self.set(key, value, self.ttl)
+
+    def __delitem__(self, key: K) -> None:
+        """エントリを削除する.
+
+        Args:
+            key: キー
+
+        Raises:
+            KeyError: エントリが存在しない場合
+
+        """
+        with self._lock:
+            del self._entries[key]
+
+    def __iter__(self) -> Iterator[K]:
+        """有効期限内のエントリのキーを返す.
+
+        Returns:
+            キーのイテレータ
+
+        """
+        now = time.monotonic()
+        with self._lock:
+            return iter([key for key, (_, expires_at) in self._entries.items() if expires_at > now])
+
+    def __len__(self) -> int:
+        """有効期限内のエントリ数を返す.
+
+        Returns:
+            エントリ数
+
+        """
+        now = time.monotonic()
+        with self._lock:
+            return sum(1 for _, expires_at in self._entries.values() if expires_at > now)
+
+    def set(self, key: K, value: V, ttl: float) -> None:
+        """有効期限を指定してエントリを保存する.
+
+        Args:
+            key: キー
+            value: エントリの値
+            ttl: エントリの有効期限(秒)
+
+        """
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
@@ -0,0 +1,72 @@
+"""プロセス内キャッシュ設定."""
+
+import os
+from typing import Self
+
+from .constants import (
+    CACHE_MAX_ENTRIES,
+    CACHE_MAX_ENTRIES_ENV,
+    CACHE_NEGATIVE_TTL_ENV,
+    CACHE_TTL,
+    CACHE_TTL_ENV,
+    NEGATIVE_CACHE_TTL,
+    REDIS_CACHE_TTL_ENV,
+    REDIS_NEGATIVE_CACHE_TTL_ENV,
+)
+from .exceptions import ValidationError
+
+
+class CacheConfig:
+    """プロセス内キャッシュ設定クラス.
+
+    Attributes:
+        max_entries: 最大エントリ数
+        ttl: キャッシュのTTL(秒)
+        negative_ttl: IPアドレス情報が存在しないことのキャッシュのTTL(秒)
+
+    """
+
+    def __init__(self, max_entries: str, ttl: str, negative_ttl: str = str(NEGATIVE_CACHE_TTL)) -> None:
+        """CacheConfigインスタンスを初期化する.
+
+        Args:
+            max_entries: 最大エントリ数
+            ttl: キャッシュのTTL(秒)
+            negative_ttl: IPアドレス情報が存在しないことのキャッシュのTTL(秒)
+
+        Raises:
+            ValidationError: 値が不正な場合
+
+        """
+        try:
+            self.max_entries = int(max_entries)
+            self.ttl = int(ttl)
+            self.negative_ttl = int(negative_ttl)
+        except ValueError as e:
+            raise ValidationError(str(e)) from e
+
+        if self.max_entries < 1 or self.ttl < 1 or self.negative_ttl < 1:
+            msg = "Cache max entries and TTL must be positive"
+            raise ValidationError(msg)
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """環境変数からCacheConfigインスタンスを作成する.
+
+        TTLが設定されていない場合はRedisキャッシュのTTLを使用する
+
+        Returns:
+            環境変数から作成されたCacheConfigインスタンス
+
+        Raises:
+            ValidationError: 環境変数の値が不正な場合
+
+        """
+        max_entries = os.environ.get(CACHE_MAX_ENTRIES_ENV, str(CACHE_MAX_ENTRIES))
+        ttl = os.environ.get(CACHE_TTL_ENV, os.environ.get(REDIS_CACHE_TTL_ENV, str(CACHE_TTL)))
+        negative_ttl = os.environ.get(
+            CACHE_NEGATIVE_TTL_ENV,
+            os.environ.get(REDIS_NEGATIVE_CACHE_TTL_ENV, str(NEGATIVE_CACHE_TTL)),
+        )
+
+        return cls(max_entries, ttl, negative_ttl)
@@ -0,0 +1,330 @@
+"""IPアドレスの一覧をRedisキャッシュに事前に読み込むクラス."""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from itertools import islice
+
+from .constants import GEOIP_MAX_WORKERS, WARM_CHUNK_SIZE, WARM_IPV4_PREFIX, WARM_IPV6_PREFIX
+from .exceptions import RateLimitError
+from .geoip_client import GeoIPClient
+from .ipdata import IPData
+from .network_index import NetworkIndex
+from .redis_client import RedisClient
+from .to_address import _to_address, _to_network
+
+
+def _shift(version: int) -> int:
+    """IPアドレスをまとめるキーのビットシフト数を返す.
+
+    IPv4は/24, IPv6は/48のネットワークアドレスをキーとする
+
+    Args:
+        version: IPバージョン
+
+    Returns:
+        IPアドレスの整数からキーを求めるための右シフト数
+
+    """
+    return 32 - WARM_IPV4_PREFIX if version == 4 else 128 - WARM_IPV6_PREFIX  # noqa: PLR2004
+
+
+def _bucket(ip_address: str) -> tuple[int, int]:
+    """同じネットワークに含まれる可能性が高いIPアドレスをまとめるキーを返す.
+
+    Args:
+        ip_address: IPアドレス
+
+    Returns:
+        IPバージョンとネットワークアドレスのタプル
+
+    """
+    address = _to_address(ip_address)
+    return (address.version, int(address) >> _shift(address.version))
+
+
+class _Buckets:
+    """問い合わせていないIPアドレスを/24(IPv6は/48)ごとにまとめて保持するクラス.
+
+    キーは問い合わせの順序を保つ辞書と, ネットワークに含まれるキーを二分探索するための
+    IPバージョンごとのソート済みリストに保持する
+
+    Attributes:
+        pending: キーごとの問い合わせていないIPアドレス
+
+    """
+
+    def __init__(self, ip_addresses: Iterable[str]) -> None:
+        """_Bucketsインスタンスを初期化する.
+
+        Args:
+            ip_addresses: 問い合わせていないIPアドレス
+
+        """
+        self.pending: dict[tuple[int, int], list[str]] = {}
+        for ip_address in ip_addresses:
+            self.pending.setdefault(_bucket(ip_address), []).append(ip_address)
+        self._keys: dict[int, list[int]] = {
+            version: sorted(key for key_version, key in self.pending if key_version == version) for version in (4, 6)
+        }
+
+    def __len__(self) -> int:
+        """問い合わせていないIPアドレスの数を返す.
+
+        Returns:
+            問い合わせていないIPアドレスの数
+
+        """
+        return sum(len(ip_addresses) for ip_addresses in self.pending.values())
+
+    def remove(self, key: tuple[int, int]) -> None:
+        """キーのIPアドレスをすべて取り除く.
+
+        Args:
+            key: 取り除くキー
+
+        """
+        del self.pending[key]
+        keys = self._keys[key[0]]
+        del keys[bisect_left(keys, key[1])]
+
+    def take(self, size: int) -> list[str]:
+        """先頭からsize個のキーのIPアドレスを1つずつ取り出す.
+
+        Args:
+            size: 取り出すIPアドレスの最大数
+
+        Returns:
+            取り出したIPアドレス
+
+        """
+        batch: list[str] = []
+        for key, ip_addresses in list(islice(self.pending.items(), size)):
+            batch.append(ip_addresses.pop(0))
+            if not ip_addresses:
+                self.remove(key)
+
+        return batch
+
+    def covered(self, networks: Iterable[IPData]) -> list[tuple[int, int]]:
+        """ネットワークのいずれかに含まれる可能性があるキーを返す.
+
+        Args:
+            networks: ネットワークのIPアドレス情報
+
+        Returns:
+            キーのリスト
+
+        """
+        covered: dict[tuple[int, int], None] = {}
+        for ip_data in networks:
+            if not ip_data.is_complete():
+                continue
+            network = _to_network(ip_data.network)
+            keys = self._keys[network.version]
+            shift = _shift(network.version)
+            start = bisect_left(keys, int(network.network_address) >> shift)
+            end = bisect_right(keys, int(network.broadcast_address) >> shift)
+            covered.update(dict.fromkeys((network.version, key) for key in keys[start:end]))
+
+        return list(covered)
+
+
+class CacheWarmer:
+    """IPアドレスの一覧をRedisキャッシュに事前に読み込むクラス.
+
+    重複を除いたIPアドレスのうち, Redisにキャッシュされていないものだけをパイプラインで確認して残す
+    キャッシュ済みまたは取得済みのネットワークに含まれるIPアドレスは問い合わせずにそのネットワークの情報を保存する
+    残りはGeoLite2 Web Serviceへ一括取得として並列に問い合わせ, 問い合わせ数はbudgetまでに制限する
+    1回の問い合わせでは同じ/24(IPv6は/48)のIPアドレスを1つだけ問い合わせ, 取得したネットワークで残りをまとめる
+    問い合わせの後は取得したネットワークに含まれる/24(IPv6は/48)のIPアドレスだけを確認するため,
+    処理時間は問い合わせの回数と残りのIPアドレスの数の積ではなく, IPアドレスの数にほぼ比例する
+
+    Attributes:
+        redis_client: Redisクライアント
+        geoip_client: GeoLite2 Web Serviceクライアント
+
+    """
+
+    def __init__(self, redis_client: RedisClient | None = None, geoip_client: GeoIPClient | None = None) -> None:
+        """CacheWarmerインスタンスを初期化する.
+
+        クライアントを指定しない場合は環境変数の設定から作成する
+
+        Args:
+            redis_client: Redisクライアント
+            geoip_client: GeoLite2 Web Serviceクライアント
+
+        Raises:
+            ConfigurationError: 設定が不正な場合
+
+        """
+        self.redis_client = RedisClient() if redis_client is None else redis_client
+        self.geoip_client = GeoIPClient() if geoip_client is None else geoip_client
+
+    def warm(
+        self,
+        ip_addresses: Iterable[str],
+        budget: int | None = None,
+        max_workers: int = GEOIP_MAX_WORKERS,
+    ) -> dict[str, int]:
+        """IPアドレス情報をRedisキャッシュに読み込む.
+
+        Args:
+            ip_addresses: 読み込むIPアドレス
+            budget: GeoLite2 Web Serviceへの問い合わせ数の上限, Noneは制限しない
+            max_workers: 同時に発行するリクエストの最大数
+
+        Returns:
+            件数の辞書
+            (requested: 重複を除いたIPアドレス, invalid: 不正なIPアドレス, cached: キャッシュ済み,
+            collapsed: 既知のネットワークから保存, fetched: 問い合わせて保存, not_found: 存在しないことを保存,
+            failed: 再試行しても取得に失敗したIPアドレス, skipped: 問い合わせ数の上限により読み込まなかったIPアドレス)
+
+        Raises:
+            RedisClientError: Redisでエラーが発生した場合
+
+        """
+        stats = dict.fromkeys(("requested", "invalid", "cached", "collapsed", "fetched", "not_found", "failed", "skipped"), 0)
+        targets: list[str] = []
+        for ip_address in dict.fromkeys(ip_addresses):
+            try:
+                _ = _to_address(ip_address)
+            except ValueError:
+                stats["invalid"] += 1
+            else:
+                targets.append(ip_address)
+        stats["requested"] = len(targets)
+
+        index = NetworkIndex(max(len(targets), 1), self.redis_client.ttl)
+        misses = self._cached(targets, index, stats)
+
+        buckets = _Buckets(misses)
+        self._collapse(buckets, list(buckets.pending), index, stats)
+
+        remaining = budget
+        while buckets.pending and remaining != 0:
+            size = max_workers if remaining is None else min(max_workers, remaining)
+            batch = buckets.take(size)
+            if remaining is not None:
+                remaining -= len(batch)
+            try:
+                fetched = self._fetch(batch, index, stats, max_workers)
+            except RateLimitError as e:
+                stats["skipped"] += len(e.details["ip_addresses"])
+                fetched = [ip_data for ip_data in e.details["results"].values() if ip_data is not None]
+                self._collapse(buckets, buckets.covered(fetched), index, stats)
+                break
+            self._collapse(buckets, buckets.covered(fetched), index, stats)
+
+        stats["skipped"] += len(buckets)
+        return stats
+
+    def _cached(self, ip_addresses: list[str], index: NetworkIndex, stats: dict[str, int]) -> list[str]:
+        """Redisにキャッシュ済みのIPアドレスをパイプラインで確認する.
+
+        キャッシュ済みのネットワークはインデックスに登録する
+
+        Args:
+            ip_addresses: 確認するIPアドレス
+            index: 既知のネットワークのインデックス
+            stats: 件数の辞書
+
+        Returns:
+            キャッシュされていないIPアドレス
+
+        """
+        misses: list[str] = []
+        for start in range(0, len(ip_addresses), WARM_CHUNK_SIZE):
+            chunk = ip_addresses[start : start + WARM_CHUNK_SIZE]
+            for ip_address, ip_data in self.redis_client.get_many(chunk).items():
+                if ip_data is None:
+                    misses.append(ip_address)
+                    continue
+                stats["cached"] += 1
+                index.insert(ip_data)
+
+        return misses
+
+    def _collapse(
+        self,
+        buckets: _Buckets,
+        keys: list[tuple[int, int]],
+        index: NetworkIndex,
+        stats: dict[str, int],
+    ) -> None:
+        """既知のネットワークに含まれるIPアドレスを問い合わせずに保存する.
+
+        Args:
+            buckets: 問い合わせていないIPアドレス
+            keys: 確認するキー
+            index: 既知のネットワークのインデックス
+            stats: 件数の辞書
+
+        """
+        collapsed: dict[str, IPData | None] = {}
+        for key in keys:
+            pending: list[str] = []
+            for ip_address in buckets.pending[key]:
+                ip_data = index.lookup(ip_address)
+                if ip_data is None:
+                    pending.append(ip_address)
+                else:
+                    collapsed[ip_address] = ip_data
+            if pending:
+                buckets.pending[key] = pending
+            else:
+                buckets.remove(key)
+
+        if collapsed:
+            self.redis_client.set_many(collapsed)
+            stats["collapsed"] += len(collapsed)
+
+    def _fetch(self, ip_addresses: list[str], index: NetworkIndex, stats: dict[str, int], max_workers: int) -> list[IPData]:
+        """GeoLite2 Web Serviceに問い合わせて取得したIPアドレス情報を保存する.
+
+        取得に失敗したIPアドレスは存在しないことを保存せず, failedとして数える
+
+        Args:
+            ip_addresses: 問い合わせるIPアドレス
+            index: 既知のネットワークのインデックス
+            stats: 件数の辞書
+            max_workers: 同時に発行するリクエストの最大数
+
+        Returns:
+            取得したIPアドレス情報
+
+        Raises:
+            RateLimitError: 問い合わせ数が上限に達した場合, 取得できたIPアドレス情報は保存される
+
+        """
+        try:
+            results = self.geoip_client.get_many(ip_addresses, max_workers)
+        except RateLimitError as e:
+            stats["failed"] += len(ip_addresses) - len(e.details["results"]) - len(e.details["ip_addresses"])
+            self._store(e.details["results"], index, stats)
+            raise
+
+        stats["failed"] += len(ip_addresses) - len(results)
+        return self._store(results, index, stats)
+
+    def _store(self, results: dict[str, IPData | None], index: NetworkIndex, stats: dict[str, int]) -> list[IPData]:
+        """取得したIPアドレス情報と存在しないことをRedisに保存する.
+
+        Args:
+            results: IPアドレスをキーとするIPアドレス情報の辞書
+            index: 既知のネットワークのインデックス
+            stats: 件数の辞書
+
+        Returns:
+            取得したIPアドレス情報
+
+        """
+        found = {ip_address: ip_data for ip_address, ip_data in results.items() if ip_data is not None}
+        not_found = [ip_address for ip_address, ip_data in results.items() if ip_data is None]
+        self.redis_client.set_many(found, not_found)
+        for ip_data in found.values():
+            index.insert(ip_data)
+
+        stats["fetched"] += len(found)
+        stats["not_found"] += len(not_found)
+        return list(found.values())
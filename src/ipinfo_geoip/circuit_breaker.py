@@ -0,0 +1,80 @@
+"""障害時に呼び出しを即座に失敗させるサーキットブレーカー."""
+
+import threading
+import time
+
+from .constants import CIRCUIT_CLOSED, CIRCUIT_HALF_OPEN, CIRCUIT_OPEN
+
+
+class CircuitBreaker:
+    """連続した失敗を検出して呼び出しを遮断するサーキットブレーカー.
+
+    失敗がfailure_threshold回連続すると開き, reset_timeout秒の間は呼び出しを許可しない
+    reset_timeout秒が経過すると半開状態になり, 1つの呼び出しだけを試行として許可する
+    試行が成功すれば閉じ, 失敗すれば再び開く
+    試行の結果がreset_timeout秒以上記録されない場合は次の試行を許可する
+
+    Attributes:
+        failure_threshold: 開くまでの連続した失敗の回数
+        reset_timeout: 開いてから試行を許可するまでの秒数
+
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        """CircuitBreakerインスタンスを初期化する.
+
+        Args:
+            failure_threshold: 開くまでの連続した失敗の回数
+            reset_timeout: 開いてから試行を許可するまでの秒数
+
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        """現在の状態.
+
+        Returns:
+            closed, open, half_openのいずれか
+
+        """
+        with self._lock:
+            return self._state
+
+    def allow(self) -> bool:
+        """呼び出しを許可するか判定する.
+
+        Returns:
+            呼び出しを許可する場合True
+
+        """
+        with self._lock:
+            if self._state == CIRCUIT_CLOSED:
+                return True
+
+            now = time.monotonic()
+            if now - self._opened_at < self.reset_timeout:
+                return False
+
+            self._state = CIRCUIT_HALF_OPEN
+            self._opened_at = now
+            return True
+
+    def record_success(self) -> None:
+        """呼び出しの成功を記録する."""
+        with self._lock:
+            self._state = CIRCUIT_CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """呼び出しの失敗を記録する."""
+        with self._lock:
+            self._failures += 1
+            if self._state == CIRCUIT_HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = CIRCUIT_OPEN
+                self._opened_at = time.monotonic()
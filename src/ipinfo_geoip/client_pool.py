@@ -0,0 +1,90 @@
+"""スレッド間で共有するクライアントのプール."""
+
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class ClientPool(Generic[T]):
+    """スレッド間で共有するクライアントのプールクラス.
+
+    クライアントは必要になった時点で最大数まで作成される
+    すべてのクライアントが使用中の場合は返却されるまで待つ
+
+    Attributes:
+        maxsize: 最大クライアント数
+
+    """
+
+    def __init__(self, factory: Callable[[], T], maxsize: int) -> None:
+        """ClientPoolインスタンスを初期化する.
+
+        設定の不備を早期に検出するため, 最初のクライアントは初期化時に作成する
+
+        Args:
+            factory: クライアントを作成する関数
+            maxsize: 最大クライアント数
+
+        """
+        self.maxsize = maxsize
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._idle: queue.LifoQueue[T] = queue.LifoQueue()
+        self._idle.put(factory())
+        self._created = 1
+
+    def __len__(self) -> int:
+        """作成済みのクライアント数を返す.
+
+        Returns:
+            作成済みのクライアント数
+
+        """
+        return self._created
+
+    @contextmanager
+    def acquire(self) -> Iterator[T]:
+        """クライアントを借りる.
+
+        Yields:
+            使用するクライアント
+
+        """
+        client = self._take()
+        try:
+            yield client
+        finally:
+            self._idle.put(client)
+
+    def _take(self) -> T:
+        """空いているクライアントを取り出す.
+
+        空いているクライアントがなく最大数に達していなければ新しく作成する
+
+        Returns:
+            クライアント
+
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            create = self._created < self.maxsize
+            if create:
+                self._created += 1
+
+        if not create:
+            return self._idle.get()
+
+        try:
+            return self._factory()
+        except BaseException:
+            with self._lock:
+                self._created -= 1
+            raise
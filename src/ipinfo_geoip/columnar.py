@@ -0,0 +1,124 @@
+"""複数のIPアドレス情報をNumPyの配列として取得するクラス.
+
+numpyはオプションの依存関係のため, pip install ipinfo-geoip[numpy]でインストールする
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from .constants import GEOIP_MAX_WORKERS
+from .ipinfo import IPInfo
+from .to_address import _to_network
+
+_WORD_BITS = 64
+_WORD_MASK = (1 << _WORD_BITS) - 1
+
+
+def _columns(results: Sequence[dict[str, str] | None]) -> dict[str, npt.NDArray[Any]]:
+    """IPアドレス情報の辞書から列ごとの配列を作成する.
+
+    Args:
+        results: IPアドレス情報の辞書, 見つからない場合はNone
+
+    Returns:
+        列名をキーとし, resultsと同じ長さの配列を値とする辞書(見つからない行は0または"")
+
+    """
+    size = len(results)
+    found = np.zeros(size, dtype=np.bool_)
+    as_number = np.zeros(size, dtype=np.uint32)
+    country = np.zeros(size, dtype="<U2")
+    version = np.zeros(size, dtype=np.uint8)
+    network_high = np.zeros(size, dtype=np.uint64)
+    network_low = np.zeros(size, dtype=np.uint64)
+    prefixlen = np.zeros(size, dtype=np.uint8)
+    organizations = [""] * size
+    for i, ip_data in enumerate(results):
+        if ip_data is None:
+            continue
+        found[i] = True
+        as_number[i] = int(ip_data["as_number"] or 0)
+        country[i] = ip_data["country"]
+        organizations[i] = ip_data["organization"]
+        if ip_data["network"]:
+            network = _to_network(ip_data["network"])
+            start = int(network.network_address)
+            version[i] = network.version
+            network_high[i] = start >> _WORD_BITS
+            network_low[i] = start & _WORD_MASK
+            prefixlen[i] = network.prefixlen
+
+    return {
+        "found": found,
+        "as_number": as_number,
+        "country": country,
+        "version": version,
+        "network_high": network_high,
+        "network_low": network_low,
+        "prefixlen": prefixlen,
+        "organization": np.array(organizations, dtype=np.str_),
+    }
+
+
+class ColumnarLookup:
+    """複数のIPアドレス情報をNumPyの配列として取得するクラス.
+
+    入力の重複はnp.uniqueで除き, 一意なIPアドレスのみをIPInfo.lookup_manyで検索階層から取得する
+    一意なIPアドレスごとの列を作成した後, 入力の位置へは逆引きのインデックスでまとめて配置するため,
+    行ごとの辞書は作成しない
+
+    返す列は以下のとおり(見つからない行は0または"")
+    found: IPアドレス情報が見つかったか(bool)
+    as_number: AS番号(uint32)
+    country: ISO国コード(<U2)
+    version: ネットワークのIPバージョン(uint8)
+    network_high, network_low: ネットワークアドレスの上位, 下位64ビット(uint64, IPv4はnetwork_lowのみ)
+    prefixlen: ネットワークのプレフィックス長(uint8)
+    organization: 組織名(<U)
+
+    Attributes:
+        ipinfo: IPアドレス情報の検索に使用するIPInfo
+
+    """
+
+    def __init__(self, ipinfo: IPInfo | None = None) -> None:
+        """ColumnarLookupインスタンスを初期化する.
+
+        Args:
+            ipinfo: IPアドレス情報の検索に使用するIPInfo, Noneの場合は環境変数の設定から作成する
+
+        Raises:
+            ConfigurationError: 設定が不正な場合
+
+        """
+        self.ipinfo = IPInfo() if ipinfo is None else ipinfo
+
+    def lookup(
+        self,
+        ip_addresses: Iterable[str],
+        max_workers: int = GEOIP_MAX_WORKERS,
+    ) -> dict[str, npt.NDArray[Any]]:
+        """複数のIPアドレス情報を列ごとの配列として取得する.
+
+        Args:
+            ip_addresses: 検索するIPアドレスの配列またはシーケンス
+            max_workers: GeoLite2 Web Serviceへ同時に発行するリクエストの最大数
+
+        Returns:
+            列名をキーとし, 入力と同じ長さの配列を値とする辞書
+
+        Raises:
+            RateLimitError: GeoLite2 Web Serviceへの問い合わせ数が上限に達した場合
+                検索できたIPアドレス情報はキャッシュされるため, 後で同じIPアドレスを再度検索できる
+            ValidationError: ip_addressesに不正なIPアドレスが含まれる場合
+
+        """
+        values = np.asarray(ip_addresses if isinstance(ip_addresses, np.ndarray) else list(ip_addresses), dtype=np.str_)
+        uniques, inverse = np.unique(values.ravel(), return_inverse=True)
+        results = self.ipinfo.lookup_many(uniques.tolist(), max_workers)
+
+        columns = _columns([results[ip_address] for ip_address in uniques.tolist()])
+        return {name: column[inverse] for name, column in columns.items()}
@@ -6,10 +6,138 @@ from typing import Final
 GEOIP_ACCOUNT_ID_ENV: Final[str] = "IPINFO_GEOIP_ACCOUNT_ID"
 GEOIP_LICENSE_KEY_ENV: Final[str] = "IPINFO_GEOIP_LICENSE_KEY"
 GEOIP_HOST_ENV: Final[str] = "IPINFO_GEOIP_HOST"
+GEOIP_POOL_SIZE_ENV: Final[str] = "IPINFO_GEOIP_POOL_SIZE"
+GEOIP_RATE_LIMIT_ENV: Final[str] = "IPINFO_GEOIP_RATE_LIMIT"
+GEOIP_RATE_LIMIT_BURST_ENV: Final[str] = "IPINFO_GEOIP_RATE_LIMIT_BURST"
+GEOIP_RATE_LIMIT_MAX_WAIT_ENV: Final[str] = "IPINFO_GEOIP_RATE_LIMIT_MAX_WAIT"
+GEOIP_RATE_LIMIT_SHARED_ENV: Final[str] = "IPINFO_GEOIP_RATE_LIMIT_SHARED"
+GEOIP_QUOTA_RESERVE_ENV: Final[str] = "IPINFO_GEOIP_QUOTA_RESERVE"
+GEOIP_TIMEOUT_ENV: Final[str] = "IPINFO_GEOIP_TIMEOUT"
+GEOIP_RETRIES_ENV: Final[str] = "IPINFO_GEOIP_RETRIES"
+GEOIP_BACKOFF_ENV: Final[str] = "IPINFO_GEOIP_BACKOFF"
+GEOIP_HEDGE_ENV: Final[str] = "IPINFO_GEOIP_HEDGE"
+GEOIP_HEDGE_DELAY_ENV: Final[str] = "IPINFO_GEOIP_HEDGE_DELAY"
+GEOIP_ENDPOINT_ENV: Final[str] = "IPINFO_GEOIP_ENDPOINT"
+RESOLVERS_ENV: Final[str] = "IPINFO_RESOLVERS"
+MMDB_ASN_PATH_ENV: Final[str] = "IPINFO_MMDB_ASN_PATH"
+MMDB_COUNTRY_PATH_ENV: Final[str] = "IPINFO_MMDB_COUNTRY_PATH"
 REDIS_URI_ENV: Final[str] = "IPINFO_REDIS_URI"
 REDIS_CACHE_TTL_ENV: Final[str] = "IPINFO_REDIS_CACHE_TTL"
+REDIS_STORAGE_ENV: Final[str] = "IPINFO_REDIS_STORAGE"
+REDIS_NEGATIVE_CACHE_TTL_ENV: Final[str] = "IPINFO_REDIS_NEGATIVE_CACHE_TTL"
+REDIS_MAX_CONNECTIONS_ENV: Final[str] = "IPINFO_REDIS_MAX_CONNECTIONS"
+REDIS_SOCKET_TIMEOUT_ENV: Final[str] = "IPINFO_REDIS_SOCKET_TIMEOUT"
+REDIS_CONNECT_TIMEOUT_ENV: Final[str] = "IPINFO_REDIS_CONNECT_TIMEOUT"
+REDIS_HEALTH_CHECK_INTERVAL_ENV: Final[str] = "IPINFO_REDIS_HEALTH_CHECK_INTERVAL"
+REDIS_KEEPALIVE_ENV: Final[str] = "IPINFO_REDIS_KEEPALIVE"
+REDIS_CLUSTER_ENV: Final[str] = "IPINFO_REDIS_CLUSTER"
+REDIS_CLIENT_CACHE_SIZE_ENV: Final[str] = "IPINFO_REDIS_CLIENT_CACHE_SIZE"
+REDIS_BREAKER_THRESHOLD_ENV: Final[str] = "IPINFO_REDIS_BREAKER_THRESHOLD"
+REDIS_BREAKER_RESET_TIMEOUT_ENV: Final[str] = "IPINFO_REDIS_BREAKER_RESET_TIMEOUT"
+CACHE_MAX_ENTRIES_ENV: Final[str] = "IPINFO_CACHE_MAX_ENTRIES"
+CACHE_TTL_ENV: Final[str] = "IPINFO_CACHE_TTL"
+CACHE_NEGATIVE_TTL_ENV: Final[str] = "IPINFO_CACHE_NEGATIVE_TTL"
+
+# 真偽値を表す環境変数の値
+TRUE_VALUES: Final[tuple[str, ...]] = ("1", "true", "yes", "on")
+FALSE_VALUES: Final[tuple[str, ...]] = ("0", "false", "no", "off")
 
 # IPData
+ADDRESS_CACHE_SIZE: Final[int] = 65_536
 AS_NUMBER_MIN: Final[int] = 1
 AS_NUMBER_MAX: Final[int] = 1_000_000
 COUNTRY_CODE_LENGTH: Final[int] = 2
+
+# GeoIPClient
+GEOIP_MAX_WORKERS: Final[int] = 8
+GEOIP_POOL_SIZE: Final[int] = GEOIP_MAX_WORKERS
+GEOIP_TIMEOUT: Final[float] = 10.0
+GEOIP_RETRIES: Final[int] = 2
+GEOIP_BACKOFF: Final[float] = 0.1
+GEOIP_BACKOFF_MAX: Final[float] = 2.0
+GEOIP_HEDGE: Final[bool] = False
+GEOIP_HEDGE_DELAY: Final[float] = 0.5
+GEOIP_ENDPOINT_COUNTRY: Final[str] = "country"
+GEOIP_ENDPOINT_CITY: Final[str] = "city"
+GEOIP_ENDPOINT_INSIGHTS: Final[str] = "insights"
+GEOIP_ENDPOINTS: Final[tuple[str, ...]] = (GEOIP_ENDPOINT_COUNTRY, GEOIP_ENDPOINT_CITY, GEOIP_ENDPOINT_INSIGHTS)
+GEOIP_ENDPOINT: Final[str] = GEOIP_ENDPOINT_CITY
+
+# LatencyTracker
+LATENCY_WINDOW: Final[int] = 256
+LATENCY_MIN_SAMPLES: Final[int] = 20
+LATENCY_PERCENTILE: Final[float] = 0.95
+
+# RateLimiter
+GEOIP_RATE_LIMIT: Final[float] = 0.0
+GEOIP_RATE_LIMIT_BURST: Final[int] = GEOIP_MAX_WORKERS
+GEOIP_RATE_LIMIT_MAX_WAIT: Final[float] = 1.0
+GEOIP_RATE_LIMIT_SHARED: Final[bool] = False
+GEOIP_RATE_LIMIT_KEY_PREFIX: Final[str] = "ipinfo:ratelimit:"
+GEOIP_QUOTA_RESERVE: Final[int] = 100
+GEOIP_QUOTA_TTL: Final[float] = 3_600.0
+
+# RedisClient
+REDIS_STORAGE_HASH: Final[str] = "hash"
+REDIS_STORAGE_NETWORK: Final[str] = "network"
+REDIS_STORAGE_BINARY: Final[str] = "binary"
+REDIS_STORAGE_MODES: Final[tuple[str, ...]] = (REDIS_STORAGE_HASH, REDIS_STORAGE_NETWORK, REDIS_STORAGE_BINARY)
+REDIS_BINARY_KEY_PREFIX: Final[bytes] = b"i:"
+REDIS_RANGE_PRUNE_BATCH: Final[int] = 1_000
+REDIS_RANGE_READ_BATCH: Final[int] = 10_000
+REDIS_MAX_CONNECTIONS: Final[int] = 64
+REDIS_SOCKET_TIMEOUT: Final[float] = 5.0
+REDIS_CONNECT_TIMEOUT: Final[float] = 2.0
+REDIS_HEALTH_CHECK_INTERVAL: Final[int] = 30
+REDIS_KEEPALIVE: Final[bool] = True
+REDIS_CLUSTER: Final[bool] = False
+REDIS_CLIENT_CACHE_SIZE: Final[int] = 0
+REDIS_BREAKER_THRESHOLD: Final[int] = 5
+REDIS_BREAKER_RESET_TIMEOUT: Final[float] = 30.0
+
+# CircuitBreaker
+CIRCUIT_CLOSED: Final[str] = "closed"
+CIRCUIT_OPEN: Final[str] = "open"
+CIRCUIT_HALF_OPEN: Final[str] = "half_open"
+
+# Resolver
+RESOLVER_MEMORY: Final[str] = "memory"
+RESOLVER_MMDB: Final[str] = "mmdb"
+RESOLVER_REDIS: Final[str] = "redis"
+RESOLVER_WEBSERVICE: Final[str] = "webservice"
+RESOLVERS: Final[tuple[str, ...]] = (RESOLVER_MEMORY, RESOLVER_MMDB, RESOLVER_REDIS, RESOLVER_WEBSERVICE)
+DEFAULT_RESOLVERS: Final[str] = f"{RESOLVER_MEMORY},{RESOLVER_REDIS},{RESOLVER_WEBSERVICE}"
+
+# CacheWarmer
+WARM_CHUNK_SIZE: Final[int] = 1_000
+WARM_IPV4_PREFIX: Final[int] = 24
+WARM_IPV6_PREFIX: Final[int] = 48
+
+# Enricher
+ENRICH_BATCH_SIZE: Final[int] = 1_000
+ENRICH_WINDOWS: Final[int] = 2
+ENRICH_FIELD: Final[str] = "ip"
+ENRICH_KEY: Final[str] = "ipinfo"
+
+# LogEnricher
+LOG_FORMAT_COMMON: Final[str] = "common"
+LOG_FORMAT_COMBINED: Final[str] = "combined"
+LOG_FORMAT_HAPROXY: Final[str] = "haproxy"
+LOG_PATTERNS: Final[dict[str, str]] = {
+    LOG_FORMAT_COMMON: r'^(?P<ip>\S+) \S+ \S+ \[[^\]]+\] "(?:[^"\\]|\\.)*" \d{3} (?:\d+|-)',
+    LOG_FORMAT_COMBINED: (
+        r'^(?P<ip>\S+) \S+ \S+ \[[^\]]+\] "(?:[^"\\]|\\.)*" \d{3} (?:\d+|-)'
+        r' "(?:[^"\\]|\\.)*" "(?:[^"\\]|\\.)*"'
+    ),
+    LOG_FORMAT_HAPROXY: r"\s(?P<ip>[0-9A-Fa-f:.]+):\d+\s\[",
+}
+LOG_OUTPUT_LINE: Final[str] = "line"
+LOG_OUTPUT_COLUMNS: Final[str] = "columns"
+LOG_OUTPUTS: Final[tuple[str, ...]] = (LOG_OUTPUT_LINE, LOG_OUTPUT_COLUMNS)
+LOG_DEDUPE_SIZE: Final[int] = 10_000
+LOG_EMPTY_FIELD: Final[str] = "-"
+
+# TTLCache
+CACHE_MAX_ENTRIES: Final[int] = 100_000
+CACHE_TTL: Final[int] = 86_400
+NEGATIVE_CACHE_TTL: Final[int] = 3_600
@@ -0,0 +1,184 @@
+"""IPアドレスまたはJSONレコードの行にIPアドレス情報を付加するクラス."""
+
+import json
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+
+from .constants import ENRICH_BATCH_SIZE, ENRICH_FIELD, ENRICH_KEY, ENRICH_WINDOWS, GEOIP_MAX_WORKERS
+from .exceptions import RateLimitError
+from .ipinfo import IPInfo
+from .to_address import _to_address
+
+_Record = dict[str, object]
+_Entry = tuple[_Record | None, str | None]
+_Results = tuple[dict[str, dict[str, str] | None], frozenset[str]]
+
+
+class Enricher:
+    """IPアドレスまたはJSONレコードの行にIPアドレス情報を付加するクラス.
+
+    入力はbatch_size行ずつのウィンドウに分け, ウィンドウごとに重複を除いたIPアドレスをlookup_manyでまとめて検索する
+    検索中のウィンドウはwindows個までとし, それを超える場合は入力の読み込みを待つため, メモリ使用量は入力の大きさによらない
+    出力の順序は入力と同じで, 空行は無視する
+
+    IPアドレスのみの行はIPアドレス情報の辞書(見つからない場合はip_addressのみ)を出力する
+    JSONオブジェクトの行はfieldのIPアドレスを検索し, keyにIPアドレス情報(見つからない場合はnull)を付加して出力する
+    解析できない行と不正なIPアドレスはerrorを付加して出力する
+    問い合わせ数の上限により検索できなかったIPアドレスと取得に失敗したIPアドレスも, それぞれ異なるerrorを付加して出力する
+
+    Attributes:
+        ipinfo: IPアドレス情報の検索に使用するIPInfo
+        field: JSONレコードのIPアドレスのキー
+        key: JSONレコードに付加するIPアドレス情報のキー
+
+    """
+
+    def __init__(self, ipinfo: IPInfo | None = None, field: str = ENRICH_FIELD, key: str = ENRICH_KEY) -> None:
+        """Enricherインスタンスを初期化する.
+
+        Args:
+            ipinfo: IPアドレス情報の検索に使用するIPInfo, Noneの場合は環境変数の設定から作成する
+            field: JSONレコードのIPアドレスのキー
+            key: JSONレコードに付加するIPアドレス情報のキー
+
+        Raises:
+            ConfigurationError: 設定が不正な場合
+
+        """
+        self.ipinfo = IPInfo() if ipinfo is None else ipinfo
+        self.field = field
+        self.key = key
+
+    def enrich(
+        self,
+        lines: Iterable[str],
+        batch_size: int = ENRICH_BATCH_SIZE,
+        max_workers: int = GEOIP_MAX_WORKERS,
+        windows: int = ENRICH_WINDOWS,
+    ) -> Iterator[str]:
+        """各行にIPアドレス情報を付加したNDJSONの行を返す.
+
+        Args:
+            lines: 入力の行
+            batch_size: 1つのウィンドウの行数
+            max_workers: GeoLite2 Web Serviceへ同時に発行するリクエストの最大数
+            windows: 同時に検索するウィンドウの最大数
+
+        Yields:
+            IPアドレス情報を付加したJSONの行(改行を含む)
+
+        """
+        iterator = iter(lines)
+        pending: deque[tuple[list[_Entry], Future[_Results]]] = deque()
+        with ThreadPoolExecutor(max_workers=windows, thread_name_prefix="ipinfo-enrich") as executor:
+            while True:
+                entries = [self._parse(line) for line in islice((line for line in iterator if line.strip()), batch_size)]
+                if entries:
+                    targets = [ip_address for _, ip_address in entries if ip_address is not None]
+                    pending.append((entries, executor.submit(self._lookup, targets, max_workers)))
+                while pending and (len(pending) >= windows or not entries):
+                    done, future = pending.popleft()
+                    results, deferred = future.result()
+                    yield "".join(self._format(record, ip_address, results, deferred) for record, ip_address in done)
+                if not entries:
+                    break
+
+    def _parse(self, line: str) -> _Entry:
+        """入力の行を解析する.
+
+        Args:
+            line: 入力の行
+
+        Returns:
+            出力するレコードと検索するIPアドレスのタプル
+            IPアドレスのみの行はレコードをNone, 検索しない場合はIPアドレスをNoneとする
+
+        """
+        text = line.strip()
+        if not text.startswith("{"):
+            invalid, address = self._validate({"ip_address": text}, text)
+            return (None if address is not None else invalid, address)
+
+        try:
+            record: _Record = json.loads(text)
+        except ValueError as e:
+            return ({"input": text, "error": str(e)}, None)
+
+        ip_address = record.get(self.field)
+        if not isinstance(ip_address, str):
+            record["error"] = f"Missing IP address field: {self.field}"
+            return (record, None)
+
+        return self._validate(record, ip_address)
+
+    @staticmethod
+    def _validate(record: _Record, ip_address: str) -> _Entry:
+        """IPアドレスを検証する.
+
+        Args:
+            record: 出力するレコード
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            出力するレコードと検索するIPアドレスのタプル
+            IPアドレスが不正な場合はerrorを付加し, IPアドレスをNoneとする
+
+        """
+        try:
+            _ = _to_address(ip_address)
+        except ValueError as e:
+            record["error"] = str(e)
+            return (record, None)
+
+        return (record, ip_address)
+
+    def _lookup(self, ip_addresses: list[str], max_workers: int) -> _Results:
+        """1つのウィンドウのIPアドレス情報をまとめて検索する.
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+            max_workers: GeoLite2 Web Serviceへ同時に発行するリクエストの最大数
+
+        Returns:
+            IPアドレスをキーとするIPアドレス情報の辞書と, 問い合わせ数の上限により検索できなかったIPアドレスのタプル
+            検索できなかったIPアドレスと取得に失敗したIPアドレスは辞書に含まない
+
+        """
+        try:
+            return (self.ipinfo.lookup_many(ip_addresses, max_workers), frozenset())
+        except RateLimitError as e:
+            return (e.details["results"], frozenset(e.details["ip_addresses"]))
+
+    def _format(
+        self,
+        record: _Record | None,
+        ip_address: str | None,
+        results: dict[str, dict[str, str] | None],
+        deferred: frozenset[str],
+    ) -> str:
+        """レコードにIPアドレス情報を付加してJSONの行に変換する.
+
+        Args:
+            record: 出力するレコード, IPアドレスのみの行はNone
+            ip_address: 検索したIPアドレス, 検索しなかった場合はNone
+            results: IPアドレスをキーとするIPアドレス情報の辞書
+            deferred: 問い合わせ数の上限により検索できなかったIPアドレス
+
+        Returns:
+            JSONの行(改行を含む)
+
+        """
+        output: _Record = {"ip_address": ip_address} if record is None else record
+        if ip_address is not None:
+            if ip_address in deferred:
+                output["error"] = "GeoIP query quota exhausted"
+            elif ip_address not in results:
+                output["error"] = "GeoIP lookup failed"
+            elif record is None:
+                output = dict(results[ip_address] or output)
+            else:
+                output[self.key] = results[ip_address]
+
+        return json.dumps(output, ensure_ascii=False) + "\n"
@@ -24,6 +24,14 @@ class GeoIPClientError(IPInfoError):
     """GeoIPクライアント関連の例外."""
 
 
+class AddressNotFoundError(GeoIPClientError):
+    """IPアドレスが見つからない場合の例外."""
+
+
+class RateLimitError(GeoIPClientError):
+    """GeoLite2 Web Serviceへの問い合わせ数が上限に達した場合の例外."""
+
+
 class RedisClientError(IPInfoError):
     """Redisクライアント関連の例外."""
 
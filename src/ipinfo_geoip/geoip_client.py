@@ -1,19 +1,114 @@
 """GeoLite2 Web Serviceクライアント."""
 
-import ipaddress
-from collections import UserDict
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
 
+import aiohttp
 import geoip2.errors
-import geoip2.webservice
+import requests
 
-from .exceptions import ConfigurationError, GeoIPClientError, ValidationError
+from .client_pool import ClientPool
+from .constants import GEOIP_BACKOFF_MAX, GEOIP_MAX_WORKERS
+from .exceptions import AddressNotFoundError, ConfigurationError, GeoIPClientError, RateLimitError, ValidationError
 from .geoip_config import GeoIPConfig
+from .geoip_response import GeoIPResponse, ProjectionClient
 from .ipdata import IPData
-from .to_str import _to_str
+from .latency_tracker import LatencyTracker
+from .rate_limiter import _get_rate_limiter
+from .single_flight import SingleFlight
+from .to_address import _to_address
 
+logger = logging.getLogger(__name__)
 
-class GeoIPClient(UserDict[str, IPData | None]):
-    """GeoLite2 Web Serviceクライアント."""
+
+def _to_ip_data(ip_address: str, response: GeoIPResponse | None) -> IPData | None:
+    """GeoLite2 Web ServiceのレスポンスをIPアドレス情報に変換する.
+
+    Args:
+        ip_address: IPアドレス
+        response: GeoLite2 Web Serviceのレスポンス
+
+    Returns:
+        IPアドレス情報
+        レスポンスがNoneまたは不完全な場合はNone
+
+    """
+    if response is None:
+        return None
+
+    if response.network == "" or response.as_number == "" or response.country == "" or response.organization == "":
+        return None
+
+    return IPData(ip_address, response.network, response.as_number, response.country, response.organization)
+
+
+def _is_transient(error: Exception) -> bool:
+    """再試行で回復する可能性のあるエラーか判定する.
+
+    Args:
+        error: リクエストのエラー
+
+    Returns:
+        サーバーエラー, 429, 接続エラー, タイムアウトの場合True
+
+    """
+    if isinstance(error, geoip2.errors.HTTPError):
+        return error.http_status is None or error.http_status >= 500 or error.http_status == 429  # noqa: PLR2004
+
+    return isinstance(
+        error,
+        (requests.ConnectionError, requests.Timeout, aiohttp.ClientConnectionError, asyncio.TimeoutError),
+    )
+
+
+def _backoff(attempt: int, base: float) -> float:
+    """再試行までの待ち時間を返す.
+
+    指数バックオフの上限までの一様乱数(フルジッター)とし, 同時に失敗したリクエストの再試行を分散する
+
+    Args:
+        attempt: 失敗したリクエストの回数から1を引いた値
+        base: 待ち時間の基準(秒)
+
+    Returns:
+        待ち時間(秒)
+
+    """
+    return random.uniform(0, min(GEOIP_BACKOFF_MAX, base * 2**attempt))  # noqa: S311
+
+
+def _retry_error(ip_address: str, attempts: int, error: Exception) -> GeoIPClientError:
+    """再試行しても失敗したことを表す例外を作成する.
+
+    Args:
+        ip_address: IPアドレス
+        attempts: リクエストの回数
+        error: 最後のリクエストのエラー
+
+    Returns:
+        GeoIPClientError
+
+    """
+    msg = f"GeoIP request failed: {ip_address}"
+    return GeoIPClientError(msg, {"ip_address": ip_address, "attempts": attempts, "error": str(error)})
+
+
+class GeoIPClient:
+    """GeoLite2 Web Serviceクライアント.
+
+    geoip2.webservice.ClientはHTTPセッションを1つしか持たないため
+    スレッドごとにプールからクライアントを借りてリクエストを発行する
+    問い合わせ数は同じアカウントのクライアントで共有するレートリミッターで制限する
+    一時的なエラーはジッター付きの指数バックオフで再試行する
+    hedgeを有効にすると, 応答が直近のp95より遅い場合に同じリクエストをもう1つ発行し, 先に返った応答を使用する
+    レスポンスはgeoip2.modelsのモデルを作成せず, 必要なフィールドのみをGeoIPResponseに取り出す
+    取得したIPアドレス情報は保持しない(プロセス内のキャッシュはIPInfoが持つ)
+    """
 
     def __init__(self) -> None:
         """GeoIPClientインスタンスを初期化する.
@@ -22,19 +117,37 @@ class GeoIPClient(UserDict[str, IPData | None]):
             ConfigurationError: 必要な認証情報が不足している場合
 
         """
-        super().__init__()
-
         try:
             config = GeoIPConfig.from_env()
+            self.limiter = _get_rate_limiter(config)
         except ValidationError as e:
             msg = "GeoIP configuration error"
             raise ConfigurationError(msg, {"error": str(e)}) from e
 
-        self.client = geoip2.webservice.Client(config.account_id, config.license_key, config.host)
+        pool_size = config.pool_size * 2 if config.hedge else config.pool_size
+        self.clients: ClientPool[ProjectionClient] = ClientPool(
+            partial(
+                ProjectionClient,
+                config.account_id,
+                config.license_key,
+                config.host,
+                timeout=config.timeout,
+            ),
+            pool_size,
+        )
+        self.endpoint = config.endpoint
+        self.retries = config.retries
+        self.backoff = config.backoff
+        self.hedge_delay = config.hedge_delay
+        self.latency = LatencyTracker()
+        self._executor = ThreadPoolExecutor(pool_size, thread_name_prefix="geoip-hedge") if config.hedge else None
+        self._flight: SingleFlight[str, IPData | None] = SingleFlight()
 
-    def __missing__(self, ip_address: str) -> IPData | None:
+    def get(self, ip_address: str) -> IPData | None:
         """指定されたIPアドレス情報を取得する.
 
+        同じIPアドレスに対する同時のリクエストは1回に集約される
+
         Args:
             ip_address: 検索するIPアドレス
 
@@ -43,35 +156,210 @@ class GeoIPClient(UserDict[str, IPData | None]):
             見つからない場合はNone
 
         Raises:
-            GeoIPClientError: GeoLite2 Web Serviceでエラーが発生した場合
+            AddressNotFoundError: IPアドレスが見つからない場合
+            RateLimitError: 問い合わせ数が上限に達した場合
             ValidationError: ip_addressが不正な場合
 
         """
         try:
-            _ = ipaddress.ip_address(ip_address)
+            _ = _to_address(ip_address)
         except ValueError as e:
             msg = f"Invalid IP address: {ip_address}"
             raise ValidationError(msg, {"error": str(e)}) from e
 
+        return self._flight.do(ip_address, partial(self._fetch, ip_address))
+
+    def _fetch(self, ip_address: str, *, batch: bool = False) -> IPData | None:
+        """GeoLite2 Web ServiceからIPアドレス情報を取得する.
+
+        レスポンスに含まれる残りの問い合わせ数をレートリミッターに記録する
+
+        Args:
+            ip_address: 検索するIPアドレス
+            batch: 一括取得の場合True
+
+        Returns:
+            GeoLite2 Web Serviceから取得したIPアドレス情報
+            見つからない場合はNone
+
+        Raises:
+            AddressNotFoundError: IPアドレスが見つからない場合
+            GeoIPClientError: 再試行しても一時的なエラーが続いた場合
+            RateLimitError: 問い合わせ数が上限に達した場合
+
+        """
         try:
-            response = self.client.city(ip_address)
+            response = self._request_with_retries(ip_address, batch=batch)
         except geoip2.errors.AddressNotFoundError as e:
             msg = f"Address not found: {ip_address}"
-            raise GeoIPClientError(msg, {"ip_address": ip_address, "error": str(e)}) from e
+            raise AddressNotFoundError(msg, {"ip_address": ip_address, "error": str(e)}) from e
 
-        if response is None:
-            return None
+        if response is not None:
+            self.limiter.update(response.queries_remaining)
+        return _to_ip_data(ip_address, response)
 
-        network = _to_str(response.traits.network)
-        as_number = _to_str(response.traits.autonomous_system_number)
-        country = _to_str(response.country.iso_code)
-        organization = _to_str(response.traits.autonomous_system_organization)
+    def _request_with_retries(self, ip_address: str, *, batch: bool) -> GeoIPResponse:
+        """一時的なエラーを再試行しながらリクエストを発行する.
 
-        if network == "" or as_number == "" or country == "" or organization == "":
-            return None
+        再試行のリクエストも問い合わせ数の制限を受ける
+
+        Args:
+            ip_address: 検索するIPアドレス
+            batch: 一括取得の場合True
+
+        Returns:
+            GeoLite2 Web Serviceのレスポンス
 
-        ip_data = IPData(ip_address, network, as_number, country, organization)
+        Raises:
+            GeoIPClientError: 再試行しても一時的なエラーが続いた場合
+            RateLimitError: 問い合わせ数が上限に達した場合
+
+        """
+        attempt = 0
+        while True:
+            self.limiter.acquire(batch=batch)
+            try:
+                if self._executor is None:
+                    return self._request(ip_address)
+                return self._hedged(self._executor, ip_address, batch=batch)
+            except Exception as e:
+                if not _is_transient(e):
+                    raise
+                if attempt >= self.retries:
+                    raise _retry_error(ip_address, attempt + 1, e) from e
+            time.sleep(_backoff(attempt, self.backoff))
+            attempt += 1
 
-        super().__setitem__(ip_address, ip_data)
+    def _request(self, ip_address: str) -> GeoIPResponse:
+        """プールから借りたクライアントでリクエストを1回発行し, 所要時間を記録する.
 
-        return ip_data
+        Args:
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            GeoLite2 Web Serviceのレスポンス
+
+        """
+        started = time.monotonic()
+        with self.clients.acquire() as client:
+            response = client.lookup(self.endpoint, ip_address)
+        self.latency.record(time.monotonic() - started)
+        return response
+
+    def _hedged(self, executor: ThreadPoolExecutor, ip_address: str, *, batch: bool) -> GeoIPResponse:
+        """応答が遅い場合に同じリクエストをもう1つ発行し, 先に成功した応答を返す.
+
+        2つ目のリクエストは直近の所要時間のp95(記録が少ない間はhedge_delay)が経過しても応答がない場合に発行する
+        問い合わせ数の制限を待たずに発行できない場合は発行しない
+
+        Args:
+            executor: リクエストを発行するスレッドプール
+            ip_address: 検索するIPアドレス
+            batch: 一括取得の場合True
+
+        Returns:
+            GeoLite2 Web Serviceのレスポンス
+
+        """
+        primary = executor.submit(self._request, ip_address)
+        done, _ = wait([primary], timeout=self.latency.percentile(self.hedge_delay))
+        if done or not self._hedge_allowed(batch=batch):
+            return primary.result()
+
+        futures: set[Future[GeoIPResponse]] = {primary, executor.submit(self._request, ip_address)}
+        while True:
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            succeeded = [future for future in done if future.exception() is None]
+            if succeeded or not futures:
+                return (succeeded or list(done))[0].result()
+
+    def _hedge_allowed(self, *, batch: bool) -> bool:
+        """2つ目のリクエストを待たずに発行できるか判定する.
+
+        Args:
+            batch: 一括取得の場合True
+
+        Returns:
+            問い合わせ数の制限内で発行できる場合True
+
+        """
+        try:
+            return self.limiter.reserve(batch=batch) == 0
+        except RateLimitError:
+            return False
+
+    def get_many(self, ip_addresses: Iterable[str], max_workers: int = GEOIP_MAX_WORKERS) -> dict[str, IPData | None]:
+        """複数のIPアドレス情報を並列に取得する.
+
+        同時に発行するリクエスト数はmax_workersで制限される
+        見つからないIPアドレスはNoneとなる
+        再試行しても取得に失敗したIPアドレスはログに記録して結果に含めず, 他のIPアドレスの取得は続ける
+        一括取得として問い合わせ数の制限を待ち, 1件ずつの取得のために残しておく問い合わせ数は使用しない
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+            max_workers: 同時に発行するリクエストの最大数
+
+        Returns:
+            IPアドレスをキーとするIPアドレス情報の辞書(取得に失敗したIPアドレスは含まない)
+
+        Raises:
+            RateLimitError: 問い合わせ数が上限に達した場合
+                (detailsのip_addressesに取得しなかったIPアドレス, resultsに取得したIPアドレス情報の辞書)
+            ValidationError: ip_addressesに不正なIPアドレスが含まれる場合
+
+        """
+        targets = list(dict.fromkeys(ip_addresses))
+        for ip_address in targets:
+            try:
+                _ = _to_address(ip_address)
+            except ValueError as e:
+                msg = f"Invalid IP address: {ip_address}"
+                raise ValidationError(msg, {"error": str(e)}) from e
+
+        if not targets:
+            return {}
+
+        deferred: list[str] = []
+        failed: list[str] = []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(targets))) as executor:
+            results = dict(
+                zip(
+                    targets,
+                    executor.map(partial(self._get_or_none, deferred=deferred, failed=failed), targets),
+                    strict=True,
+                )
+            )
+
+        unresolved = {*deferred, *failed}
+        found = {ip_address: ip_data for ip_address, ip_data in results.items() if ip_address not in unresolved}
+        if deferred:
+            msg = "GeoIP query quota exhausted"
+            raise RateLimitError(msg, {"ip_addresses": deferred, "results": found})
+
+        return found
+
+    def _get_or_none(self, ip_address: str, deferred: list[str], failed: list[str]) -> IPData | None:
+        """一括取得としてIPアドレス情報を取得し, 見つからない場合はNoneを返す.
+
+        Args:
+            ip_address: 検索するIPアドレス
+            deferred: 問い合わせ数の上限により取得しなかったIPアドレスを追加するリスト
+            failed: 再試行しても取得に失敗したIPアドレスを追加するリスト
+
+        Returns:
+            IPアドレス情報
+            見つからない場合, 取得しなかった場合, または取得に失敗した場合はNone
+
+        """
+        try:
+            return self._flight.do(ip_address, partial(self._fetch, ip_address, batch=True))
+        except AddressNotFoundError:
+            return None
+        except RateLimitError:
+            deferred.append(ip_address)
+            return None
+        except GeoIPClientError as e:
+            logger.warning("Failed to get %s: %s", ip_address, e.message)
+            failed.append(ip_address)
+            return None
@@ -3,8 +3,38 @@
 import os
 from typing import Self
 
-from .constants import GEOIP_ACCOUNT_ID_ENV, GEOIP_HOST_ENV, GEOIP_LICENSE_KEY_ENV
+from .constants import (
+    GEOIP_ACCOUNT_ID_ENV,
+    GEOIP_BACKOFF,
+    GEOIP_BACKOFF_ENV,
+    GEOIP_ENDPOINT,
+    GEOIP_ENDPOINT_ENV,
+    GEOIP_ENDPOINTS,
+    GEOIP_HEDGE,
+    GEOIP_HEDGE_DELAY,
+    GEOIP_HEDGE_DELAY_ENV,
+    GEOIP_HEDGE_ENV,
+    GEOIP_HOST_ENV,
+    GEOIP_LICENSE_KEY_ENV,
+    GEOIP_POOL_SIZE,
+    GEOIP_POOL_SIZE_ENV,
+    GEOIP_QUOTA_RESERVE,
+    GEOIP_QUOTA_RESERVE_ENV,
+    GEOIP_RATE_LIMIT,
+    GEOIP_RATE_LIMIT_BURST,
+    GEOIP_RATE_LIMIT_BURST_ENV,
+    GEOIP_RATE_LIMIT_ENV,
+    GEOIP_RATE_LIMIT_MAX_WAIT,
+    GEOIP_RATE_LIMIT_MAX_WAIT_ENV,
+    GEOIP_RATE_LIMIT_SHARED,
+    GEOIP_RATE_LIMIT_SHARED_ENV,
+    GEOIP_RETRIES,
+    GEOIP_RETRIES_ENV,
+    GEOIP_TIMEOUT,
+    GEOIP_TIMEOUT_ENV,
+)
 from .exceptions import ValidationError
+from .to_bool import _to_bool
 
 
 class GeoIPConfig:
@@ -14,22 +44,109 @@ class GeoIPConfig:
         account_id: アカウントID
         license_key: ライセンスキー
         host: ホスト名
+        pool_size: スレッド間で共有するクライアントの最大数
+        rate_limit: 1秒あたりの問い合わせ数の上限, 0は制限しない
+        rate_limit_burst: 連続して発行できる問い合わせ数
+        rate_limit_max_wait: 1件ずつの取得が問い合わせ数の制限を待つ最大秒数
+        rate_limit_shared: Redisのカウンターで複数のプロセス間の問い合わせ数を制限するか
+        quota_reserve: 一括取得で使用せず, 1件ずつの取得のために残しておく問い合わせ数
+        timeout: 1回のリクエストのタイムアウト(秒)
+        retries: 一時的なエラーで再試行する最大回数
+        backoff: 再試行までの待ち時間の基準(秒), 再試行ごとに2倍にしてジッターを加える
+        hedge: 応答が遅い場合に同じリクエストをもう1つ発行するか
+        hedge_delay: 2つ目のリクエストを発行するまでの秒数, 所要時間が十分に記録された後はそのp95を使用する
+        endpoint: 問い合わせるエンドポイント(country, city, insights)
 
     """
 
-    def __init__(self, account_id: str, license_key: str, host: str) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        account_id: str,
+        license_key: str,
+        host: str,
+        pool_size: str = str(GEOIP_POOL_SIZE),
+        *,
+        rate_limit: str = str(GEOIP_RATE_LIMIT),
+        rate_limit_burst: str = str(GEOIP_RATE_LIMIT_BURST),
+        rate_limit_max_wait: str = str(GEOIP_RATE_LIMIT_MAX_WAIT),
+        rate_limit_shared: str = str(GEOIP_RATE_LIMIT_SHARED),
+        quota_reserve: str = str(GEOIP_QUOTA_RESERVE),
+        timeout: str = str(GEOIP_TIMEOUT),
+        retries: str = str(GEOIP_RETRIES),
+        backoff: str = str(GEOIP_BACKOFF),
+        hedge: str = str(GEOIP_HEDGE),
+        hedge_delay: str = str(GEOIP_HEDGE_DELAY),
+        endpoint: str = GEOIP_ENDPOINT,
+    ) -> None:
         """GeoIPConfigインスタンスを初期化する.
 
         Args:
             account_id: アカウントID
             license_key: ライセンスキー
             host: ホスト名
+            pool_size: スレッド間で共有するクライアントの最大数
+            rate_limit: 1秒あたりの問い合わせ数の上限, 0は制限しない
+            rate_limit_burst: 連続して発行できる問い合わせ数
+            rate_limit_max_wait: 1件ずつの取得が問い合わせ数の制限を待つ最大秒数
+            rate_limit_shared: Redisのカウンターで複数のプロセス間の問い合わせ数を制限するか
+            quota_reserve: 一括取得で使用せず, 1件ずつの取得のために残しておく問い合わせ数
+            timeout: 1回のリクエストのタイムアウト(秒)
+            retries: 一時的なエラーで再試行する最大回数
+            backoff: 再試行までの待ち時間の基準(秒), 再試行ごとに2倍にしてジッターを加える
+            hedge: 応答が遅い場合に同じリクエストをもう1つ発行するか
+            hedge_delay: 2つ目のリクエストを発行するまでの秒数, 所要時間が十分に記録された後はそのp95を使用する
+            endpoint: 問い合わせるエンドポイント(country, city, insights)
+
+        Raises:
+            ValidationError: クライアントの最大数, 問い合わせ数の制限, タイムアウト, 再試行, エンドポイントの設定が不正な場合
 
         """
         self.account_id = int(account_id)
         self.license_key = license_key
         self.host = host
 
+        if endpoint not in GEOIP_ENDPOINTS:
+            msg = f"GeoIP endpoint must be one of {', '.join(GEOIP_ENDPOINTS)}"
+            raise ValidationError(msg)
+
+        self.endpoint = endpoint
+
+        try:
+            self.pool_size = int(pool_size)
+            self.rate_limit = float(rate_limit)
+            self.rate_limit_burst = int(rate_limit_burst)
+            self.rate_limit_max_wait = float(rate_limit_max_wait)
+            self.quota_reserve = int(quota_reserve)
+            self.timeout = float(timeout)
+            self.retries = int(retries)
+            self.backoff = float(backoff)
+            self.hedge_delay = float(hedge_delay)
+        except ValueError as e:
+            raise ValidationError(str(e)) from e
+
+        self.rate_limit_shared = _to_bool("GeoIP rate limit shared", rate_limit_shared)
+        self.hedge = _to_bool("GeoIP hedge", hedge)
+
+        if self.pool_size < 1:
+            msg = "GeoIP client pool size must be positive"
+            raise ValidationError(msg)
+
+        if self.rate_limit < 0 or self.rate_limit_max_wait < 0 or self.quota_reserve < 0:
+            msg = "GeoIP rate limit, max wait and quota reserve must not be negative"
+            raise ValidationError(msg)
+
+        if self.rate_limit_burst < 1:
+            msg = "GeoIP rate limit burst must be positive"
+            raise ValidationError(msg)
+
+        if self.timeout <= 0 or self.hedge_delay <= 0:
+            msg = "GeoIP timeout and hedge delay must be positive"
+            raise ValidationError(msg)
+
+        if self.retries < 0 or self.backoff < 0:
+            msg = "GeoIP retries and backoff must not be negative"
+            raise ValidationError(msg)
+
     @classmethod
     def from_env(cls) -> Self:
         """環境変数からGeoIPConfigインスタンスを作成する.
@@ -38,7 +155,7 @@ class GeoIPConfig:
             環境変数から作成されたGeoIPConfigインスタンス
 
         Raises:
-            ValidationError: 必要な環境変数が設定されていない場合
+            ValidationError: 必要な環境変数が設定されていない場合, または値が不正な場合
 
         """
         missing_vars = []
@@ -56,5 +173,22 @@ class GeoIPConfig:
         account_id = os.environ[GEOIP_ACCOUNT_ID_ENV]
         license_key = os.environ[GEOIP_LICENSE_KEY_ENV]
         host = os.environ[GEOIP_HOST_ENV]
-
-        return cls(account_id, license_key, host)
+        pool_size = os.environ.get(GEOIP_POOL_SIZE_ENV, str(GEOIP_POOL_SIZE))
+
+        return cls(
+            account_id,
+            license_key,
+            host,
+            pool_size,
+            rate_limit=os.environ.get(GEOIP_RATE_LIMIT_ENV, str(GEOIP_RATE_LIMIT)),
+            rate_limit_burst=os.environ.get(GEOIP_RATE_LIMIT_BURST_ENV, str(GEOIP_RATE_LIMIT_BURST)),
+            rate_limit_max_wait=os.environ.get(GEOIP_RATE_LIMIT_MAX_WAIT_ENV, str(GEOIP_RATE_LIMIT_MAX_WAIT)),
+            rate_limit_shared=os.environ.get(GEOIP_RATE_LIMIT_SHARED_ENV, str(GEOIP_RATE_LIMIT_SHARED)),
+            quota_reserve=os.environ.get(GEOIP_QUOTA_RESERVE_ENV, str(GEOIP_QUOTA_RESERVE)),
+            timeout=os.environ.get(GEOIP_TIMEOUT_ENV, str(GEOIP_TIMEOUT)),
+            retries=os.environ.get(GEOIP_RETRIES_ENV, str(GEOIP_RETRIES)),
+            backoff=os.environ.get(GEOIP_BACKOFF_ENV, str(GEOIP_BACKOFF)),
+            hedge=os.environ.get(GEOIP_HEDGE_ENV, str(GEOIP_HEDGE)),
+            hedge_delay=os.environ.get(GEOIP_HEDGE_DELAY_ENV, str(GEOIP_HEDGE_DELAY)),
+            endpoint=os.environ.get(GEOIP_ENDPOINT_ENV, GEOIP_ENDPOINT),
+        )
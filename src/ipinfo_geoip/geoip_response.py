@@ -0,0 +1,123 @@
+"""GeoLite2 Web Serviceのレスポンスから必要なフィールドのみを取り出すモデルとクライアント."""
+
+import ipaddress
+from collections.abc import Sequence
+from typing import cast
+
+import geoip2.webservice
+
+
+def _record(body: dict[str, object], name: str) -> dict[str, object]:
+    """レスポンスのJSONからレコードを取り出す.
+
+    Args:
+        body: レスポンスのJSON
+        name: レコード名
+
+    Returns:
+        レコード
+        存在しない場合は空の辞書
+
+    """
+    record = body.get(name)
+    return record if isinstance(record, dict) else {}
+
+
+def _field(record: dict[str, object], name: str) -> str:
+    """レコードからフィールドを文字列として取り出す.
+
+    Args:
+        record: レコード
+        name: フィールド名
+
+    Returns:
+        フィールドの文字列
+        存在しない場合は""
+
+    """
+    value = record.get(name)
+    if isinstance(value, bool) or not isinstance(value, (str, int)):
+        return ""
+
+    return str(value)
+
+
+class GeoIPResponse:
+    """GeoLite2 Web Serviceのレスポンスのうち, IPアドレス情報に必要なフィールドのみを保持するクラス.
+
+    geoip2.modelsのモデルは都市, 地域, 各言語の名前などすべてのレコードを作成するが,
+    このクラスはデコードしたJSONからネットワーク, AS番号, 国コード, 組織名, 残りの問い合わせ数のみを取り出す
+    geoip2.webservice.Clientのモデルと同じ引数で作成できる
+
+    Attributes:
+        network: IPネットワーク(CIDRブロック), 空の場合は""
+        as_number: 自律システム番号, 空の場合は""
+        country: ISO国コード, 空の場合は""
+        organization: 組織名, 空の場合は""
+        queries_remaining: 残りの問い合わせ数, 不明な場合はNone
+
+    """
+
+    __slots__ = ("as_number", "country", "network", "organization", "queries_remaining")
+
+    def __init__(self, locales: Sequence[str] | None = None, /, **body: object) -> None:  # noqa: ARG002
+        """デコードしたJSONからGeoIPResponseインスタンスを作成する.
+
+        Args:
+            locales: geoip2.webservice.Clientが渡す言語の優先順位(使用しない)
+            body: デコードしたレスポンスのJSON
+
+        """
+        traits = _record(body, "traits")
+        self.network = _field(traits, "network")
+        if self.network == "" and "prefix_len" in traits:
+            try:
+                self.network = str(ipaddress.ip_network(f"{traits.get('ip_address')}/{traits['prefix_len']}", strict=False))
+            except ValueError:
+                self.network = ""
+        self.as_number = _field(traits, "autonomous_system_number")
+        self.country = _field(_record(body, "country"), "iso_code")
+        self.organization = _field(traits, "autonomous_system_organization")
+
+        queries_remaining = _record(body, "maxmind").get("queries_remaining")
+        self.queries_remaining = queries_remaining if isinstance(queries_remaining, int) else None
+
+
+class ProjectionClient(geoip2.webservice.Client):
+    """レスポンスをGeoIPResponseとして作成するGeoLite2 Web Serviceクライアント.
+
+    認証, タイムアウト, エラーの処理はgeoip2.webservice.Clientのものを使用する
+    """
+
+    def lookup(self, endpoint: str, ip_address: str) -> GeoIPResponse:
+        """指定されたエンドポイントにIPアドレスを問い合わせる.
+
+        Args:
+            endpoint: 問い合わせるエンドポイント(country, city, insights)
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            GeoLite2 Web Serviceのレスポンス
+
+        """
+        return cast("GeoIPResponse", self._response_for(endpoint, GeoIPResponse, ip_address))  # type: ignore[arg-type]
+
+
+class AsyncProjectionClient(geoip2.webservice.AsyncClient):
+    """レスポンスをGeoIPResponseとして作成するGeoLite2 Web Service非同期クライアント.
+
+    認証, タイムアウト, エラーの処理はgeoip2.webservice.AsyncClientのものを使用する
+    """
+
+    async def lookup(self, endpoint: str, ip_address: str) -> GeoIPResponse:
+        """指定されたエンドポイントにIPアドレスを問い合わせる.
+
+        Args:
+            endpoint: 問い合わせるエンドポイント(country, city, insights)
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            GeoLite2 Web Serviceのレスポンス
+
+        """
+        return cast("GeoIPResponse", await self._response_for(endpoint, GeoIPResponse, ip_address))  # type: ignore[arg-type]
@@ -1,15 +1,24 @@
 """IPアドレス情報データモデル."""
 
 import ipaddress
-from dataclasses import dataclass
+import sys
 
 from .constants import AS_NUMBER_MAX, AS_NUMBER_MIN, COUNTRY_CODE_LENGTH
 from .exceptions import ValidationError
+from .to_address import _to_address, _to_network
 
 
-@dataclass
 class IPData:
-    """IPアドレス情報を表すデータクラス.
+    """IPアドレス情報を表すクラス.
+
+    大量のレコードを保持できるよう, フィールドはコンパクトな形式で保存する
+    IPアドレス, ネットワーク, AS番号は1つのバイト列にパックして保存し,
+    繰り返し現れる国コードと組織名はインターンした文字列を共有する
+    各フィールドは従来どおり文字列として参照できる
+
+    バイト列の形式は以下のとおり(AS番号はビッグエンディアン, 空の場合は0)
+    IPアドレス長(1) + ネットワークアドレス長(1) + IPアドレス + ネットワークアドレス + プレフィックス長(1) + AS番号(4)
+    ネットワークが空の場合はネットワークアドレス長を0とし, ネットワークアドレスとプレフィックス長を省略する
 
     Attributes:
         ip_address: IPアドレス
@@ -23,40 +32,196 @@ class IPData:
 
     """
 
-    ip_address: str
-    network: str
-    as_number: str
-    country: str
-    organization: str
+    __slots__ = ("_packed", "country", "organization")
+
+    def __init__(self, ip_address: str, network: str, as_number: str | int, country: str, organization: str) -> None:
+        """IPDataインスタンスを初期化する.
 
-    def __post_init__(self) -> None:
-        """オブジェクト初期化後のバリデーション.
+        Args:
+            ip_address: IPアドレス
+            network: IPネットワーク(CIDRブロック), 空の場合は""
+            as_number: 自律システム番号, 空の場合は""
+            country: ISO国コード, 空の場合は""
+            organization: 組織名, 空の場合は""
 
         Raises:
             ValidationError: フィールドの値が無効な場合
 
         """
         try:
-            _ = ipaddress.ip_address(self.ip_address)
+            address = _to_address(ip_address).packed
         except ValueError as e:
             raise ValidationError(str(e)) from e
 
-        if self.network != "":
+        packed_network = b""
+        if network != "":
             try:
-                _ = ipaddress.ip_network(self.network)
+                parsed = ipaddress.ip_network(network)
             except ValueError as e:
                 raise ValidationError(str(e)) from e
+            packed_network = parsed.network_address.packed + bytes([parsed.prefixlen])
 
-        if self.as_number != "":
-            as_number = int(self.as_number)
-            if as_number < AS_NUMBER_MIN or as_number >= AS_NUMBER_MAX:
+        asn = 0
+        if as_number != "":
+            try:
+                asn = int(as_number)
+            except ValueError as e:
+                raise ValidationError(str(e)) from e
+            if asn < AS_NUMBER_MIN or asn >= AS_NUMBER_MAX:
                 msg = f"AS number must be between {AS_NUMBER_MIN} and {AS_NUMBER_MAX - 1}"
                 raise ValidationError(msg)
 
-        if self.country != "" and len(self.country) != COUNTRY_CODE_LENGTH:
+        if country != "" and len(country) != COUNTRY_CODE_LENGTH:
             msg = f"Country code must be {COUNTRY_CODE_LENGTH} characters"
             raise ValidationError(msg)
 
+        self._set(address, packed_network, asn, country, organization)
+
+    @classmethod
+    def from_trusted(cls, ip_address: str, network: str, as_number: str | int, country: str, organization: str) -> "IPData":
+        """検証済みのフィールドからIPDataインスタンスを作成する.
+
+        キャッシュに保存されたデータなど, 保存時に検証済みのフィールドに使用する
+        IPアドレスとネットワークの解析結果を再利用し, 値の範囲の検証を省略する
+
+        Args:
+            ip_address: IPアドレス
+            network: IPネットワーク(CIDRブロック), 空の場合は""
+            as_number: 自律システム番号, 空の場合は""
+            country: ISO国コード, 空の場合は""
+            organization: 組織名, 空の場合は""
+
+        Returns:
+            IPDataインスタンス
+
+        Raises:
+            ValidationError: フィールドの値を解析できない場合
+
+        """
+        try:
+            address = _to_address(ip_address).packed
+            packed_network = b""
+            if network != "":
+                parsed = _to_network(network)
+                packed_network = parsed.network_address.packed + bytes([parsed.prefixlen])
+            asn = int(as_number) if as_number != "" else 0
+        except ValueError as e:
+            raise ValidationError(str(e)) from e
+
+        ip_data = cls.__new__(cls)
+        ip_data._set(address, packed_network, asn, country, organization)  # noqa: SLF001
+        return ip_data
+
+    def _set(self, address: bytes, packed_network: bytes, asn: int, country: str, organization: str) -> None:
+        """フィールドをコンパクトな形式で保存する.
+
+        Args:
+            address: パックしたIPアドレス
+            packed_network: パックしたネットワークアドレスとプレフィックス長, 空の場合はb""
+            asn: 自律システム番号, 空の場合は0
+            country: ISO国コード
+            organization: 組織名
+
+        """
+        network_length = len(packed_network) - 1 if packed_network else 0
+        self._packed = bytes([len(address), network_length]) + address + packed_network + asn.to_bytes(4, "big")
+        self.country = sys.intern(country)
+        self.organization = sys.intern(organization)
+
+    @property
+    def ip_address(self) -> str:
+        """IPアドレス.
+
+        Returns:
+            IPアドレスの文字列
+
+        """
+        return str(ipaddress.ip_address(self._packed[2 : 2 + self._packed[0]]))
+
+    @property
+    def network(self) -> str:
+        """IPネットワーク(CIDRブロック).
+
+        Returns:
+            IPネットワークの文字列
+            空の場合は""
+
+        """
+        address_length, network_length = self._packed[0], self._packed[1]
+        if network_length == 0:
+            return ""
+
+        start = 2 + address_length
+        return f"{ipaddress.ip_address(self._packed[start : start + network_length])}/{self._packed[start + network_length]}"
+
+    @property
+    def as_number(self) -> str:
+        """自律システム番号.
+
+        Returns:
+            自律システム番号の文字列
+            空の場合は""
+
+        """
+        asn = self.asn
+        return str(asn) if asn else ""
+
+    @property
+    def asn(self) -> int:
+        """自律システム番号.
+
+        Returns:
+            自律システム番号
+            空の場合は0
+
+        """
+        return int.from_bytes(self._packed[-4:], "big")
+
+    def __eq__(self, other: object) -> bool:
+        """等価性を判定する.
+
+        Args:
+            other: 比較対象
+
+        Returns:
+            すべてのフィールドが等しい場合True
+
+        """
+        if not isinstance(other, IPData):
+            return NotImplemented
+
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        """ハッシュ値を返す.
+
+        Returns:
+            すべてのフィールドから計算したハッシュ値
+
+        """
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        """文字列表現を返す.
+
+        Returns:
+            フィールドを含む文字列表現
+
+        """
+        return (
+            f"IPData(ip_address={self.ip_address!r}, network={self.network!r}, as_number={self.as_number!r}, "
+            f"country={self.country!r}, organization={self.organization!r})"
+        )
+
+    def _key(self) -> tuple[bytes, str, str]:
+        """比較に使用するフィールドを返す.
+
+        Returns:
+            フィールドのタプル
+
+        """
+        return (self._packed, self.country, self.organization)
+
     def is_complete(self) -> bool:
         """IPアドレス以外のフィールドが空でないかチェックする.
 
@@ -64,7 +229,18 @@ class IPData:
             IPアドレス以外のフィールドが空でない場合True
 
         """
-        return self.network != "" and self.as_number != "" and self.country != "" and self.organization != ""
+        return self._packed[1] != 0 and self.asn != 0 and self.country != "" and self.organization != ""
+
+    def is_empty(self) -> bool:
+        """IPアドレス以外のフィールドがすべて空かチェックする.
+
+        IPアドレス情報が存在しないことをキャッシュする場合に使用する
+
+        Returns:
+            IPアドレス以外のフィールドがすべて空の場合True
+
+        """
+        return self._packed[1] == 0 and self.asn == 0 and self.country == "" and self.organization == ""
 
     def to_dict(self) -> dict[str, str]:
         """データを辞書形式に変換する.
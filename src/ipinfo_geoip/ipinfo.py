@@ -1,29 +1,132 @@
 """IPアドレスからネットワーク, AS番号, 国, 組織を取得するメインクラス."""
 
-import ipaddress
 from collections import UserDict
+from collections.abc import Iterable, Sequence
+from contextlib import suppress
+from functools import partial
 
-from .exceptions import ValidationError
+from .cache import TTLCache
+from .cache_config import CacheConfig
+from .constants import GEOIP_MAX_WORKERS, RESOLVER_MEMORY, RESOLVER_MMDB, RESOLVER_REDIS
+from .exceptions import ConfigurationError, RateLimitError, ValidationError
 from .geoip_client import GeoIPClient
+from .ipdata import IPData
+from .mmdb_client import MMDBClient
+from .network_index import NetworkIndex
 from .redis_client import RedisClient
+from .resolver import Resolver, ResolverChain
+from .resolver_config import ResolverConfig
+from .resolvers import MemoryResolver, MMDBResolver, RedisResolver, WebServiceResolver
+from .single_flight import SingleFlight
+from .to_address import _to_address
 
 
 class IPInfo(UserDict[str, dict[str, str] | None]):
-    """IPアドレスからネットワーク, AS番号, 国, 組織を取得するメインクラス."""
+    """IPアドレスからネットワーク, AS番号, 国, 組織を取得するメインクラス.
 
-    def __init__(self) -> None:
-        """IPInfoインスタンスを初期化する."""
+    取得結果は最大エントリ数と有効期限を持つプロセス内キャッシュに保存される
+    IPアドレス情報が存在しないこともnegative_ttlの間キャッシュされる
+    同じIPアドレスに対する同時の検索は1回に集約される
+    1つのインスタンスを複数のスレッドから共有できる
+    プロセス内キャッシュにないIPアドレスは検索階層を順に検索する
+
+    Attributes:
+        resolvers: 検索階層
+
+    """
+
+    data: TTLCache[str, dict[str, str] | None]  # type: ignore[assignment]
+
+    def __init__(self, resolvers: Sequence[Resolver] | None = None) -> None:
+        """IPInfoインスタンスを初期化する.
+
+        検索階層を指定しない場合は環境変数の設定から作成する
+
+        Args:
+            resolvers: 検索順の検索階層
+
+        Raises:
+            ConfigurationError: 設定が不正な場合
+
+        """
         super().__init__()
 
-        self.geoip = GeoIPClient()
-        self.redis = RedisClient()
+        try:
+            config = CacheConfig.from_env()
+        except ValidationError as e:
+            msg = "Cache configuration error"
+            raise ConfigurationError(msg, {"error": str(e)}) from e
+
+        self.data = TTLCache(config.max_entries, config.ttl)
+        self.negative_ttl = config.negative_ttl
+        self.resolvers = ResolverChain(self._create_resolvers(config) if resolvers is None else resolvers)
+        self._flight: SingleFlight[str, dict[str, str] | None] = SingleFlight()
+
+    @staticmethod
+    def _create_resolvers(config: CacheConfig) -> list[Resolver]:
+        """環境変数の設定から検索階層を作成する.
+
+        Args:
+            config: プロセス内キャッシュの設定
+
+        Returns:
+            検索順の検索階層
+
+        Raises:
+            ConfigurationError: 設定が不正な場合
+
+        """
+        try:
+            names = ResolverConfig.from_env().resolvers
+        except ValidationError as e:
+            msg = "Resolver configuration error"
+            raise ConfigurationError(msg, {"error": str(e)}) from e
+
+        resolvers: list[Resolver] = []
+        for name in names:
+            if name == RESOLVER_MEMORY:
+                resolvers.append(MemoryResolver(NetworkIndex(config.max_entries, config.ttl)))
+            elif name == RESOLVER_MMDB:
+                resolvers.append(MMDBResolver(MMDBClient()))
+            elif name == RESOLVER_REDIS:
+                resolvers.append(RedisResolver(RedisClient()))
+            else:
+                resolvers.append(WebServiceResolver(GeoIPClient()))
+
+        return resolvers
+
+    def __getitem__(self, ip_address: str) -> dict[str, str] | None:
+        """指定されたIPアドレス情報を取得する.
+
+        プロセス内キャッシュになければ__missing__で取得する
+        確認と取得の間に他のスレッドによって削除された場合も__missing__で取得する
+
+        Args:
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            IPアドレス情報
+            見つからない場合はNone
+
+        Raises:
+            GeoIPClientError: 再試行しても一時的なエラーが続いた場合
+            RateLimitError: GeoLite2 Web Serviceへの問い合わせ数が上限に達した場合
+            ValidationError: ip_addressが不正な場合
+
+        """
+        try:
+            return self.data[ip_address]
+        except KeyError:
+            return self.__missing__(ip_address)
 
     def __missing__(self, ip_address: str) -> dict[str, str] | None:
         """指定されたIPアドレス情報を取得する.
 
-        Redisからキャッシュを検索する
-        見つからなければGeoLite2 Web Serviceから取得する
-        取得したデータに不備がなければRedisにキャッシュされる
+        検索階層を順に検索する
+        見つかったIPアドレス情報はそれより前の階層に保存される
+        取得したデータに不備があればどこにも保存されない
+        IPアドレス情報が存在しない場合はそのことがキャッシュされる
+        他のスレッドが同じIPアドレスを検索中の場合はその結果を待つ
 
         Args:
             ip_address: 検索するIPアドレス
@@ -33,25 +136,125 @@ class IPInfo(UserDict[str, dict[str, str] | None]):
             見つからない場合はNone
 
         Raises:
+            GeoIPClientError: 再試行しても一時的なエラーが続いた場合
+            RateLimitError: GeoLite2 Web Serviceへの問い合わせ数が上限に達した場合
             ValidationError: ip_addressが不正な場合
 
         """
         try:
-            _ = ipaddress.ip_address(ip_address)
+            _ = _to_address(ip_address)
         except ValueError as e:
             msg = f"Invalid IP address: {ip_address}"
             raise ValidationError(msg, {"error": str(e)}) from e
 
-        ip_data = self.redis[ip_address]
-        if ip_data is not None:
-            return ip_data.to_dict()
+        return self._flight.do(ip_address, partial(self._resolve, ip_address))
+
+    def _resolve(self, ip_address: str) -> dict[str, str] | None:
+        """検索階層を順に検索してIPアドレス情報を取得する.
+
+        Args:
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            IPアドレス情報
+            見つからない場合はNone
+
+        """
+        cached = self._cached([ip_address])
+        if cached:
+            return cached[ip_address]
+
+        return self._remember(ip_address, self.resolvers.get(ip_address))
+
+    def lookup_many(
+        self,
+        ip_addresses: Iterable[str],
+        max_workers: int = GEOIP_MAX_WORKERS,
+    ) -> dict[str, dict[str, str] | None]:
+        """複数のIPアドレス情報をまとめて取得する.
+
+        プロセス内キャッシュにないIPアドレスのみ重複を除いて検索階層を順に検索する
+        各階層にはその前の階層で見つからなかったIPアドレスのみをまとめて問い合わせる
+        (Redisは1回のパイプライン, GeoLite2 Web Serviceは並列のリクエスト)
+        見つかったIPアドレス情報と存在しないことはそれより前の階層にまとめて保存される
+        GeoLite2 Web Serviceへは一括取得として問い合わせ, 1件ずつの取得のために残しておく問い合わせ数は使用しない
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+            max_workers: GeoLite2 Web Serviceへ同時に発行するリクエストの最大数
+
+        Returns:
+            IPアドレスをキーとするIPアドレス情報の辞書
+            見つからないIPアドレスと取得に失敗したIPアドレスはNone(取得に失敗したIPアドレスはキャッシュしない)
+            再試行しても一時的なエラーが続いたIPアドレスはGeoIPClientErrorを送出せず, 取得に失敗したものとする
+
+        Raises:
+            RateLimitError: GeoLite2 Web Serviceへの問い合わせ数が上限に達した場合
+                (detailsのip_addressesに検索できなかったIPアドレス, resultsにそれ以外のIPアドレス情報の辞書)
+                検索できたIPアドレス情報はキャッシュされるため, 後で同じIPアドレスを再度検索できる
+            ValidationError: ip_addressesに不正なIPアドレスが含まれる場合
+
+        """
+        targets = list(dict.fromkeys(ip_addresses))
+        for ip_address in targets:
+            try:
+                _ = _to_address(ip_address)
+            except ValueError as e:
+                msg = f"Invalid IP address: {ip_address}"
+                raise ValidationError(msg, {"error": str(e)}) from e
+
+        results = self._cached(targets)
+        misses = [ip_address for ip_address in targets if ip_address not in results]
+        if misses:
+            try:
+                found = self.resolvers.get_many(misses, max_workers)
+            except RateLimitError as e:
+                for ip_address, ip_data in e.details["results"].items():
+                    results[ip_address] = self._remember(ip_address, ip_data)
+                raise RateLimitError(e.message, {"ip_addresses": e.details["ip_addresses"], "results": results}) from e
+            for ip_address, ip_data in found.items():
+                results[ip_address] = self._remember(ip_address, ip_data)
+
+        return {ip_address: results.get(ip_address) for ip_address in targets}
+
+    def _cached(self, ip_addresses: Iterable[str]) -> dict[str, dict[str, str] | None]:
+        """プロセス内キャッシュからIPアドレス情報を取得する.
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+
+        Returns:
+            キャッシュに存在したIPアドレスをキーとするIPアドレス情報の辞書
+
+        """
+        results: dict[str, dict[str, str] | None] = {}
+        for ip_address in ip_addresses:
+            with suppress(KeyError):
+                results[ip_address] = self.data[ip_address]
+
+        return results
+
+    def _remember(self, ip_address: str, ip_data: IPData) -> dict[str, str] | None:
+        """IPアドレス情報をプロセス内キャッシュに保存する.
+
+        IPアドレス情報が存在しない場合はnegative_ttlの間そのことを保存する
+        不備のあるIPアドレス情報は保存しない
+
+        Args:
+            ip_address: IPアドレス
+            ip_data: 保存するIPアドレス情報
+
+        Returns:
+            IPアドレス情報の辞書
+            存在しない場合はNone
+
+        """
+        if ip_data.is_empty():
+            self.data.set(ip_address, None, self.negative_ttl)
+            return None
 
-        ip_data = self.geoip[ip_address]
-        if ip_data is not None:
-            result = ip_data.to_dict()
-            if ip_data.is_complete():
-                self.redis[ip_address] = ip_data
-                super().__setitem__(ip_address, result)
-            return result
+        result = ip_data.to_dict()
+        if ip_data.is_complete():
+            self.data[ip_address] = result
 
-        return None
+        return result
@@ -0,0 +1,60 @@
+"""直近のリクエストの所要時間を記録するトラッカー."""
+
+import threading
+from collections import deque
+
+from .constants import LATENCY_MIN_SAMPLES, LATENCY_PERCENTILE, LATENCY_WINDOW
+
+
+class LatencyTracker:
+    """直近のリクエストの所要時間からパーセンタイルを求めるクラス.
+
+    1つのインスタンスを複数のスレッドから共有できる
+
+    Attributes:
+        window: 記録する所要時間の最大数
+        min_samples: パーセンタイルを求めるのに必要な所要時間の数
+
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW, min_samples: int = LATENCY_MIN_SAMPLES) -> None:
+        """LatencyTrackerインスタンスを初期化する.
+
+        Args:
+            window: 記録する所要時間の最大数
+            min_samples: パーセンタイルを求めるのに必要な所要時間の数
+
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        """リクエストの所要時間を記録する.
+
+        Args:
+            seconds: 所要時間(秒)
+
+        """
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, default: float, percentile: float = LATENCY_PERCENTILE) -> float:
+        """記録した所要時間のパーセンタイルを返す.
+
+        Args:
+            default: 記録した所要時間がmin_samplesに満たない場合の値
+            percentile: 求めるパーセンタイル(0から1)
+
+        Returns:
+            所要時間のパーセンタイル(秒)
+
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+
+        if len(samples) < self.min_samples:
+            return default
+
+        return samples[int(percentile * (len(samples) - 1))]
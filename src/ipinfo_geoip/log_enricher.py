@@ -0,0 +1,187 @@
+"""アクセスログの各行にクライアントのIPアドレス情報を付加するクラス."""
+
+import re
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from itertools import islice
+
+from .constants import (
+    ENRICH_BATCH_SIZE,
+    GEOIP_MAX_WORKERS,
+    LOG_DEDUPE_SIZE,
+    LOG_EMPTY_FIELD,
+    LOG_FORMAT_COMBINED,
+    LOG_OUTPUT_COLUMNS,
+    LOG_OUTPUT_LINE,
+    LOG_OUTPUTS,
+    LOG_PATTERNS,
+)
+from .exceptions import RateLimitError, ValidationError
+from .ipinfo import IPInfo
+from .to_address import _to_address
+
+_FIELDS = ("network", "as_number", "country", "organization")
+_COLUMN_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+_QUOTED_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
+
+class LogEnricher:
+    """アクセスログの各行にクライアントのIPアドレス情報を付加するクラス.
+
+    ログ形式の正規表現のipグループからクライアントのIPアドレスを取り出す
+    入力はbatch_size行ずつのウィンドウに分け, ウィンドウ内で重複を除いたIPアドレスをlookup_manyでまとめて検索する
+    直近に検索したdedupe_size個のIPアドレスの結果は保持し, 後続のウィンドウでは検索しない
+    そのため同じクライアントが繰り返し現れるログでは, 検索の回数は行数ではなくIPアドレスの種類の数に比例する
+
+    出力形式は以下のとおり(空のフィールドとIPアドレスを取り出せない行は"-")
+    line: 元の行の末尾にネットワーク, AS番号, 国コード, "組織名"を空白区切りで付加する
+        組織名のバックスラッシュ, ダブルクォート, 改行はバックスラッシュでエスケープする
+    columns: IPアドレス, ネットワーク, AS番号, 国コード, 組織名をタブ区切りで出力する
+        各フィールドのバックスラッシュ, タブ, 改行はバックスラッシュでエスケープする
+
+    Attributes:
+        ipinfo: IPアドレス情報の検索に使用するIPInfo
+        pattern: クライアントのIPアドレスをipグループとする正規表現
+        output: 出力形式(line, columns)
+        dedupe_size: 検索結果を保持するIPアドレスの最大数
+
+    """
+
+    def __init__(
+        self,
+        ipinfo: IPInfo | None = None,
+        log_format: str = LOG_FORMAT_COMBINED,
+        output: str = LOG_OUTPUT_LINE,
+        dedupe_size: int = LOG_DEDUPE_SIZE,
+    ) -> None:
+        """LogEnricherインスタンスを初期化する.
+
+        Args:
+            ipinfo: IPアドレス情報の検索に使用するIPInfo, Noneの場合は環境変数の設定から作成する
+            log_format: ログ形式(common, combined, haproxy), またはipグループを含む正規表現
+            output: 出力形式(line, columns)
+            dedupe_size: 検索結果を保持するIPアドレスの最大数
+
+        Raises:
+            ConfigurationError: 設定が不正な場合
+            ValidationError: ログ形式または出力形式が不正な場合
+
+        """
+        try:
+            self.pattern = re.compile(LOG_PATTERNS.get(log_format, log_format))
+        except re.error as e:
+            msg = f"Invalid log format: {log_format}"
+            raise ValidationError(msg, {"error": str(e)}) from e
+
+        if "ip" not in self.pattern.groupindex:
+            msg = f"Log format must have an ip group: {log_format}"
+            raise ValidationError(msg)
+
+        if output not in LOG_OUTPUTS:
+            msg = f"Output must be one of {', '.join(LOG_OUTPUTS)}"
+            raise ValidationError(msg)
+
+        self.ipinfo = IPInfo() if ipinfo is None else ipinfo
+        self.output = output
+        self.dedupe_size = dedupe_size
+        self._recent: OrderedDict[str, dict[str, str] | None] = OrderedDict()
+
+    def enrich(
+        self,
+        lines: Iterable[str],
+        batch_size: int = ENRICH_BATCH_SIZE,
+        max_workers: int = GEOIP_MAX_WORKERS,
+    ) -> Iterator[str]:
+        """ログの各行にIPアドレス情報を付加した行を返す.
+
+        Args:
+            lines: ログの行
+            batch_size: 1つのウィンドウの行数
+            max_workers: GeoLite2 Web Serviceへ同時に発行するリクエストの最大数
+
+        Yields:
+            1つのウィンドウのIPアドレス情報を付加した行(改行を含む)
+
+        """
+        iterator = iter(lines)
+        while window := [(line.rstrip("\r\n"), self._extract(line)) for line in islice(iterator, batch_size)]:
+            results = self._lookup([ip_address for _, ip_address in window if ip_address is not None], max_workers)
+            yield "".join(self._format(line, ip_address, results) for line, ip_address in window)
+
+    def _extract(self, line: str) -> str | None:
+        """ログの行からクライアントのIPアドレスを取り出す.
+
+        Args:
+            line: ログの行
+
+        Returns:
+            IPアドレス
+            取り出せない場合, または不正なIPアドレスの場合はNone
+
+        """
+        match = self.pattern.search(line)
+        if match is None:
+            return None
+
+        ip_address = match.group("ip")
+        try:
+            _ = _to_address(ip_address)
+        except ValueError:
+            return None
+
+        return ip_address
+
+    def _lookup(self, ip_addresses: list[str], max_workers: int) -> dict[str, dict[str, str] | None]:
+        """1つのウィンドウのIPアドレス情報を検索する.
+
+        直近に検索したIPアドレスは保持した結果を使用し, それ以外をまとめて検索する
+
+        Args:
+            ip_addresses: 検索するIPアドレス(重複を含む)
+            max_workers: GeoLite2 Web Serviceへ同時に発行するリクエストの最大数
+
+        Returns:
+            IPアドレスをキーとするIPアドレス情報の辞書
+            問い合わせ数の上限により検索できなかったIPアドレスは含まない
+
+        """
+        results: dict[str, dict[str, str] | None] = {}
+        misses: list[str] = []
+        for ip_address in dict.fromkeys(ip_addresses):
+            if ip_address in self._recent:
+                self._recent.move_to_end(ip_address)
+                results[ip_address] = self._recent[ip_address]
+            else:
+                misses.append(ip_address)
+
+        if misses:
+            try:
+                found = self.ipinfo.lookup_many(misses, max_workers)
+            except RateLimitError as e:
+                found = e.details["results"]
+            for ip_address, ip_data in found.items():
+                results[ip_address] = self._recent[ip_address] = ip_data
+            while len(self._recent) > self.dedupe_size:
+                self._recent.popitem(last=False)
+
+        return results
+
+    def _format(self, line: str, ip_address: str | None, results: dict[str, dict[str, str] | None]) -> str:
+        """ログの行にIPアドレス情報を付加する.
+
+        Args:
+            line: 改行を除いたログの行
+            ip_address: クライアントのIPアドレス, 取り出せなかった場合はNone
+            results: IPアドレスをキーとするIPアドレス情報の辞書
+
+        Returns:
+            IPアドレス情報を付加した行(改行を含む)
+
+        """
+        ip_data = results.get(ip_address) if ip_address is not None else None
+        fields = [(ip_data or {}).get(name) or LOG_EMPTY_FIELD for name in _FIELDS]
+        if self.output == LOG_OUTPUT_COLUMNS:
+            return "\t".join([ip_address or LOG_EMPTY_FIELD, *(field.translate(_COLUMN_ESCAPES) for field in fields)]) + "\n"
+
+        organization = fields[-1] if fields[-1] == LOG_EMPTY_FIELD else '"' + fields[-1].translate(_QUOTED_ESCAPES) + '"'
+        return " ".join([line, *fields[:-1], organization]) + "\n"
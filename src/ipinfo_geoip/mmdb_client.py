@@ -0,0 +1,269 @@
+"""GeoLite2データベースファイルクライアント."""
+
+import ipaddress
+from collections.abc import Iterable, Iterator
+from contextlib import suppress
+from typing import Any
+
+import geoip2.database
+import geoip2.errors
+import geoip2.models
+import maxminddb
+
+from .exceptions import AddressNotFoundError, ConfigurationError, ValidationError
+from .ipdata import IPData
+from .mmdb_config import MMDBConfig
+from .to_address import _to_address
+from .to_str import _to_str
+
+
+def _open(path: str, *database_types: str) -> geoip2.database.Reader:
+    """GeoLite2データベースファイルをメモリマップで開く.
+
+    Args:
+        path: データベースファイルのパス
+        database_types: 期待するデータベースの種類
+
+    Returns:
+        データベースのReader
+
+    Raises:
+        ConfigurationError: ファイルを開けない場合, または種類が異なる場合
+
+    """
+    try:
+        reader = geoip2.database.Reader(path, mode=geoip2.database.MODE_MMAP)
+    # 不正なデータベースファイルの場合はRuntimeErrorのサブクラスであるInvalidDatabaseErrorが送出される
+    except (OSError, ValueError, RuntimeError) as e:
+        msg = "MMDB configuration error"
+        raise ConfigurationError(msg, {"path": path, "error": str(e)}) from e
+
+    if not any(database_type in reader.metadata().database_type for database_type in database_types):
+        reader.close()
+        msg = "MMDB configuration error"
+        raise ConfigurationError(msg, {"path": path, "error": f"Expected a {' or '.join(database_types)} database"})
+
+    return reader
+
+
+def _open_database(path: str) -> maxminddb.Reader:
+    """GeoLite2データベースファイルをネットワークの列挙のためにメモリマップで開く.
+
+    geoip2のReaderはネットワークを列挙できないため, maxminddbのReaderを使用する
+
+    Args:
+        path: データベースファイルのパス
+
+    Returns:
+        データベースのReader
+
+    Raises:
+        ConfigurationError: ファイルを開けない場合
+
+    """
+    try:
+        return maxminddb.open_database(path, maxminddb.MODE_MMAP)
+    except (OSError, ValueError, RuntimeError) as e:
+        msg = "MMDB configuration error"
+        raise ConfigurationError(msg, {"path": path, "error": str(e)}) from e
+
+
+def _to_ip_data(
+    ip_address: str,
+    asn: geoip2.models.ASN | None,
+    country: geoip2.models.Country | None,
+) -> IPData | None:
+    """GeoLite2データベースの検索結果をIPアドレス情報に変換する.
+
+    2つのデータベースのネットワークのうち, より狭い方をIPアドレス情報のネットワークとする
+
+    Args:
+        ip_address: IPアドレス
+        asn: GeoLite2-ASNデータベースの検索結果
+        country: GeoLite2-CountryまたはGeoLite2-Cityデータベースの検索結果
+
+    Returns:
+        IPアドレス情報
+        検索結果がNoneまたは不完全な場合はNone
+
+    """
+    if asn is None or country is None:
+        return None
+
+    networks = [network for network in (asn.network, country.traits.network) if network is not None]
+    as_number = _to_str(asn.autonomous_system_number)
+    country_code = _to_str(country.country.iso_code)
+    organization = _to_str(asn.autonomous_system_organization)
+
+    if not networks or as_number == "" or country_code == "" or organization == "":
+        return None
+
+    network = max(networks, key=lambda network: network.prefixlen)
+
+    return IPData(ip_address, str(network), as_number, country_code, organization)
+
+
+_Network = ipaddress.IPv4Network | ipaddress.IPv6Network
+_Record = tuple[_Network, Any]
+
+
+def _bounds(network: _Network) -> tuple[tuple[int, int], tuple[int, int]]:
+    """ネットワークの開始アドレスと終了アドレスを, IPバージョンを含めて比較できる形で返す.
+
+    Args:
+        network: ネットワーク
+
+    Returns:
+        IPバージョンと整数の開始アドレス, IPバージョンと整数の終了アドレス
+
+    """
+    return (network.version, int(network.network_address)), (network.version, int(network.broadcast_address))
+
+
+def _overlaps(asn: Iterator[_Record], country: Iterator[_Record]) -> Iterator[tuple[_Network, Any, Any]]:
+    """2つのデータベースのネットワークのうち重なるものを, より狭い方のネットワークとして返す.
+
+    各データベースのネットワークは互いに重ならず, IPバージョン, アドレスの順に並ぶ
+    CIDRブロックは重なる場合は一方が他方を含むため, 重なる部分はより狭い方のネットワークとなる
+
+    Args:
+        asn: GeoLite2-ASNデータベースのネットワークとレコード
+        country: GeoLite2-CountryまたはGeoLite2-Cityデータベースのネットワークとレコード
+
+    Yields:
+        より狭い方のネットワーク, ASNのレコード, 国のレコード
+
+    """
+    asn_item = next(asn, None)
+    country_item = next(country, None)
+    while asn_item is not None and country_item is not None:
+        asn_network, asn_record = asn_item
+        country_network, country_record = country_item
+        asn_start, asn_end = _bounds(asn_network)
+        country_start, country_end = _bounds(country_network)
+        if asn_end < country_start:
+            asn_item = next(asn, None)
+        elif country_end < asn_start:
+            country_item = next(country, None)
+        else:
+            yield max(asn_network, country_network, key=lambda network: network.prefixlen), asn_record, country_record
+            # 先に終わる方のネットワークを進める
+            if asn_end <= country_end:
+                asn_item = next(asn, None)
+            else:
+                country_item = next(country, None)
+
+
+class MMDBClient:
+    """GeoLite2データベースファイルクライアント.
+
+    GeoLite2-ASNとGeoLite2-CountryまたはGeoLite2-Cityのデータベースファイルをメモリマップで読み込む
+    ファイルはページキャッシュを通じて複数のプロセスで共有される
+    """
+
+    def __init__(self) -> None:
+        """MMDBClientインスタンスを初期化する.
+
+        Raises:
+            ConfigurationError: データベースファイルの設定が不正な場合
+
+        """
+        try:
+            config = MMDBConfig.from_env()
+        except ValidationError as e:
+            msg = "MMDB configuration error"
+            raise ConfigurationError(msg, {"error": str(e)}) from e
+
+        self._paths = (config.asn_path, config.country_path)
+        self.asn = _open(config.asn_path, "ASN")
+        self.country = _open(config.country_path, "City", "Country")
+        self._city = "City" in self.country.metadata().database_type
+
+    def get(self, ip_address: str) -> IPData | None:
+        """指定されたIPアドレス情報を取得する.
+
+        取得結果は保存しない
+
+        Args:
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            データベースから取得したIPアドレス情報
+            不完全な場合はNone
+
+        Raises:
+            AddressNotFoundError: IPアドレスがどちらのデータベースにも見つからない場合
+            ValidationError: ip_addressが不正な場合
+
+        """
+        try:
+            _ = _to_address(ip_address)
+        except ValueError as e:
+            msg = f"Invalid IP address: {ip_address}"
+            raise ValidationError(msg, {"error": str(e)}) from e
+
+        asn: geoip2.models.ASN | None = None
+        country: geoip2.models.Country | None = None
+        with suppress(geoip2.errors.AddressNotFoundError):
+            asn = self.asn.asn(ip_address)
+        with suppress(geoip2.errors.AddressNotFoundError):
+            country = self.country.city(ip_address) if self._city else self.country.country(ip_address)
+
+        if asn is None and country is None:
+            msg = f"Address not found: {ip_address}"
+            raise AddressNotFoundError(msg, {"ip_address": ip_address})
+
+        return _to_ip_data(ip_address, asn, country)
+
+    def get_many(self, ip_addresses: Iterable[str]) -> dict[str, IPData | None]:
+        """複数のIPアドレス情報を取得する.
+
+        見つからないIPアドレスはNoneとなる
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+
+        Returns:
+            IPアドレスをキーとするIPアドレス情報の辞書
+
+        Raises:
+            ValidationError: ip_addressesに不正なIPアドレスが含まれる場合
+
+        """
+        results: dict[str, IPData | None] = {}
+        for ip_address in dict.fromkeys(ip_addresses):
+            try:
+                results[ip_address] = self.get(ip_address)
+            except AddressNotFoundError:
+                results[ip_address] = None
+
+        return results
+
+    def networks(self) -> Iterator[IPData]:
+        """両方のデータベースのネットワークを順に取得する.
+
+        2つのデータベースのネットワークが重なる部分ごとに, より狭い方のネットワークを返す
+        不完全なネットワークは含まない
+
+        Yields:
+            ネットワークアドレスをIPアドレスとするIPアドレス情報
+
+        Raises:
+            ConfigurationError: データベースファイルを開けない場合
+
+        """
+        asn_path, country_path = self._paths
+        with _open_database(asn_path) as asn_reader, _open_database(country_path) as country_reader:
+            for network, asn, country in _overlaps(iter(asn_reader), iter(country_reader)):
+                as_number = _to_str(asn.get("autonomous_system_number"))
+                country_code = _to_str(country.get("country", {}).get("iso_code"))
+                organization = _to_str(asn.get("autonomous_system_organization"))
+                if as_number != "" and country_code != "" and organization != "":
+                    yield IPData.from_trusted(
+                        str(network.network_address), str(network), as_number, country_code, organization
+                    )
+
+    def close(self) -> None:
+        """データベースファイルを閉じる."""
+        self.asn.close()
+        self.country.close()
@@ -0,0 +1,51 @@
+"""GeoLite2データベースファイル設定."""
+
+import os
+from typing import Self
+
+from .constants import MMDB_ASN_PATH_ENV, MMDB_COUNTRY_PATH_ENV
+from .exceptions import ValidationError
+
+
+class MMDBConfig:
+    """GeoLite2データベースファイル設定クラス.
+
+    Attributes:
+        asn_path: GeoLite2-ASNデータベースのパス
+        country_path: GeoLite2-CountryまたはGeoLite2-Cityデータベースのパス
+
+    """
+
+    def __init__(self, asn_path: str, country_path: str) -> None:
+        """MMDBConfigインスタンスを初期化する.
+
+        Args:
+            asn_path: GeoLite2-ASNデータベースのパス
+            country_path: GeoLite2-CountryまたはGeoLite2-Cityデータベースのパス
+
+        """
+        self.asn_path = asn_path
+        self.country_path = country_path
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """環境変数からMMDBConfigインスタンスを作成する.
+
+        Returns:
+            環境変数から作成されたMMDBConfigインスタンス
+
+        Raises:
+            ValidationError: 必要な環境変数が設定されていない場合
+
+        """
+        missing_vars = []
+        if MMDB_ASN_PATH_ENV not in os.environ:
+            missing_vars.append(MMDB_ASN_PATH_ENV)
+        if MMDB_COUNTRY_PATH_ENV not in os.environ:
+            missing_vars.append(MMDB_COUNTRY_PATH_ENV)
+
+        if missing_vars:
+            msg = f"Missing environment variables: {', '.join(missing_vars)}"
+            raise ValidationError(msg)
+
+        return cls(os.environ[MMDB_ASN_PATH_ENV], os.environ[MMDB_COUNTRY_PATH_ENV])
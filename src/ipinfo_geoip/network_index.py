@@ -0,0 +1,103 @@
+"""IPネットワークの最長一致インデックス."""
+
+import threading
+
+from .cache import TTLCache
+from .exceptions import ValidationError
+from .ipdata import IPData
+from .to_address import _to_address, _to_network
+
+
+class NetworkIndex:
+    """IPネットワークの最長一致インデックスクラス.
+
+    IPバージョン, プレフィックス長, ネットワークアドレスをキーとするキャッシュを持つ
+    検索時は登録済みのプレフィックス長を長い順に調べ, 最初に一致したネットワークを返す
+    登録と検索は複数のスレッドから同時に行える
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """NetworkIndexインスタンスを初期化する.
+
+        Args:
+            maxsize: 最大ネットワーク数
+            ttl: ネットワークの有効期限(秒)
+
+        """
+        self._entries: TTLCache[tuple[int, int, int], tuple[str, str, str, str]] = TTLCache(maxsize, ttl)
+        self._prefixlens: dict[int, list[int]] = {4: [], 6: []}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """登録済みのネットワーク数を返す.
+
+        Returns:
+            登録済みのネットワーク数
+
+        """
+        return len(self._entries)
+
+    def insert(self, ip_data: IPData) -> None:
+        """IPアドレス情報のネットワークを登録する.
+
+        不完全なIPアドレス情報は登録されない
+
+        Args:
+            ip_data: 登録するIPアドレス情報
+
+        """
+        if not ip_data.is_complete():
+            return
+
+        network = _to_network(ip_data.network)
+        if network.prefixlen not in self._prefixlens[network.version]:
+            with self._lock:
+                prefixlens = self._prefixlens[network.version]
+                if network.prefixlen not in prefixlens:
+                    self._prefixlens[network.version] = sorted([*prefixlens, network.prefixlen], reverse=True)
+
+        key = (network.version, network.prefixlen, int(network.network_address) >> (network.max_prefixlen - network.prefixlen))
+        self._entries[key] = (str(network), ip_data.as_number, ip_data.country, ip_data.organization)
+
+    def lookup(self, ip_address: str) -> IPData | None:
+        """IPアドレスを含む最長一致のネットワークを検索する.
+
+        Args:
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            一致したネットワークのIPアドレス情報
+            見つからない場合はNone
+
+        Raises:
+            ValidationError: ip_addressが不正な場合
+
+        """
+        try:
+            address = _to_address(ip_address)
+        except ValueError as e:
+            msg = f"Invalid IP address: {ip_address}"
+            raise ValidationError(msg, {"error": str(e)}) from e
+
+        value = int(address)
+        for prefixlen in self._prefixlens[address.version]:
+            entry = self._entries.get((address.version, prefixlen, value >> (address.max_prefixlen - prefixlen)))
+            if entry is not None:
+                return IPData.from_trusted(ip_address, *entry)
+
+        return None
+
+    def networks(self) -> list[IPData]:
+        """登録済みで有効期限内のネットワークを取得する.
+
+        Returns:
+            ネットワークアドレスをIPアドレスとするIPアドレス情報のリスト
+
+        """
+        networks: list[IPData] = []
+        for key in self._entries:
+            entry = self._entries.get(key)
+            if entry is not None:
+                networks.append(IPData.from_trusted(entry[0].split("/", maxsplit=1)[0], *entry))
+
+        return networks
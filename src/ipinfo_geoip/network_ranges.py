@@ -0,0 +1,366 @@
+"""既知のIPネットワークにIPアドレスの配列をまとめて一致させるクラス.
+
+numpyはオプションの依存関係のため, pip install ipinfo-geoip[numpy]でインストールする
+"""
+
+import socket
+from collections.abc import Iterable, Sequence
+from functools import partial
+from typing import TYPE_CHECKING, Any, Self
+
+import numpy as np
+import numpy.typing as npt
+
+from .columnar import _WORD_BITS, _WORD_MASK, _columns
+from .exceptions import ValidationError
+from .ipdata import IPData
+from .to_address import _to_network
+
+if TYPE_CHECKING:
+    from .mmdb_client import MMDBClient
+    from .network_index import NetworkIndex
+    from .redis_client import RedisClient
+
+_Range = tuple[int, int, int]
+
+_OCTETS = 4
+_DECIMAL = 10
+_MAX_DIGITS = 3
+_MAX_OCTET = 255
+# 各オクテットの後の文字, 最後のオクテットの後は連結に使う改行となる
+_SEPARATORS = np.frombuffer(b"...\n", dtype=np.uint8)
+
+
+def _segments(networks: Sequence[_Range]) -> list[_Range]:
+    """入れ子になり得るネットワークを重ならない範囲に分割する.
+
+    各範囲にはその範囲を含むネットワークのうちプレフィックスが最も長いものを割り当てる
+
+    Args:
+        networks: 開始アドレス, 終了アドレス, ネットワークの番号のタプル(開始アドレス順, 同じ場合は範囲の広い順)
+
+    Returns:
+        開始アドレス, 終了アドレス, ネットワークの番号のタプル(開始アドレス順)
+
+    """
+    segments: list[_Range] = []
+    stack: list[tuple[int, int]] = []
+    cursor = 0
+
+    def close(until: int) -> None:
+        """untilより前に終わるネットワークの残りの範囲を追加する."""
+        nonlocal cursor
+        while stack and stack[-1][0] < until:
+            end, index = stack.pop()
+            if cursor <= end:
+                segments.append((cursor, end, index))
+                cursor = end + 1
+
+    for start, end, index in networks:
+        close(start)
+        if stack and cursor < start:
+            segments.append((cursor, start - 1, stack[-1][1]))
+        stack.append((end, index))
+        cursor = start
+
+    close(1 << 128)
+    return segments
+
+
+def _words(addresses: Sequence[int]) -> npt.NDArray[np.uint64]:
+    """128ビットの整数を上位, 下位64ビットの2列のuint64の配列に変換する.
+
+    Args:
+        addresses: 128ビットの整数
+
+    Returns:
+        形状が(整数の数, 2)のuint64の配列
+
+    """
+    return np.array([(address >> _WORD_BITS, address & _WORD_MASK) for address in addresses], dtype=np.uint64).reshape(-1, 2)
+
+
+def _pack(addresses: npt.NDArray[np.uint64]) -> npt.NDArray[np.bytes_]:
+    """上位, 下位64ビットの2列のIPv6アドレスを大小関係を保つ16バイトの文字列に変換する.
+
+    numpyのsearchsortedは128ビットの整数を扱えないため, ビッグエンディアンのバイト列として比較する
+
+    Args:
+        addresses: 上位, 下位64ビットの2列の配列
+
+    Returns:
+        16バイトの文字列の配列
+
+    """
+    return np.ascontiguousarray(addresses.reshape(-1, 2), dtype=">u8").view("S16").ravel()
+
+
+def _search(
+    starts: npt.NDArray[Any],
+    ends: npt.NDArray[Any],
+    indices: npt.NDArray[np.intp],
+    keys: npt.NDArray[Any],
+) -> npt.NDArray[np.intp]:
+    """重ならない範囲のうちアドレスを含むものをsearchsortedで検索する.
+
+    Args:
+        starts: 範囲の開始アドレス(昇順)
+        ends: 範囲の終了アドレス
+        indices: 範囲のネットワークの番号
+        keys: 検索するアドレス
+
+    Returns:
+        アドレスを含む範囲のネットワークの番号の配列, 含まれない場合は-1
+
+    """
+    if len(starts) == 0:
+        return np.full(len(keys), -1, dtype=np.intp)
+
+    position = np.searchsorted(starts, keys, side="right") - 1
+    clipped = np.maximum(position, 0)
+    return np.where((position >= 0) & (keys <= ends[clipped]), indices[clipped], -1)
+
+
+def to_ipv4_array(ip_addresses: Iterable[str]) -> npt.NDArray[np.uint32]:
+    """IPv4アドレスの文字列をuint32の配列に変換する.
+
+    IPアドレスを改行区切りの1つのバイト列に連結し, 区切り文字の位置から各オクテットの数字を
+    配列としてまとめて取り出すため, IPアドレスごとのPythonの処理は行わない
+    受け付ける表記はsocket.inet_ptonと同じ(各オクテットは先頭に0のない0から255までの10進数)
+
+    Args:
+        ip_addresses: IPv4アドレスの配列またはシーケンス
+
+    Returns:
+        uint32の配列
+
+    Raises:
+        ValidationError: 不正なIPv4アドレスが含まれる場合
+
+    """
+    values = ip_addresses.tolist() if isinstance(ip_addresses, np.ndarray) else list(ip_addresses)
+    if not values:
+        return np.zeros(0, dtype=np.uint32)
+
+    msg = "Invalid IPv4 address"
+    try:
+        buffer = np.frombuffer(("\n".join(values) + "\n").encode("ascii"), dtype=np.uint8)
+    except UnicodeEncodeError as e:
+        raise ValidationError(msg, {"error": str(e)}) from e
+
+    digits = buffer - np.uint8(ord("0"))
+    is_digit = digits < _DECIMAL
+    # 各オクテットの終わり(ドットまたは改行)の位置
+    ends = np.flatnonzero(~is_digit)
+    lengths = np.diff(ends, prepend=-1) - 1
+    if (
+        len(ends) != _OCTETS * len(values)
+        or not np.array_equal(buffer[ends].reshape(-1, _OCTETS), np.broadcast_to(_SEPARATORS, (len(values), _OCTETS)))
+        or lengths.min() < 1
+        or lengths.max() > _MAX_DIGITS
+        or np.any((lengths > 1) & (digits[ends - lengths] == 0))
+    ):
+        raise ValidationError(msg)
+
+    # 1桁, 2桁のオクテットでは前の桁の位置が区切り文字または前のオクテットになるため, 数字の並びの場合のみ加える
+    ones, tens, hundreds = ends - 1, ends - 2, ends - 3
+    octets = digits[ones].astype(np.uint16)
+    octets += np.uint16(10) * (digits[tens] * is_digit[tens])
+    octets += np.uint16(100) * (digits[hundreds] * (is_digit[hundreds] & is_digit[tens]))
+    if octets.max() > _MAX_OCTET:
+        raise ValidationError(msg)
+
+    words: npt.NDArray[np.uint32] = octets.reshape(-1, _OCTETS).astype(np.uint32)
+    addresses: npt.NDArray[np.uint32] = (
+        (words[:, 0] << np.uint32(24)) | (words[:, 1] << np.uint32(16)) | (words[:, 2] << np.uint32(8)) | words[:, 3]
+    )
+    return addresses
+
+
+def to_ipv6_array(ip_addresses: Iterable[str]) -> npt.NDArray[np.uint64]:
+    """IPv6アドレスの文字列を上位, 下位64ビットの2列のuint64の配列に変換する.
+
+    Args:
+        ip_addresses: IPv6アドレス
+
+    Returns:
+        形状が(IPアドレスの数, 2)のuint64の配列
+
+    Raises:
+        ValidationError: 不正なIPv6アドレスが含まれる場合
+
+    """
+    try:
+        packed = b"".join(map(partial(socket.inet_pton, socket.AF_INET6), ip_addresses))
+    except OSError as e:
+        msg = "Invalid IPv6 address"
+        raise ValidationError(msg, {"error": str(e)}) from e
+
+    return np.frombuffer(packed, dtype=">u8").astype(np.uint64).reshape(-1, 2)
+
+
+class NetworkRanges:
+    """既知のIPネットワークにIPアドレスの配列をまとめて一致させるクラス.
+
+    入れ子のネットワークは重ならない範囲に分割し, 各範囲には最長一致のネットワークを割り当てる
+    範囲の開始アドレスと終了アドレスはIPバージョンごとにソート済みの配列として保持し,
+    IPアドレスの配列はsearchsortedで1回に一致させるため, IPアドレスごとのPythonの処理は行わない
+    IPv4はuint32, IPv6は上位, 下位64ビットの2列のuint64として扱う
+
+    Attributes:
+        networks: 登録されたネットワークのIPアドレス情報(一致したネットワークの番号の順)
+
+    """
+
+    def __init__(self, networks: Iterable[IPData]) -> None:
+        """NetworkRangesインスタンスを初期化する.
+
+        不完全なIPアドレス情報は登録されない
+        同じネットワークが複数ある場合は後のものを登録する
+
+        Args:
+            networks: 登録するネットワークのIPアドレス情報
+
+        """
+        unique = {ip_data.network: ip_data for ip_data in networks if ip_data.is_complete()}
+        self.networks = list(unique.values())
+
+        ranges: dict[int, list[_Range]] = {4: [], 6: []}
+        for index, ip_data in enumerate(self.networks):
+            network = _to_network(ip_data.network)
+            ranges[network.version].append((int(network.network_address), int(network.broadcast_address), index))
+        for version_ranges in ranges.values():
+            version_ranges.sort(key=lambda item: (item[0], -item[1]))
+
+        ipv4 = _segments(ranges[4])
+        self._ipv4_starts = np.array([start for start, _, _ in ipv4], dtype=np.uint32)
+        self._ipv4_ends = np.array([end for _, end, _ in ipv4], dtype=np.uint32)
+        self._ipv4_indices = np.array([index for _, _, index in ipv4], dtype=np.intp)
+
+        ipv6 = _segments(ranges[6])
+        self._ipv6_starts = _pack(_words([start for start, _, _ in ipv6]))
+        self._ipv6_ends = _pack(_words([end for _, end, _ in ipv6]))
+        self._ipv6_indices = np.array([index for _, _, index in ipv6], dtype=np.intp)
+
+        # 番号-1は最後の行(見つからない行)を参照する
+        self._columns = _columns([*(ip_data.to_dict() for ip_data in self.networks), None])
+
+    @classmethod
+    def from_index(cls, index: "NetworkIndex") -> Self:
+        """取得済みネットワークのインデックスに登録されたネットワークからインスタンスを作成する.
+
+        Args:
+            index: 取得済みネットワークのインデックス
+
+        Returns:
+            NetworkRangesインスタンス
+
+        """
+        return cls(index.networks())
+
+    @classmethod
+    def from_redis(cls, client: "RedisClient") -> Self:
+        """Redisのネットワーク範囲キャッシュに保存されたネットワークからインスタンスを作成する.
+
+        Args:
+            client: 保存形式がネットワーク範囲キャッシュのRedisクライアント
+
+        Returns:
+            NetworkRangesインスタンス
+
+        Raises:
+            ConfigurationError: 保存形式がネットワーク範囲キャッシュでない場合
+            RedisClientError: Redisでエラーが発生した場合
+
+        """
+        return cls(client.networks())
+
+    @classmethod
+    def from_mmdb(cls, client: "MMDBClient") -> Self:
+        """GeoLite2データベースファイルのすべてのネットワークからインスタンスを作成する.
+
+        Args:
+            client: GeoLite2データベースファイルクライアント
+
+        Returns:
+            NetworkRangesインスタンス
+
+        Raises:
+            ConfigurationError: データベースファイルを開けない場合
+
+        """
+        return cls(client.networks())
+
+    def __len__(self) -> int:
+        """登録されたネットワーク数を返す.
+
+        Returns:
+            登録されたネットワーク数
+
+        """
+        return len(self.networks)
+
+    def match_ipv4(self, addresses: npt.NDArray[np.uint32]) -> npt.NDArray[np.intp]:
+        """IPv4アドレスの配列を最長一致のネットワークに一致させる.
+
+        Args:
+            addresses: uint32のIPv4アドレスの配列
+
+        Returns:
+            一致したネットワークの番号の配列, 一致しない場合は-1
+
+        """
+        return _search(self._ipv4_starts, self._ipv4_ends, self._ipv4_indices, np.asarray(addresses, dtype=np.uint32))
+
+    def match_ipv6(self, addresses: npt.NDArray[np.uint64]) -> npt.NDArray[np.intp]:
+        """IPv6アドレスの配列を最長一致のネットワークに一致させる.
+
+        Args:
+            addresses: 上位, 下位64ビットの2列のuint64のIPv6アドレスの配列
+
+        Returns:
+            一致したネットワークの番号の配列, 一致しない場合は-1
+
+        """
+        return _search(self._ipv6_starts, self._ipv6_ends, self._ipv6_indices, _pack(np.asarray(addresses, dtype=np.uint64)))
+
+    def match(self, ip_addresses: Iterable[str]) -> npt.NDArray[np.intp]:
+        """IPv4とIPv6が混在するIPアドレスの文字列の配列を最長一致のネットワークに一致させる.
+
+        Args:
+            ip_addresses: IPアドレスの配列またはシーケンス
+
+        Returns:
+            一致したネットワークの番号の配列, 一致しない場合は-1
+
+        Raises:
+            ValidationError: 不正なIPアドレスが含まれる場合
+
+        """
+        values = np.asarray(
+            ip_addresses if isinstance(ip_addresses, np.ndarray) else list(ip_addresses), dtype=np.str_
+        ).ravel()
+        is_ipv6 = np.char.find(values, ":") >= 0
+
+        indices = np.full(len(values), -1, dtype=np.intp)
+        indices[~is_ipv6] = self.match_ipv4(to_ipv4_array(values[~is_ipv6]))
+        indices[is_ipv6] = self.match_ipv6(to_ipv6_array(values[is_ipv6].tolist()))
+        return indices
+
+    def lookup(self, ip_addresses: Iterable[str]) -> dict[str, npt.NDArray[Any]]:
+        """IPアドレスの配列に一致したネットワークの情報を列ごとの配列として返す.
+
+        列はColumnarLookup.lookupと同じ
+
+        Args:
+            ip_addresses: IPアドレスの配列またはシーケンス
+
+        Returns:
+            列名をキーとし, 入力と同じ長さの配列を値とする辞書
+
+        Raises:
+            ValidationError: 不正なIPアドレスが含まれる場合
+
+        """
+        indices = self.match(ip_addresses)
+        return {name: column[indices] for name, column in self._columns.items()}
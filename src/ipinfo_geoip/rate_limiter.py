@@ -0,0 +1,315 @@
+"""GeoLite2 Web Serviceへの問い合わせ数を制限するレートリミッター."""
+
+import asyncio
+import math
+import threading
+import time
+from functools import partial
+
+import redis
+import redis.cluster
+
+from .circuit_breaker import CircuitBreaker
+from .constants import GEOIP_QUOTA_TTL, GEOIP_RATE_LIMIT_KEY_PREFIX
+from .exceptions import RateLimitError
+from .geoip_config import GeoIPConfig
+from .redis_client import _is_unavailable
+from .redis_config import RedisConfig
+from .redis_pool import _get_breaker, _get_client
+
+_limiters: dict[tuple[object, ...], "RateLimiter"] = {}
+_lock = threading.Lock()
+
+
+class RedisRateCounter:
+    """Redisの固定ウィンドウのカウンターで複数のプロセス間の問い合わせ数を制限するクラス.
+
+    window秒ごとのキーをINCRし, limitを超えた場合は次のウィンドウまで待たせる
+    Redisが利用できない場合は制限せず, プロセス内のトークンバケットのみで制限する
+
+    Attributes:
+        client: Redisクライアント
+        key: カウンターのキーの接頭辞
+        limit: 1つのウィンドウで発行できる問い合わせ数
+        window: ウィンドウの秒数
+        breaker: Redisのサーキットブレーカー
+
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis | redis.cluster.RedisCluster,
+        key: str,
+        *,
+        limit: int,
+        window: float,
+        breaker: CircuitBreaker,
+    ) -> None:
+        """RedisRateCounterインスタンスを初期化する.
+
+        Args:
+            client: Redisクライアント
+            key: カウンターのキーの接頭辞
+            limit: 1つのウィンドウで発行できる問い合わせ数
+            window: ウィンドウの秒数
+            breaker: Redisのサーキットブレーカー
+
+        """
+        self.client = client
+        self.key = key
+        self.limit = limit
+        self.window = window
+        self.breaker = breaker
+
+    def reserve(self) -> float:
+        """問い合わせを1件カウントする.
+
+        Returns:
+            問い合わせを発行できる場合は0
+            上限に達している場合は次のウィンドウまでの秒数
+
+        """
+        if not self.breaker.allow():
+            return 0.0
+
+        now = time.time()
+        window = int(now // self.window)
+        key = f"{self.key}{window}"
+        try:
+            pipeline = self.client.pipeline(transaction=False)
+            pipeline.incr(key)
+            pipeline.expire(key, math.ceil(self.window) + 1)
+            count, _ = pipeline.execute()
+        except redis.RedisError as e:
+            if _is_unavailable(e):
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            return 0.0
+
+        self.breaker.record_success()
+        if int(count) <= self.limit:
+            return 0.0
+
+        return (window + 1) * self.window - now
+
+
+class RateLimiter:
+    """GeoLite2 Web Serviceへの問い合わせ数を制限するトークンバケット.
+
+    1つのインスタンスを複数のスレッドから共有できる
+    1件ずつの取得はトークンの補充を最大max_wait秒待ち, それを超える場合は待たずに拒否する
+    一括取得はトークンの補充を待つが, バケットの半分を1件ずつの取得のために残す
+    レスポンスに含まれる残りの問い合わせ数を記録し, 残りがquota_reserve以下になると一括取得を拒否する
+    残りがなくなると1件ずつの取得も拒否する
+    記録した残りの問い合わせ数はGEOIP_QUOTA_TTL秒の間だけ使用する
+
+    Attributes:
+        rate: 1秒あたりの問い合わせ数の上限, 0は制限しない
+        burst: 連続して発行できる問い合わせ数
+        quota_reserve: 一括取得で使用せず, 1件ずつの取得のために残しておく問い合わせ数
+        max_wait: 1件ずつの取得がトークンの補充を待つ最大秒数
+        counter: 複数のプロセス間で共有するカウンター
+
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        *,
+        quota_reserve: int,
+        max_wait: float,
+        counter: RedisRateCounter | None = None,
+    ) -> None:
+        """RateLimiterインスタンスを初期化する.
+
+        Args:
+            rate: 1秒あたりの問い合わせ数の上限, 0は制限しない
+            burst: 連続して発行できる問い合わせ数
+            quota_reserve: 一括取得で使用せず, 1件ずつの取得のために残しておく問い合わせ数
+            max_wait: 1件ずつの取得がトークンの補充を待つ最大秒数
+            counter: 複数のプロセス間で共有するカウンター
+
+        """
+        self.rate = rate
+        self.burst = burst
+        self.quota_reserve = quota_reserve
+        self.max_wait = max_wait
+        self.counter = counter
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._remaining: int | None = None
+        self._remaining_at = 0.0
+
+    def update(self, queries_remaining: int | None) -> None:
+        """GeoLite2 Web Serviceが返した残りの問い合わせ数を記録する.
+
+        Args:
+            queries_remaining: 残りの問い合わせ数, 不明な場合はNone
+
+        """
+        if queries_remaining is None:
+            return
+
+        with self._lock:
+            self._remaining = queries_remaining
+            self._remaining_at = time.monotonic()
+
+    def reserve(self, *, batch: bool = False) -> float:
+        """問い合わせを1件発行するためのトークンを取得する.
+
+        Args:
+            batch: 一括取得の場合True
+
+        Returns:
+            トークンを取得できた場合は0
+            取得できない場合は再試行するまでの秒数
+
+        Raises:
+            RateLimitError: 残りの問い合わせ数が足りない場合
+
+        """
+        with self._lock:
+            self._check_quota(batch=batch)
+            if self.rate > 0:
+                now = time.monotonic()
+                self._tokens = min(float(self.burst), self._tokens + (now - self._refilled_at) * self.rate)
+                self._refilled_at = now
+                floor = 1 + (self.burst // 2 if batch else 0)
+                if self._tokens < floor:
+                    return (floor - self._tokens) / self.rate
+                self._tokens -= 1
+            if self._remaining is not None:
+                self._remaining -= 1
+
+        wait = self.counter.reserve() if self.counter is not None and self.rate > 0 else 0.0
+        if wait > 0:
+            with self._lock:
+                self._tokens += 1
+                if self._remaining is not None:
+                    self._remaining += 1
+
+        return wait
+
+    def _check_quota(self, *, batch: bool) -> None:
+        """残りの問い合わせ数を確認する.
+
+        Args:
+            batch: 一括取得の場合True
+
+        Raises:
+            RateLimitError: 残りの問い合わせ数が足りない場合
+
+        """
+        if self._remaining is None:
+            return
+
+        if time.monotonic() - self._remaining_at >= GEOIP_QUOTA_TTL:
+            self._remaining = None
+            return
+
+        if self._remaining <= (self.quota_reserve if batch else 0):
+            msg = "GeoIP query quota exhausted"
+            raise RateLimitError(msg, {"queries_remaining": self._remaining})
+
+    def acquire(self, *, batch: bool = False) -> None:
+        """トークンを取得できるまで待つ.
+
+        Args:
+            batch: 一括取得の場合True
+
+        Raises:
+            RateLimitError: 1件ずつの取得でmax_wait秒以内にトークンを取得できない場合,
+                または残りの問い合わせ数が足りない場合
+
+        """
+        deadline = time.monotonic() + self.max_wait
+        while (wait := self.reserve(batch=batch)) > 0:
+            self._check_deadline(deadline, wait, batch=batch)
+            time.sleep(wait)
+
+    async def acquire_async(self, *, batch: bool = False) -> None:
+        """トークンを取得できるまで非同期に待つ.
+
+        共有するカウンターへの問い合わせはイベントループを止めないよう別スレッドで行う
+
+        Args:
+            batch: 一括取得の場合True
+
+        Raises:
+            RateLimitError: 1件ずつの取得でmax_wait秒以内にトークンを取得できない場合,
+                または残りの問い合わせ数が足りない場合
+
+        """
+        reserve = partial(self.reserve, batch=batch)
+        deadline = time.monotonic() + self.max_wait
+        while (wait := reserve() if self.counter is None else await asyncio.to_thread(reserve)) > 0:
+            self._check_deadline(deadline, wait, batch=batch)
+            await asyncio.sleep(wait)
+
+    def _check_deadline(self, deadline: float, wait: float, *, batch: bool) -> None:
+        """待ち時間が1件ずつの取得の上限を超えないか確認する.
+
+        Args:
+            deadline: 待つことができる期限
+            wait: 再試行するまでの秒数
+            batch: 一括取得の場合True
+
+        Raises:
+            RateLimitError: 1件ずつの取得で期限を超える場合
+
+        """
+        if not batch and time.monotonic() + wait > deadline:
+            msg = "GeoIP rate limit exceeded"
+            raise RateLimitError(msg, {"retry_after": wait})
+
+
+def _get_rate_limiter(config: GeoIPConfig) -> RateLimiter:
+    """アカウントIDごとに共有するレートリミッターを返す.
+
+    問い合わせ数の上限はアカウントごとに決まるため,
+    同じアカウントIDと設定のクライアントはプロセス内で1つのレートリミッターを共有する
+
+    Args:
+        config: GeoLite2 Web Service接続設定
+
+    Returns:
+        共有するレートリミッター
+
+    Raises:
+        ValidationError: 共有するカウンターのRedis接続設定が不正な場合
+
+    """
+    key = (
+        config.account_id,
+        config.rate_limit,
+        config.rate_limit_burst,
+        config.rate_limit_max_wait,
+        config.rate_limit_shared,
+        config.quota_reserve,
+    )
+    with _lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            counter = None
+            if config.rate_limit_shared and config.rate_limit > 0:
+                redis_config = RedisConfig.from_env()
+                counter = RedisRateCounter(
+                    _get_client(redis_config, decode_responses=True),
+                    f"{GEOIP_RATE_LIMIT_KEY_PREFIX}{config.account_id}:",
+                    limit=config.rate_limit_burst,
+                    window=config.rate_limit_burst / config.rate_limit,
+                    breaker=_get_breaker(redis_config),
+                )
+            limiter = RateLimiter(
+                config.rate_limit,
+                config.rate_limit_burst,
+                quota_reserve=config.quota_reserve,
+                max_wait=config.rate_limit_max_wait,
+                counter=counter,
+            )
+            _limiters[key] = limiter
+
+        return limiter
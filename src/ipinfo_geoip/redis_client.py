@@ -1,18 +1,568 @@
 """Redisクライアント."""
 
 import ipaddress
-from collections import UserDict
-from typing import cast
+import time
+from collections.abc import Callable, Iterable, Mapping
+from functools import partial
+from typing import TypeAlias, TypeVar, cast
 
 import redis
+import redis.asyncio.client
+import redis.asyncio.cluster
+import redis.client
+import redis.cluster
+from redis.crc import key_slot
 
+from .constants import (
+    CIRCUIT_OPEN,
+    COUNTRY_CODE_LENGTH,
+    REDIS_BINARY_KEY_PREFIX,
+    REDIS_RANGE_PRUNE_BATCH,
+    REDIS_RANGE_READ_BATCH,
+    REDIS_STORAGE_BINARY,
+    REDIS_STORAGE_NETWORK,
+)
 from .exceptions import ConfigurationError, RedisClientError, ValidationError
 from .ipdata import IPData
 from .redis_config import RedisConfig
+from .redis_pool import _get_breaker, _get_client
+from .to_address import _to_address, _to_network
 
+T = TypeVar("T")
 
-class RedisClient(UserDict[str, IPData | None]):
-    """Redisクライアント."""
+_Pipeline: TypeAlias = (
+    redis.client.Pipeline
+    | redis.asyncio.client.Pipeline
+    | redis.cluster.ClusterPipeline
+    | redis.asyncio.cluster.ClusterPipeline
+)
+
+
+def _to_ip_data(ip_address: str, response: object) -> IPData | None:
+    """HGETALLの結果をIPアドレス情報に変換する.
+
+    Args:
+        ip_address: IPアドレス
+        response: HGETALLの結果
+
+    Returns:
+        IPアドレス情報
+        存在しないことがキャッシュされている場合は空のIPアドレス情報
+        データが空または不完全な場合はNone
+
+    """
+    if not response:
+        return None
+
+    response = cast("dict[str, str]", response)
+    network = response["network"]
+    as_number = response["as_number"]
+    country = response["country"]
+    organization = response["organization"]
+
+    if network == "" and as_number == "" and country == "" and organization == "":
+        return IPData.from_trusted(ip_address, "", "", "", "")
+
+    if network == "" or as_number == "" or country == "" or organization == "":
+        return None
+
+    return IPData.from_trusted(ip_address, network, as_number, country, organization)
+
+
+def _legacy_to_ip_data(ip_address: str, response: object) -> IPData | None:
+    """デコードされていないHGETALLの結果をIPアドレス情報に変換する.
+
+    バイナリ形式のクライアントは応答をデコードしないため, 移行前のハッシュの読み込みに使用する
+
+    Args:
+        ip_address: IPアドレス
+        response: HGETALLの結果
+
+    Returns:
+        IPアドレス情報
+        存在しないことがキャッシュされている場合は空のIPアドレス情報
+        データが空または不完全な場合はNone
+
+    """
+    fields = cast("dict[bytes, bytes]", response)
+    return _to_ip_data(ip_address, {name.decode(): value.decode() for name, value in fields.items()})
+
+
+def _binary_key(ip_address: str) -> bytes:
+    """バイナリ形式のキーを返す.
+
+    キーは接頭辞とパックしたIPアドレス(IPv4は4バイト, IPv6は16バイト)からなる
+    IPv4の/16, IPv6の/32をハッシュタグとし, Redis Clusterでは近いアドレスを同じハッシュスロットに置く
+
+    Args:
+        ip_address: IPアドレス
+
+    Returns:
+        バイナリ形式のキー
+
+    """
+    packed = _to_address(ip_address).packed
+    tag_length = len(packed) // 2 if len(packed) == 4 else len(packed) // 4  # noqa: PLR2004
+    return REDIS_BINARY_KEY_PREFIX + b"{" + packed[:tag_length] + b"}" + packed[tag_length:]
+
+
+def _to_binary(ip_data: IPData) -> bytes:
+    """IPアドレス情報をバイナリ形式の値に変換する.
+
+    値の形式は以下のとおり(AS番号はビッグエンディアン)
+    プレフィックス長(1) + AS番号(4) + 国コード(2) + 組織名(UTF-8)
+    ネットワークアドレスはIPアドレスとプレフィックス長から求められるため保存しない
+
+    Args:
+        ip_data: 完全なIPアドレス情報
+
+    Returns:
+        バイナリ形式の値
+
+    """
+    prefixlen = int(ip_data.network.rsplit("/", 1)[1])
+    return (
+        bytes([prefixlen]) + ip_data.asn.to_bytes(4, "big") + ip_data.country.encode("ascii") + ip_data.organization.encode()
+    )
+
+
+def _binary_to_ip_data(ip_address: str, response: object) -> IPData | None:
+    """GETの結果をIPアドレス情報に変換する.
+
+    空の値はIPアドレス情報が存在しないことを表す
+
+    Args:
+        ip_address: IPアドレス
+        response: GETの結果
+
+    Returns:
+        IPアドレス情報
+        存在しないことがキャッシュされている場合は空のIPアドレス情報
+        データがない場合, または不正な場合はNone
+
+    """
+    if response is None:
+        return None
+
+    value = cast("bytes", response)
+    if not value:
+        return IPData.from_trusted(ip_address, "", "", "", "")
+
+    if len(value) <= 5 + COUNTRY_CODE_LENGTH:
+        return None
+
+    prefixlen = value[0]
+    as_number = int.from_bytes(value[1:5], "big")
+    country = value[5 : 5 + COUNTRY_CODE_LENGTH].decode("ascii")
+    organization = value[5 + COUNTRY_CODE_LENGTH :].decode()
+
+    return IPData.from_trusted(ip_address, f"{ip_address}/{prefixlen}", as_number, country, organization)
+
+
+def _legacy_targets(results: Mapping[str, IPData | None], storage: str) -> list[str]:
+    """移行前のハッシュを読み込むIPアドレスを返す.
+
+    Args:
+        results: IPアドレスをキーとするIPアドレス情報の辞書
+        storage: キャッシュの保存形式
+
+    Returns:
+        バイナリ形式で見つからなかったIPアドレス
+        バイナリ形式でない場合は空のリスト
+
+    """
+    if storage != REDIS_STORAGE_BINARY:
+        return []
+
+    return [ip_address for ip_address, ip_data in results.items() if ip_data is None]
+
+
+def _range_key(version: int) -> str:
+    """ネットワーク範囲キャッシュのキーを返す.
+
+    Args:
+        version: IPバージョン
+
+    Returns:
+        ネットワーク範囲キャッシュのソート済みセットのキー
+
+    """
+    return f"ipinfo:networks:{version}"
+
+
+def _expiry_key(version: int) -> str:
+    """ネットワーク範囲キャッシュの有効期限のキーを返す.
+
+    Args:
+        version: IPバージョン
+
+    Returns:
+        メンバーを有効期限のスコアで保持するソート済みセットのキー
+
+    """
+    return f"ipinfo:networks:{version}:expires"
+
+
+def _to_hex(value: int, version: int) -> str:
+    """整数のIPアドレスを固定長の16進数文字列に変換する.
+
+    固定長のため辞書順と数値順が一致する
+
+    Args:
+        value: 整数のIPアドレス
+        version: IPバージョン
+
+    Returns:
+        16進数文字列
+
+    """
+    width = 8 if version == 4 else 32  # noqa: PLR2004
+    return f"{value:0{width}x}"
+
+
+def _range_query(ip_address: str) -> tuple[str, str, str]:
+    """IPアドレスを含むネットワーク範囲を検索するZRANGEBYLEXの引数を返す.
+
+    メンバーは終了アドレスから始まるため, 終了アドレスがIPアドレス以上の最初のメンバーが候補となる
+
+    Args:
+        ip_address: 検索するIPアドレス
+
+    Returns:
+        キー, 最小値, 最大値
+
+    """
+    address = _to_address(ip_address)
+    return _range_key(address.version), f"[{_to_hex(int(address), address.version)}", "+"
+
+
+def _range_to_ip_data(ip_address: str, response: object) -> IPData | None:
+    """ZRANGEBYLEXの結果をIPアドレス情報に変換する.
+
+    Args:
+        ip_address: IPアドレス
+        response: ZRANGEBYLEXの結果
+
+    Returns:
+        IPアドレス情報
+        存在しないことがキャッシュされている場合は空のIPアドレス情報
+        IPアドレスを含むネットワークがない場合, または有効期限切れの場合はNone
+
+    """
+    if not response:
+        return None
+
+    member = cast("list[str]", response)[0]
+    end, start, prefixlen, as_number, country, expires_at, organization = member.split("|", 6)
+
+    address = _to_address(ip_address)
+    if not int(start, 16) <= int(address) <= int(end, 16) or int(expires_at) <= time.time():
+        return None
+
+    if as_number == "":
+        return IPData.from_trusted(ip_address, "", "", "", "")
+
+    network_class = ipaddress.IPv4Network if address.version == 4 else ipaddress.IPv6Network  # noqa: PLR2004
+    network = network_class((int(start, 16), int(prefixlen)))
+
+    return IPData.from_trusted(ip_address, str(network), as_number, country, organization)
+
+
+def _member_to_network(member: str, version: int) -> IPData | None:
+    """ネットワーク範囲キャッシュのメンバーをネットワークのIPアドレス情報に変換する.
+
+    Args:
+        member: ソート済みセットのメンバー
+        version: IPバージョン
+
+    Returns:
+        ネットワークアドレスをIPアドレスとするIPアドレス情報
+        存在しないことを表すメンバーの場合, または有効期限切れの場合はNone
+
+    """
+    _, start, prefixlen, as_number, country, expires_at, organization = member.split("|", 6)
+    if as_number == "" or int(expires_at) <= time.time():
+        return None
+
+    network_class = ipaddress.IPv4Network if version == 4 else ipaddress.IPv6Network  # noqa: PLR2004
+    network = network_class((int(start, 16), int(prefixlen)))
+
+    return IPData.from_trusted(str(network.network_address), str(network), as_number, country, organization)
+
+
+def _queue_range(
+    pipeline: _Pipeline,
+    ip_data: IPData,
+    ttl: int,
+) -> None:
+    """ネットワーク範囲を保存するコマンドをパイプラインに追加する.
+
+    同じネットワークの既存メンバーは置き換えられる
+    AS番号が空のメンバーはIPアドレス情報が存在しないことを表す
+    ソート済みセットはすべてのネットワークで共有するためEXPIREは使用せず,
+    メンバーごとの有効期限をメンバー自体と有効期限のソート済みセットのスコアに保存する
+
+    Args:
+        pipeline: コマンドを追加するパイプライン
+        ip_data: 保存するIPアドレス情報
+        ttl: キャッシュのTTL(秒)
+
+    """
+    network = _to_network(ip_data.network)
+    name = _range_key(network.version)
+    start = _to_hex(int(network.network_address), network.version)
+    end = _to_hex(int(network.broadcast_address), network.version)
+    prefix = f"{end}|{start}|"
+    expires_at = int(time.time()) + ttl
+    member = f"{prefix}{network.prefixlen}|{ip_data.as_number}|{ip_data.country}|{expires_at}|{ip_data.organization}"
+
+    pipeline.zremrangebylex(name, f"[{prefix}", f"({prefix}~")
+    pipeline.zadd(name, {member: 0})
+    pipeline.zadd(_expiry_key(network.version), {member: expires_at})
+
+
+def _queue_expired(pipeline: _Pipeline) -> None:
+    """有効期限切れのネットワーク範囲を取得するコマンドをパイプラインに追加する.
+
+    IPv4, IPv6の順にREDIS_RANGE_PRUNE_BATCH件までのメンバーを取得する
+
+    Args:
+        pipeline: コマンドを追加するパイプライン
+
+    """
+    now = int(time.time())
+    for version in (4, 6):
+        pipeline.zrangebyscore(_expiry_key(version), "-inf", now, start=0, num=REDIS_RANGE_PRUNE_BATCH)
+
+
+def _queue_prune(pipeline: _Pipeline, responses: list[object]) -> bool:
+    """_queue_expiredで取得した有効期限切れのメンバーを削除するコマンドをパイプラインに追加する.
+
+    Args:
+        pipeline: コマンドを追加するパイプライン
+        responses: _queue_expiredを最後に追加したパイプラインの応答
+
+    Returns:
+        削除するコマンドを追加した場合はTrue
+
+    """
+    queued = False
+    for version, response in zip((4, 6), responses[-2:], strict=True):
+        members = cast("list[str]", response)
+        if members:
+            pipeline.zrem(_range_key(version), *members)
+            pipeline.zrem(_expiry_key(version), *members)
+            queued = True
+
+    return queued
+
+
+def _queue_get(
+    pipeline: _Pipeline,
+    ip_address: str,
+    storage: str,
+) -> None:
+    """IPアドレス情報を取得するコマンドをパイプラインに追加する.
+
+    Args:
+        pipeline: コマンドを追加するパイプライン
+        ip_address: 検索するIPアドレス
+        storage: キャッシュの保存形式
+
+    """
+    if storage == REDIS_STORAGE_NETWORK:
+        name, minimum, maximum = _range_query(ip_address)
+        pipeline.zrangebylex(name, minimum, maximum, start=0, num=1)
+    elif storage == REDIS_STORAGE_BINARY:
+        pipeline.get(_binary_key(ip_address))
+    else:
+        pipeline.hgetall(f"ipinfo:{ip_address}")
+
+
+def _queue_get_many(pipeline: _Pipeline, ip_addresses: list[str], storage: str, *, cluster: bool) -> list[str]:
+    """複数のIPアドレス情報を取得するコマンドをパイプラインに追加する.
+
+    バイナリ形式ではMGETでまとめて取得する
+    Redis Clusterでは1つのMGETのキーが同じハッシュスロットになるよう, ハッシュスロットごとにMGETを分ける
+
+    Args:
+        pipeline: コマンドを追加するパイプライン
+        ip_addresses: 検索するIPアドレス
+        storage: キャッシュの保存形式
+        cluster: Redis Clusterかどうか
+
+    Returns:
+        _flatten_responsesで展開した応答の順のIPアドレス
+
+    """
+    if storage != REDIS_STORAGE_BINARY:
+        for ip_address in ip_addresses:
+            _queue_get(pipeline, ip_address, storage)
+        return ip_addresses
+
+    groups: dict[int, list[str]] = {}
+    for ip_address in ip_addresses:
+        slot = key_slot(_binary_key(ip_address)) if cluster else 0
+        groups.setdefault(slot, []).append(ip_address)
+
+    ordered: list[str] = []
+    for group in groups.values():
+        pipeline.mget([_binary_key(ip_address) for ip_address in group])
+        ordered.extend(group)
+
+    return ordered
+
+
+def _flatten_responses(responses: list[object], storage: str) -> list[object]:
+    """_queue_get_manyで追加したコマンドの応答をIPアドレスごとの応答に展開する.
+
+    Args:
+        responses: パイプラインの応答
+        storage: キャッシュの保存形式
+
+    Returns:
+        IPアドレスごとの応答
+
+    """
+    if storage != REDIS_STORAGE_BINARY:
+        return responses
+
+    return [value for response in responses for value in cast("list[object]", response)]
+
+
+def _queue_set(
+    pipeline: _Pipeline,
+    ip_address: str,
+    ip_data: IPData,
+    storage: str,
+    ttl: int,
+) -> None:
+    """IPアドレス情報を保存するコマンドをパイプラインに追加する.
+
+    Args:
+        pipeline: コマンドを追加するパイプライン
+        ip_address: IPアドレス
+        ip_data: 保存するIPアドレス情報
+        storage: キャッシュの保存形式
+        ttl: キャッシュのTTL(秒)
+
+    """
+    if storage == REDIS_STORAGE_NETWORK:
+        _queue_range(pipeline, ip_data, ttl)
+    elif storage == REDIS_STORAGE_BINARY:
+        pipeline.set(_binary_key(ip_address), _to_binary(ip_data), ex=ttl)
+    else:
+        name = f"ipinfo:{ip_address}"
+        pipeline.hset(name, mapping=ip_data.to_dict())
+        pipeline.expire(name, ttl)
+
+
+def _queue_set_not_found(
+    pipeline: _Pipeline,
+    ip_address: str,
+    storage: str,
+    ttl: int,
+) -> None:
+    """IPアドレス情報が存在しないことを保存するコマンドをパイプラインに追加する.
+
+    IPアドレス以外のフィールドが空のIPアドレス情報として保存する
+    ネットワーク範囲キャッシュではIPアドレスのみを含むネットワークとして, メンバーごとの有効期限で保存する
+    バイナリ形式では空の値として保存する
+
+    Args:
+        pipeline: コマンドを追加するパイプライン
+        ip_address: IPアドレス
+        storage: キャッシュの保存形式
+        ttl: キャッシュのTTL(秒)
+
+    """
+    if storage == REDIS_STORAGE_NETWORK:
+        _queue_range(pipeline, IPData(ip_address, ip_address, "", "", ""), ttl)
+    elif storage == REDIS_STORAGE_BINARY:
+        pipeline.set(_binary_key(ip_address), b"", ex=ttl)
+    else:
+        name = f"ipinfo:{ip_address}"
+        pipeline.hset(name, mapping=IPData(ip_address, "", "", "", "").to_dict())
+        pipeline.expire(name, ttl)
+
+
+def _response_to_ip_data(ip_address: str, response: object, storage: str) -> IPData | None:
+    """Redisの応答をIPアドレス情報に変換する.
+
+    Args:
+        ip_address: IPアドレス
+        response: Redisの応答
+        storage: キャッシュの保存形式
+
+    Returns:
+        IPアドレス情報
+        見つからない場合はNone
+
+    """
+    if storage == REDIS_STORAGE_NETWORK:
+        return _range_to_ip_data(ip_address, response)
+    if storage == REDIS_STORAGE_BINARY:
+        return _binary_to_ip_data(ip_address, response)
+
+    return _to_ip_data(ip_address, response)
+
+
+def _is_unavailable(error: redis.RedisError) -> bool:
+    """Redisが利用できないことを表すエラーか判定する.
+
+    Args:
+        error: Redisのエラー
+
+    Returns:
+        接続エラー, タイムアウト, クラスタの停止の場合True
+
+    """
+    return isinstance(error, (redis.ConnectionError, redis.TimeoutError, redis.exceptions.ClusterDownError))
+
+
+def _to_client_error(error: redis.RedisError) -> RedisClientError:
+    """RedisのエラーをRedisClientErrorに変換する.
+
+    Args:
+        error: Redisのエラー
+
+    Returns:
+        変換したRedisClientError
+
+    """
+    if isinstance(error, redis.ConnectionError):
+        msg = f"Redis connection error: {error}"
+    elif isinstance(error, redis.TimeoutError):
+        msg = f"Redis timeout: {error}"
+    else:
+        msg = f"Redis error: {error}"
+
+    return RedisClientError(msg, {"error": str(error)})
+
+
+def _breaker_open_error() -> RedisClientError:
+    """サーキットブレーカーが開いていることを表すRedisClientErrorを返す.
+
+    Returns:
+        RedisClientError
+
+    """
+    msg = "Redis circuit breaker is open"
+    return RedisClientError(msg, {"state": CIRCUIT_OPEN})
+
+
+class RedisClient:
+    """Redisクライアント.
+
+    同じ接続URIと設定のインスタンスはプロセス内で1つのコネクションプールを共有する
+    Redis Clusterではハッシュスロットをまたぐためトランザクションを使用しない
+    接続URIごとに共有するサーキットブレーカーが開いている間はRedisに接続せずにRedisClientErrorを送出する
+    クライアントサイドキャッシュを使用する場合, 1件ずつの取得は他のプロセスが更新するまでプロセス内のキャッシュから返す
+    (パイプラインによるget_manyはキャッシュを経由しない)
+    バイナリ形式ではバイト列のまま読み書きするため応答をデコードしない
+    バイナリ形式で見つからないIPアドレスは移行前のハッシュから読み込む
+    Redisから読み込んだIPアドレス情報はこのクラスでは保持しない
+    """
 
     def __init__(self) -> None:
         """RedisClientインスタンスを初期化する.
@@ -21,18 +571,50 @@ class RedisClient(UserDict[str, IPData | None]):
             ConfigurationError: 必要な認証情報が不足している場合
 
         """
-        super().__init__()
-
         try:
             config = RedisConfig.from_env()
         except ValidationError as e:
             msg = "Redis configuration error"
             raise ConfigurationError(msg, {"error": str(e)}) from e
 
-        self.client = redis.Redis.from_url(config.uri, decode_responses=True)
+        self.client = _get_client(config, decode_responses=config.storage != REDIS_STORAGE_BINARY)
         self.ttl = config.ttl
+        self.storage = config.storage
+        self.negative_ttl = config.negative_ttl
+        self.cluster = config.cluster
+        self.breaker = _get_breaker(config)
+
+    def _call(self, function: Callable[[], T]) -> T:
+        """サーキットブレーカーを通してRedisのコマンドを実行する.
+
+        Redisが利用できないことを表すエラーはサーキットブレーカーに失敗として記録する
+
+        Args:
+            function: Redisのコマンドを実行する関数
+
+        Returns:
+            関数の戻り値
+
+        Raises:
+            RedisClientError: サーキットブレーカーが開いている場合, またはRedisでエラーが発生した場合
+
+        """
+        if not self.breaker.allow():
+            raise _breaker_open_error()
+
+        try:
+            result = function()
+        except redis.RedisError as e:
+            if _is_unavailable(e):
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            raise _to_client_error(e) from e
+
+        self.breaker.record_success()
+        return result
 
-    def __missing__(self, ip_address: str) -> IPData | None:
+    def get(self, ip_address: str) -> IPData | None:
         """RedisからIPアドレス情報を取得する.
 
         Args:
@@ -40,6 +622,7 @@ class RedisClient(UserDict[str, IPData | None]):
 
         Returns:
             Redisから取得したIPアドレス情報
+            存在しないことがキャッシュされている場合は空のIPアドレス情報
             見つからない場合はNone
 
         Raises:
@@ -48,36 +631,28 @@ class RedisClient(UserDict[str, IPData | None]):
 
         """
         try:
-            _ = ipaddress.ip_address(ip_address)
+            _ = _to_address(ip_address)
         except ValueError as e:
             msg = f"Invalid IP address: {ip_address}"
             raise ValidationError(msg, {"error": str(e)}) from e
 
-        try:
-            response = self.client.hgetall(f"ipinfo:{ip_address}")
-        except redis.ConnectionError as e:
-            msg = f"Redis connection error: {e}"
-            raise RedisClientError(msg, {"error": str(e)}) from e
-
-        if not response:
-            return None
-
-        response = cast("dict[str, str]", response)
-        network = response["network"]
-        as_number = response["as_number"]
-        country = response["country"]
-        organization = response["organization"]
-
-        if network == "" or as_number == "" or country == "" or organization == "":
-            return None
+        command: Callable[[], object]
+        if self.storage == REDIS_STORAGE_NETWORK:
+            name, minimum, maximum = _range_query(ip_address)
+            command = partial(self.client.zrangebylex, name, minimum, maximum, start=0, num=1)
+        elif self.storage == REDIS_STORAGE_BINARY:
+            command = partial(self.client.get, _binary_key(ip_address))
+        else:
+            command = partial(self.client.hgetall, f"ipinfo:{ip_address}")
 
-        ip_data = IPData(ip_address, network, as_number, country, organization)
+        response = self._call(command)
 
-        super().__setitem__(ip_address, ip_data)
+        result = {ip_address: _response_to_ip_data(ip_address, response, self.storage)}
+        result.update(self._get_legacy(_legacy_targets(result, self.storage)))
 
-        return ip_data
+        return result[ip_address]
 
-    def __setitem__(self, ip_address: str, ip_data: IPData | None) -> None:
+    def put(self, ip_address: str, ip_data: IPData | None) -> None:
         """IPアドレス情報をRedisに保存する.
 
         Args:
@@ -85,11 +660,12 @@ class RedisClient(UserDict[str, IPData | None]):
             ip_data: 保存するIPアドレス情報
 
         Raises:
+            RedisClientError: サーキットブレーカーが開いている場合, またはRedisでエラーが発生した場合
             ValidationError: ip_addressが不正な場合
 
         """
         try:
-            _ = ipaddress.ip_address(ip_address)
+            _ = _to_address(ip_address)
         except ValueError as e:
             msg = f"Invalid IP address: {ip_address}"
             raise ValidationError(msg, {"error": str(e)}) from e
@@ -97,12 +673,181 @@ class RedisClient(UserDict[str, IPData | None]):
         if ip_data is None or not ip_data.is_complete():
             return
 
-        name = f"ipinfo:{ip_address}"
-        mapping = ip_data.to_dict()
+        pipeline = self.client.pipeline(transaction=not self.cluster)
+        _queue_set(pipeline, ip_address, ip_data, self.storage, self.ttl)
+        self._execute_set(pipeline)
+
+    def get_many(self, ip_addresses: Iterable[str]) -> dict[str, IPData | None]:
+        """複数のIPアドレス情報を1回のパイプラインでRedisから取得する.
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+
+        Returns:
+            IPアドレスをキーとするIPアドレス情報の辞書
+            存在しないことがキャッシュされているIPアドレスは空のIPアドレス情報
+            見つからないIPアドレスはNone
+
+        Raises:
+            RedisClientError: Redisでエラーが発生した場合
+            ValidationError: ip_addressesに不正なIPアドレスが含まれる場合
+
+        """
+        targets = list(dict.fromkeys(ip_addresses))
+        for ip_address in targets:
+            try:
+                _ = _to_address(ip_address)
+            except ValueError as e:
+                msg = f"Invalid IP address: {ip_address}"
+                raise ValidationError(msg, {"error": str(e)}) from e
+
+        if not targets:
+            return {}
+
+        pipeline = self.client.pipeline(transaction=False)
+        ordered = _queue_get_many(pipeline, targets, self.storage, cluster=self.cluster)
+
+        responses = _flatten_responses(self._call(pipeline.execute), self.storage)
+
+        results = {
+            ip_address: _response_to_ip_data(ip_address, response, self.storage)
+            for ip_address, response in zip(ordered, responses, strict=True)
+        }
+        results.update(self._get_legacy(_legacy_targets(results, self.storage)))
+
+        return {ip_address: results[ip_address] for ip_address in targets}
+
+    def networks(self) -> list[IPData]:
+        """ネットワーク範囲キャッシュに保存された有効期限内のネットワークを取得する.
+
+        REDIS_RANGE_READ_BATCH件ずつ, 前回の最後のメンバーより後のメンバーをZRANGEBYLEXで読み込む
+        存在しないことを表すメンバーは含まない
+
+        Returns:
+            ネットワークアドレスをIPアドレスとするIPアドレス情報のリスト
+
+        Raises:
+            ConfigurationError: 保存形式がネットワーク範囲キャッシュでない場合
+            RedisClientError: Redisでエラーが発生した場合
+
+        """
+        if self.storage != REDIS_STORAGE_NETWORK:
+            msg = "Redis configuration error"
+            raise ConfigurationError(msg, {"error": f"Networks are only kept in {REDIS_STORAGE_NETWORK} storage"})
+
+        networks: list[IPData] = []
+        for version in (4, 6):
+            minimum = "-"
+            while True:
+                command = partial(
+                    self.client.zrangebylex, _range_key(version), minimum, "+", start=0, num=REDIS_RANGE_READ_BATCH
+                )
+                members = cast("list[str]", self._call(command))
+                networks.extend(
+                    ip_data for ip_data in (_member_to_network(member, version) for member in members) if ip_data is not None
+                )
+                if len(members) < REDIS_RANGE_READ_BATCH:
+                    break
+                minimum = f"({members[-1]}"
+
+        return networks
+
+    def _get_legacy(self, ip_addresses: list[str]) -> dict[str, IPData | None]:
+        """移行前のハッシュから複数のIPアドレス情報を1回のパイプラインで取得する.
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+
+        Returns:
+            IPアドレスをキーとするIPアドレス情報の辞書
+
+        Raises:
+            RedisClientError: Redisでエラーが発生した場合
+
+        """
+        if not ip_addresses:
+            return {}
+
+        pipeline = self.client.pipeline(transaction=False)
+        for ip_address in ip_addresses:
+            pipeline.hgetall(f"ipinfo:{ip_address}")
+
+        responses = self._call(pipeline.execute)
+
+        return {
+            ip_address: _legacy_to_ip_data(ip_address, response)
+            for ip_address, response in zip(ip_addresses, responses, strict=True)
+        }
+
+    def set_not_found(self, ip_address: str) -> None:
+        """IPアドレス情報が存在しないことをRedisに保存する.
+
+        保存したエントリはnegative_ttlで失効する
+
+        Args:
+            ip_address: IPアドレス
+
+        Raises:
+            RedisClientError: サーキットブレーカーが開いている場合, またはRedisでエラーが発生した場合
+            ValidationError: ip_addressが不正な場合
+
+        """
+        self.set_many({}, [ip_address])
+
+    def set_many(self, items: Mapping[str, IPData | None], not_found: Iterable[str] = ()) -> None:
+        """複数のIPアドレス情報を1回のパイプラインでRedisに保存する.
+
+        不完全なIPアドレス情報は保存されない
+
+        Args:
+            items: IPアドレスをキーとするIPアドレス情報の辞書
+            not_found: IPアドレス情報が存在しないIPアドレス
+
+        Raises:
+            RedisClientError: サーキットブレーカーが開いている場合, またはRedisでエラーが発生した場合
+            ValidationError: itemsまたはnot_foundに不正なIPアドレスが含まれる場合
+
+        """
+        not_found = list(dict.fromkeys(not_found))
+        for ip_address in [*items, *not_found]:
+            try:
+                _ = _to_address(ip_address)
+            except ValueError as e:
+                msg = f"Invalid IP address: {ip_address}"
+                raise ValidationError(msg, {"error": str(e)}) from e
+
+        complete = {
+            ip_address: ip_data for ip_address, ip_data in items.items() if ip_data is not None and ip_data.is_complete()
+        }
+        if not complete and not not_found:
+            return
+
+        pipeline = self.client.pipeline(transaction=not self.cluster)
+        for ip_address, ip_data in complete.items():
+            _queue_set(pipeline, ip_address, ip_data, self.storage, self.ttl)
+        for ip_address in not_found:
+            _queue_set_not_found(pipeline, ip_address, self.storage, self.negative_ttl)
+        self._execute_set(pipeline)
+
+    def _execute_set(self, pipeline: redis.client.Pipeline | redis.cluster.ClusterPipeline) -> None:
+        """保存するコマンドを追加したパイプラインを実行する.
+
+        ネットワーク範囲キャッシュでは有効期限切れのメンバーを同じパイプラインで取得し, 存在する場合は削除する
+
+        Args:
+            pipeline: 保存するコマンドを追加したパイプライン
+
+        Raises:
+            RedisClientError: サーキットブレーカーが開いている場合, またはRedisでエラーが発生した場合
+
+        """
+        if self.storage != REDIS_STORAGE_NETWORK:
+            self._call(pipeline.execute)
+            return
 
-        pipeline = self.client.pipeline()
-        pipeline.hset(name, mapping=mapping)
-        pipeline.expire(name, self.ttl)
-        pipeline.execute()
+        _queue_expired(pipeline)
+        responses = self._call(pipeline.execute)
 
-        super().__setitem__(ip_address, ip_data)
+        pipeline = self.client.pipeline(transaction=False)
+        if _queue_prune(pipeline, responses):
+            self._call(pipeline.execute)
@@ -3,8 +3,35 @@
 import os
 from typing import Self
 
-from .constants import REDIS_CACHE_TTL_ENV, REDIS_URI_ENV
+from .constants import (
+    NEGATIVE_CACHE_TTL,
+    REDIS_BREAKER_RESET_TIMEOUT,
+    REDIS_BREAKER_RESET_TIMEOUT_ENV,
+    REDIS_BREAKER_THRESHOLD,
+    REDIS_BREAKER_THRESHOLD_ENV,
+    REDIS_CACHE_TTL_ENV,
+    REDIS_CLIENT_CACHE_SIZE,
+    REDIS_CLIENT_CACHE_SIZE_ENV,
+    REDIS_CLUSTER,
+    REDIS_CLUSTER_ENV,
+    REDIS_CONNECT_TIMEOUT,
+    REDIS_CONNECT_TIMEOUT_ENV,
+    REDIS_HEALTH_CHECK_INTERVAL,
+    REDIS_HEALTH_CHECK_INTERVAL_ENV,
+    REDIS_KEEPALIVE,
+    REDIS_KEEPALIVE_ENV,
+    REDIS_MAX_CONNECTIONS,
+    REDIS_MAX_CONNECTIONS_ENV,
+    REDIS_NEGATIVE_CACHE_TTL_ENV,
+    REDIS_SOCKET_TIMEOUT,
+    REDIS_SOCKET_TIMEOUT_ENV,
+    REDIS_STORAGE_ENV,
+    REDIS_STORAGE_HASH,
+    REDIS_STORAGE_MODES,
+    REDIS_URI_ENV,
+)
 from .exceptions import ValidationError
+from .to_bool import _to_bool
 
 
 class RedisConfig:
@@ -12,19 +39,105 @@ class RedisConfig:
 
     Attributes:
         uri: Redis接続URI
+        ttl: キャッシュのTTL(秒)
+        storage: キャッシュの保存形式
+        negative_ttl: IPアドレス情報が存在しないことのキャッシュのTTL(秒)
+        max_connections: コネクションプールの最大接続数
+        socket_timeout: コマンドのタイムアウト(秒)
+        connect_timeout: 接続のタイムアウト(秒)
+        health_check_interval: 接続を再利用する前に確認する間隔(秒), 0の場合は確認しない
+        keepalive: TCPキープアライブを使用するかどうか
+        cluster: Redis Clusterに接続するかどうか
+        client_cache_size: クライアントサイドキャッシュの最大エントリ数, 0の場合は使用しない
+        breaker_threshold: サーキットブレーカーが開くまでの連続した失敗の回数
+        breaker_reset_timeout: サーキットブレーカーが開いてから試行を許可するまでの秒数
 
     """
 
-    def __init__(self, uri: str, ttl: str) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        uri: str,
+        ttl: str,
+        storage: str = REDIS_STORAGE_HASH,
+        negative_ttl: str = str(NEGATIVE_CACHE_TTL),
+        *,
+        max_connections: str = str(REDIS_MAX_CONNECTIONS),
+        socket_timeout: str = str(REDIS_SOCKET_TIMEOUT),
+        connect_timeout: str = str(REDIS_CONNECT_TIMEOUT),
+        health_check_interval: str = str(REDIS_HEALTH_CHECK_INTERVAL),
+        keepalive: str = str(REDIS_KEEPALIVE),
+        cluster: str = str(REDIS_CLUSTER),
+        client_cache_size: str = str(REDIS_CLIENT_CACHE_SIZE),
+        breaker_threshold: str = str(REDIS_BREAKER_THRESHOLD),
+        breaker_reset_timeout: str = str(REDIS_BREAKER_RESET_TIMEOUT),
+    ) -> None:
         """RedisConfigインスタンスを初期化する.
 
         Args:
             uri: Redis接続URI
             ttl: キャッシュのTTL(秒)
+            storage: キャッシュの保存形式
+            negative_ttl: IPアドレス情報が存在しないことのキャッシュのTTL(秒)
+            max_connections: コネクションプールの最大接続数
+            socket_timeout: コマンドのタイムアウト(秒)
+            connect_timeout: 接続のタイムアウト(秒)
+            health_check_interval: 接続を再利用する前に確認する間隔(秒), 0の場合は確認しない
+            keepalive: TCPキープアライブを使用するかどうか(true/false)
+            cluster: Redis Clusterに接続するかどうか(true/false)
+            client_cache_size: クライアントサイドキャッシュの最大エントリ数, 0の場合は使用しない
+            breaker_threshold: サーキットブレーカーが開くまでの連続した失敗の回数
+            breaker_reset_timeout: サーキットブレーカーが開いてから試行を許可するまでの秒数
+
+        Raises:
+            ValidationError: storageかTTLが不正な場合, またはコネクションプールの設定が不正な場合
 
         """
+        if storage not in REDIS_STORAGE_MODES:
+            msg = f"Storage must be one of {', '.join(REDIS_STORAGE_MODES)}"
+            raise ValidationError(msg)
+
         self.uri = uri
-        self.ttl = int(ttl)
+        self.storage = storage
+
+        try:
+            self.ttl = int(ttl)
+            self.negative_ttl = int(negative_ttl)
+            self.max_connections = int(max_connections)
+            self.socket_timeout = float(socket_timeout)
+            self.connect_timeout = float(connect_timeout)
+            self.health_check_interval = int(health_check_interval)
+            self.client_cache_size = int(client_cache_size)
+            self.breaker_threshold = int(breaker_threshold)
+            self.breaker_reset_timeout = float(breaker_reset_timeout)
+        except ValueError as e:
+            raise ValidationError(str(e)) from e
+
+        if self.ttl < 1 or self.negative_ttl < 1:
+            msg = "Redis cache TTLs must be positive"
+            raise ValidationError(msg)
+
+        if self.max_connections < 1:
+            msg = "Redis max connections must be positive"
+            raise ValidationError(msg)
+
+        if self.socket_timeout <= 0 or self.connect_timeout <= 0:
+            msg = "Redis timeouts must be positive"
+            raise ValidationError(msg)
+
+        if self.health_check_interval < 0:
+            msg = "Redis health check interval must not be negative"
+            raise ValidationError(msg)
+
+        if self.client_cache_size < 0:
+            msg = "Redis client cache size must not be negative"
+            raise ValidationError(msg)
+
+        if self.breaker_threshold < 1 or self.breaker_reset_timeout <= 0:
+            msg = "Redis circuit breaker threshold and reset timeout must be positive"
+            raise ValidationError(msg)
+
+        self.keepalive = _to_bool("Redis keepalive", keepalive)
+        self.cluster = _to_bool("Redis cluster", cluster)
 
     @classmethod
     def from_env(cls) -> Self:
@@ -34,7 +147,7 @@ class RedisConfig:
             環境変数から作成されたRedisConfigインスタンス
 
         Raises:
-            ValidationError: 必要な環境変数が設定されていない場合
+            ValidationError: 必要な環境変数が設定されていない場合, または値が不正な場合
 
         """
         missing_vars = []
@@ -49,5 +162,30 @@ class RedisConfig:
 
         uri = os.environ[REDIS_URI_ENV]
         ttl = os.environ[REDIS_CACHE_TTL_ENV]
-
-        return cls(uri, ttl)
+        storage = os.environ.get(REDIS_STORAGE_ENV, REDIS_STORAGE_HASH)
+        negative_ttl = os.environ.get(REDIS_NEGATIVE_CACHE_TTL_ENV, str(NEGATIVE_CACHE_TTL))
+        max_connections = os.environ.get(REDIS_MAX_CONNECTIONS_ENV, str(REDIS_MAX_CONNECTIONS))
+        socket_timeout = os.environ.get(REDIS_SOCKET_TIMEOUT_ENV, str(REDIS_SOCKET_TIMEOUT))
+        connect_timeout = os.environ.get(REDIS_CONNECT_TIMEOUT_ENV, str(REDIS_CONNECT_TIMEOUT))
+        health_check_interval = os.environ.get(REDIS_HEALTH_CHECK_INTERVAL_ENV, str(REDIS_HEALTH_CHECK_INTERVAL))
+        keepalive = os.environ.get(REDIS_KEEPALIVE_ENV, str(REDIS_KEEPALIVE))
+        cluster = os.environ.get(REDIS_CLUSTER_ENV, str(REDIS_CLUSTER))
+        client_cache_size = os.environ.get(REDIS_CLIENT_CACHE_SIZE_ENV, str(REDIS_CLIENT_CACHE_SIZE))
+        breaker_threshold = os.environ.get(REDIS_BREAKER_THRESHOLD_ENV, str(REDIS_BREAKER_THRESHOLD))
+        breaker_reset_timeout = os.environ.get(REDIS_BREAKER_RESET_TIMEOUT_ENV, str(REDIS_BREAKER_RESET_TIMEOUT))
+
+        return cls(
+            uri,
+            ttl,
+            storage,
+            negative_ttl,
+            max_connections=max_connections,
+            socket_timeout=socket_timeout,
+            connect_timeout=connect_timeout,
+            health_check_interval=health_check_interval,
+            keepalive=keepalive,
+            cluster=cluster,
+            client_cache_size=client_cache_size,
+            breaker_threshold=breaker_threshold,
+            breaker_reset_timeout=breaker_reset_timeout,
+        )
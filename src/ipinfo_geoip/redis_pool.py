@@ -0,0 +1,183 @@
+"""プロセス内で共有するRedisコネクションプール."""
+
+import threading
+from typing import TypedDict
+
+import redis
+import redis.asyncio
+import redis.asyncio.cluster
+import redis.cluster
+from redis.cache import CacheConfig
+
+from .circuit_breaker import CircuitBreaker
+from .redis_config import RedisConfig
+
+
+class _ConnectionOptions(TypedDict):
+    """redis-pyの接続オプション."""
+
+    max_connections: int
+    socket_timeout: float
+    socket_connect_timeout: float
+    health_check_interval: int
+    socket_keepalive: bool
+
+
+_pools: dict[tuple[object, ...], redis.BlockingConnectionPool] = {}
+_clusters: dict[tuple[object, ...], redis.cluster.RedisCluster] = {}
+_breakers: dict[tuple[object, ...], CircuitBreaker] = {}
+_lock = threading.Lock()
+
+
+def _connection_options(config: RedisConfig) -> _ConnectionOptions:
+    """コネクションプールの接続オプションを返す.
+
+    Args:
+        config: Redis接続設定
+
+    Returns:
+        redis-pyの接続オプション
+
+    """
+    return {
+        "max_connections": config.max_connections,
+        "socket_timeout": config.socket_timeout,
+        "socket_connect_timeout": config.connect_timeout,
+        "health_check_interval": config.health_check_interval,
+        "socket_keepalive": config.keepalive,
+    }
+
+
+def _client_cache_options(config: RedisConfig) -> dict[str, object]:
+    """クライアントサイドキャッシュの接続オプションを返す.
+
+    RESP3で接続し, Redisからの無効化メッセージを受け取るまで読み込み結果をプロセス内に保持する
+    Redis 7.4以降が必要で, redis-pyは同期クライアントのみ対応している
+
+    Args:
+        config: Redis接続設定
+
+    Returns:
+        redis-pyの接続オプション
+        クライアントサイドキャッシュを使用しない場合は空の辞書
+
+    """
+    if config.client_cache_size == 0:
+        return {}
+
+    return {"protocol": 3, "cache_config": CacheConfig(max_size=config.client_cache_size)}
+
+
+def _get_pool(config: RedisConfig, *, decode_responses: bool) -> redis.BlockingConnectionPool:
+    """接続URIごとに共有するコネクションプールを返す.
+
+    同じ接続URIと設定のRedisClientはプロセス内で1つのコネクションプールを共有するため,
+    短命なインスタンスを作成しても接続とAUTHをやり直さない
+    最大接続数に達した場合は空きを最大socket_timeout秒待つ
+
+    Args:
+        config: Redis接続設定
+        decode_responses: 応答を文字列にデコードするかどうか
+
+    Returns:
+        コネクションプール
+
+    """
+    options = _connection_options(config)
+    key = (config.uri, decode_responses, config.client_cache_size, *options.values())
+    with _lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = redis.BlockingConnectionPool.from_url(
+                config.uri,
+                decode_responses=decode_responses,
+                timeout=config.socket_timeout,
+                **options,
+                **_client_cache_options(config),
+            )
+            _pools[key] = pool
+
+    return pool
+
+
+def _get_client(config: RedisConfig, *, decode_responses: bool) -> redis.Redis | redis.cluster.RedisCluster:
+    """共有するコネクションプールを使用するRedisクライアントを返す.
+
+    Redis Clusterの場合はサーバーごとのコネクションプールを持つクライアント自体を共有する
+
+    Args:
+        config: Redis接続設定
+        decode_responses: 応答を文字列にデコードするかどうか
+
+    Returns:
+        Redisクライアント
+
+    """
+    if not config.cluster:
+        return redis.Redis(connection_pool=_get_pool(config, decode_responses=decode_responses))
+
+    options = _connection_options(config)
+    key = (config.uri, decode_responses, config.client_cache_size, *options.values())
+    with _lock:
+        client = _clusters.get(key)
+        if client is None:
+            client = redis.cluster.RedisCluster.from_url(
+                config.uri,
+                decode_responses=decode_responses,
+                **options,
+                **_client_cache_options(config),
+            )
+            _clusters[key] = client
+
+    return client
+
+
+def _get_async_client(
+    config: RedisConfig, *, decode_responses: bool
+) -> redis.asyncio.Redis | redis.asyncio.cluster.RedisCluster:
+    """非同期クライアントのRedisクライアントを作成する.
+
+    非同期のコネクションプールはイベントループに結び付くため, プロセス内では共有せずに呼び出しごとに作成する
+    同期のコネクションプールと同様に, 最大接続数に達した場合は空きを最大socket_timeout秒待つ
+
+    Args:
+        config: Redis接続設定
+        decode_responses: 応答を文字列にデコードするかどうか
+
+    Returns:
+        Redisクライアント
+
+    """
+    options = _connection_options(config)
+    if config.cluster:
+        return redis.asyncio.cluster.RedisCluster.from_url(config.uri, decode_responses=decode_responses, **options)
+
+    pool = redis.asyncio.BlockingConnectionPool.from_url(
+        config.uri,
+        decode_responses=decode_responses,
+        timeout=config.socket_timeout,
+        **options,
+    )
+    return redis.asyncio.Redis(connection_pool=pool)
+
+
+def _get_breaker(config: RedisConfig) -> CircuitBreaker:
+    """接続URIごとに共有するサーキットブレーカーを返す.
+
+    同じRedisを使用するインスタンスは障害の検出結果を共有する
+
+    Args:
+        config: Redis接続設定
+
+    Returns:
+        サーキットブレーカー
+
+    """
+    key = (config.uri, config.breaker_threshold, config.breaker_reset_timeout)
+    with _lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(config.breaker_threshold, config.breaker_reset_timeout)
+            _breakers[key] = breaker
+
+    return breaker
@@ -0,0 +1,227 @@
+"""IPアドレス情報の検索階層."""
+
+from collections.abc import Sequence
+from typing import Protocol
+
+from .constants import GEOIP_MAX_WORKERS
+from .exceptions import GeoIPClientError, RateLimitError
+from .ipdata import IPData
+
+
+class Resolver(Protocol):
+    """IPアドレス情報の検索階層のインターフェース.
+
+    getとget_manyは見つかったIPアドレス情報を返す
+    問い合わせ数の上限により検索できなかった場合, get_manyはRateLimitErrorのdetailsに
+    検索できなかったIPアドレス(ip_addresses)と見つかったIPアドレス情報の辞書(results)を含めて送出する
+    再試行しても取得に失敗したIPアドレスがある場合も, get_manyは同じdetailsでGeoIPClientErrorを送出する
+    IPアドレス情報が存在しないことを保存している階層は, IPアドレス以外のフィールドが空のIPDataを返す
+    putとput_manyは不備のないIPアドレス情報, またはIPアドレス以外のフィールドが空のIPDataを保存する
+    保存先を持たない階層のputとput_manyは何もしない
+    """
+
+    def get(self, ip_address: str) -> IPData | None:
+        """IPアドレス情報を取得する.
+
+        Args:
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            IPアドレス情報
+            見つからない場合はNone
+
+        """
+        ...
+
+    def get_many(self, ip_addresses: list[str], max_workers: int = GEOIP_MAX_WORKERS) -> dict[str, IPData]:
+        """複数のIPアドレス情報を取得する.
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+            max_workers: 同時に発行するリクエストの最大数
+
+        Returns:
+            見つかったIPアドレスをキーとするIPアドレス情報の辞書
+
+        """
+        ...
+
+    def put(self, ip_address: str, ip_data: IPData) -> None:
+        """IPアドレス情報を保存する.
+
+        Args:
+            ip_address: IPアドレス
+            ip_data: 保存するIPアドレス情報
+
+        """
+        ...
+
+    def put_many(self, items: dict[str, IPData]) -> None:
+        """複数のIPアドレス情報を保存する.
+
+        Args:
+            items: IPアドレスをキーとする保存するIPアドレス情報の辞書
+
+        """
+        ...
+
+
+class ResolverChain:
+    """IPアドレス情報の検索階層を順に検索するクラス.
+
+    ある階層で見つかったIPアドレス情報はそれより前の階層に保存される
+    どの階層でも見つからないIPアドレスは, 存在しないことがすべての階層に保存される
+    問い合わせ数の上限により検索できなかったIPアドレスと取得に失敗したIPアドレスは, 存在しないことを保存しない
+    不備のあるIPアドレス情報はどの階層にも保存されない
+
+    Attributes:
+        resolvers: 検索順の階層
+
+    """
+
+    def __init__(self, resolvers: Sequence[Resolver]) -> None:
+        """ResolverChainインスタンスを初期化する.
+
+        Args:
+            resolvers: 検索順の階層
+
+        """
+        self.resolvers = list(resolvers)
+
+    def get(self, ip_address: str) -> IPData:
+        """各階層を順に検索してIPアドレス情報を取得する.
+
+        Args:
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            IPアドレス情報
+            見つからない場合はIPアドレス以外のフィールドが空のIPData
+
+        Raises:
+            GeoIPClientError: 再試行しても一時的なエラーが続いた場合
+            RateLimitError: 問い合わせ数が上限に達した場合
+
+        """
+        for position, resolver in enumerate(self.resolvers):
+            ip_data = resolver.get(ip_address)
+            if ip_data is not None:
+                self._put(self.resolvers[:position], ip_address, ip_data)
+                return ip_data
+
+        not_found = _not_found(ip_address)
+        self._put(self.resolvers, ip_address, not_found)
+
+        return not_found
+
+    def get_many(self, ip_addresses: list[str], max_workers: int = GEOIP_MAX_WORKERS) -> dict[str, IPData]:
+        """各階層を順に検索して複数のIPアドレス情報を取得する.
+
+        各階層にはその前の階層で見つからなかったIPアドレスのみをまとめて問い合わせる
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+            max_workers: 同時に発行するリクエストの最大数
+
+        Returns:
+            IPアドレスをキーとするIPアドレス情報の辞書
+            見つからないIPアドレスはIPアドレス以外のフィールドが空のIPData
+            取得に失敗したIPアドレスは含まない
+
+        Raises:
+            RateLimitError: 問い合わせ数の上限により検索できなかったIPアドレスがある場合
+                (detailsのip_addressesに検索できなかったIPアドレス, resultsにそれ以外のIPアドレス情報の辞書)
+                取得に失敗したIPアドレスはどちらにも含まない
+
+        """
+        results: dict[str, IPData] = {}
+        misses = list(dict.fromkeys(ip_addresses))
+        error: RateLimitError | None = None
+        deferred: list[str] = []
+        failed: list[str] = []
+        for position, resolver in enumerate(self.resolvers):
+            if not misses:
+                break
+            try:
+                found = resolver.get_many(misses, max_workers)
+            except RateLimitError as e:
+                error = e
+                found = e.details["results"]
+                deferred.extend(e.details["ip_addresses"])
+            except GeoIPClientError as e:
+                found = e.details["results"]
+                failed.extend(e.details["ip_addresses"])
+            self._put_many(self.resolvers[:position], found)
+            results.update(found)
+            misses = [
+                ip_address
+                for ip_address in misses
+                if ip_address not in found and ip_address not in deferred and ip_address not in failed
+            ]
+
+        not_found = {ip_address: _not_found(ip_address) for ip_address in misses}
+        self._put_many(self.resolvers, not_found)
+        results.update(not_found)
+
+        if error is not None:
+            raise RateLimitError(error.message, {"ip_addresses": deferred, "results": results}) from error
+
+        return results
+
+    @staticmethod
+    def _put(resolvers: Sequence[Resolver], ip_address: str, ip_data: IPData) -> None:
+        """不備のないIPアドレス情報, または存在しないことを各階層に保存する.
+
+        Args:
+            resolvers: 保存先の階層
+            ip_address: IPアドレス
+            ip_data: 保存するIPアドレス情報
+
+        """
+        if not _is_storable(ip_data):
+            return
+
+        for resolver in resolvers:
+            resolver.put(ip_address, ip_data)
+
+    @staticmethod
+    def _put_many(resolvers: Sequence[Resolver], items: dict[str, IPData]) -> None:
+        """不備のない複数のIPアドレス情報, または存在しないことを各階層に保存する.
+
+        Args:
+            resolvers: 保存先の階層
+            items: IPアドレスをキーとする保存するIPアドレス情報の辞書
+
+        """
+        items = {ip_address: ip_data for ip_address, ip_data in items.items() if _is_storable(ip_data)}
+        if not items:
+            return
+
+        for resolver in resolvers:
+            resolver.put_many(items)
+
+
+def _is_storable(ip_data: IPData) -> bool:
+    """IPアドレス情報が保存できるかチェックする.
+
+    Args:
+        ip_data: IPアドレス情報
+
+    Returns:
+        不備のないIPアドレス情報, またはIPアドレス以外のフィールドが空の場合True
+
+    """
+    return ip_data.is_complete() or ip_data.is_empty()
+
+
+def _not_found(ip_address: str) -> IPData:
+    """IPアドレス情報が存在しないことを表すIPDataを作成する.
+
+    Args:
+        ip_address: IPアドレス
+
+    Returns:
+        IPアドレス以外のフィールドが空のIPData
+
+    """
+    return IPData.from_trusted(ip_address, "", "", "", "")
@@ -0,0 +1,50 @@
+"""IPアドレス情報の検索階層設定."""
+
+import os
+from typing import Self
+
+from .constants import DEFAULT_RESOLVERS, RESOLVERS, RESOLVERS_ENV
+from .exceptions import ValidationError
+
+
+class ResolverConfig:
+    """IPアドレス情報の検索階層設定クラス.
+
+    Attributes:
+        resolvers: 検索する階層の名前(検索順)
+
+    """
+
+    def __init__(self, resolvers: str = DEFAULT_RESOLVERS) -> None:
+        """ResolverConfigインスタンスを初期化する.
+
+        Args:
+            resolvers: 検索する階層の名前(カンマ区切り, 検索順)
+
+        Raises:
+            ValidationError: 階層が不正な場合
+
+        """
+        self.resolvers = tuple(dict.fromkeys(resolver.strip() for resolver in resolvers.split(",") if resolver.strip()))
+
+        if not self.resolvers:
+            msg = "At least one resolver is required"
+            raise ValidationError(msg)
+
+        invalid = [resolver for resolver in self.resolvers if resolver not in RESOLVERS]
+        if invalid:
+            msg = f"Invalid resolvers: {', '.join(invalid)}"
+            raise ValidationError(msg)
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """環境変数からResolverConfigインスタンスを作成する.
+
+        Returns:
+            環境変数から作成されたResolverConfigインスタンス
+
+        Raises:
+            ValidationError: 環境変数の値が不正な場合
+
+        """
+        return cls(os.environ.get(RESOLVERS_ENV, DEFAULT_RESOLVERS))
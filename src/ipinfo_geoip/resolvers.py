@@ -0,0 +1,277 @@
+"""IPアドレス情報の検索階層の実装."""
+
+from contextlib import suppress
+
+from .constants import GEOIP_MAX_WORKERS
+from .exceptions import AddressNotFoundError, GeoIPClientError, RateLimitError, RedisClientError
+from .geoip_client import GeoIPClient
+from .ipdata import IPData
+from .mmdb_client import MMDBClient
+from .network_index import NetworkIndex
+from .redis_client import RedisClient
+
+
+class MemoryResolver:
+    """取得済みネットワークの最長一致インデックスによる検索階層.
+
+    IPアドレス情報が存在しないことは保存しない
+    """
+
+    def __init__(self, index: NetworkIndex) -> None:
+        """MemoryResolverインスタンスを初期化する.
+
+        Args:
+            index: 取得済みネットワークのインデックス
+
+        """
+        self.index = index
+
+    def get(self, ip_address: str) -> IPData | None:
+        """IPアドレスを含む取得済みネットワークのIPアドレス情報を取得する.
+
+        Args:
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            IPアドレス情報
+            見つからない場合はNone
+
+        """
+        return self.index.lookup(ip_address)
+
+    def get_many(self, ip_addresses: list[str], max_workers: int = GEOIP_MAX_WORKERS) -> dict[str, IPData]:  # noqa: ARG002
+        """複数のIPアドレスを含む取得済みネットワークのIPアドレス情報を取得する.
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+            max_workers: 使用しない
+
+        Returns:
+            見つかったIPアドレスをキーとするIPアドレス情報の辞書
+
+        """
+        results = {ip_address: self.index.lookup(ip_address) for ip_address in ip_addresses}
+        return {ip_address: ip_data for ip_address, ip_data in results.items() if ip_data is not None}
+
+    def put(self, ip_address: str, ip_data: IPData) -> None:  # noqa: ARG002
+        """IPアドレス情報のネットワークを登録する.
+
+        Args:
+            ip_address: IPアドレス
+            ip_data: 登録するIPアドレス情報
+
+        """
+        self.index.insert(ip_data)
+
+    def put_many(self, items: dict[str, IPData]) -> None:
+        """複数のIPアドレス情報のネットワークを登録する.
+
+        Args:
+            items: IPアドレスをキーとする登録するIPアドレス情報の辞書
+
+        """
+        for ip_data in items.values():
+            self.index.insert(ip_data)
+
+
+class MMDBResolver:
+    """GeoLite2データベースファイルによる検索階層.
+
+    読み取り専用のため, 保存は行わない
+    不完全なIPアドレス情報は見つからないものとして扱う
+    """
+
+    def __init__(self, client: MMDBClient) -> None:
+        """MMDBResolverインスタンスを初期化する.
+
+        Args:
+            client: GeoLite2データベースファイルクライアント
+
+        """
+        self.client = client
+
+    def get(self, ip_address: str) -> IPData | None:
+        """GeoLite2データベースファイルからIPアドレス情報を取得する.
+
+        Args:
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            IPアドレス情報
+            見つからない場合はNone
+
+        """
+        return self.client.get_many([ip_address])[ip_address]
+
+    def get_many(self, ip_addresses: list[str], max_workers: int = GEOIP_MAX_WORKERS) -> dict[str, IPData]:  # noqa: ARG002
+        """GeoLite2データベースファイルから複数のIPアドレス情報を取得する.
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+            max_workers: 使用しない
+
+        Returns:
+            見つかったIPアドレスをキーとするIPアドレス情報の辞書
+
+        """
+        results = self.client.get_many(ip_addresses)
+        return {ip_address: ip_data for ip_address, ip_data in results.items() if ip_data is not None}
+
+    def put(self, ip_address: str, ip_data: IPData) -> None:
+        """何もしない."""
+
+    def put_many(self, items: dict[str, IPData]) -> None:
+        """何もしない."""
+
+
+class RedisResolver:
+    """Redisキャッシュによる検索階層.
+
+    IPアドレス情報が存在しないことも保存する
+    Redisが利用できない場合は見つからなかったものとして次の階層に進み, 保存も行わない
+    """
+
+    def __init__(self, client: RedisClient) -> None:
+        """RedisResolverインスタンスを初期化する.
+
+        Args:
+            client: Redisクライアント
+
+        """
+        self.client = client
+
+    def get(self, ip_address: str) -> IPData | None:
+        """RedisからIPアドレス情報を取得する.
+
+        Args:
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            IPアドレス情報
+            存在しないことがキャッシュされている場合はIPアドレス以外のフィールドが空のIPData
+            見つからない場合, またはRedisが利用できない場合はNone
+
+        """
+        try:
+            return self.client.get(ip_address)
+        except RedisClientError:
+            return None
+
+    def get_many(self, ip_addresses: list[str], max_workers: int = GEOIP_MAX_WORKERS) -> dict[str, IPData]:  # noqa: ARG002
+        """1回のパイプラインでRedisから複数のIPアドレス情報を取得する.
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+            max_workers: 使用しない
+
+        Returns:
+            見つかったIPアドレスをキーとするIPアドレス情報の辞書
+
+        """
+        try:
+            results = self.client.get_many(ip_addresses)
+        except RedisClientError:
+            return {}
+
+        return {ip_address: ip_data for ip_address, ip_data in results.items() if ip_data is not None}
+
+    def put(self, ip_address: str, ip_data: IPData) -> None:
+        """IPアドレス情報, または存在しないことをRedisに保存する.
+
+        Args:
+            ip_address: IPアドレス
+            ip_data: 保存するIPアドレス情報
+
+        """
+        with suppress(RedisClientError):
+            if ip_data.is_empty():
+                self.client.set_not_found(ip_address)
+            else:
+                self.client.put(ip_address, ip_data)
+
+    def put_many(self, items: dict[str, IPData]) -> None:
+        """複数のIPアドレス情報と存在しないことを1回のパイプラインでRedisに保存する.
+
+        Args:
+            items: IPアドレスをキーとする保存するIPアドレス情報の辞書
+
+        """
+        complete = {ip_address: ip_data for ip_address, ip_data in items.items() if not ip_data.is_empty()}
+        not_found = [ip_address for ip_address, ip_data in items.items() if ip_data.is_empty()]
+        with suppress(RedisClientError):
+            self.client.set_many(complete, not_found)
+
+
+class WebServiceResolver:
+    """GeoLite2 Web Serviceによる検索階層.
+
+    読み取り専用のため, 保存は行わない
+    問い合わせ数が上限に達した場合はRateLimitErrorを送出する
+    """
+
+    def __init__(self, client: GeoIPClient) -> None:
+        """WebServiceResolverインスタンスを初期化する.
+
+        Args:
+            client: GeoLite2 Web Serviceクライアント
+
+        """
+        self.client = client
+
+    def get(self, ip_address: str) -> IPData | None:
+        """GeoLite2 Web ServiceからIPアドレス情報を取得する.
+
+        Args:
+            ip_address: 検索するIPアドレス
+
+        Returns:
+            IPアドレス情報
+            見つからない場合はNone
+
+        Raises:
+            GeoIPClientError: 再試行しても一時的なエラーが続いた場合
+            RateLimitError: 問い合わせ数が上限に達した場合
+
+        """
+        with suppress(AddressNotFoundError):
+            return self.client.get(ip_address)
+
+        return None
+
+    def get_many(self, ip_addresses: list[str], max_workers: int = GEOIP_MAX_WORKERS) -> dict[str, IPData]:
+        """GeoLite2 Web Serviceから複数のIPアドレス情報を並列に取得する.
+
+        Args:
+            ip_addresses: 検索するIPアドレス
+            max_workers: 同時に発行するリクエストの最大数
+
+        Returns:
+            見つかったIPアドレスをキーとするIPアドレス情報の辞書
+
+        Raises:
+            RateLimitError: 問い合わせ数が上限に達した場合
+                (detailsのip_addressesに取得しなかったIPアドレス, resultsに見つかったIPアドレス情報の辞書)
+            GeoIPClientError: 再試行しても取得に失敗したIPアドレスがある場合
+                (detailsのip_addressesに取得に失敗したIPアドレス, resultsに見つかったIPアドレス情報の辞書)
+
+        """
+        try:
+            results = self.client.get_many(ip_addresses, max_workers)
+        except RateLimitError as e:
+            found = {ip_address: ip_data for ip_address, ip_data in e.details["results"].items() if ip_data is not None}
+            unresolved = [ip_address for ip_address in ip_addresses if ip_address not in e.details["results"]]
+            raise RateLimitError(e.message, {"ip_addresses": unresolved, "results": found}) from e
+
+        found = {ip_address: ip_data for ip_address, ip_data in results.items() if ip_data is not None}
+        failed = [ip_address for ip_address in ip_addresses if ip_address not in results]
+        if failed:
+            msg = "GeoIP lookup failed"
+            raise GeoIPClientError(msg, {"ip_addresses": failed, "results": found})
+
+        return found
+
+    def put(self, ip_address: str, ip_data: IPData) -> None:
+        """何もしない."""
+
+    def put_many(self, items: dict[str, IPData]) -> None:
+        """何もしない."""
@@ -0,0 +1,55 @@
+"""同一キーに対する同時実行の集約."""
+
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """同一キーに対する同時実行を1回に集約するクラス.
+
+    最初の呼び出し元だけが関数を実行し, 実行中に同じキーで呼び出した呼び出し元はその結果を待つ
+    関数が例外を送出した場合は待っていた呼び出し元にも同じ例外が送出される
+    """
+
+    def __init__(self) -> None:
+        """SingleFlightインスタンスを初期化する."""
+        self._lock = threading.Lock()
+        self._calls: dict[K, Future[V]] = {}
+
+    def do(self, key: K, function: Callable[[], V]) -> V:
+        """キーごとに集約して関数を実行する.
+
+        Args:
+            key: 集約するキー
+            function: 実行する関数
+
+        Returns:
+            関数の戻り値
+
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = function()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
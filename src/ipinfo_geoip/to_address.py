@@ -0,0 +1,46 @@
+"""文字列をIPアドレス, IPネットワークに変換."""
+
+import ipaddress
+from functools import lru_cache
+from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
+
+from .constants import ADDRESS_CACHE_SIZE
+
+
+@lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def _to_address(ip_address: str) -> IPv4Address | IPv6Address:
+    """文字列をIPアドレスに変換する.
+
+    同じ文字列の変換結果は再利用されるため, 1回の検索で各階層が検証しても解析は1回で済む
+
+    Args:
+        ip_address: 変換する文字列
+
+    Returns:
+        IPアドレス
+
+    Raises:
+        ValueError: IPアドレスとして不正な場合
+
+    """
+    return ipaddress.ip_address(ip_address)
+
+
+@lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def _to_network(network: str) -> IPv4Network | IPv6Network:
+    """文字列をIPネットワークに変換する.
+
+    ホスト部が0でない場合はホスト部を無視する
+    同じ文字列の変換結果は再利用される
+
+    Args:
+        network: 変換する文字列
+
+    Returns:
+        IPネットワーク
+
+    Raises:
+        ValueError: IPネットワークとして不正な場合
+
+    """
+    return ipaddress.ip_network(network, strict=False)
@@ -0,0 +1,27 @@
+"""真偽値を表す文字列を変換."""
+
+from .constants import FALSE_VALUES, TRUE_VALUES
+from .exceptions import ValidationError
+
+
+def _to_bool(name: str, value: str) -> bool:
+    """真偽値を表す文字列を変換する.
+
+    Args:
+        name: 設定項目名
+        value: 変換する文字列
+
+    Returns:
+        変換した真偽値
+
+    Raises:
+        ValidationError: 真偽値を表す文字列でない場合
+
+    """
+    if value.lower() in TRUE_VALUES:
+        return True
+    if value.lower() in FALSE_VALUES:
+        return False
+
+    msg = f"{name} must be one of {', '.join(TRUE_VALUES + FALSE_VALUES)}"
+    raise ValidationError(msg)
@@ -11,10 +11,25 @@ TEST_GEOIP_ACCOUNT_ID_INT: Final[int] = 12345
 TEST_GEOIP_ACCOUNT_ID_STR: Final[str] = "12345"
 TEST_GEOIP_LICENSE_KEY: Final[str] = "license_key"
 TEST_GEOIP_HOST: Final[str] = "geolite.info"
+TEST_GEOIP_POOL_SIZE_INT: Final[int] = 4
+TEST_GEOIP_POOL_SIZE_STR: Final[str] = "4"
+TEST_GEOIP_TIMEOUT: Final[float] = 5.0
+TEST_GEOIP_HEDGE_DELAY: Final[float] = 0.01
+TEST_RATE_LIMIT: Final[float] = 10.0
+TEST_RATE_LIMIT_BURST: Final[int] = 4
+TEST_RATE_LIMIT_MAX_WAIT: Final[float] = 0.5
+TEST_QUOTA_RESERVE: Final[int] = 10
+
+TEST_MMDB_ASN_PATH: Final[str] = "/var/lib/GeoIP/GeoLite2-ASN.mmdb"
+TEST_MMDB_COUNTRY_PATH: Final[str] = "/var/lib/GeoIP/GeoLite2-Country.mmdb"
 
 TEST_REDIS_URI: Final[str] = "redis://localhost:6379"
 TEST_REDIS_TTL_INT: Final[int] = 3600
 TEST_REDIS_TTL_STR: Final[str] = "3600"
+TEST_REDIS_NEGATIVE_TTL_INT: Final[int] = 600
+TEST_REDIS_NEGATIVE_TTL_STR: Final[str] = "600"
+TEST_BREAKER_THRESHOLD: Final[int] = 2
+TEST_BREAKER_RESET_TIMEOUT: Final[float] = 30.0
 
 TEST_IP_ADDRESS_1: Final[str] = "192.0.2.1"
 TEST_IP_ADDRESS_2: Final[str] = "192.0.2.2"
@@ -23,6 +38,7 @@ TEST_AS_NUMBER_INT: Final[int] = 65001
 TEST_AS_NUMBER_STR: Final[str] = "65001"
 TEST_COUNTRY_CODE: Final[str] = "US"
 TEST_ORGANIZATION: Final[str] = "Test Organization"
+TEST_QUERIES_REMAINING: Final[int] = 1_000
 TEST_IPADDRESS_INVALID_: Final[str] = "invalid.ip"
 
 TEST_IPDATA: Final[IPData] = IPData(
@@ -32,6 +48,13 @@ TEST_IPDATA: Final[IPData] = IPData(
     country=TEST_COUNTRY_CODE,
     organization=TEST_ORGANIZATION,
 )
+TEST_IPDATA_2: Final[IPData] = IPData(
+    ip_address=TEST_IP_ADDRESS_2,
+    network=TEST_IP_NETWORK,
+    as_number=TEST_AS_NUMBER_STR,
+    country=TEST_COUNTRY_CODE,
+    organization=TEST_ORGANIZATION,
+)
 TEST_IPDATA_INCOMPLETE: Final[IPData] = IPData(
     ip_address=TEST_IP_ADDRESS_1,
     as_number=TEST_AS_NUMBER_STR,
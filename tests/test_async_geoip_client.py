@@ -0,0 +1,338 @@
+"""AsyncGeoIPClientクラスのテスト."""
+
+import asyncio
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, Mock, patch
+
+import aiohttp
+import geoip2.errors
+import pytest
+
+from ipinfo_geoip.async_geoip_client import AsyncGeoIPClient
+from ipinfo_geoip.constants import GEOIP_ENDPOINT_CITY
+from ipinfo_geoip.exceptions import ConfigurationError, GeoIPClientError, RateLimitError, ValidationError
+from ipinfo_geoip.geoip_response import GeoIPResponse
+from ipinfo_geoip.rate_limiter import RateLimiter
+from tests.conftest import (
+    TEST_AS_NUMBER_INT,
+    TEST_COUNTRY_CODE,
+    TEST_GEOIP_ACCOUNT_ID_INT,
+    TEST_GEOIP_HEDGE_DELAY,
+    TEST_GEOIP_HOST,
+    TEST_GEOIP_LICENSE_KEY,
+    TEST_GEOIP_POOL_SIZE_INT,
+    TEST_GEOIP_TIMEOUT,
+    TEST_IP_ADDRESS_1,
+    TEST_IP_ADDRESS_2,
+    TEST_IP_NETWORK,
+    TEST_IPADDRESS_INVALID_,
+    TEST_IPDATA,
+    TEST_ORGANIZATION,
+    TEST_QUERIES_REMAINING,
+)
+
+
+def _mock_response() -> GeoIPResponse:
+    """GeoLite2 Web Serviceのレスポンスを作成する.
+
+    Returns:
+        レスポンス
+
+    """
+    return GeoIPResponse(
+        traits={
+            "network": TEST_IP_NETWORK,
+            "autonomous_system_number": TEST_AS_NUMBER_INT,
+            "autonomous_system_organization": TEST_ORGANIZATION,
+        },
+        country={"iso_code": TEST_COUNTRY_CODE},
+        maxmind={"queries_remaining": TEST_QUERIES_REMAINING},
+    )
+
+
+class TestAsyncGeoIPClient:
+    """AsyncGeoIPClientクラスのテストクラス."""
+
+    @pytest.fixture(autouse=True)
+    def limiter(self) -> Iterator[Mock]:
+        """テストごとに新しいレートリミッターのモックを使用する."""
+        limiter = Mock(spec=RateLimiter)
+        with patch("ipinfo_geoip.async_geoip_client._get_rate_limiter", return_value=limiter):
+            yield limiter
+
+    @patch("ipinfo_geoip.async_geoip_client.AsyncProjectionClient")
+    @patch("ipinfo_geoip.async_geoip_client.GeoIPConfig.from_env")
+    def test_init(self, mock_from_env: Mock, mock_client: Mock) -> None:
+        """初期化のテスト."""
+        # モック設定
+        mock_config = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False)
+        mock_config.account_id = TEST_GEOIP_ACCOUNT_ID_INT
+        mock_config.license_key = TEST_GEOIP_LICENSE_KEY
+        mock_config.host = TEST_GEOIP_HOST
+        mock_config.timeout = TEST_GEOIP_TIMEOUT
+        mock_from_env.return_value = mock_config
+
+        # テスト実行
+        client = AsyncGeoIPClient()
+
+        # 検証
+        assert isinstance(client, AsyncGeoIPClient)
+        mock_client.assert_called_once_with(
+            TEST_GEOIP_ACCOUNT_ID_INT,
+            TEST_GEOIP_LICENSE_KEY,
+            TEST_GEOIP_HOST,
+            timeout=TEST_GEOIP_TIMEOUT,
+        )
+
+    @patch("ipinfo_geoip.async_geoip_client.GeoIPConfig.from_env")
+    def test_init_with_configuration_error(self, mock_from_env: Mock) -> None:
+        """設定エラーでの初期化テスト."""
+        # モック設定
+        mock_from_env.side_effect = ValidationError("Missing environment variables")
+
+        # テスト実行
+        with pytest.raises(ConfigurationError):
+            _ = AsyncGeoIPClient()
+
+    @patch("ipinfo_geoip.async_geoip_client.AsyncProjectionClient")
+    @patch("ipinfo_geoip.async_geoip_client.GeoIPConfig.from_env")
+    def test_get_success(self, mock_from_env: Mock, mock_client: Mock) -> None:
+        """成功時のgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False)
+
+        mock_client_instance = Mock()
+        mock_client_instance.lookup = AsyncMock(return_value=_mock_response())
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = AsyncGeoIPClient()
+        result = asyncio.run(client.get(TEST_IP_ADDRESS_1))
+
+        # 検証
+        assert result == TEST_IPDATA
+        mock_client_instance.lookup.assert_awaited_once_with(GEOIP_ENDPOINT_CITY, TEST_IP_ADDRESS_1)
+
+    @patch("ipinfo_geoip.async_geoip_client.AsyncProjectionClient")
+    @patch("ipinfo_geoip.async_geoip_client.GeoIPConfig.from_env")
+    def test_get_with_invalid_ip_value(self, mock_from_env: Mock, mock_client: Mock) -> None:
+        """IPアドレスが無効な場合のgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False)
+
+        mock_client_instance = Mock()
+        mock_client_instance.lookup = AsyncMock()
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = AsyncGeoIPClient()
+
+        with pytest.raises(ValidationError):
+            _ = asyncio.run(client.get(TEST_IPADDRESS_INVALID_))
+
+        # 検証
+        mock_client_instance.lookup.assert_not_awaited()
+
+    @patch("ipinfo_geoip.async_geoip_client.AsyncProjectionClient")
+    @patch("ipinfo_geoip.async_geoip_client.GeoIPConfig.from_env")
+    def test_get_with_address_not_found(self, mock_from_env: Mock, mock_client: Mock) -> None:
+        """アドレスが見つからない場合のgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False)
+
+        mock_client_instance = Mock()
+        mock_client_instance.lookup = AsyncMock(side_effect=geoip2.errors.AddressNotFoundError("Address not found"))
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = AsyncGeoIPClient()
+
+        with pytest.raises(GeoIPClientError):
+            _ = asyncio.run(client.get(TEST_IP_ADDRESS_1))
+
+    @patch("ipinfo_geoip.async_geoip_client.AsyncProjectionClient")
+    @patch("ipinfo_geoip.async_geoip_client.GeoIPConfig.from_env")
+    def test_get_many(self, mock_from_env: Mock, mock_client: Mock, limiter: Mock) -> None:
+        """複数のIPアドレスを取得するget_manyメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False)
+
+        async def lookup(_endpoint: str, ip_address: str) -> GeoIPResponse:
+            if ip_address == TEST_IP_ADDRESS_2:
+                msg = "Address not found"
+                raise geoip2.errors.AddressNotFoundError(msg)
+            return _mock_response()
+
+        mock_client_instance = Mock()
+        mock_client_instance.lookup = AsyncMock(side_effect=lookup)
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = AsyncGeoIPClient()
+        result = asyncio.run(client.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2, TEST_IP_ADDRESS_1]))
+
+        # 検証
+        assert result == {TEST_IP_ADDRESS_1: TEST_IPDATA, TEST_IP_ADDRESS_2: None}
+        assert mock_client_instance.lookup.await_count == 2  # noqa: PLR2004
+        limiter.acquire_async.assert_awaited_with(batch=True)
+
+    @patch("ipinfo_geoip.async_geoip_client.asyncio.sleep", new_callable=AsyncMock)
+    @patch("ipinfo_geoip.async_geoip_client.AsyncProjectionClient")
+    @patch("ipinfo_geoip.async_geoip_client.GeoIPConfig.from_env")
+    def test_get_many_with_failure(self, mock_from_env: Mock, mock_client: Mock, mock_sleep: AsyncMock) -> None:
+        """再試行しても取得に失敗したIPアドレスを除いて他のIPアドレスを返すget_manyメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False, retries=1, backoff=0.0)
+
+        async def lookup(_endpoint: str, ip_address: str) -> GeoIPResponse:
+            if ip_address == TEST_IP_ADDRESS_2:
+                msg = "Connection reset"
+                raise aiohttp.ClientConnectionError(msg)
+            return _mock_response()
+
+        mock_client_instance = Mock()
+        mock_client_instance.lookup = AsyncMock(side_effect=lookup)
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = AsyncGeoIPClient()
+        result = asyncio.run(client.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2]))
+
+        # 検証
+        assert result == {TEST_IP_ADDRESS_1: TEST_IPDATA}
+        assert mock_client_instance.lookup.await_count == 3  # noqa: PLR2004
+        mock_sleep.assert_called_once()
+
+    @patch("ipinfo_geoip.async_geoip_client.AsyncProjectionClient")
+    @patch("ipinfo_geoip.async_geoip_client.GeoIPConfig.from_env")
+    def test_get_with_rate_limit(self, mock_from_env: Mock, mock_client: Mock, limiter: Mock) -> None:
+        """問い合わせ数が上限に達した場合のgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False)
+        limiter.acquire_async.side_effect = RateLimitError("GeoIP rate limit exceeded")
+
+        mock_client_instance = Mock()
+        mock_client_instance.lookup = AsyncMock()
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = AsyncGeoIPClient()
+
+        with pytest.raises(RateLimitError):
+            _ = asyncio.run(client.get(TEST_IP_ADDRESS_1))
+
+        # 検証
+        limiter.acquire_async.assert_awaited_once_with(batch=False)
+        mock_client_instance.lookup.assert_not_awaited()
+
+    @patch("ipinfo_geoip.async_geoip_client.AsyncProjectionClient")
+    @patch("ipinfo_geoip.async_geoip_client.GeoIPConfig.from_env")
+    def test_get_many_with_rate_limit(self, mock_from_env: Mock, mock_client: Mock, limiter: Mock) -> None:
+        """問い合わせ数が上限に達した場合のget_manyメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False)
+
+        async def acquire_async(*, batch: bool) -> None:
+            if batch and mock_client_instance.lookup.await_count > 0:
+                msg = "GeoIP query quota exhausted"
+                raise RateLimitError(msg)
+
+        limiter.acquire_async.side_effect = acquire_async
+
+        mock_client_instance = Mock()
+        mock_client_instance.lookup = AsyncMock(return_value=_mock_response())
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = AsyncGeoIPClient()
+
+        with pytest.raises(RateLimitError) as exc_info:
+            _ = asyncio.run(client.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2], max_workers=1))
+
+        # 検証
+        assert exc_info.value.details == {"ip_addresses": [TEST_IP_ADDRESS_2], "results": {TEST_IP_ADDRESS_1: TEST_IPDATA}}
+
+    @patch("ipinfo_geoip.async_geoip_client.asyncio.sleep", new_callable=AsyncMock)
+    @patch("ipinfo_geoip.async_geoip_client.AsyncProjectionClient")
+    @patch("ipinfo_geoip.async_geoip_client.GeoIPConfig.from_env")
+    def test_get_with_retry(self, mock_from_env: Mock, mock_client: Mock, mock_sleep: AsyncMock) -> None:
+        """一時的なエラーを再試行するgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False, retries=2, backoff=0.0)
+
+        mock_client_instance = Mock()
+        mock_client_instance.lookup = AsyncMock(
+            side_effect=[aiohttp.ClientConnectionError("Connection reset"), _mock_response()],
+        )
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = AsyncGeoIPClient()
+        result = asyncio.run(client.get(TEST_IP_ADDRESS_1))
+
+        # 検証
+        assert result == TEST_IPDATA
+        assert mock_client_instance.lookup.await_count == 2  # noqa: PLR2004
+        mock_sleep.assert_awaited_once()
+
+    @patch("ipinfo_geoip.async_geoip_client.asyncio.sleep", new_callable=AsyncMock)
+    @patch("ipinfo_geoip.async_geoip_client.AsyncProjectionClient")
+    @patch("ipinfo_geoip.async_geoip_client.GeoIPConfig.from_env")
+    def test_get_with_retries_exhausted(self, mock_from_env: Mock, mock_client: Mock, mock_sleep: AsyncMock) -> None:
+        """再試行しても一時的なエラーが続く場合のgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False, retries=1, backoff=0.0)
+
+        mock_client_instance = Mock()
+        mock_client_instance.lookup = AsyncMock(side_effect=TimeoutError())
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = AsyncGeoIPClient()
+
+        with pytest.raises(GeoIPClientError) as exc_info:
+            _ = asyncio.run(client.get(TEST_IP_ADDRESS_1))
+
+        # 検証
+        assert exc_info.value.details["attempts"] == 2  # noqa: PLR2004
+        assert mock_client_instance.lookup.await_count == 2  # noqa: PLR2004
+        mock_sleep.assert_awaited_once()
+
+    @patch("ipinfo_geoip.async_geoip_client.AsyncProjectionClient")
+    @patch("ipinfo_geoip.async_geoip_client.GeoIPConfig.from_env")
+    def test_get_hedged(self, mock_from_env: Mock, mock_client: Mock, limiter: Mock) -> None:
+        """応答が遅い場合に2つ目のリクエストの応答を使用するgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock(
+            endpoint=GEOIP_ENDPOINT_CITY,
+            hedge=True,
+            pool_size=TEST_GEOIP_POOL_SIZE_INT,
+            hedge_delay=TEST_GEOIP_HEDGE_DELAY,
+            retries=0,
+        )
+        limiter.counter = None
+        limiter.reserve.return_value = 0.0
+        cancelled: list[bool] = []
+
+        async def lookup(_endpoint: str, _ip_address: str) -> GeoIPResponse:
+            if mock_client_instance.lookup.await_count == 1:
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(True)
+                    raise
+            return _mock_response()
+
+        mock_client_instance = Mock()
+        mock_client_instance.lookup = AsyncMock(side_effect=lookup)
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = AsyncGeoIPClient()
+        result = asyncio.run(client.get(TEST_IP_ADDRESS_1))
+
+        # 検証
+        assert result == TEST_IPDATA
+        assert mock_client_instance.lookup.await_count == 2  # noqa: PLR2004
+        assert cancelled == [True]
+        limiter.reserve.assert_called_once_with(batch=False)
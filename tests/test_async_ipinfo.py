@@ -0,0 +1,406 @@
+"""AsyncIPInfoクラスのテスト."""
+
+import asyncio
+import os
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from ipinfo_geoip.async_ipinfo import AsyncIPInfo
+from ipinfo_geoip.constants import GEOIP_MAX_WORKERS, RESOLVERS_ENV
+from ipinfo_geoip.exceptions import (
+    AddressNotFoundError,
+    ConfigurationError,
+    GeoIPClientError,
+    RateLimitError,
+    RedisClientError,
+    ValidationError,
+)
+from tests.conftest import (
+    TEST_IP_ADDRESS_1,
+    TEST_IP_ADDRESS_2,
+    TEST_IPADDRESS_INVALID_,
+    TEST_IPDATA,
+    TEST_IPDATA_2,
+)
+
+
+class TestAsyncIPInfo:
+    """AsyncIPInfoクラスのテストクラス."""
+
+    @patch("ipinfo_geoip.async_ipinfo.AsyncRedisClient")
+    @patch("ipinfo_geoip.async_ipinfo.AsyncGeoIPClient")
+    def test_get_from_redis(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """RedisからIPアドレス情報を取得するgetメソッドテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get = AsyncMock()
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get = AsyncMock(return_value=TEST_IPDATA)
+        mock_redis_instance.set_many = AsyncMock()
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = AsyncIPInfo()
+        result = asyncio.run(ipinfo.get(TEST_IP_ADDRESS_1))
+
+        # 検証
+        assert result == TEST_IPDATA.to_dict()
+        mock_geoip_instance.get.assert_not_awaited()
+        mock_redis_instance.set_many.assert_not_awaited()
+
+    @patch("ipinfo_geoip.async_ipinfo.AsyncRedisClient")
+    @patch("ipinfo_geoip.async_ipinfo.AsyncGeoIPClient")
+    def test_get_from_geoip(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """GeoLite2 Web ServiceからIPアドレス情報を取得するgetメソッドテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get = AsyncMock(return_value=TEST_IPDATA)
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get = AsyncMock(return_value=None)
+        mock_redis_instance.set_many = AsyncMock()
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = AsyncIPInfo()
+        result = asyncio.run(ipinfo.get(TEST_IP_ADDRESS_1))
+        result_cached = asyncio.run(ipinfo.get(TEST_IP_ADDRESS_1))
+
+        # 検証
+        assert result == TEST_IPDATA.to_dict()
+        assert result_cached == TEST_IPDATA.to_dict()
+        mock_geoip_instance.get.assert_awaited_once_with(TEST_IP_ADDRESS_1)
+        mock_redis_instance.get.assert_awaited_once_with(TEST_IP_ADDRESS_1)
+        mock_redis_instance.set_many.assert_awaited_once_with({TEST_IP_ADDRESS_1: TEST_IPDATA}, [])
+
+    @patch("ipinfo_geoip.async_ipinfo.AsyncRedisClient")
+    @patch("ipinfo_geoip.async_ipinfo.AsyncGeoIPClient")
+    def test_get_cached_expiring(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """プロセス内キャッシュを1回だけ参照し, 確認と取得の間に期限切れになってもKeyErrorにしないテスト."""
+        # モック設定
+        mock_geoip_client.return_value = Mock()
+        mock_redis_client.return_value = Mock()
+
+        ipinfo = AsyncIPInfo()
+        ipinfo.data[TEST_IP_ADDRESS_1] = TEST_IPDATA.to_dict()
+
+        # テスト実行
+        with patch("ipinfo_geoip.cache.time") as mock_time:
+            mock_time.monotonic.side_effect = [0.0, float("inf")]
+            result = asyncio.run(ipinfo.get(TEST_IP_ADDRESS_1))
+            mock_time.monotonic.side_effect = [0.0, float("inf")]
+            results = asyncio.run(ipinfo.get_many([TEST_IP_ADDRESS_1]))
+
+        # 検証
+        assert result == TEST_IPDATA.to_dict()
+        assert results == {TEST_IP_ADDRESS_1: TEST_IPDATA.to_dict()}
+
+    @patch("ipinfo_geoip.async_ipinfo.AsyncRedisClient")
+    @patch("ipinfo_geoip.async_ipinfo.AsyncGeoIPClient")
+    def test_get_with_invalid_ip_value(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """IPアドレスが無効な場合のgetメソッドテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get = AsyncMock()
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get = AsyncMock()
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = AsyncIPInfo()
+
+        with pytest.raises(ValidationError):
+            _ = asyncio.run(ipinfo.get(TEST_IPADDRESS_INVALID_))
+
+        # 検証
+        mock_geoip_instance.get.assert_not_awaited()
+        mock_redis_instance.get.assert_not_awaited()
+
+    @patch("ipinfo_geoip.async_ipinfo.AsyncRedisClient")
+    @patch("ipinfo_geoip.async_ipinfo.AsyncGeoIPClient")
+    def test_get_many(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """複数のIPアドレス情報をまとめて取得するget_manyメソッドテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get_many = AsyncMock(return_value={TEST_IP_ADDRESS_2: TEST_IPDATA_2})
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get_many = AsyncMock(return_value={TEST_IP_ADDRESS_1: TEST_IPDATA, TEST_IP_ADDRESS_2: None})
+        mock_redis_instance.set_many = AsyncMock()
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = AsyncIPInfo()
+        result = asyncio.run(ipinfo.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2, TEST_IP_ADDRESS_1]))
+
+        # 検証
+        assert result == {TEST_IP_ADDRESS_1: TEST_IPDATA.to_dict(), TEST_IP_ADDRESS_2: TEST_IPDATA_2.to_dict()}
+        mock_redis_instance.get_many.assert_awaited_once_with([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])
+        mock_geoip_instance.get_many.assert_awaited_once_with([TEST_IP_ADDRESS_2], GEOIP_MAX_WORKERS)
+        mock_redis_instance.set_many.assert_awaited_once_with({TEST_IP_ADDRESS_2: TEST_IPDATA_2}, [])
+
+    @patch("ipinfo_geoip.async_ipinfo.AsyncRedisClient")
+    @patch("ipinfo_geoip.async_ipinfo.AsyncGeoIPClient")
+    def test_get_many_with_failure(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """取得に失敗したIPアドレスをNoneとし, 存在しないことを保存しないget_manyメソッドテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get_many = AsyncMock(return_value={TEST_IP_ADDRESS_1: TEST_IPDATA})
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get_many = AsyncMock(return_value={})
+        mock_redis_instance.set_many = AsyncMock()
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = AsyncIPInfo()
+        result = asyncio.run(ipinfo.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2]))
+
+        # 検証
+        assert result == {TEST_IP_ADDRESS_1: TEST_IPDATA.to_dict(), TEST_IP_ADDRESS_2: None}
+        mock_redis_instance.set_many.assert_awaited_once_with({TEST_IP_ADDRESS_1: TEST_IPDATA}, [])
+        assert TEST_IP_ADDRESS_2 not in ipinfo.data
+
+    @patch("ipinfo_geoip.async_ipinfo.AsyncRedisClient")
+    @patch("ipinfo_geoip.async_ipinfo.AsyncGeoIPClient")
+    def test_get_many_with_rate_limit(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """問い合わせ数が上限に達した場合のget_manyメソッドテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get_many = AsyncMock(
+            side_effect=RateLimitError(
+                "GeoIP query quota exhausted",
+                {"ip_addresses": [TEST_IP_ADDRESS_2], "results": {TEST_IP_ADDRESS_1: TEST_IPDATA}},
+            ),
+        )
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get_many = AsyncMock(return_value={})
+        mock_redis_instance.set_many = AsyncMock()
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = AsyncIPInfo()
+        with pytest.raises(RateLimitError) as exc_info:
+            _ = asyncio.run(ipinfo.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2]))
+
+        # 検証
+        assert exc_info.value.details == {
+            "ip_addresses": [TEST_IP_ADDRESS_2],
+            "results": {TEST_IP_ADDRESS_1: TEST_IPDATA.to_dict()},
+        }
+        mock_redis_instance.set_many.assert_awaited_once_with({TEST_IP_ADDRESS_1: TEST_IPDATA}, [])
+        assert TEST_IP_ADDRESS_1 in ipinfo.data
+        assert TEST_IP_ADDRESS_2 not in ipinfo.data
+
+    @patch("ipinfo_geoip.async_ipinfo.AsyncRedisClient")
+    @patch("ipinfo_geoip.async_ipinfo.AsyncGeoIPClient")
+    def test_context_manager(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """非同期コンテキストマネージャのテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.close = AsyncMock()
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.close = AsyncMock()
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        async def run() -> None:
+            async with AsyncIPInfo() as ipinfo:
+                assert isinstance(ipinfo, AsyncIPInfo)
+
+        asyncio.run(run())
+
+        # 検証
+        mock_geoip_instance.close.assert_awaited_once()
+        mock_redis_instance.close.assert_awaited_once()
+
+    @patch("ipinfo_geoip.async_ipinfo.AsyncRedisClient")
+    @patch("ipinfo_geoip.async_ipinfo.AsyncGeoIPClient")
+    def test_get_with_address_not_found(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """アドレスが見つからない場合のgetメソッドテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get = AsyncMock(side_effect=AddressNotFoundError("Address not found"))
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get = AsyncMock(return_value=None)
+        mock_redis_instance.set_many = AsyncMock()
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = AsyncIPInfo()
+        result = asyncio.run(ipinfo.get(TEST_IP_ADDRESS_1))
+        result_cached = asyncio.run(ipinfo.get(TEST_IP_ADDRESS_1))
+
+        # 検証
+        assert result is None
+        assert result_cached is None
+        mock_geoip_instance.get.assert_awaited_once_with(TEST_IP_ADDRESS_1)
+        mock_redis_instance.set_many.assert_awaited_once_with({}, [TEST_IP_ADDRESS_1])
+
+    @patch("ipinfo_geoip.async_ipinfo.AsyncRedisClient")
+    @patch("ipinfo_geoip.async_ipinfo.AsyncGeoIPClient")
+    def test_get_with_geoip_client_error(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """再試行しても一時的なエラーが続いた場合のgetメソッドテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get = AsyncMock(side_effect=GeoIPClientError("GeoIP request failed"))
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get = AsyncMock(return_value=None)
+        mock_redis_instance.set_many = AsyncMock()
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = AsyncIPInfo()
+
+        with pytest.raises(GeoIPClientError):
+            _ = asyncio.run(ipinfo.get(TEST_IP_ADDRESS_1))
+
+        # 検証
+        assert TEST_IP_ADDRESS_1 not in ipinfo.data
+        mock_redis_instance.set_many.assert_not_awaited()
+
+    @patch("ipinfo_geoip.async_ipinfo.AsyncRedisClient")
+    @patch("ipinfo_geoip.async_ipinfo.AsyncGeoIPClient")
+    def test_get_coalesces_concurrent_calls(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """同じIPアドレスに対する同時のgetメソッドが1回に集約されるテスト."""
+
+        # モック設定
+        async def get(_: str) -> object:
+            await asyncio.sleep(0)
+            return TEST_IPDATA
+
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get = AsyncMock(side_effect=get)
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get = AsyncMock(return_value=None)
+        mock_redis_instance.set_many = AsyncMock()
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = AsyncIPInfo()
+
+        async def run() -> list[dict[str, str] | None]:
+            return await asyncio.gather(*(ipinfo.get(TEST_IP_ADDRESS_1) for _ in range(3)))
+
+        results = asyncio.run(run())
+
+        # 検証
+        assert results == [TEST_IPDATA.to_dict()] * 3
+        assert ipinfo._inflight == {}  # noqa: SLF001
+        mock_redis_instance.get.assert_awaited_once_with(TEST_IP_ADDRESS_1)
+        mock_geoip_instance.get.assert_awaited_once_with(TEST_IP_ADDRESS_1)
+        mock_redis_instance.set_many.assert_awaited_once_with({TEST_IP_ADDRESS_1: TEST_IPDATA}, [])
+
+    @patch.dict(os.environ, {RESOLVERS_ENV: "redis,webservice"})
+    @patch("ipinfo_geoip.async_ipinfo.AsyncRedisClient")
+    @patch("ipinfo_geoip.async_ipinfo.AsyncGeoIPClient")
+    def test_get_with_redis_unavailable(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """Redisが利用できない場合にGeoLite2 Web Serviceから取得するgetメソッドテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get = AsyncMock(return_value=TEST_IPDATA)
+        mock_geoip_instance.get_many = AsyncMock(return_value={TEST_IP_ADDRESS_2: TEST_IPDATA_2})
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        error = RedisClientError("Redis circuit breaker is open")
+        mock_redis_instance = Mock()
+        mock_redis_instance.get = AsyncMock(side_effect=error)
+        mock_redis_instance.get_many = AsyncMock(side_effect=error)
+        mock_redis_instance.set_many = AsyncMock(side_effect=error)
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = AsyncIPInfo()
+        result = asyncio.run(ipinfo.get(TEST_IP_ADDRESS_1))
+        results = asyncio.run(ipinfo.get_many([TEST_IP_ADDRESS_2]))
+
+        # 検証
+        assert result == TEST_IPDATA.to_dict()
+        assert results == {TEST_IP_ADDRESS_2: TEST_IPDATA_2.to_dict()}
+        assert mock_redis_instance.set_many.await_count == 2  # noqa: PLR2004
+
+    @patch.dict(os.environ, {RESOLVERS_ENV: "memory,mmdb,redis,webservice"})
+    @patch("ipinfo_geoip.async_ipinfo.AsyncRedisClient")
+    @patch("ipinfo_geoip.async_ipinfo.AsyncGeoIPClient")
+    @patch("ipinfo_geoip.async_ipinfo.MMDBClient")
+    def test_get_from_mmdb(self, mock_mmdb_client: Mock, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """環境変数の検索階層に従ってGeoLite2データベースファイルから取得するgetメソッドテスト."""
+        # モック設定
+        mock_mmdb_instance = Mock()
+        mock_mmdb_instance.get_many = Mock(return_value={TEST_IP_ADDRESS_1: TEST_IPDATA})
+        mock_mmdb_client.return_value = mock_mmdb_instance
+
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get = AsyncMock()
+        mock_geoip_instance.close = AsyncMock()
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get = AsyncMock()
+        mock_redis_instance.close = AsyncMock()
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        async def run() -> dict[str, str] | None:
+            async with AsyncIPInfo() as ipinfo:
+                return await ipinfo.get(TEST_IP_ADDRESS_1)
+
+        result = asyncio.run(run())
+
+        # 検証
+        assert result == TEST_IPDATA.to_dict()
+        mock_mmdb_instance.get_many.assert_called_once_with([TEST_IP_ADDRESS_1])
+        mock_redis_instance.get.assert_not_awaited()
+        mock_geoip_instance.get.assert_not_awaited()
+        mock_mmdb_instance.close.assert_called_once()
+
+    @patch.dict(os.environ, {RESOLVERS_ENV: "memory,redis"})
+    @patch("ipinfo_geoip.async_ipinfo.AsyncRedisClient")
+    @patch("ipinfo_geoip.async_ipinfo.AsyncGeoIPClient")
+    def test_get_many_from_memory(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """取得済みネットワークに含まれるIPアドレスをRedisに問い合わせないget_manyメソッドテスト."""
+        # モック設定
+        mock_redis_instance = Mock()
+        mock_redis_instance.get_many = AsyncMock(return_value={TEST_IP_ADDRESS_1: TEST_IPDATA})
+        mock_redis_instance.set_many = AsyncMock()
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = AsyncIPInfo()
+        _ = asyncio.run(ipinfo.get_many([TEST_IP_ADDRESS_1]))
+        results = asyncio.run(ipinfo.get_many([TEST_IP_ADDRESS_2]))
+
+        # 検証
+        assert results == {TEST_IP_ADDRESS_2: TEST_IPDATA_2.to_dict()}
+        mock_geoip_client.assert_not_called()
+        mock_redis_instance.get_many.assert_awaited_once_with([TEST_IP_ADDRESS_1])
+
+    @patch.dict(os.environ, {RESOLVERS_ENV: "memory,unknown"})
+    @patch("ipinfo_geoip.async_ipinfo.AsyncRedisClient")
+    @patch("ipinfo_geoip.async_ipinfo.AsyncGeoIPClient")
+    def test_init_with_invalid_resolvers(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """検索階層の設定が不正な場合の初期化テスト."""
+        with pytest.raises(ConfigurationError):
+            _ = AsyncIPInfo()
+
+        # 検証
+        mock_geoip_client.assert_not_called()
+        mock_redis_client.assert_not_called()
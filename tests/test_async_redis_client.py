@@ -0,0 +1,254 @@
+"""AsyncRedisClientクラスのテスト."""
+
+import asyncio
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, Mock, patch
+
+import fakeredis
+import pytest
+import redis
+import redis.asyncio
+
+from ipinfo_geoip.async_redis_client import AsyncRedisClient
+from ipinfo_geoip.circuit_breaker import CircuitBreaker
+from ipinfo_geoip.constants import REDIS_STORAGE_BINARY, REDIS_STORAGE_NETWORK
+from ipinfo_geoip.exceptions import ConfigurationError, RedisClientError, ValidationError
+from ipinfo_geoip.ipdata import IPData
+from ipinfo_geoip.redis_config import RedisConfig
+from tests.conftest import (
+    TEST_BREAKER_RESET_TIMEOUT,
+    TEST_BREAKER_THRESHOLD,
+    TEST_IP_ADDRESS_1,
+    TEST_IP_ADDRESS_2,
+    TEST_IPADDRESS_INVALID_,
+    TEST_IPDATA,
+    TEST_IPDATA_INCOMPLETE,
+    TEST_REDIS_NEGATIVE_TTL_INT,
+    TEST_REDIS_TTL_INT,
+    TEST_REDIS_TTL_STR,
+    TEST_REDIS_URI,
+)
+
+
+class TestAsyncRedisClient:
+    """AsyncRedisClientクラスのテストクラス."""
+
+    @pytest.fixture(autouse=True)
+    def breaker(self) -> Iterator[CircuitBreaker]:
+        """テストごとに新しいサーキットブレーカーを使用する."""
+        breaker = CircuitBreaker(TEST_BREAKER_THRESHOLD, TEST_BREAKER_RESET_TIMEOUT)
+        with patch("ipinfo_geoip.async_redis_client._get_breaker", return_value=breaker):
+            yield breaker
+
+    @patch("ipinfo_geoip.async_redis_client._get_async_client")
+    @patch("ipinfo_geoip.async_redis_client.RedisConfig.from_env")
+    def test_init(self, mock_from_env: Mock, mock_get_async_client: Mock) -> None:
+        """初期化のテスト."""
+        # モック設定
+        mock_config = Mock(cluster=False)
+        mock_config.uri = TEST_REDIS_URI
+        mock_config.ttl = TEST_REDIS_TTL_INT
+        mock_from_env.return_value = mock_config
+
+        # テスト実行
+        client = AsyncRedisClient()
+
+        # 検証
+        assert isinstance(client, AsyncRedisClient)
+        mock_get_async_client.assert_called_once_with(mock_config, decode_responses=True)
+
+    @patch("ipinfo_geoip.async_redis_client.RedisConfig.from_env")
+    def test_init_with_configuration_error(self, mock_from_env: Mock) -> None:
+        """設定エラーでの初期化テスト."""
+        # モック設定
+        mock_from_env.side_effect = ValidationError("Missing environment variables")
+
+        # テスト実行
+        with pytest.raises(ConfigurationError):
+            _ = AsyncRedisClient()
+
+    @patch("ipinfo_geoip.async_redis_client._get_async_client")
+    @patch("ipinfo_geoip.async_redis_client.RedisConfig.from_env")
+    def test_get_many(self, mock_from_env: Mock, mock_get_async_client: Mock) -> None:
+        """複数のIPアドレスを取得するget_manyメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock(cluster=False)
+
+        mock_redis_pipeline = Mock()
+        mock_redis_pipeline.execute = AsyncMock(return_value=[TEST_IPDATA.to_dict(), {}])
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.pipeline.return_value = mock_redis_pipeline
+        mock_get_async_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = AsyncRedisClient()
+        result = asyncio.run(client.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2]))
+
+        # 検証
+        assert result == {TEST_IP_ADDRESS_1: TEST_IPDATA, TEST_IP_ADDRESS_2: None}
+        mock_redis_pipeline.hgetall.assert_any_call(f"ipinfo:{TEST_IP_ADDRESS_1}")
+        mock_redis_pipeline.execute.assert_awaited_once()
+
+    @patch("ipinfo_geoip.async_redis_client._get_async_client")
+    @patch("ipinfo_geoip.async_redis_client.RedisConfig.from_env")
+    def test_get_with_invalid_ip_value(self, mock_from_env: Mock, mock_get_async_client: Mock) -> None:
+        """IPアドレスが無効な場合のgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock(cluster=False)
+
+        mock_redis_instance = Mock()
+        mock_get_async_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = AsyncRedisClient()
+
+        with pytest.raises(ValidationError):
+            _ = asyncio.run(client.get(TEST_IPADDRESS_INVALID_))
+
+        # 検証
+        mock_redis_instance.pipeline.assert_not_called()
+
+    @patch("ipinfo_geoip.async_redis_client._get_async_client")
+    @patch("ipinfo_geoip.async_redis_client.RedisConfig.from_env")
+    def test_get_with_connection_error(self, mock_from_env: Mock, mock_get_async_client: Mock) -> None:
+        """接続エラーでのgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock(cluster=False)
+
+        mock_redis_pipeline = Mock()
+        mock_redis_pipeline.execute = AsyncMock(side_effect=redis.ConnectionError("Connection failed"))
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.pipeline.return_value = mock_redis_pipeline
+        mock_get_async_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = AsyncRedisClient()
+
+        with pytest.raises(RedisClientError):
+            _ = asyncio.run(client.get(TEST_IP_ADDRESS_1))
+
+    @patch("ipinfo_geoip.async_redis_client._get_async_client")
+    @patch("ipinfo_geoip.async_redis_client.RedisConfig.from_env")
+    def test_set_many(self, mock_from_env: Mock, mock_get_async_client: Mock) -> None:
+        """複数のIPアドレス情報を保存するset_manyメソッドテスト."""
+        # モック設定
+        mock_config = Mock(cluster=False)
+        mock_config.ttl = TEST_REDIS_TTL_INT
+        mock_from_env.return_value = mock_config
+
+        mock_redis_pipeline = Mock()
+        mock_redis_pipeline.execute = AsyncMock(return_value=[1, True])
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.pipeline.return_value = mock_redis_pipeline
+        mock_get_async_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = AsyncRedisClient()
+        asyncio.run(client.set_many({TEST_IP_ADDRESS_1: TEST_IPDATA, TEST_IP_ADDRESS_2: TEST_IPDATA_INCOMPLETE}))
+
+        # 検証
+        mock_redis_pipeline.hset.assert_called_once_with(f"ipinfo:{TEST_IP_ADDRESS_1}", mapping=TEST_IPDATA.to_dict())
+        mock_redis_pipeline.expire.assert_called_once_with(f"ipinfo:{TEST_IP_ADDRESS_1}", TEST_REDIS_TTL_INT)
+        mock_redis_pipeline.execute.assert_awaited_once()
+
+    @patch("ipinfo_geoip.async_redis_client._get_async_client")
+    @patch("ipinfo_geoip.async_redis_client.RedisConfig.from_env")
+    def test_set_many_with_network_storage(self, mock_from_env: Mock, mock_get_async_client: Mock) -> None:
+        """ネットワーク範囲キャッシュにEXPIREを使用せずに保存し, 有効期限切れのメンバーを削除するset_manyメソッドテスト."""
+        # モック設定
+        mock_config = Mock(cluster=False)
+        mock_config.ttl = TEST_REDIS_TTL_INT
+        mock_config.negative_ttl = TEST_REDIS_NEGATIVE_TTL_INT
+        mock_config.storage = REDIS_STORAGE_NETWORK
+        mock_from_env.return_value = mock_config
+
+        expired = "c6336401|c6336401|32|||1|"
+        mock_redis_pipeline = Mock()
+        mock_redis_pipeline.execute = AsyncMock(side_effect=[[0, 1, 1, 0, 1, 1, [expired], []], [1, 1]])
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.pipeline.return_value = mock_redis_pipeline
+        mock_get_async_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = AsyncRedisClient()
+        asyncio.run(client.set_many({TEST_IP_ADDRESS_1: TEST_IPDATA}, [TEST_IP_ADDRESS_2]))
+
+        # 検証
+        mock_redis_pipeline.expire.assert_not_called()
+        assert mock_redis_pipeline.zrem.call_args_list == [
+            (("ipinfo:networks:4", expired),),
+            (("ipinfo:networks:4:expires", expired),),
+        ]
+        assert mock_redis_pipeline.execute.await_count == 2  # noqa: PLR2004
+
+    @patch("ipinfo_geoip.async_redis_client._get_async_client")
+    @patch("ipinfo_geoip.async_redis_client.RedisConfig.from_env")
+    def test_get_many_with_binary_storage_legacy_hash(self, mock_from_env: Mock, mock_get_async_client: Mock) -> None:
+        """バイナリ形式にないIPアドレスを移行前のハッシュから読み込むget_manyメソッドテスト."""
+        # モック設定
+        mock_config = Mock(cluster=False)
+        mock_config.uri = TEST_REDIS_URI
+        mock_config.storage = REDIS_STORAGE_BINARY
+        mock_from_env.return_value = mock_config
+
+        legacy = {name.encode(): value.encode() for name, value in TEST_IPDATA.to_dict().items()}
+        mock_redis_pipeline = Mock()
+        mock_redis_pipeline.execute = AsyncMock(side_effect=[[[None]], [legacy]])
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.pipeline.return_value = mock_redis_pipeline
+        mock_get_async_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = AsyncRedisClient()
+        result = asyncio.run(client.get_many([TEST_IP_ADDRESS_1]))
+
+        # 検証
+        assert result == {TEST_IP_ADDRESS_1: TEST_IPDATA}
+        assert mock_get_async_client.call_args.kwargs["decode_responses"] is False
+        mock_redis_pipeline.mget.assert_called_once()
+        mock_redis_pipeline.hgetall.assert_called_once_with(f"ipinfo:{TEST_IP_ADDRESS_1}")
+
+    @patch("ipinfo_geoip.redis_pool.redis.asyncio.cluster.RedisCluster.from_url")
+    @patch("ipinfo_geoip.async_redis_client.RedisConfig.from_env")
+    def test_init_with_cluster(self, mock_from_env: Mock, mock_cluster_from_url: Mock) -> None:
+        """Redis Clusterでの初期化テスト."""
+        # モック設定
+        mock_config = Mock(cluster=True)
+        mock_config.uri = TEST_REDIS_URI
+        mock_from_env.return_value = mock_config
+
+        # テスト実行
+        client = AsyncRedisClient()
+
+        # 検証
+        assert client.client is mock_cluster_from_url.return_value
+        assert mock_cluster_from_url.call_args.args == (TEST_REDIS_URI,)
+
+    @patch("ipinfo_geoip.async_redis_client.RedisConfig.from_env")
+    def test_concurrency_above_max_connections(self, mock_from_env: Mock) -> None:
+        """最大接続数を超える同時実行で接続の空きを待つテスト."""
+        # モック設定
+        mock_from_env.return_value = RedisConfig(
+            TEST_REDIS_URI, TEST_REDIS_TTL_STR, max_connections="4", health_check_interval="0"
+        )
+        client = AsyncRedisClient()
+        assert isinstance(client.client, redis.asyncio.Redis)
+        pool = client.client.connection_pool
+        pool.connection_class = fakeredis.aioredis.FakeAsyncRedisConnection
+        pool.connection_kwargs["server"] = fakeredis.FakeServer()
+
+        async def run() -> list[dict[str, IPData | None]]:
+            await client.set_many({TEST_IP_ADDRESS_1: TEST_IPDATA})
+            return list(await asyncio.gather(*(client.get_many([TEST_IP_ADDRESS_1]) for _ in range(50))))
+
+        # テスト実行
+        results = asyncio.run(run())
+
+        # 検証
+        assert results == [{TEST_IP_ADDRESS_1: TEST_IPDATA}] * 50
+        assert len(pool._available_connections) + len(pool._in_use_connections) <= 4  # noqa: PLR2004, SLF001
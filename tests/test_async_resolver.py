@@ -0,0 +1,127 @@
+"""AsyncResolverChainクラスのテスト."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ipinfo_geoip.async_resolver import AsyncResolverChain
+from ipinfo_geoip.constants import GEOIP_MAX_WORKERS
+from ipinfo_geoip.exceptions import GeoIPClientError, RateLimitError
+from ipinfo_geoip.ipdata import IPData
+from tests.conftest import (
+    TEST_IP_ADDRESS_1,
+    TEST_IP_ADDRESS_2,
+    TEST_IPDATA,
+    TEST_IPDATA_INCOMPLETE,
+)
+
+TEST_NOT_FOUND_1: IPData = IPData(TEST_IP_ADDRESS_1, "", "", "", "")
+TEST_NOT_FOUND_2: IPData = IPData(TEST_IP_ADDRESS_2, "", "", "", "")
+
+
+def make_resolver(found: dict[str, IPData]) -> Mock:
+    """指定されたIPアドレス情報を返す非同期の検索階層のモックを作成する."""
+    resolver = Mock()
+    resolver.get = AsyncMock(side_effect=found.get)
+    resolver.get_many = AsyncMock(
+        side_effect=lambda ip_addresses, _: {
+            ip_address: found[ip_address] for ip_address in ip_addresses if ip_address in found
+        },
+    )
+    resolver.put = AsyncMock()
+    resolver.put_many = AsyncMock()
+    resolver.close = AsyncMock()
+    return resolver
+
+
+class TestAsyncResolverChain:
+    """AsyncResolverChainクラスのテストクラス."""
+
+    def test_get_writes_back(self) -> None:
+        """後の階層で見つかったIPアドレス情報を前の階層に保存するgetメソッドテスト."""
+        first = make_resolver({})
+        second = make_resolver({TEST_IP_ADDRESS_1: TEST_IPDATA})
+
+        result = asyncio.run(AsyncResolverChain([first, second]).get(TEST_IP_ADDRESS_1))
+
+        assert result == TEST_IPDATA
+        first.put.assert_awaited_once_with(TEST_IP_ADDRESS_1, TEST_IPDATA)
+        second.put.assert_not_awaited()
+
+    def test_get_not_found(self) -> None:
+        """どの階層でも見つからない場合に存在しないことを保存するgetメソッドテスト."""
+        first = make_resolver({})
+        second = make_resolver({})
+
+        result = asyncio.run(AsyncResolverChain([first, second]).get(TEST_IP_ADDRESS_1))
+
+        assert result == TEST_NOT_FOUND_1
+        first.put.assert_awaited_once_with(TEST_IP_ADDRESS_1, TEST_NOT_FOUND_1)
+        second.put.assert_awaited_once_with(TEST_IP_ADDRESS_1, TEST_NOT_FOUND_1)
+
+    def test_get_incomplete(self) -> None:
+        """不備のあるIPアドレス情報を保存しないgetメソッドテスト."""
+        first = make_resolver({})
+        second = make_resolver({TEST_IP_ADDRESS_1: TEST_IPDATA_INCOMPLETE})
+
+        result = asyncio.run(AsyncResolverChain([first, second]).get(TEST_IP_ADDRESS_1))
+
+        assert result == TEST_IPDATA_INCOMPLETE
+        first.put.assert_not_awaited()
+
+    def test_get_many(self) -> None:
+        """前の階層で見つからなかったIPアドレスのみを次の階層に問い合わせるget_manyメソッドテスト."""
+        first = make_resolver({TEST_IP_ADDRESS_1: TEST_IPDATA})
+        second = make_resolver({})
+
+        result = asyncio.run(AsyncResolverChain([first, second]).get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2]))
+
+        assert result == {TEST_IP_ADDRESS_1: TEST_IPDATA, TEST_IP_ADDRESS_2: TEST_NOT_FOUND_2}
+        second.get_many.assert_awaited_once_with([TEST_IP_ADDRESS_2], GEOIP_MAX_WORKERS)
+        first.put_many.assert_awaited_once_with({TEST_IP_ADDRESS_2: TEST_NOT_FOUND_2})
+        second.put_many.assert_awaited_once_with({TEST_IP_ADDRESS_2: TEST_NOT_FOUND_2})
+
+    def test_get_many_failed(self) -> None:
+        """取得に失敗したIPアドレスの存在しないことを保存せずに結果から除くget_manyメソッドテスト."""
+        first = make_resolver({})
+        second = make_resolver({})
+        second.get_many.side_effect = GeoIPClientError(
+            "GeoIP lookup failed",
+            {"ip_addresses": [TEST_IP_ADDRESS_2], "results": {TEST_IP_ADDRESS_1: TEST_IPDATA}},
+        )
+
+        result = asyncio.run(AsyncResolverChain([first, second]).get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2]))
+
+        assert result == {TEST_IP_ADDRESS_1: TEST_IPDATA}
+        first.put_many.assert_awaited_once_with({TEST_IP_ADDRESS_1: TEST_IPDATA})
+        second.put_many.assert_not_awaited()
+
+    def test_get_many_rate_limited(self) -> None:
+        """問い合わせ数の上限により検索できなかったIPアドレスの存在しないことを保存しないget_manyメソッドテスト."""
+        first = make_resolver({})
+        second = make_resolver({})
+        second.get_many.side_effect = RateLimitError(
+            "GeoIP query quota exhausted",
+            {"ip_addresses": [TEST_IP_ADDRESS_2], "results": {TEST_IP_ADDRESS_1: TEST_IPDATA}},
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            _ = asyncio.run(AsyncResolverChain([first, second]).get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2]))
+
+        assert exc_info.value.details == {
+            "ip_addresses": [TEST_IP_ADDRESS_2],
+            "results": {TEST_IP_ADDRESS_1: TEST_IPDATA},
+        }
+        first.put_many.assert_awaited_once_with({TEST_IP_ADDRESS_1: TEST_IPDATA})
+        second.put_many.assert_not_awaited()
+
+    def test_close(self) -> None:
+        """すべての階層を閉じるcloseメソッドテスト."""
+        first = make_resolver({})
+        second = make_resolver({})
+
+        asyncio.run(AsyncResolverChain([first, second]).close())
+
+        first.close.assert_awaited_once()
+        second.close.assert_awaited_once()
@@ -0,0 +1,151 @@
+"""非同期の検索階層の実装クラスのテスト."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ipinfo_geoip.async_resolvers import AsyncMemoryResolver, AsyncMMDBResolver, AsyncRedisResolver, AsyncWebServiceResolver
+from ipinfo_geoip.exceptions import AddressNotFoundError, GeoIPClientError, RateLimitError, RedisClientError
+from ipinfo_geoip.ipdata import IPData
+from ipinfo_geoip.network_index import NetworkIndex
+from tests.conftest import TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2, TEST_IPDATA, TEST_IPDATA_2
+
+TEST_NOT_FOUND_2: IPData = IPData(TEST_IP_ADDRESS_2, "", "", "", "")
+
+
+class TestAsyncMemoryResolver:
+    """AsyncMemoryResolverクラスのテストクラス."""
+
+    def test_put_and_get(self) -> None:
+        """登録したネットワークから取得するテスト."""
+        resolver = AsyncMemoryResolver(NetworkIndex(10, 60))
+        asyncio.run(resolver.put(TEST_IP_ADDRESS_1, TEST_IPDATA))
+
+        result = asyncio.run(resolver.get(TEST_IP_ADDRESS_2))
+
+        assert result is not None
+        assert result.network == TEST_IPDATA.network
+
+    def test_put_many_and_get_many(self) -> None:
+        """複数のネットワークを登録して取得するテスト."""
+        resolver = AsyncMemoryResolver(NetworkIndex(10, 60))
+        asyncio.run(resolver.put_many({TEST_IP_ADDRESS_1: TEST_IPDATA, TEST_IP_ADDRESS_2: TEST_NOT_FOUND_2}))
+
+        result = asyncio.run(resolver.get_many([TEST_IP_ADDRESS_1, "198.51.100.1"]))
+
+        assert list(result) == [TEST_IP_ADDRESS_1]
+
+
+class TestAsyncMMDBResolver:
+    """AsyncMMDBResolverクラスのテストクラス."""
+
+    def test_get_many(self) -> None:
+        """見つかったIPアドレス情報のみを返すテスト."""
+        client = Mock()
+        client.get_many.return_value = {TEST_IP_ADDRESS_1: TEST_IPDATA, TEST_IP_ADDRESS_2: None}
+        resolver = AsyncMMDBResolver(client)
+
+        result = asyncio.run(resolver.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2]))
+
+        assert result == {TEST_IP_ADDRESS_1: TEST_IPDATA}
+        client.get_many.assert_called_once_with([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])
+
+    def test_put_and_close(self) -> None:
+        """保存は行わず, closeでデータベースファイルを閉じるテスト."""
+        client = Mock()
+        resolver = AsyncMMDBResolver(client)
+
+        asyncio.run(resolver.put(TEST_IP_ADDRESS_1, TEST_IPDATA))
+        asyncio.run(resolver.put_many({TEST_IP_ADDRESS_1: TEST_IPDATA}))
+        asyncio.run(resolver.close())
+
+        client.close.assert_called_once_with()
+        assert len(client.mock_calls) == 1
+
+
+class TestAsyncRedisResolver:
+    """AsyncRedisResolverクラスのテストクラス."""
+
+    def test_get(self) -> None:
+        """Redisから取得するテスト."""
+        client = Mock()
+        client.get = AsyncMock(return_value=TEST_IPDATA)
+        resolver = AsyncRedisResolver(client)
+
+        assert asyncio.run(resolver.get(TEST_IP_ADDRESS_1)) == TEST_IPDATA
+        client.get.assert_awaited_once_with(TEST_IP_ADDRESS_1)
+
+    def test_put_many(self) -> None:
+        """IPアドレス情報と存在しないことを1回のパイプラインで保存するテスト."""
+        client = Mock()
+        client.set_many = AsyncMock()
+        resolver = AsyncRedisResolver(client)
+
+        asyncio.run(resolver.put_many({TEST_IP_ADDRESS_1: TEST_IPDATA, TEST_IP_ADDRESS_2: TEST_NOT_FOUND_2}))
+
+        client.set_many.assert_awaited_once_with({TEST_IP_ADDRESS_1: TEST_IPDATA}, [TEST_IP_ADDRESS_2])
+
+    def test_fail_open(self) -> None:
+        """Redisが利用できない場合は見つからなかったものとして扱うテスト."""
+        error = RedisClientError("Redis circuit breaker is open")
+        client = Mock()
+        client.get = AsyncMock(side_effect=error)
+        client.get_many = AsyncMock(side_effect=error)
+        client.set_many = AsyncMock(side_effect=error)
+        resolver = AsyncRedisResolver(client)
+
+        assert asyncio.run(resolver.get(TEST_IP_ADDRESS_1)) is None
+        assert asyncio.run(resolver.get_many([TEST_IP_ADDRESS_1])) == {}
+        asyncio.run(resolver.put(TEST_IP_ADDRESS_1, TEST_IPDATA))
+        asyncio.run(resolver.put(TEST_IP_ADDRESS_2, TEST_NOT_FOUND_2))
+
+
+class TestAsyncWebServiceResolver:
+    """AsyncWebServiceResolverクラスのテストクラス."""
+
+    def test_get_with_address_not_found(self) -> None:
+        """IPアドレスが見つからない場合のテスト."""
+        client = Mock()
+        client.get = AsyncMock(side_effect=AddressNotFoundError("Address not found"))
+        resolver = AsyncWebServiceResolver(client)
+
+        assert asyncio.run(resolver.get(TEST_IP_ADDRESS_1)) is None
+
+    def test_get_many(self) -> None:
+        """並行に取得するテスト."""
+        client = Mock()
+        client.get_many = AsyncMock(return_value={TEST_IP_ADDRESS_1: None, TEST_IP_ADDRESS_2: TEST_IPDATA_2})
+        resolver = AsyncWebServiceResolver(client)
+
+        result = asyncio.run(resolver.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2], 4))
+
+        assert result == {TEST_IP_ADDRESS_2: TEST_IPDATA_2}
+        client.get_many.assert_awaited_once_with([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2], 4)
+
+    def test_get_many_with_rate_limit(self) -> None:
+        """問い合わせ数が上限に達した場合に見つかったIPアドレス情報を送出するテスト."""
+        client = Mock()
+        client.get_many = AsyncMock(
+            side_effect=RateLimitError(
+                "GeoIP query quota exhausted",
+                {"ip_addresses": [TEST_IP_ADDRESS_2], "results": {TEST_IP_ADDRESS_1: None}},
+            ),
+        )
+        resolver = AsyncWebServiceResolver(client)
+
+        with pytest.raises(RateLimitError) as exc_info:
+            _ = asyncio.run(resolver.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2]))
+
+        assert exc_info.value.details == {"ip_addresses": [TEST_IP_ADDRESS_2], "results": {}}
+
+    def test_get_many_with_failure(self) -> None:
+        """取得に失敗したIPアドレスと見つかったIPアドレス情報を送出するテスト."""
+        client = Mock()
+        client.get_many = AsyncMock(return_value={TEST_IP_ADDRESS_1: TEST_IPDATA})
+        resolver = AsyncWebServiceResolver(client)
+
+        with pytest.raises(GeoIPClientError) as exc_info:
+            _ = asyncio.run(resolver.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2]))
+
+        assert exc_info.value.details == {"ip_addresses": [TEST_IP_ADDRESS_2], "results": {TEST_IP_ADDRESS_1: TEST_IPDATA}}
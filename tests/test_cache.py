@@ -0,0 +1,85 @@
+"""TTLCacheクラスのテスト."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ipinfo_geoip.cache import TTLCache
+from tests.conftest import TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2, TEST_IPDATA, TEST_IPDATA_2
+
+TEST_CACHE_TTL: int = 60
+TEST_CACHE_MAX_ENTRIES: int = 100
+
+
+class TestTTLCache:
+    """TTLCacheクラスのテストクラス."""
+
+    def test_setitem_and_getitem(self) -> None:
+        """保存と取得のテスト."""
+        cache: TTLCache[str, object] = TTLCache(2, TEST_CACHE_TTL)
+        cache[TEST_IP_ADDRESS_1] = TEST_IPDATA
+
+        assert cache[TEST_IP_ADDRESS_1] == TEST_IPDATA
+        assert TEST_IP_ADDRESS_1 in cache
+        assert len(cache) == 1
+        assert list(cache) == [TEST_IP_ADDRESS_1]
+
+    def test_getitem_missing(self) -> None:
+        """存在しないキーの取得テスト."""
+        cache: TTLCache[str, object] = TTLCache(2, TEST_CACHE_TTL)
+
+        with pytest.raises(KeyError):
+            _ = cache[TEST_IP_ADDRESS_1]
+
+        assert cache.get(TEST_IP_ADDRESS_1) is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        """最大エントリ数を超えた場合に最も長く参照されていないエントリを削除するテスト."""
+        cache: TTLCache[str, object] = TTLCache(2, TEST_CACHE_TTL)
+        cache[TEST_IP_ADDRESS_1] = TEST_IPDATA
+        cache[TEST_IP_ADDRESS_2] = TEST_IPDATA_2
+        _ = cache[TEST_IP_ADDRESS_1]
+        cache["192.0.2.3"] = None
+
+        assert TEST_IP_ADDRESS_1 in cache
+        assert TEST_IP_ADDRESS_2 not in cache
+        assert "192.0.2.3" in cache
+
+    @patch("ipinfo_geoip.cache.time.monotonic")
+    def test_expires(self, mock_monotonic: Mock) -> None:
+        """有効期限を過ぎたエントリの取得テスト."""
+        mock_monotonic.return_value = 0.0
+        cache: TTLCache[str, object] = TTLCache(2, TEST_CACHE_TTL)
+        cache[TEST_IP_ADDRESS_1] = TEST_IPDATA
+        cache.set(TEST_IP_ADDRESS_2, TEST_IPDATA_2, TEST_CACHE_TTL * 2)
+
+        mock_monotonic.return_value = float(TEST_CACHE_TTL)
+
+        assert TEST_IP_ADDRESS_1 not in cache
+        assert cache[TEST_IP_ADDRESS_2] == TEST_IPDATA_2
+        assert len(cache) == 1
+
+    def test_delitem(self) -> None:
+        """削除のテスト."""
+        cache: TTLCache[str, object] = TTLCache(2, TEST_CACHE_TTL)
+        cache[TEST_IP_ADDRESS_1] = TEST_IPDATA
+        del cache[TEST_IP_ADDRESS_1]
+
+        assert TEST_IP_ADDRESS_1 not in cache
+        assert len(cache) == 0
+
+    def test_concurrent_set(self) -> None:
+        """複数のスレッドからの保存で最大エントリ数を超えないテスト."""
+        cache: TTLCache[int, int] = TTLCache(TEST_CACHE_MAX_ENTRIES, TEST_CACHE_TTL)
+
+        def fill(offset: int) -> None:
+            for key in range(offset, offset + TEST_CACHE_MAX_ENTRIES * 4):
+                cache[key] = key
+                _ = cache.get(key - 1)
+
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(fill, range(0, TEST_CACHE_MAX_ENTRIES * 16, TEST_CACHE_MAX_ENTRIES * 4)))
+
+        assert len(cache) == TEST_CACHE_MAX_ENTRIES
+        assert all(cache[key] == key for key in cache)
@@ -0,0 +1,82 @@
+"""CacheConfigクラスのテスト."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ipinfo_geoip.cache_config import CacheConfig
+from ipinfo_geoip.constants import (
+    CACHE_MAX_ENTRIES,
+    CACHE_MAX_ENTRIES_ENV,
+    CACHE_NEGATIVE_TTL_ENV,
+    CACHE_TTL,
+    CACHE_TTL_ENV,
+    NEGATIVE_CACHE_TTL,
+    REDIS_CACHE_TTL_ENV,
+    REDIS_NEGATIVE_CACHE_TTL_ENV,
+)
+from ipinfo_geoip.exceptions import ValidationError
+from tests.conftest import (
+    TEST_REDIS_NEGATIVE_TTL_INT,
+    TEST_REDIS_NEGATIVE_TTL_STR,
+    TEST_REDIS_TTL_INT,
+    TEST_REDIS_TTL_STR,
+)
+
+
+class TestCacheConfig:
+    """CacheConfigクラスのテストクラス."""
+
+    def test_init(self) -> None:
+        """初期化のテスト."""
+        config = CacheConfig("1000", TEST_REDIS_TTL_STR)
+
+        assert config.max_entries == 1000  # noqa: PLR2004
+        assert config.ttl == TEST_REDIS_TTL_INT
+
+    @pytest.mark.parametrize(("max_entries", "ttl"), [("0", "60"), ("10", "0"), ("many", "60")])
+    def test_init_with_invalid_value(self, max_entries: str, ttl: str) -> None:
+        """値が不正な場合の初期化テスト."""
+        with pytest.raises(ValidationError):
+            _ = CacheConfig(max_entries, ttl)
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_from_env_defaults(self) -> None:
+        """環境変数が設定されていない場合の作成テスト."""
+        config = CacheConfig.from_env()
+
+        assert config.max_entries == CACHE_MAX_ENTRIES
+        assert config.ttl == CACHE_TTL
+        assert config.negative_ttl == NEGATIVE_CACHE_TTL
+
+    @patch.dict(
+        os.environ,
+        {REDIS_CACHE_TTL_ENV: TEST_REDIS_TTL_STR, REDIS_NEGATIVE_CACHE_TTL_ENV: TEST_REDIS_NEGATIVE_TTL_STR},
+        clear=True,
+    )
+    def test_from_env_with_redis_ttl(self) -> None:
+        """RedisキャッシュのTTLを使用する作成テスト."""
+        config = CacheConfig.from_env()
+
+        assert config.ttl == TEST_REDIS_TTL_INT
+        assert config.negative_ttl == TEST_REDIS_NEGATIVE_TTL_INT
+
+    @patch.dict(os.environ, {CACHE_NEGATIVE_TTL_ENV: "30"}, clear=True)
+    def test_from_env_with_negative_ttl(self) -> None:
+        """存在しないことのキャッシュのTTLを指定した作成テスト."""
+        config = CacheConfig.from_env()
+
+        assert config.negative_ttl == 30  # noqa: PLR2004
+
+    @patch.dict(
+        os.environ,
+        {CACHE_MAX_ENTRIES_ENV: "10", CACHE_TTL_ENV: "60", REDIS_CACHE_TTL_ENV: TEST_REDIS_TTL_STR},
+        clear=True,
+    )
+    def test_from_env(self) -> None:
+        """環境変数からの作成テスト."""
+        config = CacheConfig.from_env()
+
+        assert config.max_entries == 10  # noqa: PLR2004
+        assert config.ttl == 60  # noqa: PLR2004
@@ -0,0 +1,185 @@
+"""CacheWarmerクラスのテスト."""
+
+from unittest.mock import Mock, call, patch
+
+from ipinfo_geoip.cache_warmer import CacheWarmer
+from ipinfo_geoip.constants import GEOIP_MAX_WORKERS
+from ipinfo_geoip.exceptions import RateLimitError
+from ipinfo_geoip.geoip_client import GeoIPClient
+from ipinfo_geoip.ipdata import IPData
+from ipinfo_geoip.network_index import NetworkIndex
+from ipinfo_geoip.redis_client import RedisClient
+from tests.conftest import (
+    TEST_AS_NUMBER_STR,
+    TEST_COUNTRY_CODE,
+    TEST_IP_ADDRESS_1,
+    TEST_IP_ADDRESS_2,
+    TEST_IPADDRESS_INVALID_,
+    TEST_IPDATA,
+    TEST_IPDATA_2,
+    TEST_ORGANIZATION,
+    TEST_REDIS_TTL_INT,
+)
+
+TEST_IP_ADDRESS_3: str = "198.51.100.1"
+TEST_IP_ADDRESS_4: str = "203.0.113.1"
+TEST_IPDATA_3: IPData = IPData(TEST_IP_ADDRESS_3, "198.51.100.0/24", TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, TEST_ORGANIZATION)
+
+
+def make_warmer(cached: dict[str, IPData | None]) -> tuple[CacheWarmer, Mock, Mock]:
+    """キャッシュ済みのIPアドレス情報を返すクライアントのモックでCacheWarmerを作成する."""
+    redis_client = Mock(spec=RedisClient)
+    redis_client.ttl = TEST_REDIS_TTL_INT
+    redis_client.get_many.side_effect = lambda ip_addresses: {
+        ip_address: cached.get(ip_address) for ip_address in ip_addresses
+    }
+    geoip_client = Mock(spec=GeoIPClient)
+    return CacheWarmer(redis_client, geoip_client), redis_client, geoip_client
+
+
+class TestCacheWarmer:
+    """CacheWarmerクラスのテストクラス."""
+
+    def test_warm(self) -> None:
+        """キャッシュされていないIPアドレスのみを問い合わせて保存するテスト."""
+        # モック設定
+        warmer, redis_client, geoip_client = make_warmer(
+            {TEST_IP_ADDRESS_4: IPData.from_trusted(TEST_IP_ADDRESS_4, "", "", "", "")}
+        )
+        geoip_client.get_many.return_value = {TEST_IP_ADDRESS_3: TEST_IPDATA_3, TEST_IP_ADDRESS_1: None}
+
+        # テスト実行
+        stats = warmer.warm(
+            [TEST_IP_ADDRESS_3, TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_3, TEST_IPADDRESS_INVALID_, TEST_IP_ADDRESS_4]
+        )
+
+        # 検証
+        assert stats == {
+            "requested": 3,
+            "invalid": 1,
+            "cached": 1,
+            "collapsed": 0,
+            "fetched": 1,
+            "not_found": 1,
+            "failed": 0,
+            "skipped": 0,
+        }
+        redis_client.get_many.assert_called_once_with([TEST_IP_ADDRESS_3, TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_4])
+        geoip_client.get_many.assert_called_once()
+        assert sorted(geoip_client.get_many.call_args.args[0]) == sorted([TEST_IP_ADDRESS_3, TEST_IP_ADDRESS_1])
+        redis_client.set_many.assert_any_call({TEST_IP_ADDRESS_3: TEST_IPDATA_3}, [TEST_IP_ADDRESS_1])
+
+    def test_warm_collapses_cached_network(self) -> None:
+        """キャッシュ済みのネットワークに含まれるIPアドレスを問い合わせずに保存するテスト."""
+        # モック設定
+        warmer, redis_client, geoip_client = make_warmer({TEST_IP_ADDRESS_1: TEST_IPDATA})
+
+        # テスト実行
+        stats = warmer.warm([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])
+
+        # 検証
+        assert stats["cached"] == 1
+        assert stats["collapsed"] == 1
+        geoip_client.get_many.assert_not_called()
+        redis_client.set_many.assert_called_once_with({TEST_IP_ADDRESS_2: TEST_IPDATA_2})
+
+    def test_warm_collapses_fetched_network(self) -> None:
+        """同じ/24のIPアドレスは1つだけ問い合わせ, 取得したネットワークで残りを保存するテスト."""
+        # モック設定
+        warmer, redis_client, geoip_client = make_warmer({})
+        geoip_client.get_many.return_value = {TEST_IP_ADDRESS_1: TEST_IPDATA}
+
+        # テスト実行
+        stats = warmer.warm([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])
+
+        # 検証
+        assert stats["fetched"] == 1
+        assert stats["collapsed"] == 1
+        geoip_client.get_many.assert_called_once_with([TEST_IP_ADDRESS_1], GEOIP_MAX_WORKERS)
+        assert call({TEST_IP_ADDRESS_2: TEST_IPDATA_2}) in redis_client.set_many.call_args_list
+
+    def test_warm_with_budget(self) -> None:
+        """問い合わせ数をbudgetまでに制限するテスト."""
+        # モック設定
+        warmer, _, geoip_client = make_warmer({})
+        geoip_client.get_many.return_value = {TEST_IP_ADDRESS_1: TEST_IPDATA}
+
+        # テスト実行
+        stats = warmer.warm([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_3, TEST_IP_ADDRESS_4], budget=1)
+
+        # 検証
+        assert stats["fetched"] == 1
+        assert stats["skipped"] == 2  # noqa: PLR2004
+        geoip_client.get_many.assert_called_once_with([TEST_IP_ADDRESS_1], GEOIP_MAX_WORKERS)
+
+    def test_warm_with_failure(self) -> None:
+        """取得に失敗したIPアドレスの存在しないことを保存しないテスト."""
+        # モック設定
+        warmer, redis_client, geoip_client = make_warmer({})
+        geoip_client.get_many.return_value = {TEST_IP_ADDRESS_1: TEST_IPDATA}
+
+        # テスト実行
+        stats = warmer.warm([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_3])
+
+        # 検証
+        assert stats["fetched"] == 1
+        assert stats["failed"] == 1
+        assert stats["not_found"] == 0
+        redis_client.set_many.assert_called_once_with({TEST_IP_ADDRESS_1: TEST_IPDATA}, [])
+
+    def test_warm_with_rate_limit(self) -> None:
+        """問い合わせ数が上限に達した場合に取得できたIPアドレス情報を保存して終了するテスト."""
+        # モック設定
+        warmer, redis_client, geoip_client = make_warmer({})
+        geoip_client.get_many.side_effect = RateLimitError(
+            "GeoIP query quota exhausted",
+            {"ip_addresses": [TEST_IP_ADDRESS_3], "results": {TEST_IP_ADDRESS_1: TEST_IPDATA}},
+        )
+
+        # テスト実行
+        stats = warmer.warm([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2, TEST_IP_ADDRESS_3, TEST_IP_ADDRESS_4], max_workers=2)
+
+        # 検証
+        assert stats["fetched"] == 1
+        assert stats["collapsed"] == 1
+        assert stats["skipped"] == 2  # noqa: PLR2004
+        geoip_client.get_many.assert_called_once_with([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_3], 2)
+        redis_client.set_many.assert_any_call({TEST_IP_ADDRESS_1: TEST_IPDATA}, [])
+
+    def test_warm_collapses_other_buckets_in_fetched_network(self) -> None:
+        """取得したネットワークに含まれる他の/24のIPアドレスを問い合わせずに保存するテスト."""
+        # モック設定
+        warmer, _, geoip_client = make_warmer({})
+        geoip_client.get_many.return_value = {
+            "10.1.0.1": IPData("10.1.0.1", "10.1.0.0/16", TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, TEST_ORGANIZATION)
+        }
+
+        # テスト実行
+        stats = warmer.warm(["10.1.0.1", "10.1.2.1", "10.1.255.1"], max_workers=1)
+
+        # 検証
+        assert stats["fetched"] == 1
+        assert stats["collapsed"] == 2  # noqa: PLR2004
+        geoip_client.get_many.assert_called_once_with(["10.1.0.1"], 1)
+
+    def test_warm_rechecks_only_fetched_networks(self) -> None:
+        """問い合わせの後に取得したネットワークに含まれるIPアドレスだけを確認するテスト."""
+        # モック設定
+        size = 2_000
+        ip_addresses = [f"10.{i >> 8}.{i & 0xFF}.1" for i in range(size)]
+        warmer, _, geoip_client = make_warmer({})
+        geoip_client.get_many.side_effect = lambda ip_addresses, _: {
+            ip_address: IPData(
+                ip_address, f"{ip_address.rsplit('.', 1)[0]}.0/24", TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, TEST_ORGANIZATION
+            )
+            for ip_address in ip_addresses
+        }
+
+        # テスト実行
+        with patch.object(NetworkIndex, "lookup", autospec=True, side_effect=NetworkIndex.lookup) as mock_lookup:
+            stats = warmer.warm(ip_addresses)
+
+        # 検証
+        assert stats["fetched"] == size
+        # 残りのIPアドレスを毎回確認すると問い合わせの回数に比例して増える
+        assert mock_lookup.call_count <= 2 * size
@@ -0,0 +1,92 @@
+"""CircuitBreakerクラスのテスト."""
+
+from unittest.mock import Mock, patch
+
+from ipinfo_geoip.circuit_breaker import CircuitBreaker
+from ipinfo_geoip.constants import CIRCUIT_CLOSED, CIRCUIT_HALF_OPEN, CIRCUIT_OPEN
+from tests.conftest import TEST_BREAKER_RESET_TIMEOUT, TEST_BREAKER_THRESHOLD
+
+
+def open_breaker(mock_monotonic: Mock) -> CircuitBreaker:
+    """開いた状態のサーキットブレーカーを作成する."""
+    mock_monotonic.return_value = 0.0
+    breaker = CircuitBreaker(TEST_BREAKER_THRESHOLD, TEST_BREAKER_RESET_TIMEOUT)
+    for _ in range(TEST_BREAKER_THRESHOLD):
+        breaker.record_failure()
+    return breaker
+
+
+class TestCircuitBreaker:
+    """CircuitBreakerクラスのテストクラス."""
+
+    def test_closed(self) -> None:
+        """閉じている間は呼び出しを許可するテスト."""
+        breaker = CircuitBreaker(TEST_BREAKER_THRESHOLD, TEST_BREAKER_RESET_TIMEOUT)
+
+        assert breaker.state == CIRCUIT_CLOSED
+        assert breaker.allow()
+
+    def test_success_resets_failures(self) -> None:
+        """成功すると連続した失敗の回数がリセットされるテスト."""
+        breaker = CircuitBreaker(TEST_BREAKER_THRESHOLD, TEST_BREAKER_RESET_TIMEOUT)
+
+        for _ in range(TEST_BREAKER_THRESHOLD - 1):
+            breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CIRCUIT_CLOSED
+
+    @patch("ipinfo_geoip.circuit_breaker.time.monotonic")
+    def test_open(self, mock_monotonic: Mock) -> None:
+        """連続した失敗で開き, 呼び出しを許可しないテスト."""
+        breaker = open_breaker(mock_monotonic)
+        mock_monotonic.return_value = TEST_BREAKER_RESET_TIMEOUT - 1
+
+        assert breaker.state == CIRCUIT_OPEN
+        assert not breaker.allow()
+
+    @patch("ipinfo_geoip.circuit_breaker.time.monotonic")
+    def test_half_open_allows_single_probe(self, mock_monotonic: Mock) -> None:
+        """reset_timeout経過後は1つの呼び出しだけを試行として許可するテスト."""
+        breaker = open_breaker(mock_monotonic)
+        mock_monotonic.return_value = TEST_BREAKER_RESET_TIMEOUT
+
+        assert breaker.allow()
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        assert not breaker.allow()
+
+    @patch("ipinfo_geoip.circuit_breaker.time.monotonic")
+    def test_half_open_success(self, mock_monotonic: Mock) -> None:
+        """試行が成功すると閉じるテスト."""
+        breaker = open_breaker(mock_monotonic)
+        mock_monotonic.return_value = TEST_BREAKER_RESET_TIMEOUT
+        assert breaker.allow()
+
+        breaker.record_success()
+
+        assert breaker.state == CIRCUIT_CLOSED
+        assert breaker.allow()
+
+    @patch("ipinfo_geoip.circuit_breaker.time.monotonic")
+    def test_half_open_failure(self, mock_monotonic: Mock) -> None:
+        """試行が失敗すると再び開くテスト."""
+        breaker = open_breaker(mock_monotonic)
+        mock_monotonic.return_value = TEST_BREAKER_RESET_TIMEOUT
+        assert breaker.allow()
+
+        breaker.record_failure()
+
+        assert breaker.state == CIRCUIT_OPEN
+        assert not breaker.allow()
+
+    @patch("ipinfo_geoip.circuit_breaker.time.monotonic")
+    def test_half_open_stalled_probe(self, mock_monotonic: Mock) -> None:
+        """試行の結果が記録されないままreset_timeoutが経過すると次の試行を許可するテスト."""
+        breaker = open_breaker(mock_monotonic)
+        mock_monotonic.return_value = TEST_BREAKER_RESET_TIMEOUT
+        assert breaker.allow()
+
+        mock_monotonic.return_value = TEST_BREAKER_RESET_TIMEOUT * 2
+
+        assert breaker.allow()
@@ -0,0 +1,84 @@
+"""ClientPoolクラスのテスト."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from ipinfo_geoip.client_pool import ClientPool
+
+TEST_POOL_SIZE: int = 2
+
+
+class TestClientPool:
+    """ClientPoolクラスのテストクラス."""
+
+    def test_init(self) -> None:
+        """初期化時に最初のクライアントを作成するテスト."""
+        factory = Mock(side_effect=object)
+        pool: ClientPool[object] = ClientPool(factory, TEST_POOL_SIZE)
+
+        assert pool.maxsize == TEST_POOL_SIZE
+        assert len(pool) == 1
+        factory.assert_called_once_with()
+
+    def test_acquire_reuses_client(self) -> None:
+        """返却されたクライアントを再利用するテスト."""
+        factory = Mock(side_effect=object)
+        pool: ClientPool[object] = ClientPool(factory, TEST_POOL_SIZE)
+
+        with pool.acquire() as first:
+            pass
+        with pool.acquire() as second:
+            pass
+
+        assert first is second
+        assert len(pool) == 1
+
+    def test_acquire_creates_up_to_maxsize(self) -> None:
+        """使用中のクライアントがある場合に最大数まで作成するテスト."""
+        factory = Mock(side_effect=object)
+        pool: ClientPool[object] = ClientPool(factory, TEST_POOL_SIZE)
+
+        with pool.acquire() as first, pool.acquire() as second:
+            assert first is not second
+
+        assert len(pool) == TEST_POOL_SIZE
+        assert factory.call_count == TEST_POOL_SIZE
+
+    def test_acquire_waits_for_release(self) -> None:
+        """最大数に達した場合に返却を待つテスト."""
+        pool: ClientPool[object] = ClientPool(object, 1)
+        acquired = threading.Event()
+        release = threading.Event()
+
+        def hold() -> object:
+            with pool.acquire() as client:
+                acquired.set()
+                release.wait()
+                return client
+
+        def take() -> object:
+            with pool.acquire() as client:
+                return client
+
+        with ThreadPoolExecutor(2) as executor:
+            holder = executor.submit(hold)
+            acquired.wait()
+            taker = executor.submit(take)
+            release.set()
+
+            assert holder.result() is taker.result()
+
+        assert len(pool) == 1
+
+    def test_acquire_with_factory_error(self) -> None:
+        """クライアントの作成に失敗した場合のテスト."""
+        factory = Mock(side_effect=[object(), RuntimeError("connection failed"), object()])
+        pool: ClientPool[object] = ClientPool(factory, TEST_POOL_SIZE)
+
+        with pool.acquire(), pytest.raises(RuntimeError), pool.acquire():
+            pass
+
+        assert len(pool) == 1
@@ -0,0 +1,97 @@
+"""ColumnarLookupクラスのテスト."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from ipinfo_geoip.constants import GEOIP_MAX_WORKERS
+from ipinfo_geoip.exceptions import ValidationError
+from ipinfo_geoip.ipinfo import IPInfo
+from tests.conftest import (
+    TEST_AS_NUMBER_INT,
+    TEST_COUNTRY_CODE,
+    TEST_IP_ADDRESS_1,
+    TEST_IP_ADDRESS_2,
+    TEST_IPDATA,
+    TEST_ORGANIZATION,
+)
+
+np = pytest.importorskip("numpy")
+
+from ipinfo_geoip.columnar import ColumnarLookup  # noqa: E402
+
+TEST_IPV6_ADDRESS: str = "2001:db8::1"
+TEST_IPV6_RESULT: dict[str, str] = {
+    "ip_address": TEST_IPV6_ADDRESS,
+    "network": "2001:db8::/32",
+    "as_number": str(TEST_AS_NUMBER_INT),
+    "country": TEST_COUNTRY_CODE,
+    "organization": TEST_ORGANIZATION,
+}
+
+
+def make_lookup(results: dict[str, dict[str, str] | None]) -> tuple[ColumnarLookup, Mock]:
+    """指定されたIPアドレス情報を返すIPInfoのモックでColumnarLookupを作成する."""
+    ipinfo = Mock(spec=IPInfo)
+    ipinfo.lookup_many.side_effect = lambda ip_addresses, _: {ip_address: results[ip_address] for ip_address in ip_addresses}
+    return ColumnarLookup(ipinfo), ipinfo
+
+
+class TestColumnarLookup:
+    """ColumnarLookupクラスのテストクラス."""
+
+    def test_lookup(self) -> None:
+        """重複を除いて検索し, 入力の位置に列を配置するテスト."""
+        # モック設定
+        lookup, ipinfo = make_lookup({TEST_IP_ADDRESS_1: TEST_IPDATA.to_dict(), TEST_IP_ADDRESS_2: None})
+
+        # テスト実行
+        columns = lookup.lookup([TEST_IP_ADDRESS_2, TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2, TEST_IP_ADDRESS_1])
+
+        # 検証
+        ipinfo.lookup_many.assert_called_once_with([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2], GEOIP_MAX_WORKERS)
+        assert columns["found"].tolist() == [False, True, False, True]
+        assert columns["as_number"].dtype == np.uint32
+        assert columns["as_number"].tolist() == [0, TEST_AS_NUMBER_INT, 0, TEST_AS_NUMBER_INT]
+        assert columns["country"].dtype == np.dtype("<U2")
+        assert columns["country"].tolist() == ["", TEST_COUNTRY_CODE, "", TEST_COUNTRY_CODE]
+        assert columns["version"].tolist() == [0, 4, 0, 4]
+        assert columns["network_high"].tolist() == [0, 0, 0, 0]
+        assert columns["network_low"].tolist() == [0, 0xC0000200, 0, 0xC0000200]
+        assert columns["prefixlen"].tolist() == [0, 24, 0, 24]
+        assert columns["organization"].tolist() == ["", TEST_ORGANIZATION, "", TEST_ORGANIZATION]
+
+    def test_lookup_ipv6_array(self) -> None:
+        """IPv6のネットワークアドレスを上位と下位の64ビットに分けるテスト."""
+        # モック設定
+        lookup, _ = make_lookup({TEST_IPV6_ADDRESS: TEST_IPV6_RESULT})
+
+        # テスト実行
+        columns = lookup.lookup(np.array([TEST_IPV6_ADDRESS]))
+
+        # 検証
+        assert columns["version"].tolist() == [6]
+        assert columns["network_high"].tolist() == [0x20010DB800000000]
+        assert columns["network_low"].tolist() == [0]
+        assert columns["prefixlen"].tolist() == [32]
+
+    def test_lookup_empty(self) -> None:
+        """空の入力で空の列を返すテスト."""
+        # モック設定
+        lookup, _ = make_lookup({})
+
+        # テスト実行
+        columns = lookup.lookup([])
+
+        # 検証
+        assert all(len(column) == 0 for column in columns.values())
+
+    def test_lookup_invalid(self) -> None:
+        """不正なIPアドレスが含まれる場合にValidationErrorを送出するテスト."""
+        # モック設定
+        ipinfo = Mock(spec=IPInfo)
+        ipinfo.lookup_many.side_effect = ValidationError("Invalid IP address: invalid.ip")
+
+        # テスト実行・検証
+        with pytest.raises(ValidationError):
+            ColumnarLookup(ipinfo).lookup(["invalid.ip"])
@@ -0,0 +1,154 @@
+"""Enricherクラスのテスト."""
+
+import json
+from unittest.mock import Mock
+
+from ipinfo_geoip.constants import GEOIP_MAX_WORKERS
+from ipinfo_geoip.enricher import Enricher
+from ipinfo_geoip.exceptions import RateLimitError
+from ipinfo_geoip.ipinfo import IPInfo
+from tests.conftest import TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2, TEST_IPADDRESS_INVALID_, TEST_IPDATA
+
+TEST_RESULT: dict[str, str] = TEST_IPDATA.to_dict()
+
+
+def make_enricher(results: dict[str, dict[str, str] | None]) -> tuple[Enricher, Mock]:
+    """指定されたIPアドレス情報を返すIPInfoのモックでEnricherを作成する."""
+    ipinfo = Mock(spec=IPInfo)
+    ipinfo.lookup_many.side_effect = lambda ip_addresses, _: {ip_address: results[ip_address] for ip_address in ip_addresses}
+    return Enricher(ipinfo), ipinfo
+
+
+def decode(chunks: list[str]) -> list[dict[str, object]]:
+    """出力されたNDJSONを行ごとにデコードする."""
+    return [json.loads(line) for line in "".join(chunks).splitlines()]
+
+
+class TestEnricher:
+    """Enricherクラスのテストクラス."""
+
+    def test_enrich_ip_addresses(self) -> None:
+        """IPアドレスのみの行にIPアドレス情報を出力するテスト."""
+        # モック設定
+        enricher, ipinfo = make_enricher({TEST_IP_ADDRESS_1: TEST_RESULT, TEST_IP_ADDRESS_2: None})
+
+        # テスト実行
+        output = decode(list(enricher.enrich([f"{TEST_IP_ADDRESS_1}\n", "\n", f"{TEST_IP_ADDRESS_2}\n"])))
+
+        # 検証
+        assert output == [TEST_RESULT, {"ip_address": TEST_IP_ADDRESS_2}]
+        ipinfo.lookup_many.assert_called_once()
+
+    def test_enrich_json_records(self) -> None:
+        """JSONレコードにIPアドレス情報を付加するテスト."""
+        # モック設定
+        enricher, _ = make_enricher({TEST_IP_ADDRESS_1: TEST_RESULT, TEST_IP_ADDRESS_2: None})
+        lines = [
+            json.dumps({"ip": TEST_IP_ADDRESS_1, "path": "/"}),
+            json.dumps({"ip": TEST_IP_ADDRESS_2}),
+        ]
+
+        # テスト実行
+        output = decode(list(enricher.enrich(lines)))
+
+        # 検証
+        assert output == [
+            {"ip": TEST_IP_ADDRESS_1, "path": "/", "ipinfo": TEST_RESULT},
+            {"ip": TEST_IP_ADDRESS_2, "ipinfo": None},
+        ]
+
+    def test_enrich_invalid_lines(self) -> None:
+        """解析できない行と不正なIPアドレスにerrorを付加するテスト."""
+        # モック設定
+        enricher, ipinfo = make_enricher({})
+        lines = [TEST_IPADDRESS_INVALID_, "{invalid", "[1]", json.dumps({"address": TEST_IP_ADDRESS_1})]
+
+        # テスト実行
+        output = decode(list(enricher.enrich(lines)))
+
+        # 検証
+        assert [set(record) for record in output] == [
+            {"ip_address", "error"},
+            {"input", "error"},
+            {"ip_address", "error"},
+            {"address", "error"},
+        ]
+        ipinfo.lookup_many.assert_called_once_with([], GEOIP_MAX_WORKERS)
+
+    def test_enrich_in_windows(self) -> None:
+        """batch_size行ずつ検索し, 入力と同じ順序で出力するテスト."""
+        # モック設定
+        enricher, ipinfo = make_enricher({TEST_IP_ADDRESS_1: TEST_RESULT, TEST_IP_ADDRESS_2: None})
+        lines = [TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2, TEST_IP_ADDRESS_2, TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2]
+
+        # テスト実行
+        chunks = list(enricher.enrich(lines, batch_size=2, windows=2))
+
+        # 検証
+        assert len(chunks) == 3  # noqa: PLR2004
+        assert [record["ip_address"] for record in decode(chunks)] == lines
+        assert ipinfo.lookup_many.call_count == 3  # noqa: PLR2004
+
+    def test_enrich_reads_lazily(self) -> None:
+        """検索中のウィンドウがwindows個に達すると入力の読み込みを待つテスト."""
+        # モック設定
+        enricher, _ = make_enricher({TEST_IP_ADDRESS_1: TEST_RESULT})
+        read: list[str] = []
+
+        def lines() -> object:
+            for _ in range(10):
+                read.append(TEST_IP_ADDRESS_1)
+                yield TEST_IP_ADDRESS_1
+
+        # テスト実行
+        chunks = enricher.enrich(lines(), batch_size=2, windows=2)  # type: ignore[arg-type]
+        next(chunks)
+
+        # 検証
+        assert len(read) == 4  # noqa: PLR2004
+
+    def test_enrich_with_rate_limit(self) -> None:
+        """問い合わせ数の上限により検索できなかったIPアドレスにerrorを付加するテスト."""
+        # モック設定
+        enricher, ipinfo = make_enricher({})
+        ipinfo.lookup_many.side_effect = RateLimitError(
+            "GeoIP query quota exhausted",
+            {"ip_addresses": [TEST_IP_ADDRESS_2], "results": {TEST_IP_ADDRESS_1: TEST_RESULT}},
+        )
+
+        # テスト実行
+        output = decode(list(enricher.enrich([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])))
+
+        # 検証
+        assert output == [TEST_RESULT, {"ip_address": TEST_IP_ADDRESS_2, "error": "GeoIP query quota exhausted"}]
+
+    def test_enrich_with_failed_lookup(self) -> None:
+        """取得に失敗したIPアドレスに問い合わせ数の上限とは異なるerrorを付加するテスト."""
+        # モック設定
+        enricher, ipinfo = make_enricher({})
+        ipinfo.lookup_many.side_effect = None
+        ipinfo.lookup_many.return_value = {TEST_IP_ADDRESS_1: TEST_RESULT}
+
+        # テスト実行
+        output = decode(list(enricher.enrich([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])))
+
+        # 検証
+        assert output == [TEST_RESULT, {"ip_address": TEST_IP_ADDRESS_2, "error": "GeoIP lookup failed"}]
+
+    def test_enrich_with_rate_limit_and_failed_lookup(self) -> None:
+        """問い合わせ数の上限と取得の失敗を区別してerrorを付加するテスト."""
+        # モック設定
+        enricher, ipinfo = make_enricher({})
+        ipinfo.lookup_many.side_effect = RateLimitError(
+            "GeoIP query quota exhausted",
+            {"ip_addresses": [TEST_IP_ADDRESS_2], "results": {}},
+        )
+
+        # テスト実行
+        output = decode(list(enricher.enrich([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])))
+
+        # 検証
+        assert output == [
+            {"ip_address": TEST_IP_ADDRESS_1, "error": "GeoIP lookup failed"},
+            {"ip_address": TEST_IP_ADDRESS_2, "error": "GeoIP query quota exhausted"},
+        ]
@@ -3,9 +3,11 @@
 import pytest
 
 from ipinfo_geoip.exceptions import (
+    AddressNotFoundError,
     ConfigurationError,
     GeoIPClientError,
     IPInfoError,
+    RateLimitError,
     RedisClientError,
     ValidationError,
 )
@@ -28,6 +30,22 @@ class TestErrorInheritance:
         assert isinstance(exception, IPInfoError)
         assert isinstance(exception, Exception)
 
+    def test_address_not_found_error_inheritance(self) -> None:
+        """AddressNotFoundErrorの継承テスト."""
+        exception = AddressNotFoundError(TEST_EXCEPTION_MESSAGE)
+
+        assert isinstance(exception, GeoIPClientError)
+        assert isinstance(exception, IPInfoError)
+        assert isinstance(exception, Exception)
+
+    def test_rate_limit_error_inheritance(self) -> None:
+        """RateLimitErrorの継承テスト."""
+        exception = RateLimitError(TEST_EXCEPTION_MESSAGE)
+
+        assert isinstance(exception, GeoIPClientError)
+        assert isinstance(exception, IPInfoError)
+        assert isinstance(exception, Exception)
+
     def test_redis_client_error_inheritance(self) -> None:
         """RedisClientErrorの継承テスト."""
         exception = RedisClientError(TEST_EXCEPTION_MESSAGE)
@@ -58,6 +76,7 @@ class TestErrorMessage:
         [
             IPInfoError,
             GeoIPClientError,
+            RateLimitError,
             RedisClientError,
             ConfigurationError,
             ValidationError,
@@ -79,6 +98,7 @@ class TestErrorDetails:
         [
             IPInfoError,
             GeoIPClientError,
+            RateLimitError,
             RedisClientError,
             ConfigurationError,
             ValidationError,
@@ -100,6 +120,7 @@ class TestErrorNoneDetails:
         [
             IPInfoError,
             GeoIPClientError,
+            RateLimitError,
             RedisClientError,
             ConfigurationError,
             ValidationError,
@@ -121,6 +142,7 @@ class TestErrorRaising:
         [
             IPInfoError,
             GeoIPClientError,
+            RateLimitError,
             RedisClientError,
             ConfigurationError,
             ValidationError,
@@ -139,6 +161,7 @@ class TestCatchAsBaseException:
         "exception_class",
         [
             GeoIPClientError,
+            RateLimitError,
             RedisClientError,
             ConfigurationError,
             ValidationError,
@@ -154,6 +177,7 @@ class TestCatchAsBaseException:
         [
             IPInfoError,
             GeoIPClientError,
+            RateLimitError,
             RedisClientError,
             ConfigurationError,
             ValidationError,
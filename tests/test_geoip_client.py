@@ -1,41 +1,115 @@
 """GeoIPClientクラスのテスト."""
 
-from collections import UserDict
-from ipaddress import IPv4Network
+import threading
+from collections.abc import Iterator
 from unittest.mock import Mock, patch
 
 import geoip2.errors
 import pytest
-
-from ipinfo_geoip.exceptions import ConfigurationError, GeoIPClientError, ValidationError
-from ipinfo_geoip.geoip_client import GeoIPClient
+import requests
+
+from ipinfo_geoip.constants import GEOIP_BACKOFF_MAX, GEOIP_ENDPOINT_CITY
+from ipinfo_geoip.exceptions import (
+    AddressNotFoundError,
+    ConfigurationError,
+    GeoIPClientError,
+    RateLimitError,
+    ValidationError,
+)
+from ipinfo_geoip.geoip_client import GeoIPClient, _backoff, _is_transient
+from ipinfo_geoip.geoip_response import GeoIPResponse
 from ipinfo_geoip.ipdata import IPData
+from ipinfo_geoip.rate_limiter import RateLimiter
 from tests.conftest import (
     TEST_AS_NUMBER_INT,
     TEST_AS_NUMBER_STR,
     TEST_COUNTRY_CODE,
     TEST_GEOIP_ACCOUNT_ID_INT,
+    TEST_GEOIP_HEDGE_DELAY,
     TEST_GEOIP_HOST,
     TEST_GEOIP_LICENSE_KEY,
+    TEST_GEOIP_POOL_SIZE_INT,
+    TEST_GEOIP_TIMEOUT,
     TEST_IP_ADDRESS_1,
+    TEST_IP_ADDRESS_2,
     TEST_IP_NETWORK,
     TEST_IPADDRESS_INVALID_,
     TEST_ORGANIZATION,
+    TEST_QUERIES_REMAINING,
 )
 
+TEST_URI = "https://geolite.info/geoip/v2.1/city/192.0.2.1"
+
+
+def _mock_response() -> GeoIPResponse:
+    """GeoLite2 Web Serviceのレスポンスを作成する.
+
+    Returns:
+        レスポンス
+
+    """
+    return GeoIPResponse(
+        traits={
+            "network": TEST_IP_NETWORK,
+            "autonomous_system_number": TEST_AS_NUMBER_INT,
+            "autonomous_system_organization": TEST_ORGANIZATION,
+        },
+        country={"iso_code": TEST_COUNTRY_CODE},
+        maxmind={"queries_remaining": TEST_QUERIES_REMAINING},
+    )
+
+
+class TestRetry:
+    """再試行の判定と待ち時間のテストクラス."""
+
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (geoip2.errors.HTTPError("Server error", 503, TEST_URI), True),
+            (geoip2.errors.HTTPError("Too many requests", 429, TEST_URI), True),
+            (geoip2.errors.HTTPError("Connection reset", None, TEST_URI), True),
+            (geoip2.errors.HTTPError("Bad request", 400, TEST_URI), False),
+            (requests.ConnectionError("Connection refused"), True),
+            (requests.Timeout("Read timed out"), True),
+            (TimeoutError(), True),
+            (geoip2.errors.AuthenticationError("Invalid license key"), False),
+            (geoip2.errors.AddressNotFoundError("Address not found"), False),
+        ],
+    )
+    def test_is_transient(self, error: Exception, *, expected: bool) -> None:
+        """一時的なエラーの判定テスト."""
+        assert _is_transient(error) is expected
+
+    @patch("ipinfo_geoip.geoip_client.random.uniform")
+    def test_backoff(self, mock_uniform: Mock) -> None:
+        """指数バックオフの上限までの一様乱数を返すテスト."""
+        mock_uniform.side_effect = lambda _, high: high
+
+        assert _backoff(0, 0.1) == pytest.approx(0.1)
+        assert _backoff(2, 0.1) == pytest.approx(0.4)
+        assert _backoff(10, 0.1) == GEOIP_BACKOFF_MAX
+
 
 class TestGeoIPClient:
     """GeoIPClientクラスのテストクラス."""
 
-    @patch("ipinfo_geoip.geoip_client.geoip2.webservice.Client")
+    @pytest.fixture(autouse=True)
+    def limiter(self) -> Iterator[Mock]:
+        """テストごとに新しいレートリミッターのモックを使用する."""
+        limiter = Mock(spec=RateLimiter)
+        with patch("ipinfo_geoip.geoip_client._get_rate_limiter", return_value=limiter):
+            yield limiter
+
+    @patch("ipinfo_geoip.geoip_client.ProjectionClient")
     @patch("ipinfo_geoip.geoip_client.GeoIPConfig.from_env")
     def test_init(self, mock_from_env: Mock, mock_client: Mock) -> None:
         """初期化のテスト."""
         # モック設定
-        mock_config = Mock()
+        mock_config = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False)
         mock_config.account_id = TEST_GEOIP_ACCOUNT_ID_INT
         mock_config.license_key = TEST_GEOIP_LICENSE_KEY
         mock_config.host = TEST_GEOIP_HOST
+        mock_config.timeout = TEST_GEOIP_TIMEOUT
         mock_from_env.return_value = mock_config
 
         # テスト実行
@@ -43,9 +117,13 @@ class TestGeoIPClient:
 
         # 検証
         assert isinstance(client, GeoIPClient)
-        assert isinstance(client, UserDict)
         mock_from_env.assert_called_once()
-        mock_client.assert_called_once_with(TEST_GEOIP_ACCOUNT_ID_INT, TEST_GEOIP_LICENSE_KEY, TEST_GEOIP_HOST)
+        mock_client.assert_called_once_with(
+            TEST_GEOIP_ACCOUNT_ID_INT,
+            TEST_GEOIP_LICENSE_KEY,
+            TEST_GEOIP_HOST,
+            timeout=TEST_GEOIP_TIMEOUT,
+        )
 
     @patch("ipinfo_geoip.geoip_client.GeoIPConfig.from_env")
     def test_init_with_configuration_error(self, mock_from_env: Mock) -> None:
@@ -60,48 +138,44 @@ class TestGeoIPClient:
         # 検証
         mock_from_env.assert_called_once()
 
-    @patch("ipinfo_geoip.geoip_client.geoip2.webservice.Client")
+    @patch("ipinfo_geoip.geoip_client.ProjectionClient")
     @patch("ipinfo_geoip.geoip_client.GeoIPConfig.from_env")
-    def test_missing_with_invalid_ip_value(self, mock_from_env: Mock, mock_client: Mock) -> None:
-        """IPアドレスが無効な場合の__missing__メソッドテスト."""
+    def test_get_with_invalid_ip_value(self, mock_from_env: Mock, mock_client: Mock) -> None:
+        """IPアドレスが無効な場合のgetメソッドテスト."""
         # モック設定
-        mock_config = Mock()
+        mock_config = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False)
         mock_from_env.return_value = mock_config
 
         mock_client_instance = Mock()
-        mock_client_instance.city.return_value = None
+        mock_client_instance.lookup.return_value = None
         mock_client.return_value = mock_client_instance
 
         # テスト実行
         client = GeoIPClient()
 
         with pytest.raises(ValidationError):
-            _ = client[TEST_IPADDRESS_INVALID_]
+            _ = client.get(TEST_IPADDRESS_INVALID_)
 
         # 検証
-        mock_client_instance.city.assert_not_called()
+        mock_client_instance.lookup.assert_not_called()
 
-    @patch("ipinfo_geoip.geoip_client.geoip2.webservice.Client")
+    @patch("ipinfo_geoip.geoip_client.ProjectionClient")
     @patch("ipinfo_geoip.geoip_client.GeoIPConfig.from_env")
-    def test_missing_success(self, mock_from_env: Mock, mock_client: Mock) -> None:
-        """成功時の__missing__メソッドテスト."""
+    def test_get_success(self, mock_from_env: Mock, mock_client: Mock, limiter: Mock) -> None:
+        """成功時のgetメソッドテスト."""
         # モック設定
-        mock_config = Mock()
+        mock_config = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False)
         mock_from_env.return_value = mock_config
 
-        mock_response = Mock()
-        mock_response.traits.network = IPv4Network(TEST_IP_NETWORK)
-        mock_response.traits.autonomous_system_number = TEST_AS_NUMBER_INT
-        mock_response.country.iso_code = TEST_COUNTRY_CODE
-        mock_response.traits.autonomous_system_organization = TEST_ORGANIZATION
+        mock_response = _mock_response()
 
         mock_client_instance = Mock()
-        mock_client_instance.city.return_value = mock_response
+        mock_client_instance.lookup.return_value = mock_response
         mock_client.return_value = mock_client_instance
 
         # テスト実行
         client = GeoIPClient()
-        result = client[TEST_IP_ADDRESS_1]
+        result = client.get(TEST_IP_ADDRESS_1)
 
         # 検証
         assert isinstance(result, IPData)
@@ -110,71 +184,344 @@ class TestGeoIPClient:
         assert result.as_number == TEST_AS_NUMBER_STR
         assert result.country == TEST_COUNTRY_CODE
         assert result.organization == TEST_ORGANIZATION
-        mock_client_instance.city.assert_called_once_with(TEST_IP_ADDRESS_1)
+        mock_client_instance.lookup.assert_called_once_with(GEOIP_ENDPOINT_CITY, TEST_IP_ADDRESS_1)
+        limiter.acquire.assert_called_once_with(batch=False)
+        limiter.update.assert_called_once_with(mock_response.queries_remaining)
 
-    @patch("ipinfo_geoip.geoip_client.geoip2.webservice.Client")
+    @patch("ipinfo_geoip.geoip_client.ProjectionClient")
     @patch("ipinfo_geoip.geoip_client.GeoIPConfig.from_env")
-    def test_missing_with_address_not_found(self, mock_from_env: Mock, mock_client: Mock) -> None:
-        """アドレスが見つからない場合の__missing__メソッドテスト."""
+    def test_get_with_address_not_found(self, mock_from_env: Mock, mock_client: Mock) -> None:
+        """アドレスが見つからない場合のgetメソッドテスト."""
         # モック設定
-        mock_config = Mock()
+        mock_config = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False)
         mock_from_env.return_value = mock_config
 
         mock_client_instance = Mock()
-        mock_client_instance.city.side_effect = geoip2.errors.AddressNotFoundError("Address not found")
+        mock_client_instance.lookup.side_effect = geoip2.errors.AddressNotFoundError("Address not found")
         mock_client.return_value = mock_client_instance
 
         # テスト実行
         client = GeoIPClient()
 
-        with pytest.raises(GeoIPClientError):
-            _ = client[TEST_IP_ADDRESS_1]
+        with pytest.raises(GeoIPClientError) as exc_info:
+            _ = client.get(TEST_IP_ADDRESS_1)
 
         # 検証
-        mock_client_instance.city.assert_called_once_with(TEST_IP_ADDRESS_1)
+        assert isinstance(exc_info.value, AddressNotFoundError)
+        mock_client_instance.lookup.assert_called_once_with(GEOIP_ENDPOINT_CITY, TEST_IP_ADDRESS_1)
 
-    @patch("ipinfo_geoip.geoip_client.geoip2.webservice.Client")
+    @patch("ipinfo_geoip.geoip_client.ProjectionClient")
     @patch("ipinfo_geoip.geoip_client.GeoIPConfig.from_env")
-    def test_missing_with_none_response(self, mock_from_env: Mock, mock_client: Mock) -> None:
-        """レスポンスがNoneの場合の__missing__メソッドテスト."""
+    def test_get_with_none_response(self, mock_from_env: Mock, mock_client: Mock) -> None:
+        """レスポンスがNoneの場合のgetメソッドテスト."""
         # モック設定
-        mock_config = Mock()
+        mock_config = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False)
         mock_from_env.return_value = mock_config
 
         mock_client_instance = Mock()
-        mock_client_instance.city.return_value = None
+        mock_client_instance.lookup.return_value = None
         mock_client.return_value = mock_client_instance
 
         # テスト実行
         client = GeoIPClient()
-        result = client[TEST_IP_ADDRESS_1]
+        result = client.get(TEST_IP_ADDRESS_1)
 
         # 検証
         assert result is None
-        mock_client_instance.city.assert_called_once_with(TEST_IP_ADDRESS_1)
+        mock_client_instance.lookup.assert_called_once_with(GEOIP_ENDPOINT_CITY, TEST_IP_ADDRESS_1)
 
-    @patch("ipinfo_geoip.geoip_client.geoip2.webservice.Client")
+    @patch("ipinfo_geoip.geoip_client.ProjectionClient")
     @patch("ipinfo_geoip.geoip_client.GeoIPConfig.from_env")
-    def test_missing_with_partial_data(self, mock_from_env: Mock, mock_client: Mock) -> None:
-        """データが不完全な場合の__missing__メソッドテスト."""
+    def test_get_with_partial_data(self, mock_from_env: Mock, mock_client: Mock) -> None:
+        """データが不完全な場合のgetメソッドテスト."""
         # モック設定
-        mock_config = Mock()
+        mock_config = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False)
         mock_from_env.return_value = mock_config
 
-        mock_response = Mock()
-        mock_response.traits.network = None
-        mock_response.traits.autonomous_system_number = None
-        mock_response.country.iso_code = TEST_COUNTRY_CODE
-        mock_response.traits.autonomous_system_organization = TEST_ORGANIZATION
+        mock_response = GeoIPResponse(
+            traits={"autonomous_system_organization": TEST_ORGANIZATION},
+            country={"iso_code": TEST_COUNTRY_CODE},
+        )
 
         mock_client_instance = Mock()
-        mock_client_instance.city.return_value = mock_response
+        mock_client_instance.lookup.return_value = mock_response
         mock_client.return_value = mock_client_instance
 
         # テスト実行
         client = GeoIPClient()
-        result = client[TEST_IP_ADDRESS_1]
+        result = client.get(TEST_IP_ADDRESS_1)
 
         # 検証
         assert result is None
-        mock_client_instance.city.assert_called_once_with(TEST_IP_ADDRESS_1)
+        mock_client_instance.lookup.assert_called_once_with(GEOIP_ENDPOINT_CITY, TEST_IP_ADDRESS_1)
+
+    @patch("ipinfo_geoip.geoip_client.ProjectionClient")
+    @patch("ipinfo_geoip.geoip_client.GeoIPConfig.from_env")
+    def test_get_many(self, mock_from_env: Mock, mock_client: Mock, limiter: Mock) -> None:
+        """複数のIPアドレスを取得するget_manyメソッドテスト."""
+        # モック設定
+        mock_config = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False)
+        mock_config.pool_size = TEST_GEOIP_POOL_SIZE_INT
+        mock_from_env.return_value = mock_config
+
+        mock_response = _mock_response()
+
+        def lookup(_endpoint: str, ip_address: str) -> GeoIPResponse:
+            if ip_address == TEST_IP_ADDRESS_2:
+                msg = "Address not found"
+                raise geoip2.errors.AddressNotFoundError(msg)
+            return mock_response
+
+        mock_client_instance = Mock()
+        mock_client_instance.lookup.side_effect = lookup
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = GeoIPClient()
+        result = client.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2, TEST_IP_ADDRESS_1])
+
+        # 検証
+        assert list(result) == [TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2]
+        assert isinstance(result[TEST_IP_ADDRESS_1], IPData)
+        assert result[TEST_IP_ADDRESS_2] is None
+        assert mock_client_instance.lookup.call_count == 2  # noqa: PLR2004
+        limiter.acquire.assert_called_with(batch=True)
+
+    @patch("ipinfo_geoip.geoip_client.time.sleep")
+    @patch("ipinfo_geoip.geoip_client.ProjectionClient")
+    @patch("ipinfo_geoip.geoip_client.GeoIPConfig.from_env")
+    def test_get_many_with_failure(self, mock_from_env: Mock, mock_client: Mock, mock_sleep: Mock) -> None:
+        """再試行しても取得に失敗したIPアドレスを除いて他のIPアドレスを返すget_manyメソッドテスト."""
+        # モック設定
+        mock_config = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False, retries=1, backoff=0.0)
+        mock_config.pool_size = TEST_GEOIP_POOL_SIZE_INT
+        mock_from_env.return_value = mock_config
+
+        def lookup(_endpoint: str, ip_address: str) -> GeoIPResponse:
+            if ip_address == TEST_IP_ADDRESS_2:
+                msg = "Connection refused"
+                raise requests.ConnectionError(msg)
+            return _mock_response()
+
+        mock_client_instance = Mock()
+        mock_client_instance.lookup.side_effect = lookup
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = GeoIPClient()
+        result = client.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])
+
+        # 検証
+        assert list(result) == [TEST_IP_ADDRESS_1]
+        assert isinstance(result[TEST_IP_ADDRESS_1], IPData)
+        assert mock_client_instance.lookup.call_count == 3  # noqa: PLR2004
+        mock_sleep.assert_called_once()
+
+    @patch("ipinfo_geoip.geoip_client.ProjectionClient")
+    @patch("ipinfo_geoip.geoip_client.GeoIPConfig.from_env")
+    def test_get_with_rate_limit(self, mock_from_env: Mock, mock_client: Mock, limiter: Mock) -> None:
+        """問い合わせ数が上限に達した場合のgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False)
+        limiter.acquire.side_effect = RateLimitError("GeoIP rate limit exceeded")
+
+        mock_client_instance = Mock()
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = GeoIPClient()
+
+        with pytest.raises(RateLimitError):
+            _ = client.get(TEST_IP_ADDRESS_1)
+
+        # 検証
+        mock_client_instance.lookup.assert_not_called()
+
+    @patch("ipinfo_geoip.geoip_client.ProjectionClient")
+    @patch("ipinfo_geoip.geoip_client.GeoIPConfig.from_env")
+    def test_get_many_with_rate_limit(self, mock_from_env: Mock, mock_client: Mock, limiter: Mock) -> None:
+        """問い合わせ数が上限に達した場合のget_manyメソッドテスト."""
+        # モック設定
+        mock_config = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False)
+        mock_config.pool_size = TEST_GEOIP_POOL_SIZE_INT
+        mock_from_env.return_value = mock_config
+
+        def acquire(*, batch: bool) -> None:
+            if batch and mock_client_instance.lookup.call_count > 0:
+                msg = "GeoIP query quota exhausted"
+                raise RateLimitError(msg)
+
+        limiter.acquire.side_effect = acquire
+
+        mock_client_instance = Mock()
+        mock_client_instance.lookup.side_effect = geoip2.errors.AddressNotFoundError("Address not found")
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = GeoIPClient()
+
+        with pytest.raises(RateLimitError) as exc_info:
+            _ = client.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2], max_workers=1)
+
+        # 検証
+        assert exc_info.value.details == {"ip_addresses": [TEST_IP_ADDRESS_2], "results": {TEST_IP_ADDRESS_1: None}}
+        mock_client_instance.lookup.assert_called_once_with(GEOIP_ENDPOINT_CITY, TEST_IP_ADDRESS_1)
+
+    @patch("ipinfo_geoip.geoip_client.ProjectionClient")
+    @patch("ipinfo_geoip.geoip_client.GeoIPConfig.from_env")
+    def test_get_many_with_invalid_ip_value(self, mock_from_env: Mock, mock_client: Mock) -> None:
+        """IPアドレスが無効な場合のget_manyメソッドテスト."""
+        # モック設定
+        mock_config = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False)
+        mock_from_env.return_value = mock_config
+
+        mock_client_instance = Mock()
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = GeoIPClient()
+
+        with pytest.raises(ValidationError):
+            _ = client.get_many([TEST_IP_ADDRESS_1, TEST_IPADDRESS_INVALID_])
+
+        # 検証
+        mock_client_instance.lookup.assert_not_called()
+
+    @patch("ipinfo_geoip.geoip_client.time.sleep")
+    @patch("ipinfo_geoip.geoip_client.ProjectionClient")
+    @patch("ipinfo_geoip.geoip_client.GeoIPConfig.from_env")
+    def test_get_with_retry(self, mock_from_env: Mock, mock_client: Mock, mock_sleep: Mock, limiter: Mock) -> None:
+        """一時的なエラーを再試行するgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False, retries=2, backoff=0.0)
+
+        mock_client_instance = Mock()
+        mock_client_instance.lookup.side_effect = [
+            geoip2.errors.HTTPError("Server error", 503, TEST_URI),
+            requests.Timeout("Read timed out"),
+            _mock_response(),
+        ]
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = GeoIPClient()
+        result = client.get(TEST_IP_ADDRESS_1)
+
+        # 検証
+        assert isinstance(result, IPData)
+        assert mock_client_instance.lookup.call_count == 3  # noqa: PLR2004
+        assert limiter.acquire.call_count == 3  # noqa: PLR2004
+        assert mock_sleep.call_count == 2  # noqa: PLR2004
+
+    @patch("ipinfo_geoip.geoip_client.time.sleep")
+    @patch("ipinfo_geoip.geoip_client.ProjectionClient")
+    @patch("ipinfo_geoip.geoip_client.GeoIPConfig.from_env")
+    def test_get_with_retries_exhausted(self, mock_from_env: Mock, mock_client: Mock, mock_sleep: Mock) -> None:
+        """再試行しても一時的なエラーが続く場合のgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False, retries=1, backoff=0.0)
+
+        mock_client_instance = Mock()
+        mock_client_instance.lookup.side_effect = requests.ConnectionError("Connection refused")
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = GeoIPClient()
+
+        with pytest.raises(GeoIPClientError) as exc_info:
+            _ = client.get(TEST_IP_ADDRESS_1)
+
+        # 検証
+        assert exc_info.value.details["attempts"] == 2  # noqa: PLR2004
+        assert mock_client_instance.lookup.call_count == 2  # noqa: PLR2004
+        mock_sleep.assert_called_once()
+
+    @patch("ipinfo_geoip.geoip_client.time.sleep")
+    @patch("ipinfo_geoip.geoip_client.ProjectionClient")
+    @patch("ipinfo_geoip.geoip_client.GeoIPConfig.from_env")
+    def test_get_without_retry(self, mock_from_env: Mock, mock_client: Mock, mock_sleep: Mock) -> None:
+        """一時的でないエラーを再試行しないgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock(endpoint=GEOIP_ENDPOINT_CITY, hedge=False, retries=2, backoff=0.0)
+
+        mock_client_instance = Mock()
+        mock_client_instance.lookup.side_effect = geoip2.errors.HTTPError("Bad request", 400, TEST_URI)
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = GeoIPClient()
+
+        with pytest.raises(geoip2.errors.HTTPError):
+            _ = client.get(TEST_IP_ADDRESS_1)
+
+        # 検証
+        mock_client_instance.lookup.assert_called_once_with(GEOIP_ENDPOINT_CITY, TEST_IP_ADDRESS_1)
+        mock_sleep.assert_not_called()
+
+    @patch("ipinfo_geoip.geoip_client.ProjectionClient")
+    @patch("ipinfo_geoip.geoip_client.GeoIPConfig.from_env")
+    def test_get_hedged(self, mock_from_env: Mock, mock_client: Mock, limiter: Mock) -> None:
+        """応答が遅い場合に2つ目のリクエストの応答を使用するgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock(
+            endpoint=GEOIP_ENDPOINT_CITY,
+            hedge=True,
+            pool_size=TEST_GEOIP_POOL_SIZE_INT,
+            hedge_delay=TEST_GEOIP_HEDGE_DELAY,
+            retries=0,
+        )
+        limiter.reserve.return_value = 0.0
+
+        release = threading.Event()
+        response = _mock_response()
+
+        def lookup(_endpoint: str, _ip_address: str) -> GeoIPResponse:
+            if mock_client_instance.lookup.call_count == 1:
+                release.wait()
+            return response
+
+        mock_client_instance = Mock()
+        mock_client_instance.lookup.side_effect = lookup
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = GeoIPClient()
+        try:
+            result = client.get(TEST_IP_ADDRESS_1)
+        finally:
+            release.set()
+
+        # 検証
+        assert isinstance(result, IPData)
+        assert mock_client_instance.lookup.call_count == 2  # noqa: PLR2004
+        limiter.reserve.assert_called_once_with(batch=False)
+
+    @patch("ipinfo_geoip.geoip_client.ProjectionClient")
+    @patch("ipinfo_geoip.geoip_client.GeoIPConfig.from_env")
+    def test_get_hedge_not_allowed(self, mock_from_env: Mock, mock_client: Mock, limiter: Mock) -> None:
+        """問い合わせ数の制限により2つ目のリクエストを発行しないgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock(
+            endpoint=GEOIP_ENDPOINT_CITY,
+            hedge=True,
+            pool_size=TEST_GEOIP_POOL_SIZE_INT,
+            hedge_delay=TEST_GEOIP_HEDGE_DELAY,
+            retries=0,
+        )
+        limiter.reserve.side_effect = RateLimitError("GeoIP query quota exhausted")
+
+        def lookup(_endpoint: str, _ip_address: str) -> GeoIPResponse:
+            threading.Event().wait(TEST_GEOIP_HEDGE_DELAY * 5)
+            return _mock_response()
+
+        mock_client_instance = Mock()
+        mock_client_instance.lookup.side_effect = lookup
+        mock_client.return_value = mock_client_instance
+
+        # テスト実行
+        client = GeoIPClient()
+        result = client.get(TEST_IP_ADDRESS_1)
+
+        # 検証
+        assert isinstance(result, IPData)
+        mock_client_instance.lookup.assert_called_once_with(GEOIP_ENDPOINT_CITY, TEST_IP_ADDRESS_1)
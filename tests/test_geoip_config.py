@@ -5,10 +5,50 @@ from unittest.mock import patch
 
 import pytest
 
-from ipinfo_geoip.constants import GEOIP_ACCOUNT_ID_ENV, GEOIP_HOST_ENV, GEOIP_LICENSE_KEY_ENV
+from ipinfo_geoip.constants import (
+    GEOIP_ACCOUNT_ID_ENV,
+    GEOIP_BACKOFF,
+    GEOIP_BACKOFF_ENV,
+    GEOIP_ENDPOINT,
+    GEOIP_ENDPOINT_COUNTRY,
+    GEOIP_ENDPOINT_ENV,
+    GEOIP_HEDGE_DELAY,
+    GEOIP_HEDGE_DELAY_ENV,
+    GEOIP_HEDGE_ENV,
+    GEOIP_HOST_ENV,
+    GEOIP_LICENSE_KEY_ENV,
+    GEOIP_POOL_SIZE,
+    GEOIP_POOL_SIZE_ENV,
+    GEOIP_QUOTA_RESERVE,
+    GEOIP_QUOTA_RESERVE_ENV,
+    GEOIP_RATE_LIMIT,
+    GEOIP_RATE_LIMIT_BURST,
+    GEOIP_RATE_LIMIT_BURST_ENV,
+    GEOIP_RATE_LIMIT_ENV,
+    GEOIP_RATE_LIMIT_MAX_WAIT,
+    GEOIP_RATE_LIMIT_MAX_WAIT_ENV,
+    GEOIP_RATE_LIMIT_SHARED_ENV,
+    GEOIP_RETRIES,
+    GEOIP_RETRIES_ENV,
+    GEOIP_TIMEOUT,
+    GEOIP_TIMEOUT_ENV,
+)
 from ipinfo_geoip.exceptions import ValidationError
 from ipinfo_geoip.geoip_config import GeoIPConfig
-from tests.conftest import TEST_GEOIP_ACCOUNT_ID_INT, TEST_GEOIP_ACCOUNT_ID_STR, TEST_GEOIP_HOST, TEST_GEOIP_LICENSE_KEY
+from tests.conftest import (
+    TEST_GEOIP_ACCOUNT_ID_INT,
+    TEST_GEOIP_ACCOUNT_ID_STR,
+    TEST_GEOIP_HEDGE_DELAY,
+    TEST_GEOIP_HOST,
+    TEST_GEOIP_LICENSE_KEY,
+    TEST_GEOIP_POOL_SIZE_INT,
+    TEST_GEOIP_POOL_SIZE_STR,
+    TEST_GEOIP_TIMEOUT,
+    TEST_QUOTA_RESERVE,
+    TEST_RATE_LIMIT,
+    TEST_RATE_LIMIT_BURST,
+    TEST_RATE_LIMIT_MAX_WAIT,
+)
 
 
 class TestGeoIPConfig:
@@ -21,6 +61,30 @@ class TestGeoIPConfig:
         assert config.account_id == TEST_GEOIP_ACCOUNT_ID_INT
         assert config.license_key == TEST_GEOIP_LICENSE_KEY
         assert config.host == TEST_GEOIP_HOST
+        assert config.pool_size == GEOIP_POOL_SIZE
+        assert config.rate_limit == GEOIP_RATE_LIMIT
+        assert config.rate_limit_burst == GEOIP_RATE_LIMIT_BURST
+        assert config.rate_limit_max_wait == GEOIP_RATE_LIMIT_MAX_WAIT
+        assert config.rate_limit_shared is False
+        assert config.quota_reserve == GEOIP_QUOTA_RESERVE
+        assert config.timeout == GEOIP_TIMEOUT
+        assert config.retries == GEOIP_RETRIES
+        assert config.backoff == GEOIP_BACKOFF
+        assert config.hedge is False
+        assert config.hedge_delay == GEOIP_HEDGE_DELAY
+        assert config.endpoint == GEOIP_ENDPOINT
+
+    def test_init_with_pool_size(self) -> None:
+        """クライアントの最大数を指定した初期化のテスト."""
+        config = GeoIPConfig(TEST_GEOIP_ACCOUNT_ID_STR, TEST_GEOIP_LICENSE_KEY, TEST_GEOIP_HOST, TEST_GEOIP_POOL_SIZE_STR)
+
+        assert config.pool_size == TEST_GEOIP_POOL_SIZE_INT
+
+    @pytest.mark.parametrize("pool_size", ["0", "-1", "invalid"])
+    def test_init_with_invalid_pool_size(self, pool_size: str) -> None:
+        """クライアントの最大数が不正な場合の初期化テスト."""
+        with pytest.raises(ValidationError):
+            _ = GeoIPConfig(TEST_GEOIP_ACCOUNT_ID_STR, TEST_GEOIP_LICENSE_KEY, TEST_GEOIP_HOST, pool_size)
 
     @patch.dict(
         os.environ,
@@ -39,6 +103,90 @@ class TestGeoIPConfig:
         assert config.license_key == TEST_GEOIP_LICENSE_KEY
         assert config.host == TEST_GEOIP_HOST
 
+    @pytest.mark.parametrize(
+        ("name", "value"),
+        [
+            ("rate_limit", "-1"),
+            ("rate_limit", "invalid"),
+            ("rate_limit_burst", "0"),
+            ("rate_limit_max_wait", "-1"),
+            ("rate_limit_shared", "invalid"),
+            ("quota_reserve", "-1"),
+        ],
+    )
+    def test_init_with_invalid_rate_limit(self, name: str, value: str) -> None:
+        """問い合わせ数の制限が不正な場合の初期化テスト."""
+        with pytest.raises(ValidationError):
+            _ = GeoIPConfig(TEST_GEOIP_ACCOUNT_ID_STR, TEST_GEOIP_LICENSE_KEY, TEST_GEOIP_HOST, **{name: value})
+
+    @patch.dict(
+        os.environ,
+        {
+            GEOIP_ACCOUNT_ID_ENV: TEST_GEOIP_ACCOUNT_ID_STR,
+            GEOIP_LICENSE_KEY_ENV: TEST_GEOIP_LICENSE_KEY,
+            GEOIP_HOST_ENV: TEST_GEOIP_HOST,
+            GEOIP_RATE_LIMIT_ENV: str(TEST_RATE_LIMIT),
+            GEOIP_RATE_LIMIT_BURST_ENV: str(TEST_RATE_LIMIT_BURST),
+            GEOIP_RATE_LIMIT_MAX_WAIT_ENV: str(TEST_RATE_LIMIT_MAX_WAIT),
+            GEOIP_RATE_LIMIT_SHARED_ENV: "true",
+            GEOIP_QUOTA_RESERVE_ENV: str(TEST_QUOTA_RESERVE),
+        },
+        clear=True,
+    )
+    def test_from_env_with_rate_limit(self) -> None:
+        """問い合わせ数の制限を指定した環境変数からの作成テスト."""
+        config = GeoIPConfig.from_env()
+
+        assert config.rate_limit == TEST_RATE_LIMIT
+        assert config.rate_limit_burst == TEST_RATE_LIMIT_BURST
+        assert config.rate_limit_max_wait == TEST_RATE_LIMIT_MAX_WAIT
+        assert config.rate_limit_shared is True
+        assert config.quota_reserve == TEST_QUOTA_RESERVE
+
+    @pytest.mark.parametrize(
+        ("name", "value"),
+        [
+            ("timeout", "0"),
+            ("timeout", "invalid"),
+            ("retries", "-1"),
+            ("retries", "1.5"),
+            ("backoff", "-1"),
+            ("hedge", "invalid"),
+            ("hedge_delay", "0"),
+            ("endpoint", "asn"),
+        ],
+    )
+    def test_init_with_invalid_retry(self, name: str, value: str) -> None:
+        """タイムアウト, 再試行, ヘッジ, エンドポイントの設定が不正な場合の初期化テスト."""
+        with pytest.raises(ValidationError):
+            _ = GeoIPConfig(TEST_GEOIP_ACCOUNT_ID_STR, TEST_GEOIP_LICENSE_KEY, TEST_GEOIP_HOST, **{name: value})
+
+    @patch.dict(
+        os.environ,
+        {
+            GEOIP_ACCOUNT_ID_ENV: TEST_GEOIP_ACCOUNT_ID_STR,
+            GEOIP_LICENSE_KEY_ENV: TEST_GEOIP_LICENSE_KEY,
+            GEOIP_HOST_ENV: TEST_GEOIP_HOST,
+            GEOIP_TIMEOUT_ENV: str(TEST_GEOIP_TIMEOUT),
+            GEOIP_RETRIES_ENV: "0",
+            GEOIP_BACKOFF_ENV: "0.5",
+            GEOIP_HEDGE_ENV: "true",
+            GEOIP_HEDGE_DELAY_ENV: str(TEST_GEOIP_HEDGE_DELAY),
+            GEOIP_ENDPOINT_ENV: GEOIP_ENDPOINT_COUNTRY,
+        },
+        clear=True,
+    )
+    def test_from_env_with_retry(self) -> None:
+        """タイムアウト, 再試行, ヘッジ, エンドポイントを指定した環境変数からの作成テスト."""
+        config = GeoIPConfig.from_env()
+
+        assert config.timeout == TEST_GEOIP_TIMEOUT
+        assert config.retries == 0
+        assert config.backoff == 0.5  # noqa: PLR2004
+        assert config.hedge is True
+        assert config.hedge_delay == TEST_GEOIP_HEDGE_DELAY
+        assert config.endpoint == GEOIP_ENDPOINT_COUNTRY
+
     @patch.dict(
         os.environ,
         {
@@ -91,3 +239,19 @@ class TestGeoIPConfig:
         match = f"Missing environment variables: {GEOIP_ACCOUNT_ID_ENV}, {GEOIP_LICENSE_KEY_ENV}, {GEOIP_HOST_ENV}"
         with pytest.raises(ValidationError, match=match):
             _ = GeoIPConfig.from_env()
+
+    @patch.dict(
+        os.environ,
+        {
+            GEOIP_ACCOUNT_ID_ENV: TEST_GEOIP_ACCOUNT_ID_STR,
+            GEOIP_LICENSE_KEY_ENV: TEST_GEOIP_LICENSE_KEY,
+            GEOIP_HOST_ENV: TEST_GEOIP_HOST,
+            GEOIP_POOL_SIZE_ENV: TEST_GEOIP_POOL_SIZE_STR,
+        },
+        clear=True,
+    )
+    def test_from_env_with_pool_size(self) -> None:
+        """クライアントの最大数の環境変数からの作成テスト."""
+        config = GeoIPConfig.from_env()
+
+        assert config.pool_size == TEST_GEOIP_POOL_SIZE_INT
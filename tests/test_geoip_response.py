@@ -0,0 +1,103 @@
+"""GeoIPResponseクラスのテスト."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from ipinfo_geoip.constants import GEOIP_ENDPOINT_COUNTRY
+from ipinfo_geoip.geoip_response import AsyncProjectionClient, GeoIPResponse, ProjectionClient
+from tests.conftest import (
+    TEST_AS_NUMBER_INT,
+    TEST_AS_NUMBER_STR,
+    TEST_COUNTRY_CODE,
+    TEST_GEOIP_ACCOUNT_ID_INT,
+    TEST_GEOIP_HOST,
+    TEST_GEOIP_LICENSE_KEY,
+    TEST_IP_ADDRESS_1,
+    TEST_IP_NETWORK,
+    TEST_ORGANIZATION,
+    TEST_QUERIES_REMAINING,
+)
+
+TEST_BODY: dict[str, object] = {
+    "city": {"geoname_id": 1850147, "names": {"en": "Tokyo", "ja": "東京"}},
+    "continent": {"code": "AS", "geoname_id": 6255147, "names": {"en": "Asia"}},
+    "country": {"geoname_id": 1861060, "iso_code": TEST_COUNTRY_CODE, "names": {"en": "Japan"}},
+    "location": {"latitude": 35.6895, "longitude": 139.6917, "time_zone": "Asia/Tokyo"},
+    "subdivisions": [{"geoname_id": 1850144, "iso_code": "13", "names": {"en": "Tokyo"}}],
+    "traits": {
+        "autonomous_system_number": TEST_AS_NUMBER_INT,
+        "autonomous_system_organization": TEST_ORGANIZATION,
+        "ip_address": TEST_IP_ADDRESS_1,
+        "network": TEST_IP_NETWORK,
+    },
+    "maxmind": {"queries_remaining": TEST_QUERIES_REMAINING},
+}
+
+
+class TestGeoIPResponse:
+    """GeoIPResponseクラスのテストクラス."""
+
+    def test_init(self) -> None:
+        """必要なフィールドのみを取り出すテスト."""
+        response = GeoIPResponse(["en"], **TEST_BODY)
+
+        assert response.network == TEST_IP_NETWORK
+        assert response.as_number == TEST_AS_NUMBER_STR
+        assert response.country == TEST_COUNTRY_CODE
+        assert response.organization == TEST_ORGANIZATION
+        assert response.queries_remaining == TEST_QUERIES_REMAINING
+
+    def test_init_with_empty_body(self) -> None:
+        """フィールドが存在しない場合のテスト."""
+        response = GeoIPResponse()
+
+        assert response.network == ""
+        assert response.as_number == ""
+        assert response.country == ""
+        assert response.organization == ""
+        assert response.queries_remaining is None
+
+    def test_init_with_prefix_len(self) -> None:
+        """networkがない場合にIPアドレスとプレフィックス長からネットワークを求めるテスト."""
+        response = GeoIPResponse(traits={"ip_address": TEST_IP_ADDRESS_1, "prefix_len": 24})
+
+        assert response.network == TEST_IP_NETWORK
+
+    @pytest.mark.parametrize("traits", [{"ip_address": "invalid", "prefix_len": 24}, {"network": None}, "invalid"])
+    def test_init_with_invalid_traits(self, traits: object) -> None:
+        """traitsが不正な場合に空のフィールドとするテスト."""
+        response = GeoIPResponse(traits=traits)
+
+        assert response.network == ""
+        assert response.as_number == ""
+
+
+class TestProjectionClient:
+    """ProjectionClientクラスのテストクラス."""
+
+    def test_lookup(self) -> None:
+        """指定されたエンドポイントに問い合わせ, GeoIPResponseを作成するテスト."""
+        client = ProjectionClient(TEST_GEOIP_ACCOUNT_ID_INT, TEST_GEOIP_LICENSE_KEY, TEST_GEOIP_HOST)
+
+        with patch.object(ProjectionClient, "_response_for", return_value=GeoIPResponse(**TEST_BODY)) as mock_response_for:
+            response = client.lookup(GEOIP_ENDPOINT_COUNTRY, TEST_IP_ADDRESS_1)
+
+        assert response.country == TEST_COUNTRY_CODE
+        mock_response_for.assert_called_once_with(GEOIP_ENDPOINT_COUNTRY, GeoIPResponse, TEST_IP_ADDRESS_1)
+
+    def test_lookup_async(self) -> None:
+        """非同期クライアントで指定されたエンドポイントに問い合わせるテスト."""
+        client = AsyncProjectionClient(TEST_GEOIP_ACCOUNT_ID_INT, TEST_GEOIP_LICENSE_KEY, TEST_GEOIP_HOST)
+
+        with patch.object(
+            AsyncProjectionClient,
+            "_response_for",
+            new_callable=AsyncMock,
+            return_value=GeoIPResponse(**TEST_BODY),
+        ) as mock_response_for:
+            response = asyncio.run(client.lookup(GEOIP_ENDPOINT_COUNTRY, TEST_IP_ADDRESS_1))
+
+        assert response.country == TEST_COUNTRY_CODE
+        mock_response_for.assert_awaited_once_with(GEOIP_ENDPOINT_COUNTRY, GeoIPResponse, TEST_IP_ADDRESS_1)
@@ -11,6 +11,7 @@ from tests.conftest import (
     TEST_IP_ADDRESS_1,
     TEST_IP_ADDRESS_2,
     TEST_IP_NETWORK,
+    TEST_IPDATA,
     TEST_ORGANIZATION,
 )
 
@@ -227,6 +228,18 @@ class TestIPData:
 
         assert ip_data.is_complete() is False
 
+    def test_is_empty_with_all_empty(self) -> None:
+        """IPアドレス以外のフィールドがすべて空の場合のis_emptyテスト."""
+        ip_data = IPData(ip_address=TEST_IP_ADDRESS_1, network="", as_number="", country="", organization="")
+
+        assert ip_data.is_empty() is True
+
+    def test_is_empty_with_partial_data(self) -> None:
+        """一部のフィールドが空でない場合のis_emptyテスト."""
+        ip_data = IPData(ip_address=TEST_IP_ADDRESS_1, network="", as_number="", country=TEST_COUNTRY_CODE, organization="")
+
+        assert ip_data.is_empty() is False
+
     def test_to_dict(self) -> None:
         """to_dictメソッドのテスト."""
         ip_data = IPData(
@@ -266,3 +279,76 @@ class TestIPData:
         }
 
         assert ip_data.to_dict() == expected
+
+    def test_compact_representation(self) -> None:
+        """コンパクトな形式で保存されるテスト."""
+        ip_data = IPData(TEST_IP_ADDRESS_1, TEST_IP_NETWORK, int(TEST_AS_NUMBER_STR), TEST_COUNTRY_CODE, TEST_ORGANIZATION)
+
+        assert not hasattr(ip_data, "__dict__")
+        assert ip_data.asn == int(TEST_AS_NUMBER_STR)
+        assert isinstance(ip_data._packed, bytes)  # noqa: SLF001
+        assert ip_data.as_number == TEST_AS_NUMBER_STR
+        assert ip_data == TEST_IPDATA
+
+    def test_interned_strings(self) -> None:
+        """国コードと組織名が共有されるテスト."""
+        organization = "".join(TEST_ORGANIZATION)
+        ip_data1 = IPData(TEST_IP_ADDRESS_1, TEST_IP_NETWORK, TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, organization)
+        ip_data2 = IPData(
+            TEST_IP_ADDRESS_2, TEST_IP_NETWORK, TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, " ".join(TEST_ORGANIZATION.split(" "))
+        )
+
+        assert ip_data1.organization is ip_data2.organization
+
+    def test_ipv6(self) -> None:
+        """IPv6アドレスのテスト."""
+        ip_data = IPData("2001:DB8::1", "2001:db8::/32", TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, TEST_ORGANIZATION)
+
+        assert ip_data.ip_address == "2001:db8::1"
+        assert ip_data.network == "2001:db8::/32"
+
+    def test_empty_as_number(self) -> None:
+        """空のAS番号のテスト."""
+        ip_data = IPData(TEST_IP_ADDRESS_1, "", "", "", "")
+
+        assert ip_data.as_number == ""
+        assert ip_data.asn == 0
+
+    def test_post_init_non_numeric_as_number(self) -> None:
+        """数値でない自律システム番号の初期化テスト."""
+        with pytest.raises(ValidationError):
+            _ = IPData(TEST_IP_ADDRESS_1, TEST_IP_NETWORK, "AS65001", TEST_COUNTRY_CODE, TEST_ORGANIZATION)
+
+    def test_hash(self) -> None:
+        """等しいIPDataのハッシュ値が等しいテスト."""
+        ip_data = IPData(TEST_IP_ADDRESS_1, TEST_IP_NETWORK, TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, TEST_ORGANIZATION)
+
+        assert hash(ip_data) == hash(TEST_IPDATA)
+        assert len({ip_data, TEST_IPDATA}) == 1
+
+    def test_from_trusted(self) -> None:
+        """検証済みのフィールドから作成したIPDataが等しいテスト."""
+        ip_data = IPData.from_trusted(
+            TEST_IP_ADDRESS_1, TEST_IP_NETWORK, TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, TEST_ORGANIZATION
+        )
+
+        assert ip_data == TEST_IPDATA
+        assert ip_data.is_complete()
+
+    def test_from_trusted_empty(self) -> None:
+        """検証済みの空のフィールドから作成したIPDataのテスト."""
+        ip_data = IPData.from_trusted(TEST_IP_ADDRESS_1, "", "", "", "")
+
+        assert ip_data == IPData(TEST_IP_ADDRESS_1, "", "", "", "")
+        assert ip_data.is_empty()
+
+    def test_from_trusted_skips_range_validation(self) -> None:
+        """検証済みのフィールドは値の範囲を検証しないテスト."""
+        ip_data = IPData.from_trusted(TEST_IP_ADDRESS_1, TEST_IP_NETWORK, TEST_AS_NUMBER_STR, "JPN", TEST_ORGANIZATION)
+
+        assert ip_data.country == "JPN"
+
+    def test_from_trusted_invalid_ip_address(self) -> None:
+        """解析できないIPアドレスから作成するテスト."""
+        with pytest.raises(ValidationError):
+            _ = IPData.from_trusted("invalid", "", "", "", "")
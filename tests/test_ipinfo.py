@@ -1,13 +1,31 @@
 """IPInfoクラスのテスト."""
 
+import os
+import threading
 from collections import UserDict
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
 
-from ipinfo_geoip.exceptions import ValidationError
+from ipinfo_geoip.cache import TTLCache
+from ipinfo_geoip.constants import GEOIP_MAX_WORKERS, RESOLVERS_ENV
+from ipinfo_geoip.exceptions import (
+    AddressNotFoundError,
+    ConfigurationError,
+    GeoIPClientError,
+    RateLimitError,
+    ValidationError,
+)
+from ipinfo_geoip.ipdata import IPData
 from ipinfo_geoip.ipinfo import IPInfo
-from tests.conftest import TEST_IP_ADDRESS_1, TEST_IPDATA, TEST_IPDATA_INCOMPLETE
+from tests.conftest import (
+    TEST_IP_ADDRESS_1,
+    TEST_IP_ADDRESS_2,
+    TEST_IPDATA,
+    TEST_IPDATA_2,
+    TEST_IPDATA_INCOMPLETE,
+)
 
 
 class TestIPInfo:
@@ -32,12 +50,12 @@ class TestIPInfo:
         """IPアドレスが無効な場合の__missing__メソッドテスト."""
         # モック設定
         mock_geoip_instance = Mock()
-        mock_geoip_instance.__getitem__ = Mock(return_value=None)
+        mock_geoip_instance.get = Mock(return_value=None)
         mock_geoip_client.return_value = mock_geoip_instance
 
         mock_redis_instance = Mock()
-        mock_redis_instance.__getitem__ = Mock(return_value=TEST_IPDATA)
-        mock_redis_instance.__setitem__ = Mock()
+        mock_redis_instance.get = Mock(return_value=TEST_IPDATA)
+        mock_redis_instance.put = Mock()
         mock_redis_client.return_value = mock_redis_instance
 
         # テスト実行
@@ -47,9 +65,9 @@ class TestIPInfo:
             _ = ipinfo["invalid.ip"]
 
         # 検証
-        mock_geoip_instance.__getitem__.assert_not_called()
-        mock_redis_instance.__getitem__.assert_not_called()
-        mock_redis_instance.__setitem__.assert_not_called()
+        mock_geoip_instance.get.assert_not_called()
+        mock_redis_instance.get.assert_not_called()
+        mock_redis_instance.put.assert_not_called()
 
     @patch("ipinfo_geoip.ipinfo.RedisClient")
     @patch("ipinfo_geoip.ipinfo.GeoIPClient")
@@ -57,12 +75,12 @@ class TestIPInfo:
         """GeoIPインスタンスからIPアドレス情報を取得する__missing__メソッドテスト."""
         # モック設定
         mock_geoip_instance = Mock()
-        mock_geoip_instance.__getitem__ = Mock(return_value=TEST_IPDATA)
+        mock_geoip_instance.get = Mock(return_value=TEST_IPDATA)
         mock_geoip_client.return_value = mock_geoip_instance
 
         mock_redis_instance = Mock()
-        mock_redis_instance.__getitem__ = Mock(return_value=None)
-        mock_redis_instance.__setitem__ = Mock()
+        mock_redis_instance.get = Mock(return_value=None)
+        mock_redis_instance.put = Mock()
         mock_redis_client.return_value = mock_redis_instance
 
         # テスト実行
@@ -71,9 +89,9 @@ class TestIPInfo:
 
         # 検証
         assert result == TEST_IPDATA.to_dict()
-        mock_geoip_instance.__getitem__.assert_called_once_with(TEST_IP_ADDRESS_1)
-        mock_redis_instance.__getitem__.assert_called_once_with(TEST_IP_ADDRESS_1)
-        mock_redis_instance.__setitem__.assert_called_once_with(TEST_IP_ADDRESS_1, TEST_IPDATA)
+        mock_geoip_instance.get.assert_called_once_with(TEST_IP_ADDRESS_1)
+        mock_redis_instance.get.assert_called_once_with(TEST_IP_ADDRESS_1)
+        mock_redis_instance.put.assert_called_once_with(TEST_IP_ADDRESS_1, TEST_IPDATA)
 
     @patch("ipinfo_geoip.ipinfo.RedisClient")
     @patch("ipinfo_geoip.ipinfo.GeoIPClient")
@@ -81,12 +99,12 @@ class TestIPInfo:
         """RedisインスタンスからIPアドレス情報を取得する__missing__メソッドテスト."""
         # モック設定
         mock_geoip_instance = Mock()
-        mock_geoip_instance.__getitem__ = Mock(return_value=None)
+        mock_geoip_instance.get = Mock(return_value=None)
         mock_geoip_client.return_value = mock_geoip_instance
 
         mock_redis_instance = Mock()
-        mock_redis_instance.__getitem__ = Mock(return_value=TEST_IPDATA)
-        mock_redis_instance.__setitem__ = Mock()
+        mock_redis_instance.get = Mock(return_value=TEST_IPDATA)
+        mock_redis_instance.put = Mock()
         mock_redis_client.return_value = mock_redis_instance
 
         # テスト実行
@@ -95,9 +113,9 @@ class TestIPInfo:
 
         # 検証
         assert result == TEST_IPDATA.to_dict()
-        mock_geoip_instance.__getitem__.assert_not_called()
-        mock_redis_instance.__getitem__.assert_called_once_with(TEST_IP_ADDRESS_1)
-        mock_redis_instance.__setitem__.assert_not_called()
+        mock_geoip_instance.get.assert_not_called()
+        mock_redis_instance.get.assert_called_once_with(TEST_IP_ADDRESS_1)
+        mock_redis_instance.put.assert_not_called()
 
     @patch("ipinfo_geoip.ipinfo.RedisClient")
     @patch("ipinfo_geoip.ipinfo.GeoIPClient")
@@ -105,13 +123,13 @@ class TestIPInfo:
         """データが完全な場合の__missing__メソッドテスト."""
         # モック設定
         mock_geoip_instance = Mock()
-        mock_geoip_instance.__getitem__ = Mock(return_value=TEST_IPDATA)
+        mock_geoip_instance.get = Mock(return_value=TEST_IPDATA)
         mock_geoip_client.return_value = mock_geoip_instance
 
         # Redisクライアントのモック設定
         mock_redis_instance = Mock()
-        mock_redis_instance.__getitem__ = Mock(return_value=None)
-        mock_redis_instance.__setitem__ = Mock()
+        mock_redis_instance.get = Mock(return_value=None)
+        mock_redis_instance.put = Mock()
         mock_redis_client.return_value = mock_redis_instance
 
         # テスト実行
@@ -120,9 +138,9 @@ class TestIPInfo:
 
         # 検証
         assert result == TEST_IPDATA.to_dict()
-        mock_geoip_instance.__getitem__.assert_called_once_with(TEST_IP_ADDRESS_1)
-        mock_redis_instance.__getitem__.assert_called_once_with(TEST_IP_ADDRESS_1)
-        mock_redis_instance.__setitem__.assert_called_once_with(TEST_IP_ADDRESS_1, TEST_IPDATA)
+        mock_geoip_instance.get.assert_called_once_with(TEST_IP_ADDRESS_1)
+        mock_redis_instance.get.assert_called_once_with(TEST_IP_ADDRESS_1)
+        mock_redis_instance.put.assert_called_once_with(TEST_IP_ADDRESS_1, TEST_IPDATA)
 
     @patch("ipinfo_geoip.ipinfo.RedisClient")
     @patch("ipinfo_geoip.ipinfo.GeoIPClient")
@@ -130,12 +148,12 @@ class TestIPInfo:
         """データが不完全な場合の__missing__メソッドテスト."""
         # モック設定
         mock_geoip_instance = Mock()
-        mock_geoip_instance.__getitem__ = Mock(return_value=TEST_IPDATA_INCOMPLETE)
+        mock_geoip_instance.get = Mock(return_value=TEST_IPDATA_INCOMPLETE)
         mock_geoip_client.return_value = mock_geoip_instance
 
         mock_redis_instance = Mock()
-        mock_redis_instance.__getitem__ = Mock(return_value=None)
-        mock_redis_instance.__setitem__ = Mock()
+        mock_redis_instance.get = Mock(return_value=None)
+        mock_redis_instance.put = Mock()
         mock_redis_client.return_value = mock_redis_instance
 
         # テスト実行
@@ -144,9 +162,9 @@ class TestIPInfo:
 
         # 検証
         assert result == TEST_IPDATA_INCOMPLETE.to_dict()
-        mock_geoip_instance.__getitem__.assert_called_once_with(TEST_IP_ADDRESS_1)
-        mock_redis_instance.__getitem__.assert_called_once_with(TEST_IP_ADDRESS_1)
-        mock_redis_instance.__setitem__.assert_not_called()
+        mock_geoip_instance.get.assert_called_once_with(TEST_IP_ADDRESS_1)
+        mock_redis_instance.get.assert_called_once_with(TEST_IP_ADDRESS_1)
+        mock_redis_instance.put.assert_not_called()
 
     @patch("ipinfo_geoip.ipinfo.RedisClient")
     @patch("ipinfo_geoip.ipinfo.GeoIPClient")
@@ -154,12 +172,12 @@ class TestIPInfo:
         """データがNoneの場合の__missing__メソッドテスト."""
         # モック設定
         mock_geoip_instance = Mock()
-        mock_geoip_instance.__getitem__ = Mock(return_value=None)
+        mock_geoip_instance.get = Mock(return_value=None)
         mock_geoip_client.return_value = mock_geoip_instance
 
         mock_redis_instance = Mock()
-        mock_redis_instance.__getitem__ = Mock(return_value=None)
-        mock_redis_instance.__setitem__ = Mock()
+        mock_redis_instance.get = Mock(return_value=None)
+        mock_redis_instance.put = Mock()
         mock_redis_client.return_value = mock_redis_instance
 
         # テスト実行
@@ -168,6 +186,394 @@ class TestIPInfo:
 
         # 検証
         assert result is None
-        mock_geoip_instance.__getitem__.assert_called_once_with(TEST_IP_ADDRESS_1)
-        mock_redis_instance.__getitem__.assert_called_once_with(TEST_IP_ADDRESS_1)
-        mock_redis_instance.__setitem__.assert_not_called()
+        mock_geoip_instance.get.assert_called_once_with(TEST_IP_ADDRESS_1)
+        mock_redis_instance.get.assert_called_once_with(TEST_IP_ADDRESS_1)
+        mock_redis_instance.put.assert_not_called()
+
+    @patch("ipinfo_geoip.ipinfo.RedisClient")
+    @patch("ipinfo_geoip.ipinfo.GeoIPClient")
+    def test_lookup_many(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """複数のIPアドレス情報をまとめて取得するlookup_manyメソッドテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get_many = Mock(return_value={TEST_IP_ADDRESS_2: TEST_IPDATA_2})
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get_many = Mock(return_value={TEST_IP_ADDRESS_1: TEST_IPDATA, TEST_IP_ADDRESS_2: None})
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = IPInfo()
+        result = ipinfo.lookup_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2, TEST_IP_ADDRESS_1])
+
+        # 検証
+        assert result == {TEST_IP_ADDRESS_1: TEST_IPDATA.to_dict(), TEST_IP_ADDRESS_2: TEST_IPDATA_2.to_dict()}
+        mock_redis_instance.get_many.assert_called_once_with([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])
+        mock_geoip_instance.get_many.assert_called_once_with([TEST_IP_ADDRESS_2], GEOIP_MAX_WORKERS)
+        mock_redis_instance.set_many.assert_called_once_with({TEST_IP_ADDRESS_2: TEST_IPDATA_2}, [])
+
+    @patch("ipinfo_geoip.ipinfo.RedisClient")
+    @patch("ipinfo_geoip.ipinfo.GeoIPClient")
+    def test_lookup_many_with_not_found(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """見つからないIPアドレスを含む場合のlookup_manyメソッドテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get_many = Mock(return_value={TEST_IP_ADDRESS_1: None})
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get_many = Mock(return_value={TEST_IP_ADDRESS_1: None})
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = IPInfo()
+        result = ipinfo.lookup_many([TEST_IP_ADDRESS_1])
+
+        # 検証
+        assert result == {TEST_IP_ADDRESS_1: None}
+        mock_redis_instance.set_many.assert_called_once_with({}, [TEST_IP_ADDRESS_1])
+        assert ipinfo.lookup_many([TEST_IP_ADDRESS_1]) == {TEST_IP_ADDRESS_1: None}
+        mock_redis_instance.get_many.assert_called_once()
+
+    @patch("ipinfo_geoip.ipinfo.RedisClient")
+    @patch("ipinfo_geoip.ipinfo.GeoIPClient")
+    def test_lookup_many_with_rate_limit(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """問い合わせ数が上限に達した場合のlookup_manyメソッドテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get_many = Mock(
+            side_effect=RateLimitError(
+                "GeoIP query quota exhausted",
+                {"ip_addresses": [TEST_IP_ADDRESS_2], "results": {TEST_IP_ADDRESS_1: TEST_IPDATA}},
+            ),
+        )
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get_many = Mock(return_value={})
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = IPInfo()
+        with pytest.raises(RateLimitError) as exc_info:
+            _ = ipinfo.lookup_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])
+
+        # 検証
+        assert exc_info.value.details == {
+            "ip_addresses": [TEST_IP_ADDRESS_2],
+            "results": {TEST_IP_ADDRESS_1: TEST_IPDATA.to_dict()},
+        }
+        mock_redis_instance.set_many.assert_called_once_with({TEST_IP_ADDRESS_1: TEST_IPDATA}, [])
+        assert ipinfo[TEST_IP_ADDRESS_1] == TEST_IPDATA.to_dict()
+        assert TEST_IP_ADDRESS_2 not in ipinfo.data
+
+    @patch("ipinfo_geoip.ipinfo.RedisClient")
+    @patch("ipinfo_geoip.ipinfo.GeoIPClient")
+    def test_lookup_many_with_failure(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """取得に失敗したIPアドレスをNoneとし, 存在しないことを保存しないlookup_manyメソッドテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get_many = Mock(return_value={TEST_IP_ADDRESS_1: TEST_IPDATA})
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get_many = Mock(return_value={})
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = IPInfo()
+        result = ipinfo.lookup_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])
+
+        # 検証
+        assert result == {TEST_IP_ADDRESS_1: TEST_IPDATA.to_dict(), TEST_IP_ADDRESS_2: None}
+        mock_redis_instance.set_many.assert_called_once_with({TEST_IP_ADDRESS_1: TEST_IPDATA}, [])
+        assert TEST_IP_ADDRESS_2 not in ipinfo.data
+
+    @patch("ipinfo_geoip.ipinfo.RedisClient")
+    @patch("ipinfo_geoip.ipinfo.GeoIPClient")
+    def test_lookup_many_with_invalid_ip_value(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """IPアドレスが無効な場合のlookup_manyメソッドテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = IPInfo()
+
+        with pytest.raises(ValidationError):
+            _ = ipinfo.lookup_many([TEST_IP_ADDRESS_1, "invalid.ip"])
+
+        # 検証
+        mock_redis_instance.get_many.assert_not_called()
+        mock_geoip_instance.get_many.assert_not_called()
+
+    @patch("ipinfo_geoip.ipinfo.RedisClient")
+    @patch("ipinfo_geoip.ipinfo.GeoIPClient")
+    def test_missing_from_network_index(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """取得済みのネットワークからIPアドレス情報を取得する__missing__メソッドテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get = Mock(return_value=TEST_IPDATA)
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get = Mock(return_value=None)
+        mock_redis_instance.put = Mock()
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = IPInfo()
+        _ = ipinfo[TEST_IP_ADDRESS_1]
+        result = ipinfo[TEST_IP_ADDRESS_2]
+
+        # 検証
+        assert result == TEST_IPDATA_2.to_dict()
+        mock_geoip_instance.get.assert_called_once_with(TEST_IP_ADDRESS_1)
+        mock_redis_instance.get.assert_called_once_with(TEST_IP_ADDRESS_1)
+
+    @patch("ipinfo_geoip.ipinfo.RedisClient")
+    @patch("ipinfo_geoip.ipinfo.GeoIPClient")
+    def test_getitem_from_cache(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """プロセス内キャッシュからIPアドレス情報を取得するテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get = Mock(return_value=None)
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get = Mock(return_value=TEST_IPDATA)
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = IPInfo()
+        _ = ipinfo[TEST_IP_ADDRESS_1]
+        result = ipinfo[TEST_IP_ADDRESS_1]
+
+        # 検証
+        assert result == TEST_IPDATA.to_dict()
+        assert isinstance(ipinfo.data, TTLCache)
+        mock_redis_instance.get.assert_called_once_with(TEST_IP_ADDRESS_1)
+
+    @patch("ipinfo_geoip.ipinfo.RedisClient")
+    @patch("ipinfo_geoip.ipinfo.GeoIPClient")
+    def test_missing_with_geoip_client_error(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """再試行しても一時的なエラーが続いた場合の__missing__メソッドテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get = Mock(side_effect=GeoIPClientError("GeoIP request failed"))
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get = Mock(return_value=None)
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = IPInfo()
+
+        with pytest.raises(GeoIPClientError):
+            _ = ipinfo[TEST_IP_ADDRESS_1]
+
+        # 検証
+        assert TEST_IP_ADDRESS_1 not in ipinfo.data
+        mock_redis_instance.set_not_found.assert_not_called()
+
+    @patch("ipinfo_geoip.ipinfo.RedisClient")
+    @patch("ipinfo_geoip.ipinfo.GeoIPClient")
+    def test_missing_with_address_not_found(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """アドレスが見つからない場合の__missing__メソッドテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get = Mock(side_effect=AddressNotFoundError("Address not found"))
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get = Mock(return_value=None)
+        mock_redis_instance.put = Mock()
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = IPInfo()
+        result = ipinfo[TEST_IP_ADDRESS_1]
+        result_cached = ipinfo[TEST_IP_ADDRESS_1]
+
+        # 検証
+        assert result is None
+        assert result_cached is None
+        mock_geoip_instance.get.assert_called_once_with(TEST_IP_ADDRESS_1)
+        mock_redis_instance.get.assert_called_once_with(TEST_IP_ADDRESS_1)
+        mock_redis_instance.set_not_found.assert_called_once_with(TEST_IP_ADDRESS_1)
+        mock_redis_instance.put.assert_not_called()
+
+    @patch("ipinfo_geoip.ipinfo.RedisClient")
+    @patch("ipinfo_geoip.ipinfo.GeoIPClient")
+    def test_missing_with_not_found_in_redis(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """存在しないことがRedisにキャッシュされている場合の__missing__メソッドテスト."""
+        # モック設定
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get = Mock(return_value=TEST_IPDATA)
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get = Mock(return_value=IPData(TEST_IP_ADDRESS_1, "", "", "", ""))
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = IPInfo()
+        result = ipinfo[TEST_IP_ADDRESS_1]
+
+        # 検証
+        assert result is None
+        assert TEST_IP_ADDRESS_1 in ipinfo
+        mock_geoip_instance.get.assert_not_called()
+        mock_redis_instance.set_not_found.assert_not_called()
+
+    @patch("ipinfo_geoip.ipinfo.RedisClient")
+    @patch("ipinfo_geoip.ipinfo.GeoIPClient")
+    def test_missing_coalesces_concurrent_calls(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """同じIPアドレスに対する同時の__missing__メソッドが1回に集約されるテスト."""
+        # モック設定
+        started = threading.Event()
+        release = threading.Event()
+
+        def getitem(_: str) -> IPData:
+            started.set()
+            release.wait()
+            return TEST_IPDATA
+
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get = Mock(side_effect=getitem)
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get = Mock(return_value=None)
+        mock_redis_instance.put = Mock()
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = IPInfo()
+
+        with ThreadPoolExecutor(2) as executor:
+            leader = executor.submit(ipinfo.__missing__, TEST_IP_ADDRESS_1)
+            started.wait()
+            follower = executor.submit(ipinfo.__missing__, TEST_IP_ADDRESS_1)
+            while not follower.running():
+                threading.Event().wait(0.001)
+            release.set()
+            results = [leader.result(), follower.result()]
+
+        # 検証
+        assert results == [TEST_IPDATA.to_dict()] * 2
+        mock_geoip_instance.get.assert_called_once_with(TEST_IP_ADDRESS_1)
+        mock_redis_instance.put.assert_called_once_with(TEST_IP_ADDRESS_1, TEST_IPDATA)
+
+    @patch.dict(os.environ, {RESOLVERS_ENV: "memory,mmdb,redis,webservice"})
+    @patch("ipinfo_geoip.ipinfo.RedisClient")
+    @patch("ipinfo_geoip.ipinfo.GeoIPClient")
+    @patch("ipinfo_geoip.ipinfo.MMDBClient")
+    def test_missing_from_mmdb(self, mock_mmdb_client: Mock, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """GeoLite2データベースファイルからIPアドレス情報を取得する__missing__メソッドテスト."""
+        # モック設定
+        mock_mmdb_instance = Mock()
+        mock_mmdb_instance.get_many = Mock(return_value={TEST_IP_ADDRESS_1: TEST_IPDATA})
+        mock_mmdb_client.return_value = mock_mmdb_instance
+
+        mock_geoip_instance = Mock()
+        mock_geoip_instance.get = Mock()
+        mock_geoip_client.return_value = mock_geoip_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get = Mock()
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = IPInfo()
+        result = ipinfo[TEST_IP_ADDRESS_1]
+
+        # 検証
+        assert result == TEST_IPDATA.to_dict()
+        mock_mmdb_instance.get_many.assert_called_once_with([TEST_IP_ADDRESS_1])
+        mock_redis_instance.get.assert_not_called()
+        mock_geoip_instance.get.assert_not_called()
+
+    @patch.dict(os.environ, {RESOLVERS_ENV: "memory,mmdb,redis"})
+    @patch("ipinfo_geoip.ipinfo.RedisClient")
+    @patch("ipinfo_geoip.ipinfo.GeoIPClient")
+    @patch("ipinfo_geoip.ipinfo.MMDBClient")
+    def test_missing_offline(self, mock_mmdb_client: Mock, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """GeoLite2データベースファイルのみを使用する__missing__メソッドテスト."""
+        # モック設定
+        mock_mmdb_instance = Mock()
+        mock_mmdb_instance.get_many = Mock(return_value={TEST_IP_ADDRESS_1: None})
+        mock_mmdb_client.return_value = mock_mmdb_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get = Mock(return_value=None)
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = IPInfo()
+        result = ipinfo[TEST_IP_ADDRESS_1]
+
+        # 検証
+        assert result is None
+        mock_geoip_client.assert_not_called()
+        mock_redis_instance.set_not_found.assert_called_once_with(TEST_IP_ADDRESS_1)
+
+    @patch.dict(os.environ, {RESOLVERS_ENV: "memory,mmdb,redis"})
+    @patch("ipinfo_geoip.ipinfo.RedisClient")
+    @patch("ipinfo_geoip.ipinfo.GeoIPClient")
+    @patch("ipinfo_geoip.ipinfo.MMDBClient")
+    def test_lookup_many_offline(self, mock_mmdb_client: Mock, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """GeoLite2データベースファイルのみを使用するlookup_manyメソッドテスト."""
+        # モック設定
+        mock_mmdb_instance = Mock()
+        mock_mmdb_instance.get_many = Mock(return_value={TEST_IP_ADDRESS_1: TEST_IPDATA, TEST_IP_ADDRESS_2: None})
+        mock_mmdb_client.return_value = mock_mmdb_instance
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get_many = Mock(return_value={TEST_IP_ADDRESS_2: None})
+        mock_redis_client.return_value = mock_redis_instance
+
+        # テスト実行
+        ipinfo = IPInfo()
+        result = ipinfo.lookup_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])
+
+        # 検証
+        assert result == {TEST_IP_ADDRESS_1: TEST_IPDATA.to_dict(), TEST_IP_ADDRESS_2: None}
+        mock_geoip_client.assert_not_called()
+        mock_redis_instance.get_many.assert_called_once_with([TEST_IP_ADDRESS_2])
+        mock_redis_instance.set_many.assert_called_once_with({}, [TEST_IP_ADDRESS_2])
+
+    @patch.dict(os.environ, {RESOLVERS_ENV: "memory,unknown"})
+    @patch("ipinfo_geoip.ipinfo.RedisClient")
+    @patch("ipinfo_geoip.ipinfo.GeoIPClient")
+    def test_init_with_invalid_backends(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """取得元が不正な場合の初期化テスト."""
+        with pytest.raises(ConfigurationError):
+            _ = IPInfo()
+
+        # 検証
+        mock_geoip_client.assert_not_called()
+        mock_redis_client.assert_not_called()
+
+    @patch("ipinfo_geoip.ipinfo.RedisClient")
+    @patch("ipinfo_geoip.ipinfo.GeoIPClient")
+    def test_init_with_resolvers(self, mock_geoip_client: Mock, mock_redis_client: Mock) -> None:
+        """検索階層を指定した初期化のテスト."""
+        # モック設定
+        resolver = Mock()
+        resolver.get.return_value = TEST_IPDATA
+
+        # テスト実行
+        ipinfo = IPInfo([resolver])
+        result = ipinfo[TEST_IP_ADDRESS_1]
+
+        # 検証
+        assert result == TEST_IPDATA.to_dict()
+        resolver.get.assert_called_once_with(TEST_IP_ADDRESS_1)
+        mock_geoip_client.assert_not_called()
+        mock_redis_client.assert_not_called()
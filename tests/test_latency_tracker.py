@@ -0,0 +1,39 @@
+"""LatencyTrackerクラスのテスト."""
+
+import pytest
+
+from ipinfo_geoip.latency_tracker import LatencyTracker
+from tests.conftest import TEST_GEOIP_HEDGE_DELAY
+
+TEST_SAMPLES: int = 100
+
+
+class TestLatencyTracker:
+    """LatencyTrackerクラスのテストクラス."""
+
+    def test_percentile_with_few_samples(self) -> None:
+        """記録がmin_samplesに満たない場合にdefaultを返すテスト."""
+        tracker = LatencyTracker(min_samples=TEST_SAMPLES)
+        for i in range(TEST_SAMPLES - 1):
+            tracker.record(float(i))
+
+        assert tracker.percentile(TEST_GEOIP_HEDGE_DELAY) == TEST_GEOIP_HEDGE_DELAY
+
+    def test_percentile(self) -> None:
+        """記録した所要時間のパーセンタイルを返すテスト."""
+        tracker = LatencyTracker(min_samples=TEST_SAMPLES)
+        for i in reversed(range(TEST_SAMPLES)):
+            tracker.record(float(i))
+
+        assert tracker.percentile(TEST_GEOIP_HEDGE_DELAY) == pytest.approx(94.0)
+        assert tracker.percentile(TEST_GEOIP_HEDGE_DELAY, 0.5) == pytest.approx(49.0)
+
+    def test_record_window(self) -> None:
+        """windowを超えた古い記録を使用しないテスト."""
+        tracker = LatencyTracker(window=TEST_SAMPLES, min_samples=1)
+        for _ in range(TEST_SAMPLES):
+            tracker.record(1.0)
+        for _ in range(TEST_SAMPLES):
+            tracker.record(0.1)
+
+        assert tracker.percentile(TEST_GEOIP_HEDGE_DELAY) == pytest.approx(0.1)
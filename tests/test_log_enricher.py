@@ -0,0 +1,211 @@
+"""LogEnricherクラスのテスト."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from ipinfo_geoip.constants import (
+    GEOIP_MAX_WORKERS,
+    LOG_FORMAT_COMBINED,
+    LOG_FORMAT_COMMON,
+    LOG_FORMAT_HAPROXY,
+    LOG_OUTPUT_COLUMNS,
+)
+from ipinfo_geoip.exceptions import RateLimitError, ValidationError
+from ipinfo_geoip.ipinfo import IPInfo
+from ipinfo_geoip.log_enricher import LogEnricher
+from tests.conftest import (
+    TEST_AS_NUMBER_STR,
+    TEST_COUNTRY_CODE,
+    TEST_IP_ADDRESS_1,
+    TEST_IP_ADDRESS_2,
+    TEST_IP_NETWORK,
+    TEST_IPDATA,
+    TEST_ORGANIZATION,
+)
+
+TEST_RESULT: dict[str, str] = TEST_IPDATA.to_dict()
+TEST_FIELDS: str = f'{TEST_IP_NETWORK} {TEST_AS_NUMBER_STR} {TEST_COUNTRY_CODE} "{TEST_ORGANIZATION}"'
+
+
+def make_line(ip_address: str) -> str:
+    """combined形式のログの行を作成する."""
+    return f'{ip_address} - - [17/Oct/2026:10:00:00 +0900] "GET / HTTP/1.1" 200 512 "-" "curl/8.0"\n'
+
+
+def make_ipinfo(results: dict[str, dict[str, str] | None]) -> Mock:
+    """指定されたIPアドレス情報を返すIPInfoのモックを作成する."""
+    ipinfo = Mock(spec=IPInfo)
+    ipinfo.lookup_many.side_effect = lambda ip_addresses, _: {ip_address: results[ip_address] for ip_address in ip_addresses}
+    return ipinfo
+
+
+class TestLogEnricher:
+    """LogEnricherクラスのテストクラス."""
+
+    def test_enrich_combined(self) -> None:
+        """combined形式の行の末尾にIPアドレス情報を付加するテスト."""
+        # モック設定
+        ipinfo = make_ipinfo({TEST_IP_ADDRESS_1: TEST_RESULT, TEST_IP_ADDRESS_2: None})
+        enricher = LogEnricher(ipinfo)
+        lines = [make_line(TEST_IP_ADDRESS_1), make_line(TEST_IP_ADDRESS_2), make_line(TEST_IP_ADDRESS_1)]
+
+        # テスト実行
+        output = "".join(enricher.enrich(lines))
+
+        # 検証
+        assert output.splitlines() == [
+            f"{lines[0].rstrip()} {TEST_FIELDS}",
+            f"{lines[1].rstrip()} - - - -",
+            f"{lines[2].rstrip()} {TEST_FIELDS}",
+        ]
+        ipinfo.lookup_many.assert_called_once_with([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2], GEOIP_MAX_WORKERS)
+
+    def test_enrich_dedupes_across_windows(self) -> None:
+        """直近に検索したIPアドレスを後続のウィンドウで検索しないテスト."""
+        # モック設定
+        ipinfo = make_ipinfo({TEST_IP_ADDRESS_1: TEST_RESULT, TEST_IP_ADDRESS_2: None})
+        enricher = LogEnricher(ipinfo)
+        lines = [make_line(TEST_IP_ADDRESS_1), make_line(TEST_IP_ADDRESS_1), make_line(TEST_IP_ADDRESS_2)]
+
+        # テスト実行
+        chunks = list(enricher.enrich(lines, batch_size=1))
+
+        # 検証
+        assert len(chunks) == 3  # noqa: PLR2004
+        assert [call.args[0] for call in ipinfo.lookup_many.call_args_list] == [[TEST_IP_ADDRESS_1], [TEST_IP_ADDRESS_2]]
+
+    def test_enrich_evicts_oldest(self) -> None:
+        """保持する検索結果がdedupe_sizeを超えた場合に古いものから検索し直すテスト."""
+        # モック設定
+        ipinfo = make_ipinfo({TEST_IP_ADDRESS_1: TEST_RESULT, TEST_IP_ADDRESS_2: None})
+        enricher = LogEnricher(ipinfo, dedupe_size=1)
+        lines = [make_line(TEST_IP_ADDRESS_1), make_line(TEST_IP_ADDRESS_2), make_line(TEST_IP_ADDRESS_1)]
+
+        # テスト実行
+        _ = list(enricher.enrich(lines, batch_size=1))
+
+        # 検証
+        assert ipinfo.lookup_many.call_count == 3  # noqa: PLR2004
+
+    def test_enrich_haproxy_columns(self) -> None:
+        """haproxy形式の行からIPアドレスを取り出して列で出力するテスト."""
+        # モック設定
+        ipinfo = make_ipinfo({TEST_IP_ADDRESS_1: TEST_RESULT})
+        enricher = LogEnricher(ipinfo, log_format=LOG_FORMAT_HAPROXY, output=LOG_OUTPUT_COLUMNS)
+        line = f"Oct 17 10:00:00 localhost haproxy[1234]: {TEST_IP_ADDRESS_1}:54321 [17/Oct/2026:10:00:00.000] http-in\n"
+
+        # テスト実行
+        output = "".join(enricher.enrich([line]))
+
+        # 検証
+        assert (
+            output
+            == f"{TEST_IP_ADDRESS_1}\t{TEST_IP_NETWORK}\t{TEST_AS_NUMBER_STR}\t{TEST_COUNTRY_CODE}\t{TEST_ORGANIZATION}\n"
+        )
+
+    def test_enrich_custom_pattern(self) -> None:
+        """ipグループを含む正規表現でIPアドレスを取り出すテスト."""
+        # モック設定
+        ipinfo = make_ipinfo({TEST_IP_ADDRESS_1: TEST_RESULT})
+        enricher = LogEnricher(ipinfo, log_format=r"client=(?P<ip>\S+)", output=LOG_OUTPUT_COLUMNS)
+
+        # テスト実行
+        output = "".join(enricher.enrich([f"level=info client={TEST_IP_ADDRESS_1}\n"]))
+
+        # 検証
+        assert output.startswith(f"{TEST_IP_ADDRESS_1}\t{TEST_IP_NETWORK}\t")
+
+    def test_enrich_unparsable_lines(self) -> None:
+        """IPアドレスを取り出せない行を検索せずに出力するテスト."""
+        # モック設定
+        ipinfo = make_ipinfo({})
+        enricher = LogEnricher(ipinfo, log_format=LOG_FORMAT_HAPROXY)
+
+        # テスト実行
+        output = "".join(enricher.enrich(["garbage\n", make_line("not-an-ip")]))
+
+        # 検証
+        assert output.splitlines() == ["garbage - - - -", f"{make_line('not-an-ip').rstrip()} - - - -"]
+        ipinfo.lookup_many.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("log_format", "line"),
+        [
+            (LOG_FORMAT_COMBINED, f"{TEST_IP_ADDRESS_1} GET / HTTP/1.1\n"),
+            (LOG_FORMAT_COMBINED, f'{TEST_IP_ADDRESS_1} - - [17/Oct/2026:10:00:00 +0900] "GET / HTTP/1.1" 200 512\n'),
+            (LOG_FORMAT_COMMON, f"{TEST_IP_ADDRESS_1} - - 17/Oct/2026 GET / 200 512\n"),
+        ],
+    )
+    def test_enrich_malformed_lines(self, log_format: str, line: str) -> None:
+        """ログ形式に一致しない行からIPアドレスを取り出さないテスト."""
+        # モック設定
+        ipinfo = make_ipinfo({})
+        enricher = LogEnricher(ipinfo, log_format=log_format)
+
+        # テスト実行
+        output = "".join(enricher.enrich([line]))
+
+        # 検証
+        assert output == f"{line.rstrip()} - - - -\n"
+        ipinfo.lookup_many.assert_not_called()
+
+    def test_enrich_common(self) -> None:
+        """common形式の行とcombined形式の行からIPアドレスを取り出すテスト."""
+        # モック設定
+        ipinfo = make_ipinfo({TEST_IP_ADDRESS_1: TEST_RESULT})
+        enricher = LogEnricher(ipinfo, log_format=LOG_FORMAT_COMMON)
+        line = f'{TEST_IP_ADDRESS_1} - - [17/Oct/2026:10:00:00 +0900] "GET /?q=\\"x\\" HTTP/1.1" 200 -\n'
+
+        # テスト実行
+        output = "".join(enricher.enrich([line, make_line(TEST_IP_ADDRESS_1)]))
+
+        # 検証
+        assert output.splitlines() == [
+            f"{line.rstrip()} {TEST_FIELDS}",
+            f"{make_line(TEST_IP_ADDRESS_1).rstrip()} {TEST_FIELDS}",
+        ]
+
+    def test_enrich_escapes_organization(self) -> None:
+        """組織名のバックスラッシュ, ダブルクォート, タブ, 改行をエスケープするテスト."""
+        # モック設定
+        result = {**TEST_RESULT, "organization": 'A\\"B\tC\nD'}
+        line_enricher = LogEnricher(make_ipinfo({TEST_IP_ADDRESS_1: result}))
+        columns_enricher = LogEnricher(make_ipinfo({TEST_IP_ADDRESS_1: result}), output=LOG_OUTPUT_COLUMNS)
+
+        # テスト実行
+        line_output = "".join(line_enricher.enrich([make_line(TEST_IP_ADDRESS_1)]))
+        columns_output = "".join(columns_enricher.enrich([make_line(TEST_IP_ADDRESS_1)]))
+
+        # 検証
+        assert line_output.endswith(' "A\\\\\\"B\tC\\nD"\n')
+        assert (
+            columns_output
+            == f'{TEST_IP_ADDRESS_1}\t{TEST_IP_NETWORK}\t{TEST_AS_NUMBER_STR}\t{TEST_COUNTRY_CODE}\tA\\\\"B\\tC\\nD\n'
+        )
+
+    def test_enrich_with_rate_limit(self) -> None:
+        """問い合わせ数の上限により検索できなかったIPアドレスを保持しないテスト."""
+        # モック設定
+        ipinfo = Mock(spec=IPInfo)
+        ipinfo.lookup_many.side_effect = RateLimitError(
+            "GeoIP query quota exhausted",
+            {"results": {TEST_IP_ADDRESS_1: TEST_RESULT}, "ip_addresses": [TEST_IP_ADDRESS_2]},
+        )
+        enricher = LogEnricher(ipinfo, output=LOG_OUTPUT_COLUMNS)
+
+        # テスト実行
+        output = "".join(enricher.enrich([make_line(TEST_IP_ADDRESS_1), make_line(TEST_IP_ADDRESS_2)], batch_size=1))
+
+        # 検証
+        assert output.splitlines()[1] == f"{TEST_IP_ADDRESS_2}\t-\t-\t-\t-"
+        assert ipinfo.lookup_many.call_count == 2  # noqa: PLR2004
+
+    @pytest.mark.parametrize(
+        ("log_format", "output"),
+        [("(", "line"), (r"^\S+", "line"), ("combined", "json")],
+    )
+    def test_init_with_invalid_arguments(self, log_format: str, output: str) -> None:
+        """ログ形式または出力形式が不正な場合のテスト."""
+        with pytest.raises(ValidationError):
+            LogEnricher(Mock(spec=IPInfo), log_format=log_format, output=output)
@@ -0,0 +1,118 @@
+"""コマンドラインのエントリポイントのテスト."""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ipinfo_geoip.__main__ import main
+from ipinfo_geoip.constants import GEOIP_MAX_WORKERS
+from ipinfo_geoip.exceptions import ConfigurationError, ValidationError
+from tests.conftest import TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2
+
+
+class TestMain:
+    """main関数のテストクラス."""
+
+    @patch("ipinfo_geoip.__main__.CacheWarmer")
+    def test_warm(self, mock_warmer: Mock, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """ファイルから読み込んだIPアドレスをキャッシュに読み込むテスト."""
+        # モック設定
+        path = tmp_path / "ip_addresses.txt"
+        path.write_text(f"# comment\n{TEST_IP_ADDRESS_1}\n\n{TEST_IP_ADDRESS_2} 10\n", encoding="utf-8")
+        ip_addresses: list[str] = []
+
+        def warm(addresses: list[str], budget: int | None, max_workers: int) -> dict[str, int]:
+            ip_addresses.extend(addresses)
+            return {"requested": len(ip_addresses), "budget": budget or 0, "max_workers": max_workers}
+
+        mock_warmer.return_value.warm.side_effect = warm
+
+        # テスト実行
+        code = main(["warm", str(path), "--budget", "5", "--max-workers", "2"])
+
+        # 検証
+        assert code == 0
+        assert ip_addresses == [TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2]
+        assert capsys.readouterr().out == "requested: 2\nbudget: 5\nmax_workers: 2\n"
+
+    @patch("ipinfo_geoip.__main__.sys.stdin")
+    @patch("ipinfo_geoip.__main__.CacheWarmer")
+    def test_warm_from_stdin(self, mock_warmer: Mock, mock_stdin: Mock) -> None:
+        """ファイルを指定しない場合は標準入力から読み込むテスト."""
+        # モック設定
+        mock_stdin.__iter__ = Mock(return_value=iter([f"{TEST_IP_ADDRESS_1}\n"]))
+        mock_warmer.return_value.warm.side_effect = lambda addresses, *_: {"requested": len(list(addresses))}
+
+        # テスト実行
+        code = main(["warm"])
+
+        # 検証
+        assert code == 0
+        mock_warmer.return_value.warm.assert_called_once()
+
+    @patch("ipinfo_geoip.__main__.CacheWarmer")
+    def test_warm_with_configuration_error(self, mock_warmer: Mock, capsys: pytest.CaptureFixture[str]) -> None:
+        """設定が不正な場合に終了コード1を返すテスト."""
+        # モック設定
+        mock_warmer.side_effect = ConfigurationError("Redis configuration error")
+
+        # テスト実行
+        code = main(["warm"])
+
+        # 検証
+        assert code == 1
+        assert "Redis configuration error" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("budget", ["0", "invalid"])
+    def test_warm_with_invalid_budget(self, budget: str) -> None:
+        """問い合わせ数の上限が不正な場合のテスト."""
+        with pytest.raises(SystemExit):
+            main(["warm", "--budget", budget])
+
+    @patch("ipinfo_geoip.__main__.sys.stdin")
+    @patch("ipinfo_geoip.__main__.Enricher")
+    def test_enrich(self, mock_enricher: Mock, mock_stdin: Mock, capsys: pytest.CaptureFixture[str]) -> None:
+        """標準入力の各行にIPアドレス情報を付加して出力するテスト."""
+        # モック設定
+        mock_enricher.return_value.enrich.return_value = iter(['{"ip_address": "192.0.2.1"}\n'])
+
+        # テスト実行
+        code = main(["enrich", "--field", "client_ip", "--batch-size", "10", "--windows", "3"])
+
+        # 検証
+        assert code == 0
+        assert capsys.readouterr().out == '{"ip_address": "192.0.2.1"}\n'
+        mock_enricher.assert_called_once_with(field="client_ip", key="ipinfo")
+        mock_enricher.return_value.enrich.assert_called_once_with(mock_stdin, 10, GEOIP_MAX_WORKERS, 3)
+
+    @patch("ipinfo_geoip.__main__.LogEnricher")
+    def test_logs(self, mock_enricher: Mock, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """アクセスログの各行にIPアドレス情報を付加して出力するテスト."""
+        # モック設定
+        path = tmp_path / "access.log"
+        path.write_text(f"{TEST_IP_ADDRESS_1} - - [17/Oct/2026:10:00:00 +0900]\n", encoding="utf-8")
+        lines: list[str] = []
+
+        def enrich(source: list[str], batch_size: int, max_workers: int) -> list[str]:
+            lines.extend(source)
+            return [f"{batch_size} {max_workers}\n"]
+
+        mock_enricher.return_value.enrich.side_effect = enrich
+
+        # テスト実行
+        code = main(["logs", str(path), "--format", "common", "--output", "columns", "--batch-size", "10"])
+
+        # 検証
+        assert code == 0
+        assert lines == [f"{TEST_IP_ADDRESS_1} - - [17/Oct/2026:10:00:00 +0900]\n"]
+        assert capsys.readouterr().out == f"10 {GEOIP_MAX_WORKERS}\n"
+        mock_enricher.assert_called_once_with(log_format="common", output="columns")
+
+    def test_logs_with_invalid_format(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """ログ形式が不正な場合に終了コード1を返すテスト."""
+        with patch("ipinfo_geoip.__main__.LogEnricher.__init__", side_effect=ValidationError("Invalid log format: (")):
+            code = main(["logs", "--format", "("])
+
+        assert code == 1
+        assert "Invalid log format" in capsys.readouterr().err
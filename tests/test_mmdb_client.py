@@ -0,0 +1,328 @@
+"""MMDBClientクラスのテスト."""
+
+import ipaddress
+from typing import NoReturn
+from unittest.mock import MagicMock, Mock, patch
+
+import geoip2.database
+import geoip2.errors
+import geoip2.models
+import maxminddb
+import pytest
+
+from ipinfo_geoip.exceptions import AddressNotFoundError, ConfigurationError, ValidationError
+from ipinfo_geoip.ipdata import IPData
+from ipinfo_geoip.mmdb_client import MMDBClient
+from tests.conftest import (
+    TEST_AS_NUMBER_INT,
+    TEST_AS_NUMBER_STR,
+    TEST_COUNTRY_CODE,
+    TEST_IP_ADDRESS_1,
+    TEST_IP_ADDRESS_2,
+    TEST_IP_NETWORK,
+    TEST_IPADDRESS_INVALID_,
+    TEST_MMDB_ASN_PATH,
+    TEST_MMDB_COUNTRY_PATH,
+    TEST_ORGANIZATION,
+)
+
+
+def make_reader(database_type: str) -> Mock:
+    """指定された種類のデータベースのReaderのモックを作成する."""
+    reader = Mock()
+    reader.metadata.return_value.database_type = database_type
+    return reader
+
+
+def make_asn(ip_address: str) -> geoip2.models.ASN:
+    """GeoLite2-ASNデータベースの検索結果を作成する."""
+    return geoip2.models.ASN(
+        ip_address,
+        autonomous_system_number=TEST_AS_NUMBER_INT,
+        autonomous_system_organization=TEST_ORGANIZATION,
+        prefix_len=16,
+    )
+
+
+def make_country(ip_address: str) -> geoip2.models.Country:
+    """GeoLite2-Countryデータベースの検索結果を作成する."""
+    return geoip2.models.Country(["en"], ip_address=ip_address, prefix_len=24, country={"iso_code": TEST_COUNTRY_CODE})
+
+
+def make_database(*records: tuple[str, dict[str, object]]) -> MagicMock:
+    """ネットワークとレコードを順に返すmaxminddbのReaderのモックを作成する."""
+    reader = MagicMock()
+    reader.__enter__.return_value = reader
+    reader.__iter__.return_value = iter([(ipaddress.ip_network(network), record) for network, record in records])
+    return reader
+
+
+def address_not_found(ip_address: str) -> NoReturn:
+    """IPアドレスが見つからない場合の例外を送出する."""
+    msg = f"The address {ip_address} is not in the database."
+    raise geoip2.errors.AddressNotFoundError(msg)
+
+
+class TestMMDBClient:
+    """MMDBClientクラスのテストクラス."""
+
+    @pytest.fixture
+    def mock_config(self) -> Mock:
+        """MMDBConfigのモック."""
+        mock_config = Mock()
+        mock_config.asn_path = TEST_MMDB_ASN_PATH
+        mock_config.country_path = TEST_MMDB_COUNTRY_PATH
+        return mock_config
+
+    @patch("ipinfo_geoip.mmdb_client.geoip2.database.Reader")
+    @patch("ipinfo_geoip.mmdb_client.MMDBConfig.from_env")
+    def test_init(self, mock_from_env: Mock, mock_reader: Mock, mock_config: Mock) -> None:
+        """初期化のテスト."""
+        # モック設定
+        mock_from_env.return_value = mock_config
+        mock_reader.side_effect = [make_reader("GeoLite2-ASN"), make_reader("GeoLite2-City")]
+
+        # テスト実行
+        client = MMDBClient()
+
+        # 検証
+        assert isinstance(client, MMDBClient)
+        mock_reader.assert_any_call(TEST_MMDB_ASN_PATH, mode=geoip2.database.MODE_MMAP)
+        mock_reader.assert_any_call(TEST_MMDB_COUNTRY_PATH, mode=geoip2.database.MODE_MMAP)
+
+    @patch("ipinfo_geoip.mmdb_client.MMDBConfig.from_env")
+    def test_init_with_configuration_error(self, mock_from_env: Mock) -> None:
+        """設定エラーでの初期化テスト."""
+        # モック設定
+        mock_from_env.side_effect = ValidationError("Missing environment variables")
+
+        # テスト実行
+        with pytest.raises(ConfigurationError):
+            _ = MMDBClient()
+
+    @patch("ipinfo_geoip.mmdb_client.geoip2.database.Reader")
+    @patch("ipinfo_geoip.mmdb_client.MMDBConfig.from_env")
+    def test_init_with_missing_file(self, mock_from_env: Mock, mock_reader: Mock, mock_config: Mock) -> None:
+        """データベースファイルが存在しない場合の初期化テスト."""
+        # モック設定
+        mock_from_env.return_value = mock_config
+        mock_reader.side_effect = FileNotFoundError(TEST_MMDB_ASN_PATH)
+
+        # テスト実行
+        with pytest.raises(ConfigurationError):
+            _ = MMDBClient()
+
+    @patch("ipinfo_geoip.mmdb_client.geoip2.database.Reader")
+    @patch("ipinfo_geoip.mmdb_client.MMDBConfig.from_env")
+    def test_init_with_wrong_database_type(self, mock_from_env: Mock, mock_reader: Mock, mock_config: Mock) -> None:
+        """データベースの種類が異なる場合の初期化テスト."""
+        # モック設定
+        mock_from_env.return_value = mock_config
+        wrong_reader = make_reader("GeoLite2-Country")
+        mock_reader.side_effect = [wrong_reader]
+
+        # テスト実行
+        with pytest.raises(ConfigurationError):
+            _ = MMDBClient()
+
+        # 検証
+        wrong_reader.close.assert_called_once()
+
+    @patch("ipinfo_geoip.mmdb_client.geoip2.database.Reader")
+    @patch("ipinfo_geoip.mmdb_client.MMDBConfig.from_env")
+    def test_get_success(self, mock_from_env: Mock, mock_reader: Mock, mock_config: Mock) -> None:
+        """IPアドレス情報を取得するgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = mock_config
+        asn_reader = make_reader("GeoLite2-ASN")
+        asn_reader.asn.side_effect = make_asn
+        country_reader = make_reader("GeoLite2-Country")
+        country_reader.country.side_effect = make_country
+        mock_reader.side_effect = [asn_reader, country_reader]
+
+        # テスト実行
+        client = MMDBClient()
+        result = client.get(TEST_IP_ADDRESS_1)
+
+        # 検証
+        assert result == IPData(TEST_IP_ADDRESS_1, TEST_IP_NETWORK, TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, TEST_ORGANIZATION)
+        assert not hasattr(client, "data")
+        country_reader.city.assert_not_called()
+
+    @patch("ipinfo_geoip.mmdb_client.geoip2.database.Reader")
+    @patch("ipinfo_geoip.mmdb_client.MMDBConfig.from_env")
+    def test_get_with_city_database(self, mock_from_env: Mock, mock_reader: Mock, mock_config: Mock) -> None:
+        """GeoLite2-Cityデータベースを使用するgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = mock_config
+        asn_reader = make_reader("GeoLite2-ASN")
+        asn_reader.asn.side_effect = make_asn
+        city_reader = make_reader("GeoLite2-City")
+        city_reader.city.side_effect = make_country
+        mock_reader.side_effect = [asn_reader, city_reader]
+
+        # テスト実行
+        client = MMDBClient()
+        result = client.get(TEST_IP_ADDRESS_1)
+
+        # 検証
+        assert result is not None
+        assert result.country == TEST_COUNTRY_CODE
+        city_reader.city.assert_called_once_with(TEST_IP_ADDRESS_1)
+
+    @patch("ipinfo_geoip.mmdb_client.geoip2.database.Reader")
+    @patch("ipinfo_geoip.mmdb_client.MMDBConfig.from_env")
+    def test_get_with_partial_data(self, mock_from_env: Mock, mock_reader: Mock, mock_config: Mock) -> None:
+        """一方のデータベースにのみ存在する場合のgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = mock_config
+        asn_reader = make_reader("GeoLite2-ASN")
+        asn_reader.asn.side_effect = address_not_found
+        country_reader = make_reader("GeoLite2-Country")
+        country_reader.country.side_effect = make_country
+        mock_reader.side_effect = [asn_reader, country_reader]
+
+        # テスト実行
+        client = MMDBClient()
+        result = client.get(TEST_IP_ADDRESS_1)
+
+        # 検証
+        assert result is None
+
+    @patch("ipinfo_geoip.mmdb_client.geoip2.database.Reader")
+    @patch("ipinfo_geoip.mmdb_client.MMDBConfig.from_env")
+    def test_get_with_address_not_found(self, mock_from_env: Mock, mock_reader: Mock, mock_config: Mock) -> None:
+        """どちらのデータベースにも存在しない場合のgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = mock_config
+        asn_reader = make_reader("GeoLite2-ASN")
+        asn_reader.asn.side_effect = address_not_found
+        country_reader = make_reader("GeoLite2-Country")
+        country_reader.country.side_effect = address_not_found
+        mock_reader.side_effect = [asn_reader, country_reader]
+
+        # テスト実行
+        client = MMDBClient()
+
+        with pytest.raises(AddressNotFoundError):
+            _ = client.get(TEST_IP_ADDRESS_1)
+
+    @patch("ipinfo_geoip.mmdb_client.geoip2.database.Reader")
+    @patch("ipinfo_geoip.mmdb_client.MMDBConfig.from_env")
+    def test_get_with_invalid_ip_value(self, mock_from_env: Mock, mock_reader: Mock, mock_config: Mock) -> None:
+        """IPアドレスが無効な場合のgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = mock_config
+        asn_reader = make_reader("GeoLite2-ASN")
+        mock_reader.side_effect = [asn_reader, make_reader("GeoLite2-Country")]
+
+        # テスト実行
+        client = MMDBClient()
+
+        with pytest.raises(ValidationError):
+            _ = client.get(TEST_IPADDRESS_INVALID_)
+
+        # 検証
+        asn_reader.asn.assert_not_called()
+
+    @patch("ipinfo_geoip.mmdb_client.geoip2.database.Reader")
+    @patch("ipinfo_geoip.mmdb_client.MMDBConfig.from_env")
+    def test_get_many(self, mock_from_env: Mock, mock_reader: Mock, mock_config: Mock) -> None:
+        """複数のIPアドレスを取得するget_manyメソッドテスト."""
+
+        # モック設定
+        def asn(ip_address: str) -> geoip2.models.ASN:
+            return address_not_found(ip_address) if ip_address == TEST_IP_ADDRESS_2 else make_asn(ip_address)
+
+        def country(ip_address: str) -> geoip2.models.Country:
+            return address_not_found(ip_address) if ip_address == TEST_IP_ADDRESS_2 else make_country(ip_address)
+
+        mock_from_env.return_value = mock_config
+        asn_reader = make_reader("GeoLite2-ASN")
+        asn_reader.asn.side_effect = asn
+        country_reader = make_reader("GeoLite2-Country")
+        country_reader.country.side_effect = country
+        mock_reader.side_effect = [asn_reader, country_reader]
+
+        # テスト実行
+        client = MMDBClient()
+        result = client.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2, TEST_IP_ADDRESS_1])
+
+        # 検証
+        assert list(result) == [TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2]
+        assert isinstance(result[TEST_IP_ADDRESS_1], IPData)
+        assert result[TEST_IP_ADDRESS_2] is None
+        assert asn_reader.asn.call_count == 2  # noqa: PLR2004
+
+    @patch("ipinfo_geoip.mmdb_client.geoip2.database.Reader")
+    @patch("ipinfo_geoip.mmdb_client.MMDBConfig.from_env")
+    def test_close(self, mock_from_env: Mock, mock_reader: Mock, mock_config: Mock) -> None:
+        """closeメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = mock_config
+        asn_reader = make_reader("GeoLite2-ASN")
+        country_reader = make_reader("GeoLite2-Country")
+        mock_reader.side_effect = [asn_reader, country_reader]
+
+        # テスト実行
+        client = MMDBClient()
+        client.close()
+
+        # 検証
+        asn_reader.close.assert_called_once()
+        country_reader.close.assert_called_once()
+
+    @patch("ipinfo_geoip.mmdb_client.maxminddb.open_database")
+    @patch("ipinfo_geoip.mmdb_client.geoip2.database.Reader")
+    @patch("ipinfo_geoip.mmdb_client.MMDBConfig.from_env")
+    def test_networks(self, mock_from_env: Mock, mock_reader: Mock, mock_open_database: Mock, mock_config: Mock) -> None:
+        """両方のデータベースのネットワークが重なる部分をより狭い方のネットワークとして取得するnetworksメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = mock_config
+        mock_reader.side_effect = [make_reader("GeoLite2-ASN"), make_reader("GeoLite2-Country")]
+        asn = {"autonomous_system_number": TEST_AS_NUMBER_INT, "autonomous_system_organization": TEST_ORGANIZATION}
+        asn_database = make_database(("10.0.0.0/8", asn), ("192.0.2.0/25", asn), ("2001:db8::/32", asn))
+        country_database = make_database(
+            ("10.1.0.0/16", {"country": {"iso_code": "JP"}}),
+            ("10.2.0.0/16", {"continent": {"code": "AS"}}),
+            ("172.16.0.0/12", {"country": {"iso_code": "US"}}),
+            ("192.0.2.0/24", {"country": {"iso_code": TEST_COUNTRY_CODE}}),
+            ("2001:db8::/48", {"country": {"iso_code": "FR"}}),
+        )
+        mock_open_database.side_effect = [asn_database, country_database]
+
+        # テスト実行
+        client = MMDBClient()
+        result = list(client.networks())
+
+        # 検証
+        assert result == [
+            IPData("10.1.0.0", "10.1.0.0/16", TEST_AS_NUMBER_STR, "JP", TEST_ORGANIZATION),
+            IPData("192.0.2.0", "192.0.2.0/25", TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, TEST_ORGANIZATION),
+            IPData("2001:db8::", "2001:db8::/48", TEST_AS_NUMBER_STR, "FR", TEST_ORGANIZATION),
+        ]
+        mock_open_database.assert_any_call(TEST_MMDB_ASN_PATH, maxminddb.MODE_MMAP)
+        mock_open_database.assert_any_call(TEST_MMDB_COUNTRY_PATH, maxminddb.MODE_MMAP)
+        asn_database.__exit__.assert_called_once()
+        country_database.__exit__.assert_called_once()
+
+    @patch("ipinfo_geoip.mmdb_client.maxminddb.open_database")
+    @patch("ipinfo_geoip.mmdb_client.geoip2.database.Reader")
+    @patch("ipinfo_geoip.mmdb_client.MMDBConfig.from_env")
+    def test_networks_with_missing_file(
+        self, mock_from_env: Mock, mock_reader: Mock, mock_open_database: Mock, mock_config: Mock
+    ) -> None:
+        """データベースファイルを開けない場合にnetworksメソッドでConfigurationErrorを送出するテスト."""
+        # モック設定
+        mock_from_env.return_value = mock_config
+        mock_reader.side_effect = [make_reader("GeoLite2-ASN"), make_reader("GeoLite2-Country")]
+        asn_database = make_database()
+        mock_open_database.side_effect = [asn_database, FileNotFoundError(TEST_MMDB_COUNTRY_PATH)]
+
+        # テスト実行
+        client = MMDBClient()
+        with pytest.raises(ConfigurationError):
+            _ = list(client.networks())
+
+        # 検証
+        asn_database.__exit__.assert_called_once()
@@ -0,0 +1,44 @@
+"""MMDBConfigクラスのテスト."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ipinfo_geoip.constants import MMDB_ASN_PATH_ENV, MMDB_COUNTRY_PATH_ENV
+from ipinfo_geoip.exceptions import ValidationError
+from ipinfo_geoip.mmdb_config import MMDBConfig
+from tests.conftest import TEST_MMDB_ASN_PATH, TEST_MMDB_COUNTRY_PATH
+
+
+class TestMMDBConfig:
+    """MMDBConfigクラスのテストクラス."""
+
+    def test_init(self) -> None:
+        """初期化のテスト."""
+        config = MMDBConfig(TEST_MMDB_ASN_PATH, TEST_MMDB_COUNTRY_PATH)
+
+        assert config.asn_path == TEST_MMDB_ASN_PATH
+        assert config.country_path == TEST_MMDB_COUNTRY_PATH
+
+    @patch.dict(
+        os.environ,
+        {
+            MMDB_ASN_PATH_ENV: TEST_MMDB_ASN_PATH,
+            MMDB_COUNTRY_PATH_ENV: TEST_MMDB_COUNTRY_PATH,
+        },
+        clear=True,
+    )
+    def test_from_env(self) -> None:
+        """環境変数からの作成テスト."""
+        config = MMDBConfig.from_env()
+
+        assert config.asn_path == TEST_MMDB_ASN_PATH
+        assert config.country_path == TEST_MMDB_COUNTRY_PATH
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_from_env_missing_environment_variables(self) -> None:
+        """環境変数不足のテスト."""
+        match = f"Missing environment variables: {MMDB_ASN_PATH_ENV}, {MMDB_COUNTRY_PATH_ENV}"
+        with pytest.raises(ValidationError, match=match):
+            _ = MMDBConfig.from_env()
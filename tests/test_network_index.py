@@ -0,0 +1,106 @@
+"""NetworkIndexクラスのテスト."""
+
+import pytest
+
+from ipinfo_geoip.constants import CACHE_MAX_ENTRIES, CACHE_TTL
+from ipinfo_geoip.exceptions import ValidationError
+from ipinfo_geoip.ipdata import IPData
+from ipinfo_geoip.network_index import NetworkIndex
+from tests.conftest import (
+    TEST_AS_NUMBER_STR,
+    TEST_COUNTRY_CODE,
+    TEST_IP_ADDRESS_1,
+    TEST_IP_ADDRESS_2,
+    TEST_IPADDRESS_INVALID_,
+    TEST_IPDATA,
+    TEST_IPDATA_2,
+    TEST_IPDATA_INCOMPLETE,
+    TEST_ORGANIZATION,
+)
+
+
+class TestNetworkIndex:
+    """NetworkIndexクラスのテストクラス."""
+
+    def test_lookup_same_network(self) -> None:
+        """同じネットワークに含まれるIPアドレスの検索テスト."""
+        index = NetworkIndex(CACHE_MAX_ENTRIES, CACHE_TTL)
+        index.insert(TEST_IPDATA)
+
+        assert index.lookup(TEST_IP_ADDRESS_2) == TEST_IPDATA_2
+        assert len(index) == 1
+
+    def test_lookup_other_network(self) -> None:
+        """異なるネットワークのIPアドレスの検索テスト."""
+        index = NetworkIndex(CACHE_MAX_ENTRIES, CACHE_TTL)
+        index.insert(TEST_IPDATA)
+
+        assert index.lookup("198.51.100.1") is None
+        assert index.lookup("2001:db8::1") is None
+
+    def test_lookup_longest_prefix(self) -> None:
+        """最長一致のネットワークを返す検索テスト."""
+        index = NetworkIndex(CACHE_MAX_ENTRIES, CACHE_TTL)
+        index.insert(IPData("192.0.0.1", "192.0.0.0/16", "64500", "JP", "Wide Organization"))
+        index.insert(TEST_IPDATA)
+
+        result = index.lookup(TEST_IP_ADDRESS_1)
+        assert result == TEST_IPDATA
+
+        result = index.lookup("192.0.3.1")
+        assert result is not None
+        assert result.network == "192.0.0.0/16"
+
+    def test_lookup_ipv6(self) -> None:
+        """IPv6ネットワークの検索テスト."""
+        index = NetworkIndex(CACHE_MAX_ENTRIES, CACHE_TTL)
+        index.insert(IPData("2001:db8::1", "2001:db8::/48", TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, TEST_ORGANIZATION))
+
+        result = index.lookup("2001:db8:0:ffff::1")
+        assert result is not None
+        assert result.ip_address == "2001:db8:0:ffff::1"
+        assert result.network == "2001:db8::/48"
+        assert index.lookup("2001:db8:1::1") is None
+
+    def test_insert_incomplete_data(self) -> None:
+        """不完全なIPアドレス情報の登録テスト."""
+        index = NetworkIndex(CACHE_MAX_ENTRIES, CACHE_TTL)
+        index.insert(TEST_IPDATA_INCOMPLETE)
+
+        assert len(index) == 0
+        assert index.lookup(TEST_IP_ADDRESS_1) is None
+
+    def test_lookup_with_invalid_ip_value(self) -> None:
+        """IPアドレスが無効な場合の検索テスト."""
+        index = NetworkIndex(CACHE_MAX_ENTRIES, CACHE_TTL)
+
+        with pytest.raises(ValidationError):
+            _ = index.lookup(TEST_IPADDRESS_INVALID_)
+
+    def test_insert_evicts_oldest_network(self) -> None:
+        """最大ネットワーク数を超えた場合の登録テスト."""
+        index = NetworkIndex(1, CACHE_TTL)
+        index.insert(TEST_IPDATA)
+        index.insert(IPData("198.51.100.1", "198.51.100.0/24", TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, TEST_ORGANIZATION))
+
+        assert len(index) == 1
+        assert index.lookup(TEST_IP_ADDRESS_1) is None
+        assert index.lookup("198.51.100.2") is not None
+
+    def test_networks(self) -> None:
+        """登録済みのネットワークをネットワークアドレスのIPアドレス情報として取得するテスト."""
+        index = NetworkIndex(CACHE_MAX_ENTRIES, CACHE_TTL)
+        index.insert(TEST_IPDATA)
+        index.insert(IPData("2001:db8::1", "2001:db8::/48", TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, TEST_ORGANIZATION))
+
+        assert index.networks() == [
+            IPData("192.0.2.0", "192.0.2.0/24", TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, TEST_ORGANIZATION),
+            IPData("2001:db8::", "2001:db8::/48", TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, TEST_ORGANIZATION),
+        ]
+
+    def test_networks_skips_expired(self) -> None:
+        """有効期限を過ぎたネットワークを取得しないテスト."""
+        index = NetworkIndex(CACHE_MAX_ENTRIES, 0)
+        index.insert(TEST_IPDATA)
+
+        assert index.networks() == []
@@ -0,0 +1,202 @@
+"""NetworkRangesクラスのテスト."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from ipinfo_geoip.constants import CACHE_MAX_ENTRIES, CACHE_TTL
+from ipinfo_geoip.exceptions import ValidationError
+from ipinfo_geoip.ipdata import IPData
+from ipinfo_geoip.network_index import NetworkIndex
+from tests.conftest import TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, TEST_IPDATA, TEST_ORGANIZATION
+
+np = pytest.importorskip("numpy")
+
+from ipinfo_geoip.network_ranges import NetworkRanges, to_ipv4_array, to_ipv6_array  # noqa: E402
+
+
+def make_ipdata(network: str, country: str = TEST_COUNTRY_CODE) -> IPData:
+    """指定されたネットワークのIPアドレス情報を作成する."""
+    ip_address = network.split("/", maxsplit=1)[0]
+    return IPData(ip_address, network, TEST_AS_NUMBER_STR, country, TEST_ORGANIZATION)
+
+
+TEST_NETWORKS: list[IPData] = [
+    make_ipdata("10.0.0.0/8", "US"),
+    make_ipdata("10.1.0.0/16", "JP"),
+    make_ipdata("10.1.2.0/24", "DE"),
+    make_ipdata("2001:db8::/32", "FR"),
+    make_ipdata("2001:db8:1::/48", "GB"),
+]
+
+
+class TestConversion:
+    """IPアドレスの配列への変換のテストクラス."""
+
+    def test_to_ipv4_array(self) -> None:
+        """IPv4アドレスをuint32の配列に変換するテスト."""
+        addresses = to_ipv4_array(["192.0.2.1", "255.255.255.255"])
+
+        assert addresses.dtype == np.uint32
+        assert addresses.tolist() == [0xC0000201, 0xFFFFFFFF]
+
+    def test_to_ipv6_array(self) -> None:
+        """IPv6アドレスを上位, 下位64ビットの2列のuint64の配列に変換するテスト."""
+        addresses = to_ipv6_array(["2001:db8::1", "::"])
+
+        assert addresses.dtype == np.uint64
+        assert addresses.tolist() == [[0x20010DB800000000, 1], [0, 0]]
+
+    def test_to_ipv4_array_from_numpy_array(self) -> None:
+        """NumPyの文字列の配列のIPv4アドレスをuint32の配列に変換するテスト."""
+        addresses = to_ipv4_array(np.array(["0.0.0.1", "10.20.255.9", "1.2.3.4"]))
+
+        assert addresses.dtype == np.uint32
+        assert addresses.tolist() == [1, 0x0A14FF09, 0x01020304]
+
+    def test_to_ipv4_array_empty(self) -> None:
+        """空のIPv4アドレスを空のuint32の配列に変換するテスト."""
+        addresses = to_ipv4_array([])
+
+        assert addresses.dtype == np.uint32
+        assert addresses.tolist() == []
+
+    @pytest.mark.parametrize(
+        "ip_address",
+        [
+            "1.2.3",
+            "1.2.3.4.5",
+            "01.2.3.4",
+            "1..2.3",
+            ".1.2.3",
+            "1.2.3.",
+            "1.2.3.4 ",
+            "1000.1.1.1",
+            "a.b.c.d",
+            "1.2.3.\uff14",
+            "",
+            "1.2.3.4\n5.6.7.8",
+        ],
+    )
+    def test_to_ipv4_array_invalid(self, ip_address: str) -> None:
+        """socket.inet_ptonと同じく不正なIPv4アドレスでValidationErrorを送出するテスト."""
+        with pytest.raises(ValidationError):
+            _ = to_ipv4_array(["192.0.2.1", ip_address, "198.51.100.1"])
+
+    @pytest.mark.parametrize(("ip_address", "convert"), [("256.0.0.1", to_ipv4_array), ("2001:db8::g", to_ipv6_array)])
+    def test_invalid(self, ip_address: str, convert: object) -> None:
+        """不正なIPアドレスでValidationErrorを送出するテスト."""
+        assert callable(convert)
+        with pytest.raises(ValidationError):
+            convert([ip_address])
+
+
+class TestNetworkRanges:
+    """NetworkRangesクラスのテストクラス."""
+
+    def test_match_longest_prefix(self) -> None:
+        """入れ子のネットワークで最長一致のネットワークに一致させるテスト."""
+        # テスト実行
+        ranges = NetworkRanges(TEST_NETWORKS)
+        indices = ranges.match(
+            [
+                "10.0.0.1",
+                "10.1.0.1",
+                "10.1.2.3",
+                "10.1.3.0",
+                "10.255.255.255",
+                "11.0.0.0",
+                "9.255.255.255",
+                "2001:db8::1",
+                "2001:db8:1::1",
+                "2001:db8:2::",
+                "2001:db9::",
+            ]
+        )
+
+        # 検証
+        assert len(ranges) == len(TEST_NETWORKS)
+        assert indices.tolist() == [0, 1, 2, 1, 0, -1, -1, 3, 4, 3, -1]
+
+    def test_match_integer_arrays(self) -> None:
+        """整数の配列のまま一致させるテスト."""
+        # テスト実行
+        ranges = NetworkRanges(TEST_NETWORKS)
+
+        # 検証
+        assert ranges.match_ipv4(np.array([0x0A010203, 0x0B000000], dtype=np.uint32)).tolist() == [2, -1]
+        assert ranges.match_ipv6(np.array([[0x20010DB800010000, 5]], dtype=np.uint64)).tolist() == [4]
+
+    def test_lookup(self) -> None:
+        """一致したネットワークの情報を列ごとの配列として返すテスト."""
+        # テスト実行
+        columns = NetworkRanges([TEST_IPDATA, *TEST_NETWORKS]).lookup(np.array(["10.1.2.3", "192.0.2.9", "203.0.113.1"]))
+
+        # 検証
+        assert columns["found"].tolist() == [True, True, False]
+        assert columns["country"].tolist() == ["DE", TEST_COUNTRY_CODE, ""]
+        assert columns["prefixlen"].tolist() == [24, 24, 0]
+
+    def test_empty(self) -> None:
+        """ネットワークが登録されていない場合に一致しないテスト."""
+        # テスト実行
+        ranges = NetworkRanges([])
+
+        # 検証
+        assert ranges.match(["192.0.2.1", "2001:db8::1"]).tolist() == [-1, -1]
+        assert ranges.match([]).tolist() == []
+
+    def test_duplicate_and_incomplete(self) -> None:
+        """同じネットワークは後のものを登録し, 不完全なIPアドレス情報は登録しないテスト."""
+        # テスト実行
+        ranges = NetworkRanges(
+            [
+                make_ipdata("192.0.2.0/24", "US"),
+                make_ipdata("192.0.2.0/24", "JP"),
+                IPData("198.51.100.1", "198.51.100.0/24", TEST_AS_NUMBER_STR, "", ""),
+            ]
+        )
+
+        # 検証
+        assert len(ranges) == 1
+        assert ranges.lookup(["192.0.2.1", "198.51.100.1"])["country"].tolist() == ["JP", ""]
+
+    def test_from_index(self) -> None:
+        """取得済みネットワークのインデックスから作成するテスト."""
+        # モック設定
+        index = NetworkIndex(CACHE_MAX_ENTRIES, CACHE_TTL)
+        for ip_data in TEST_NETWORKS:
+            index.insert(ip_data)
+
+        # テスト実行
+        ranges = NetworkRanges.from_index(index)
+
+        # 検証
+        assert len(ranges) == len(TEST_NETWORKS)
+        assert ranges.lookup(["10.1.2.3", "2001:db8:1::1"])["country"].tolist() == ["DE", "GB"]
+
+    def test_from_redis(self) -> None:
+        """Redisのネットワーク範囲キャッシュから作成するテスト."""
+        # モック設定
+        client = Mock()
+        client.networks.return_value = TEST_NETWORKS
+
+        # テスト実行
+        ranges = NetworkRanges.from_redis(client)
+
+        # 検証
+        assert len(ranges) == len(TEST_NETWORKS)
+        client.networks.assert_called_once_with()
+
+    def test_from_mmdb(self) -> None:
+        """GeoLite2データベースファイルから作成するテスト."""
+        # モック設定
+        client = Mock()
+        client.networks.return_value = iter(TEST_NETWORKS)
+
+        # テスト実行
+        ranges = NetworkRanges.from_mmdb(client)
+
+        # 検証
+        assert len(ranges) == len(TEST_NETWORKS)
+        assert ranges.match(["10.1.3.0", "2001:db8::1"]).tolist() == [1, 3]
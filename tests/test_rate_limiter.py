@@ -0,0 +1,248 @@
+"""RateLimiterクラスのテスト."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+import redis
+
+from ipinfo_geoip.circuit_breaker import CircuitBreaker
+from ipinfo_geoip.constants import GEOIP_QUOTA_TTL, GEOIP_RATE_LIMIT_KEY_PREFIX
+from ipinfo_geoip.exceptions import RateLimitError
+from ipinfo_geoip.geoip_config import GeoIPConfig
+from ipinfo_geoip.rate_limiter import RateLimiter, RedisRateCounter, _get_rate_limiter
+from tests.conftest import (
+    TEST_BREAKER_RESET_TIMEOUT,
+    TEST_BREAKER_THRESHOLD,
+    TEST_GEOIP_ACCOUNT_ID_STR,
+    TEST_GEOIP_HOST,
+    TEST_GEOIP_LICENSE_KEY,
+    TEST_QUOTA_RESERVE,
+    TEST_RATE_LIMIT,
+    TEST_RATE_LIMIT_BURST,
+    TEST_RATE_LIMIT_MAX_WAIT,
+)
+
+
+def make_limiter(rate: float = TEST_RATE_LIMIT, counter: RedisRateCounter | None = None) -> RateLimiter:
+    """テスト用のレートリミッターを作成する."""
+    return RateLimiter(
+        rate,
+        TEST_RATE_LIMIT_BURST,
+        quota_reserve=TEST_QUOTA_RESERVE,
+        max_wait=TEST_RATE_LIMIT_MAX_WAIT,
+        counter=counter,
+    )
+
+
+def make_counter(count: int) -> tuple[RedisRateCounter, Mock]:
+    """指定された回数を返すカウンターを作成する."""
+    pipeline = Mock()
+    pipeline.execute.return_value = [count, True]
+    client = Mock()
+    client.pipeline.return_value = pipeline
+    breaker = CircuitBreaker(TEST_BREAKER_THRESHOLD, TEST_BREAKER_RESET_TIMEOUT)
+    counter = RedisRateCounter(client, GEOIP_RATE_LIMIT_KEY_PREFIX, limit=TEST_RATE_LIMIT_BURST, window=1.0, breaker=breaker)
+    return counter, pipeline
+
+
+class TestRateLimiter:
+    """RateLimiterクラスのテストクラス."""
+
+    @patch("ipinfo_geoip.rate_limiter.time.monotonic")
+    def test_reserve_burst(self, mock_monotonic: Mock) -> None:
+        """burstまで連続して取得でき, その後は補充までの秒数を返すテスト."""
+        mock_monotonic.return_value = 0.0
+        limiter = make_limiter()
+
+        for _ in range(TEST_RATE_LIMIT_BURST):
+            assert limiter.reserve() == 0
+
+        assert limiter.reserve() == pytest.approx(1 / TEST_RATE_LIMIT)
+
+        mock_monotonic.return_value = 1 / TEST_RATE_LIMIT
+        assert limiter.reserve() == 0
+
+    @patch("ipinfo_geoip.rate_limiter.time.monotonic")
+    def test_reserve_batch_leaves_tokens(self, mock_monotonic: Mock) -> None:
+        """一括取得はバケットの半分を1件ずつの取得のために残すテスト."""
+        mock_monotonic.return_value = 0.0
+        limiter = make_limiter()
+
+        for _ in range(TEST_RATE_LIMIT_BURST // 2):
+            assert limiter.reserve(batch=True) == 0
+
+        assert limiter.reserve(batch=True) > 0
+        assert limiter.reserve() == 0
+
+    def test_reserve_unlimited(self) -> None:
+        """rateが0の場合は制限しないテスト."""
+        limiter = make_limiter(rate=0)
+
+        for _ in range(TEST_RATE_LIMIT_BURST * 2):
+            assert limiter.reserve() == 0
+
+    def test_reserve_with_quota(self) -> None:
+        """残りの問い合わせ数がquota_reserve以下の場合に一括取得を拒否するテスト."""
+        limiter = make_limiter(rate=0)
+        limiter.update(TEST_QUOTA_RESERVE + 1)
+
+        assert limiter.reserve(batch=True) == 0
+        with pytest.raises(RateLimitError) as exc_info:
+            limiter.reserve(batch=True)
+
+        assert exc_info.value.details == {"queries_remaining": TEST_QUOTA_RESERVE}
+        assert limiter.reserve() == 0
+
+    def test_reserve_with_quota_exhausted(self) -> None:
+        """残りの問い合わせ数がない場合に1件ずつの取得も拒否するテスト."""
+        limiter = make_limiter(rate=0)
+        limiter.update(0)
+
+        with pytest.raises(RateLimitError):
+            limiter.reserve()
+
+    def test_update_with_none(self) -> None:
+        """残りの問い合わせ数が不明な場合は記録しないテスト."""
+        limiter = make_limiter(rate=0)
+        limiter.update(0)
+        limiter.update(None)
+
+        with pytest.raises(RateLimitError):
+            limiter.reserve()
+
+    @patch("ipinfo_geoip.rate_limiter.time.monotonic")
+    def test_reserve_with_expired_quota(self, mock_monotonic: Mock) -> None:
+        """記録した残りの問い合わせ数がGEOIP_QUOTA_TTL秒経過後に使用されないテスト."""
+        mock_monotonic.return_value = 0.0
+        limiter = make_limiter(rate=0)
+        limiter.update(0)
+
+        mock_monotonic.return_value = GEOIP_QUOTA_TTL
+
+        assert limiter.reserve() == 0
+
+    @patch("ipinfo_geoip.rate_limiter.time.sleep")
+    @patch("ipinfo_geoip.rate_limiter.time.monotonic")
+    def test_acquire_waits(self, mock_monotonic: Mock, mock_sleep: Mock) -> None:
+        """トークンの補充をmax_wait秒以内待つテスト."""
+        mock_monotonic.return_value = 0.0
+        limiter = make_limiter()
+        for _ in range(TEST_RATE_LIMIT_BURST):
+            limiter.acquire()
+
+        mock_sleep.side_effect = lambda seconds: setattr(mock_monotonic, "return_value", mock_monotonic.return_value + seconds)
+        limiter.acquire()
+
+        mock_sleep.assert_called_once_with(pytest.approx(1 / TEST_RATE_LIMIT))
+
+    @patch("ipinfo_geoip.rate_limiter.time.sleep")
+    @patch("ipinfo_geoip.rate_limiter.time.monotonic")
+    def test_acquire_rejects(self, mock_monotonic: Mock, mock_sleep: Mock) -> None:
+        """max_wait秒を超える場合は待たずに拒否するテスト."""
+        mock_monotonic.return_value = 0.0
+        limiter = make_limiter(rate=1 / (TEST_RATE_LIMIT_MAX_WAIT * 2))
+        for _ in range(TEST_RATE_LIMIT_BURST):
+            limiter.acquire()
+
+        with pytest.raises(RateLimitError) as exc_info:
+            limiter.acquire()
+
+        assert exc_info.value.details == {"retry_after": pytest.approx(TEST_RATE_LIMIT_MAX_WAIT * 2)}
+        mock_sleep.assert_not_called()
+
+    @patch("ipinfo_geoip.rate_limiter.asyncio.sleep")
+    @patch("ipinfo_geoip.rate_limiter.time.monotonic")
+    def test_acquire_async_batch(self, mock_monotonic: Mock, mock_sleep: Mock) -> None:
+        """一括取得はmax_wait秒を超えても非同期に待つテスト."""
+        mock_monotonic.return_value = 0.0
+        limiter = make_limiter(rate=1 / (TEST_RATE_LIMIT_MAX_WAIT * 2))
+        for _ in range(TEST_RATE_LIMIT_BURST):
+            limiter.acquire()
+
+        async def sleep(seconds: float) -> None:
+            mock_monotonic.return_value += seconds
+
+        mock_sleep.side_effect = sleep
+        asyncio.run(limiter.acquire_async(batch=True))
+
+        assert mock_sleep.await_count > 0
+
+    @patch("ipinfo_geoip.rate_limiter.time.monotonic")
+    def test_reserve_with_counter(self, mock_monotonic: Mock) -> None:
+        """共有するカウンターが上限に達している場合はトークンを戻すテスト."""
+        mock_monotonic.return_value = 0.0
+        counter, _ = make_counter(TEST_RATE_LIMIT_BURST + 1)
+        limiter = make_limiter(counter=counter)
+
+        assert limiter.reserve() > 0
+        assert limiter._tokens == TEST_RATE_LIMIT_BURST  # noqa: SLF001
+
+
+class TestRedisRateCounter:
+    """RedisRateCounterクラスのテストクラス."""
+
+    @patch("ipinfo_geoip.rate_limiter.time.time")
+    def test_reserve(self, mock_time: Mock) -> None:
+        """上限以内の場合に0を返すテスト."""
+        mock_time.return_value = 100.25
+        counter, pipeline = make_counter(TEST_RATE_LIMIT_BURST)
+
+        assert counter.reserve() == 0
+
+        pipeline.incr.assert_called_once_with(f"{GEOIP_RATE_LIMIT_KEY_PREFIX}100")
+        pipeline.expire.assert_called_once_with(f"{GEOIP_RATE_LIMIT_KEY_PREFIX}100", 2)
+
+    @patch("ipinfo_geoip.rate_limiter.time.time")
+    def test_reserve_over_limit(self, mock_time: Mock) -> None:
+        """上限を超えた場合に次のウィンドウまでの秒数を返すテスト."""
+        mock_time.return_value = 100.25
+        counter, _ = make_counter(TEST_RATE_LIMIT_BURST + 1)
+
+        assert counter.reserve() == pytest.approx(0.75)
+
+    def test_reserve_with_connection_error(self) -> None:
+        """Redisが利用できない場合は制限しないテスト."""
+        counter, pipeline = make_counter(0)
+        pipeline.execute.side_effect = redis.ConnectionError("Connection failed")
+
+        for _ in range(TEST_BREAKER_THRESHOLD + 1):
+            assert counter.reserve() == 0
+
+        assert pipeline.execute.call_count == TEST_BREAKER_THRESHOLD
+
+
+class TestGetRateLimiter:
+    """_get_rate_limiter関数のテストクラス."""
+
+    def test_get_rate_limiter_shared(self) -> None:
+        """同じアカウントIDと設定でレートリミッターを共有するテスト."""
+        config = GeoIPConfig(TEST_GEOIP_ACCOUNT_ID_STR, TEST_GEOIP_LICENSE_KEY, TEST_GEOIP_HOST)
+        limiter = _get_rate_limiter(config)
+
+        assert _get_rate_limiter(GeoIPConfig(TEST_GEOIP_ACCOUNT_ID_STR, TEST_GEOIP_LICENSE_KEY, TEST_GEOIP_HOST)) is limiter
+        assert _get_rate_limiter(GeoIPConfig("1", TEST_GEOIP_LICENSE_KEY, TEST_GEOIP_HOST)) is not limiter
+        assert limiter.counter is None
+
+    @patch("ipinfo_geoip.rate_limiter._get_client")
+    @patch("ipinfo_geoip.rate_limiter.RedisConfig.from_env")
+    def test_get_rate_limiter_with_counter(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """共有するカウンターを使用するレートリミッターのテスト."""
+        mock_from_env.return_value = Mock()
+        config = GeoIPConfig(
+            TEST_GEOIP_ACCOUNT_ID_STR,
+            TEST_GEOIP_LICENSE_KEY,
+            TEST_GEOIP_HOST,
+            rate_limit=str(TEST_RATE_LIMIT),
+            rate_limit_burst=str(TEST_RATE_LIMIT_BURST),
+            rate_limit_shared="true",
+        )
+
+        with patch("ipinfo_geoip.rate_limiter._get_breaker"):
+            limiter = _get_rate_limiter(config)
+
+        assert isinstance(limiter.counter, RedisRateCounter)
+        assert limiter.counter.client is mock_get_client.return_value
+        assert limiter.counter.key == f"{GEOIP_RATE_LIMIT_KEY_PREFIX}{TEST_GEOIP_ACCOUNT_ID_STR}:"
+        assert limiter.counter.limit == TEST_RATE_LIMIT_BURST
+        assert limiter.counter.window == pytest.approx(TEST_RATE_LIMIT_BURST / TEST_RATE_LIMIT)
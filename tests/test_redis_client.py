@@ -1,51 +1,76 @@
 """RedisClientクラスのテスト."""
 
-from collections import UserDict
+import time
+from collections.abc import Iterator
 from unittest.mock import Mock, patch
 
+import fakeredis
 import pytest
 import redis
 
+from ipinfo_geoip.circuit_breaker import CircuitBreaker
+from ipinfo_geoip.constants import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_OPEN,
+    REDIS_STORAGE_BINARY,
+    REDIS_STORAGE_HASH,
+    REDIS_STORAGE_NETWORK,
+)
 from ipinfo_geoip.exceptions import ConfigurationError, RedisClientError, ValidationError
 from ipinfo_geoip.ipdata import IPData
 from ipinfo_geoip.redis_client import RedisClient
 from tests.conftest import (
+    TEST_AS_NUMBER_INT,
     TEST_AS_NUMBER_STR,
+    TEST_BREAKER_RESET_TIMEOUT,
+    TEST_BREAKER_THRESHOLD,
     TEST_COUNTRY_CODE,
     TEST_IP_ADDRESS_1,
+    TEST_IP_ADDRESS_2,
     TEST_IP_NETWORK,
     TEST_IPDATA,
+    TEST_IPDATA_2,
     TEST_IPDATA_INCOMPLETE,
     TEST_ORGANIZATION,
+    TEST_REDIS_NEGATIVE_TTL_INT,
     TEST_REDIS_TTL_INT,
-    TEST_REDIS_URI,
+)
+
+TEST_BINARY_KEY: bytes = b"i:{\xc0\x00}\x02\x01"
+TEST_BINARY_VALUE: bytes = (
+    b"\x18" + TEST_AS_NUMBER_INT.to_bytes(4, "big") + TEST_COUNTRY_CODE.encode() + TEST_ORGANIZATION.encode()
 )
 
 
 class TestRedisClient:
     """RedisClientクラスのテストクラス."""
 
-    @patch("ipinfo_geoip.redis_client.redis.Redis.from_url")
+    @pytest.fixture(autouse=True)
+    def breaker(self) -> Iterator[CircuitBreaker]:
+        """テストごとに新しいサーキットブレーカーを使用する."""
+        breaker = CircuitBreaker(TEST_BREAKER_THRESHOLD, TEST_BREAKER_RESET_TIMEOUT)
+        with patch("ipinfo_geoip.redis_client._get_breaker", return_value=breaker):
+            yield breaker
+
+    @patch("ipinfo_geoip.redis_client._get_client")
     @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
-    def test_init(self, mock_from_env: Mock, mock_redis_from_url: Mock) -> None:
+    def test_init(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
         """初期化のテスト."""
         # モック設定
         mock_config = Mock()
-        mock_config.uri = TEST_REDIS_URI
         mock_config.ttl = TEST_REDIS_TTL_INT
         mock_from_env.return_value = mock_config
 
         mock_redis_instance = Mock()
-        mock_redis_from_url.return_value = mock_redis_instance
+        mock_get_client.return_value = mock_redis_instance
 
         # テスト実行
         client = RedisClient()
 
         # 検証
         assert isinstance(client, RedisClient)
-        assert isinstance(client, UserDict)
         mock_from_env.assert_called_once()
-        mock_redis_from_url.assert_called_once_with(TEST_REDIS_URI, decode_responses=True)
+        mock_get_client.assert_called_once_with(mock_config, decode_responses=True)
 
     @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
     def test_init_with_configuration_error(self, mock_from_env: Mock) -> None:
@@ -60,42 +85,42 @@ class TestRedisClient:
         # 検証
         mock_from_env.assert_called_once()
 
-    @patch("ipinfo_geoip.redis_client.redis.Redis.from_url")
+    @patch("ipinfo_geoip.redis_client._get_client")
     @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
-    def test_missing_with_invalid_ip_value(self, mock_from_env: Mock, mock_redis_from_url: Mock) -> None:
-        """IPアドレスが無効な場合の__missing__メソッドテスト."""
+    def test_get_with_invalid_ip_value(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """IPアドレスが無効な場合のgetメソッドテスト."""
         # モック設定
         mock_config = Mock()
         mock_from_env.return_value = mock_config
 
         mock_redis_instance = Mock()
         mock_redis_instance.hgetall.return_value = {}
-        mock_redis_from_url.return_value = mock_redis_instance
+        mock_get_client.return_value = mock_redis_instance
 
         # テスト実行
         client = RedisClient()
 
         with pytest.raises(ValidationError):
-            _ = client["invalid.ip"]
+            _ = client.get("invalid.ip")
 
         # 検証
         mock_redis_instance.hgetall.assert_not_called()
 
-    @patch("ipinfo_geoip.redis_client.redis.Redis.from_url")
+    @patch("ipinfo_geoip.redis_client._get_client")
     @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
-    def test_missing_success(self, mock_from_env: Mock, mock_redis_from_url: Mock) -> None:
-        """成功時の__missing__メソッドテスト."""
+    def test_get_success(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """成功時のgetメソッドテスト."""
         # モック設定
         mock_config = Mock()
         mock_from_env.return_value = mock_config
 
         mock_redis_instance = Mock()
         mock_redis_instance.hgetall.return_value = TEST_IPDATA.to_dict()
-        mock_redis_from_url.return_value = mock_redis_instance
+        mock_get_client.return_value = mock_redis_instance
 
         # テスト実行
         client = RedisClient()
-        result = client[TEST_IP_ADDRESS_1]
+        result = client.get(TEST_IP_ADDRESS_1)
 
         # 検証
         assert isinstance(result, IPData)
@@ -106,71 +131,71 @@ class TestRedisClient:
         assert result.organization == TEST_ORGANIZATION
         mock_redis_instance.hgetall.assert_called_once_with(f"ipinfo:{TEST_IP_ADDRESS_1}")
 
-    @patch("ipinfo_geoip.redis_client.redis.Redis.from_url")
+    @patch("ipinfo_geoip.redis_client._get_client")
     @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
-    def test_missing_with_connection_error(self, mock_from_env: Mock, mock_redis_from_url: Mock) -> None:
-        """接続エラーでの__missing__メソッドテスト."""
+    def test_get_with_connection_error(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """接続エラーでのgetメソッドテスト."""
         # モック設定
         mock_config = Mock()
         mock_from_env.return_value = mock_config
 
         mock_redis_instance = Mock()
         mock_redis_instance.hgetall.side_effect = redis.ConnectionError("Connection failed")
-        mock_redis_from_url.return_value = mock_redis_instance
+        mock_get_client.return_value = mock_redis_instance
 
         # テスト実行
         client = RedisClient()
 
         with pytest.raises(RedisClientError):
-            _ = client[TEST_IP_ADDRESS_1]
+            _ = client.get(TEST_IP_ADDRESS_1)
 
         # 検証
         mock_redis_instance.hgetall.assert_called_once_with(f"ipinfo:{TEST_IP_ADDRESS_1}")
 
-    @patch("ipinfo_geoip.redis_client.redis.Redis.from_url")
+    @patch("ipinfo_geoip.redis_client._get_client")
     @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
-    def test_missing_with_empty_response(self, mock_from_env: Mock, mock_redis_from_url: Mock) -> None:
-        """レスポンスが空な場合の__missing__メソッドテスト."""
+    def test_get_with_empty_response(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """レスポンスが空な場合のgetメソッドテスト."""
         # モック設定
         mock_config = Mock()
         mock_from_env.return_value = mock_config
 
         mock_redis_instance = Mock()
         mock_redis_instance.hgetall.return_value = {}
-        mock_redis_from_url.return_value = mock_redis_instance
+        mock_get_client.return_value = mock_redis_instance
 
         # テスト実行
         client = RedisClient()
-        result = client[TEST_IP_ADDRESS_1]
+        result = client.get(TEST_IP_ADDRESS_1)
 
         # 検証
         assert result is None
         mock_redis_instance.hgetall.assert_called_once_with(f"ipinfo:{TEST_IP_ADDRESS_1}")
 
-    @patch("ipinfo_geoip.redis_client.redis.Redis.from_url")
+    @patch("ipinfo_geoip.redis_client._get_client")
     @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
-    def test_missing_with_partial_data(self, mock_from_env: Mock, mock_redis_from_url: Mock) -> None:
-        """データが不完全な場合の__missing__メソッドテスト."""
+    def test_get_with_partial_data(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """データが不完全な場合のgetメソッドテスト."""
         # モック設定
         mock_config = Mock()
         mock_from_env.return_value = mock_config
 
         mock_redis_instance = Mock()
         mock_redis_instance.hgetall.return_value = TEST_IPDATA_INCOMPLETE.to_dict()
-        mock_redis_from_url.return_value = mock_redis_instance
+        mock_get_client.return_value = mock_redis_instance
 
         # テスト実行
         client = RedisClient()
-        result = client[TEST_IP_ADDRESS_1]
+        result = client.get(TEST_IP_ADDRESS_1)
 
         # 検証
         assert result is None
         mock_redis_instance.hgetall.assert_called_once_with(f"ipinfo:{TEST_IP_ADDRESS_1}")
 
-    @patch("ipinfo_geoip.redis_client.redis.Redis.from_url")
+    @patch("ipinfo_geoip.redis_client._get_client")
     @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
-    def test_setitem_with_invalid_ip_value(self, mock_from_env: Mock, mock_redis_from_url: Mock) -> None:
-        """IPアドレスが無効な場合の__setitem__メソッドテスト."""
+    def test_put_with_invalid_ip_value(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """IPアドレスが無効な場合のputメソッドテスト."""
         # モック設定
         mock_config = Mock()
         mock_from_env.return_value = mock_config
@@ -182,13 +207,13 @@ class TestRedisClient:
 
         mock_redis_instance = Mock()
         mock_redis_instance.pipeline.return_value = mock_redis_pipeline
-        mock_redis_from_url.return_value = mock_redis_instance
+        mock_get_client.return_value = mock_redis_instance
 
         # テスト実行
         client = RedisClient()
 
         with pytest.raises(ValidationError):
-            client["invalid.ip"] = TEST_IPDATA
+            client.put("invalid.ip", TEST_IPDATA)
 
         # 検証
         mock_redis_instance.pipeline.assert_not_called()
@@ -196,10 +221,10 @@ class TestRedisClient:
         mock_redis_pipeline.expire.assert_not_called()
         mock_redis_pipeline.execute.assert_not_called()
 
-    @patch("ipinfo_geoip.redis_client.redis.Redis.from_url")
+    @patch("ipinfo_geoip.redis_client._get_client")
     @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
-    def test_setitem_success(self, mock_from_env: Mock, mock_redis_from_url: Mock) -> None:
-        """成功時の__setitem__メソッドテスト."""
+    def test_put_success(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """成功時のputメソッドテスト."""
         # モック設定
         mock_config = Mock()
         mock_config.ttl = TEST_REDIS_TTL_INT
@@ -212,11 +237,11 @@ class TestRedisClient:
 
         mock_redis_instance = Mock()
         mock_redis_instance.pipeline.return_value = mock_redis_pipeline
-        mock_redis_from_url.return_value = mock_redis_instance
+        mock_get_client.return_value = mock_redis_instance
 
         # テスト実行
         client = RedisClient()
-        client[TEST_IP_ADDRESS_1] = TEST_IPDATA
+        client.put(TEST_IP_ADDRESS_1, TEST_IPDATA)
 
         # 検証
         mock_redis_instance.pipeline.assert_called_once()
@@ -224,10 +249,10 @@ class TestRedisClient:
         mock_redis_pipeline.expire.assert_called_once_with(f"ipinfo:{TEST_IP_ADDRESS_1}", TEST_REDIS_TTL_INT)
         mock_redis_pipeline.execute.assert_called_once()
 
-    @patch("ipinfo_geoip.redis_client.redis.Redis.from_url")
+    @patch("ipinfo_geoip.redis_client._get_client")
     @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
-    def test_redis_with_incomplete_ipdata(self, mock_from_env: Mock, mock_redis_from_url: Mock) -> None:
-        """データが不完全な場合の__setitem__メソッドテスト."""
+    def test_redis_with_incomplete_ipdata(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """データが不完全な場合のputメソッドテスト."""
         # モック設定
         mock_config = Mock()
         mock_from_env.return_value = mock_config
@@ -239,11 +264,11 @@ class TestRedisClient:
 
         mock_redis_instance = Mock()
         mock_redis_instance.pipeline.return_value = mock_redis_pipeline
-        mock_redis_from_url.return_value = mock_redis_instance
+        mock_get_client.return_value = mock_redis_instance
 
         # テスト実行
         client = RedisClient()
-        client[TEST_IP_ADDRESS_1] = TEST_IPDATA_INCOMPLETE
+        client.put(TEST_IP_ADDRESS_1, TEST_IPDATA_INCOMPLETE)
 
         # 検証
         mock_redis_instance.pipeline.assert_not_called()
@@ -251,10 +276,10 @@ class TestRedisClient:
         mock_redis_pipeline.expire.assert_not_called()
         mock_redis_pipeline.execute.assert_not_called()
 
-    @patch("ipinfo_geoip.redis_client.redis.Redis.from_url")
+    @patch("ipinfo_geoip.redis_client._get_client")
     @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
-    def test_redis_with_none_ipdata(self, mock_from_env: Mock, mock_redis_from_url: Mock) -> None:
-        """データがNoneな場合の__setitem__メソッドテスト."""
+    def test_redis_with_none_ipdata(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """データがNoneな場合のputメソッドテスト."""
         # モック設定
         mock_config = Mock()
         mock_from_env.return_value = mock_config
@@ -266,14 +291,707 @@ class TestRedisClient:
 
         mock_redis_instance = Mock()
         mock_redis_instance.pipeline.return_value = mock_redis_pipeline
-        mock_redis_from_url.return_value = mock_redis_instance
+        mock_get_client.return_value = mock_redis_instance
 
         # テスト実行
         client = RedisClient()
-        client[TEST_IP_ADDRESS_1] = None
+        client.put(TEST_IP_ADDRESS_1, None)
 
         # 検証
         mock_redis_instance.pipeline.assert_not_called()
         mock_redis_pipeline.hset.assert_not_called()
         mock_redis_pipeline.expire.assert_not_called()
         mock_redis_pipeline.execute.assert_not_called()
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_get_many(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """複数のIPアドレスを取得するget_manyメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_from_env.return_value = mock_config
+
+        mock_redis_pipeline = Mock()
+        mock_redis_pipeline.execute.return_value = [TEST_IPDATA.to_dict(), {}]
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.pipeline.return_value = mock_redis_pipeline
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        result = client.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2, TEST_IP_ADDRESS_1])
+
+        # 検証
+        assert result == {TEST_IP_ADDRESS_1: TEST_IPDATA, TEST_IP_ADDRESS_2: None}
+        mock_redis_instance.pipeline.assert_called_once()
+        assert mock_redis_pipeline.hgetall.call_count == 2  # noqa: PLR2004
+        mock_redis_pipeline.execute.assert_called_once()
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_get_many_with_connection_error(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """接続エラーでのget_manyメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_from_env.return_value = mock_config
+
+        mock_redis_pipeline = Mock()
+        mock_redis_pipeline.execute.side_effect = redis.ConnectionError("Connection failed")
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.pipeline.return_value = mock_redis_pipeline
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+
+        with pytest.raises(RedisClientError):
+            _ = client.get_many([TEST_IP_ADDRESS_1])
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_set_many(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """複数のIPアドレス情報を保存するset_manyメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.ttl = TEST_REDIS_TTL_INT
+        mock_from_env.return_value = mock_config
+
+        mock_redis_pipeline = Mock()
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.pipeline.return_value = mock_redis_pipeline
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        client.set_many({TEST_IP_ADDRESS_1: TEST_IPDATA, TEST_IP_ADDRESS_2: TEST_IPDATA_INCOMPLETE})
+
+        # 検証
+        mock_redis_instance.pipeline.assert_called_once()
+        mock_redis_pipeline.hset.assert_called_once_with(f"ipinfo:{TEST_IP_ADDRESS_1}", mapping=TEST_IPDATA.to_dict())
+        mock_redis_pipeline.expire.assert_called_once_with(f"ipinfo:{TEST_IP_ADDRESS_1}", TEST_REDIS_TTL_INT)
+        mock_redis_pipeline.execute.assert_called_once()
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_get_with_network_storage(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """ネットワーク範囲キャッシュからのgetメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.storage = REDIS_STORAGE_NETWORK
+        mock_from_env.return_value = mock_config
+
+        expires_at = int(time.time()) + TEST_REDIS_TTL_INT
+        member = f"c00002ff|c0000200|24|{TEST_AS_NUMBER_STR}|{TEST_COUNTRY_CODE}|{expires_at}|{TEST_ORGANIZATION}"
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.zrangebylex.return_value = [member]
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        result = client.get(TEST_IP_ADDRESS_2)
+
+        # 検証
+        assert result == TEST_IPDATA_2
+        mock_redis_instance.zrangebylex.assert_called_once_with("ipinfo:networks:4", "[c0000202", "+", start=0, num=1)
+        mock_redis_instance.hgetall.assert_not_called()
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_get_with_network_storage_outside_range(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """ネットワーク範囲外の場合のgetメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.storage = REDIS_STORAGE_NETWORK
+        mock_from_env.return_value = mock_config
+
+        expires_at = int(time.time()) + TEST_REDIS_TTL_INT
+        member = f"c00003ff|c0000300|24|{TEST_AS_NUMBER_STR}|{TEST_COUNTRY_CODE}|{expires_at}|{TEST_ORGANIZATION}"
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.zrangebylex.return_value = [member]
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        result = client.get(TEST_IP_ADDRESS_1)
+
+        # 検証
+        assert result is None
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_get_with_network_storage_expired(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """有効期限切れのネットワーク範囲のgetメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.storage = REDIS_STORAGE_NETWORK
+        mock_from_env.return_value = mock_config
+
+        expires_at = int(time.time()) - 1
+        member = f"c00002ff|c0000200|24|{TEST_AS_NUMBER_STR}|{TEST_COUNTRY_CODE}|{expires_at}|{TEST_ORGANIZATION}"
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.zrangebylex.return_value = [member]
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        result = client.get(TEST_IP_ADDRESS_1)
+
+        # 検証
+        assert result is None
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_put_with_network_storage(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """ネットワーク範囲キャッシュへのputメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.ttl = TEST_REDIS_TTL_INT
+        mock_config.storage = REDIS_STORAGE_NETWORK
+        mock_from_env.return_value = mock_config
+
+        mock_redis_pipeline = Mock()
+        mock_redis_pipeline.execute.return_value = [0, 1, 1, [], []]
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.pipeline.return_value = mock_redis_pipeline
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        client.put(TEST_IP_ADDRESS_1, TEST_IPDATA)
+
+        # 検証
+        name = "ipinfo:networks:4"
+        mock_redis_pipeline.zremrangebylex.assert_called_once_with(name, "[c00002ff|c0000200|", "(c00002ff|c0000200|~")
+        assert mock_redis_pipeline.zadd.call_count == 2  # noqa: PLR2004
+        (ranges, expiries) = mock_redis_pipeline.zadd.call_args_list
+        member = next(iter(ranges.args[1]))
+        assert ranges.args[0] == name
+        assert member.startswith(f"c00002ff|c0000200|24|{TEST_AS_NUMBER_STR}|{TEST_COUNTRY_CODE}|")
+        assert member.endswith(f"|{TEST_ORGANIZATION}")
+        assert expiries.args == ("ipinfo:networks:4:expires", {member: int(member.split("|")[5])})
+        mock_redis_pipeline.expire.assert_not_called()
+        mock_redis_pipeline.zrem.assert_not_called()
+        mock_redis_pipeline.hset.assert_not_called()
+        mock_redis_pipeline.execute.assert_called_once()
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_get_with_not_found(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """存在しないことがキャッシュされている場合のgetメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_from_env.return_value = mock_config
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.hgetall.return_value = IPData(TEST_IP_ADDRESS_1, "", "", "", "").to_dict()
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        result = client.get(TEST_IP_ADDRESS_1)
+
+        # 検証
+        assert result is not None
+        assert result.is_empty()
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_set_not_found(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """存在しないことを保存するset_not_foundメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.negative_ttl = TEST_REDIS_NEGATIVE_TTL_INT
+        mock_from_env.return_value = mock_config
+
+        mock_redis_pipeline = Mock()
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.pipeline.return_value = mock_redis_pipeline
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        client.set_not_found(TEST_IP_ADDRESS_1)
+
+        # 検証
+        name = f"ipinfo:{TEST_IP_ADDRESS_1}"
+        mock_redis_pipeline.hset.assert_called_once_with(name, mapping=IPData(TEST_IP_ADDRESS_1, "", "", "", "").to_dict())
+        mock_redis_pipeline.expire.assert_called_once_with(name, TEST_REDIS_NEGATIVE_TTL_INT)
+        mock_redis_pipeline.execute.assert_called_once()
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_set_not_found_with_network_storage(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """ネットワーク範囲キャッシュに存在しないことを保存するset_not_foundメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.storage = REDIS_STORAGE_NETWORK
+        mock_config.negative_ttl = TEST_REDIS_NEGATIVE_TTL_INT
+        mock_from_env.return_value = mock_config
+
+        mock_redis_pipeline = Mock()
+        mock_redis_pipeline.execute.return_value = [0, 1, 1, [], []]
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.pipeline.return_value = mock_redis_pipeline
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        client.set_not_found(TEST_IP_ADDRESS_1)
+
+        # 検証
+        (ranges, expiries) = mock_redis_pipeline.zadd.call_args_list
+        member = next(iter(ranges.args[1]))
+        assert member.startswith("c0000201|c0000201|32|||")
+        expires_at = int(member.split("|")[5])
+        assert expires_at - time.time() <= TEST_REDIS_NEGATIVE_TTL_INT
+        assert expiries.args == ("ipinfo:networks:4:expires", {member: expires_at})
+        mock_redis_pipeline.expire.assert_not_called()
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_set_many_with_network_storage_prunes_expired(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """ネットワーク範囲キャッシュへの保存時に有効期限切れのメンバーを削除するテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.storage = REDIS_STORAGE_NETWORK
+        mock_config.ttl = TEST_REDIS_TTL_INT
+        mock_from_env.return_value = mock_config
+
+        expired = "c0000201|c0000201|32|||1|"
+        mock_redis_pipeline = Mock()
+        mock_redis_pipeline.execute.side_effect = [[0, 1, 1, [expired], []], [1, 1]]
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.pipeline.return_value = mock_redis_pipeline
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        client.set_many({TEST_IP_ADDRESS_1: TEST_IPDATA})
+
+        # 検証
+        assert mock_redis_pipeline.zrem.call_args_list == [
+            (("ipinfo:networks:4", expired),),
+            (("ipinfo:networks:4:expires", expired),),
+        ]
+        assert mock_redis_pipeline.execute.call_count == 2  # noqa: PLR2004
+
+    def test_network_storage_negative_entry_keeps_positive_ranges(self) -> None:
+        """存在しないことを保存してもnegative_ttl後にキャッシュ済みのネットワークを解決できるテスト."""
+        # モック設定
+        server = fakeredis.FakeServer()
+        mock_config = Mock(storage=REDIS_STORAGE_NETWORK, ttl=TEST_REDIS_TTL_INT, negative_ttl=TEST_REDIS_NEGATIVE_TTL_INT)
+        now = time.time()
+
+        with (
+            patch("ipinfo_geoip.redis_client.RedisConfig.from_env", return_value=mock_config),
+            patch(
+                "ipinfo_geoip.redis_client._get_client", return_value=fakeredis.FakeRedis(server=server, decode_responses=True)
+            ),
+            patch("ipinfo_geoip.redis_client.time.time") as mock_time,
+        ):
+            client = RedisClient()
+
+            # テスト実行
+            mock_time.return_value = now
+            client.put(TEST_IP_ADDRESS_1, TEST_IPDATA)
+            client.set_not_found("198.51.100.1")
+            mock_time.return_value = now + TEST_REDIS_NEGATIVE_TTL_INT + 1
+            client.set_many({}, ["203.0.113.1"])
+            result = client.get(TEST_IP_ADDRESS_2)
+            expired = client.get("198.51.100.1")
+
+        # 検証
+        assert result is not None
+        assert result.network == TEST_IP_NETWORK
+        assert expired is None
+        redis_client = fakeredis.FakeRedis(server=server, decode_responses=True)
+        assert redis_client.ttl("ipinfo:networks:4") == -1
+        assert redis_client.zcard("ipinfo:networks:4") == 2  # noqa: PLR2004
+        assert redis_client.zcard("ipinfo:networks:4:expires") == 2  # noqa: PLR2004
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_get_with_network_storage_not_found(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """ネットワーク範囲キャッシュに存在しないことがキャッシュされている場合のgetメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.storage = REDIS_STORAGE_NETWORK
+        mock_from_env.return_value = mock_config
+
+        expires_at = int(time.time()) + TEST_REDIS_NEGATIVE_TTL_INT
+        mock_redis_instance = Mock()
+        mock_redis_instance.zrangebylex.return_value = [f"c0000201|c0000201|32|||{expires_at}|"]
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        result = client.get(TEST_IP_ADDRESS_1)
+
+        # 検証
+        assert result is not None
+        assert result.is_empty()
+
+    def test_networks_with_network_storage(self) -> None:
+        """ネットワーク範囲キャッシュから有効期限内のネットワークをページごとに取得するテスト."""
+        # モック設定
+        server = fakeredis.FakeServer()
+        mock_config = Mock(storage=REDIS_STORAGE_NETWORK, ttl=TEST_REDIS_TTL_INT, negative_ttl=TEST_REDIS_NEGATIVE_TTL_INT)
+        ipv6 = IPData("2001:db8::1", "2001:db8::/48", TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, TEST_ORGANIZATION)
+        other = IPData("198.51.100.1", "198.51.100.0/24", TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, TEST_ORGANIZATION)
+        now = time.time()
+
+        with (
+            patch("ipinfo_geoip.redis_client.RedisConfig.from_env", return_value=mock_config),
+            patch(
+                "ipinfo_geoip.redis_client._get_client", return_value=fakeredis.FakeRedis(server=server, decode_responses=True)
+            ),
+            patch("ipinfo_geoip.redis_client.REDIS_RANGE_READ_BATCH", 1),
+            patch("ipinfo_geoip.redis_client.time.time") as mock_time,
+        ):
+            client = RedisClient()
+            mock_time.return_value = now
+            client.set_many({TEST_IP_ADDRESS_1: TEST_IPDATA, "2001:db8::1": ipv6}, ["203.0.113.1"])
+            mock_time.return_value = now - TEST_REDIS_TTL_INT
+            client.put("198.51.100.1", other)
+
+            # テスト実行
+            mock_time.return_value = now + 1
+            result = client.networks()
+
+        # 検証
+        assert result == [
+            IPData("192.0.2.0", TEST_IP_NETWORK, TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, TEST_ORGANIZATION),
+            IPData("2001:db8::", "2001:db8::/48", TEST_AS_NUMBER_STR, TEST_COUNTRY_CODE, TEST_ORGANIZATION),
+        ]
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_networks_with_hash_storage(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """ネットワーク範囲キャッシュでない場合にnetworksメソッドでConfigurationErrorを送出するテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.storage = REDIS_STORAGE_HASH
+        mock_from_env.return_value = mock_config
+        mock_get_client.return_value = Mock()
+
+        # テスト実行
+        client = RedisClient()
+        with pytest.raises(ConfigurationError):
+            _ = client.networks()
+
+        # 検証
+        mock_get_client.return_value.zrangebylex.assert_not_called()
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_init_with_binary_storage(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """バイナリ形式での初期化テスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.storage = REDIS_STORAGE_BINARY
+        mock_from_env.return_value = mock_config
+
+        # テスト実行
+        _ = RedisClient()
+
+        # 検証
+        mock_get_client.assert_called_once_with(mock_config, decode_responses=False)
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_put_with_binary_storage(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """バイナリ形式へのputメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.ttl = TEST_REDIS_TTL_INT
+        mock_config.storage = REDIS_STORAGE_BINARY
+        mock_from_env.return_value = mock_config
+
+        mock_redis_pipeline = Mock()
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.pipeline.return_value = mock_redis_pipeline
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        client.put(TEST_IP_ADDRESS_1, TEST_IPDATA)
+
+        # 検証
+        mock_redis_pipeline.set.assert_called_once_with(TEST_BINARY_KEY, TEST_BINARY_VALUE, ex=TEST_REDIS_TTL_INT)
+        mock_redis_pipeline.hset.assert_not_called()
+        mock_redis_pipeline.expire.assert_not_called()
+        mock_redis_pipeline.execute.assert_called_once()
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_get_with_binary_storage(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """バイナリ形式からのgetメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.storage = REDIS_STORAGE_BINARY
+        mock_from_env.return_value = mock_config
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get.return_value = TEST_BINARY_VALUE
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        result = client.get(TEST_IP_ADDRESS_1)
+
+        # 検証
+        assert result == TEST_IPDATA
+        mock_redis_instance.get.assert_called_once_with(TEST_BINARY_KEY)
+        mock_redis_instance.pipeline.assert_not_called()
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_get_with_binary_storage_not_found(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """バイナリ形式に存在しないことがキャッシュされている場合のgetメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.storage = REDIS_STORAGE_BINARY
+        mock_from_env.return_value = mock_config
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get.return_value = b""
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        result = client.get(TEST_IP_ADDRESS_1)
+
+        # 検証
+        assert result is not None
+        assert result.is_empty()
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_get_with_binary_storage_legacy_hash(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """バイナリ形式にない場合に移行前のハッシュから読み込むgetメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.storage = REDIS_STORAGE_BINARY
+        mock_from_env.return_value = mock_config
+
+        mock_redis_pipeline = Mock()
+        legacy = {name.encode(): value.encode() for name, value in TEST_IPDATA.to_dict().items()}
+        mock_redis_pipeline.execute.return_value = [legacy]
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.get.return_value = None
+        mock_redis_instance.pipeline.return_value = mock_redis_pipeline
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        result = client.get(TEST_IP_ADDRESS_1)
+
+        # 検証
+        assert result == TEST_IPDATA
+        mock_redis_pipeline.hgetall.assert_called_once_with(f"ipinfo:{TEST_IP_ADDRESS_1}")
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_get_many_with_binary_storage(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """バイナリ形式から複数のIPアドレスを取得するget_manyメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.cluster = False
+        mock_config.storage = REDIS_STORAGE_BINARY
+        mock_from_env.return_value = mock_config
+
+        mock_redis_pipeline = Mock()
+        mock_redis_pipeline.execute.side_effect = [[[TEST_BINARY_VALUE, None]], [{}]]
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.pipeline.return_value = mock_redis_pipeline
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        result = client.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])
+
+        # 検証
+        assert result == {TEST_IP_ADDRESS_1: TEST_IPDATA, TEST_IP_ADDRESS_2: None}
+        mock_redis_pipeline.mget.assert_called_once()
+        mock_redis_pipeline.hgetall.assert_called_once_with(f"ipinfo:{TEST_IP_ADDRESS_2}")
+        assert mock_redis_pipeline.execute.call_count == 2  # noqa: PLR2004
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_set_not_found_with_binary_storage(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """バイナリ形式に存在しないことを保存するset_not_foundメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.storage = REDIS_STORAGE_BINARY
+        mock_config.negative_ttl = TEST_REDIS_NEGATIVE_TTL_INT
+        mock_from_env.return_value = mock_config
+
+        mock_redis_pipeline = Mock()
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.pipeline.return_value = mock_redis_pipeline
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        client.set_not_found(TEST_IP_ADDRESS_1)
+
+        # 検証
+        mock_redis_pipeline.set.assert_called_once_with(TEST_BINARY_KEY, b"", ex=TEST_REDIS_NEGATIVE_TTL_INT)
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_get_many_with_binary_storage_cluster(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """Redis Clusterでハッシュスロットごとに取得するget_manyメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.storage = REDIS_STORAGE_BINARY
+        mock_config.cluster = True
+        mock_from_env.return_value = mock_config
+
+        ip_address_3 = "192.0.2.2"
+        ip_address_4 = "198.51.100.1"
+
+        mock_redis_pipeline = Mock()
+        mock_redis_pipeline.execute.return_value = [[TEST_BINARY_VALUE, b""], [b""]]
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.pipeline.return_value = mock_redis_pipeline
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        result = client.get_many([TEST_IP_ADDRESS_1, ip_address_4, ip_address_3])
+
+        # 検証
+        assert list(result) == [TEST_IP_ADDRESS_1, ip_address_4, ip_address_3]
+        assert result[TEST_IP_ADDRESS_1] == TEST_IPDATA
+        assert result[ip_address_3] == IPData(ip_address_3, "", "", "", "")
+        assert result[ip_address_4] == IPData(ip_address_4, "", "", "", "")
+        assert [call.args[0] for call in mock_redis_pipeline.mget.call_args_list] == [
+            [TEST_BINARY_KEY, b"i:{\xc0\x00}\x02\x02"],
+            [b"i:{\xc63}d\x01"],
+        ]
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_set_many_with_cluster(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """Redis Clusterでトランザクションを使用しないset_manyメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.cluster = True
+        mock_from_env.return_value = mock_config
+
+        mock_redis_instance = Mock()
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        client.set_many({TEST_IP_ADDRESS_1: TEST_IPDATA})
+
+        # 検証
+        mock_redis_instance.pipeline.assert_called_once_with(transaction=False)
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_get_with_breaker_open(
+        self,
+        mock_from_env: Mock,
+        mock_get_client: Mock,
+        breaker: CircuitBreaker,
+    ) -> None:
+        """連続した接続エラーでサーキットブレーカーが開き, Redisに接続しないgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock()
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.hgetall.side_effect = redis.ConnectionError("Connection failed")
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        for _ in range(TEST_BREAKER_THRESHOLD):
+            with pytest.raises(RedisClientError, match="Redis connection error"):
+                _ = client.get(TEST_IP_ADDRESS_1)
+
+        with pytest.raises(RedisClientError, match="circuit breaker is open"):
+            _ = client.get(TEST_IP_ADDRESS_1)
+
+        # 検証
+        assert breaker.state == CIRCUIT_OPEN
+        assert mock_redis_instance.hgetall.call_count == TEST_BREAKER_THRESHOLD
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_get_with_timeout(self, mock_from_env: Mock, mock_get_client: Mock, breaker: CircuitBreaker) -> None:
+        """タイムアウトが失敗として記録されるgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock()
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.hgetall.side_effect = redis.TimeoutError("Timeout reading from socket")
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        for _ in range(TEST_BREAKER_THRESHOLD):
+            with pytest.raises(RedisClientError, match="Redis timeout"):
+                _ = client.get(TEST_IP_ADDRESS_1)
+
+        # 検証
+        assert breaker.state == CIRCUIT_OPEN
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_get_with_response_error(self, mock_from_env: Mock, mock_get_client: Mock, breaker: CircuitBreaker) -> None:
+        """コマンドのエラーは失敗として記録されないgetメソッドテスト."""
+        # モック設定
+        mock_from_env.return_value = Mock()
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.hgetall.side_effect = redis.ResponseError("WRONGTYPE")
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+        for _ in range(TEST_BREAKER_THRESHOLD):
+            with pytest.raises(RedisClientError, match="Redis error"):
+                _ = client.get(TEST_IP_ADDRESS_1)
+
+        # 検証
+        assert breaker.state == CIRCUIT_CLOSED
+
+    @patch("ipinfo_geoip.redis_client._get_client")
+    @patch("ipinfo_geoip.redis_client.RedisConfig.from_env")
+    def test_set_many_with_connection_error(self, mock_from_env: Mock, mock_get_client: Mock) -> None:
+        """接続エラーでのset_manyメソッドテスト."""
+        # モック設定
+        mock_config = Mock()
+        mock_config.cluster = False
+        mock_from_env.return_value = mock_config
+
+        mock_redis_pipeline = Mock()
+        mock_redis_pipeline.execute.side_effect = redis.ConnectionError("Connection failed")
+
+        mock_redis_instance = Mock()
+        mock_redis_instance.pipeline.return_value = mock_redis_pipeline
+        mock_get_client.return_value = mock_redis_instance
+
+        # テスト実行
+        client = RedisClient()
+
+        with pytest.raises(RedisClientError):
+            client.set_many({TEST_IP_ADDRESS_1: TEST_IPDATA})
@@ -5,10 +5,39 @@ from unittest.mock import patch
 
 import pytest
 
-from ipinfo_geoip.constants import REDIS_CACHE_TTL_ENV, REDIS_URI_ENV
+from ipinfo_geoip.constants import (
+    NEGATIVE_CACHE_TTL,
+    REDIS_BREAKER_RESET_TIMEOUT,
+    REDIS_BREAKER_RESET_TIMEOUT_ENV,
+    REDIS_BREAKER_THRESHOLD,
+    REDIS_BREAKER_THRESHOLD_ENV,
+    REDIS_CACHE_TTL_ENV,
+    REDIS_CLIENT_CACHE_SIZE_ENV,
+    REDIS_CLUSTER_ENV,
+    REDIS_CONNECT_TIMEOUT,
+    REDIS_CONNECT_TIMEOUT_ENV,
+    REDIS_HEALTH_CHECK_INTERVAL,
+    REDIS_HEALTH_CHECK_INTERVAL_ENV,
+    REDIS_KEEPALIVE_ENV,
+    REDIS_MAX_CONNECTIONS,
+    REDIS_MAX_CONNECTIONS_ENV,
+    REDIS_NEGATIVE_CACHE_TTL_ENV,
+    REDIS_SOCKET_TIMEOUT,
+    REDIS_SOCKET_TIMEOUT_ENV,
+    REDIS_STORAGE_ENV,
+    REDIS_STORAGE_HASH,
+    REDIS_STORAGE_NETWORK,
+    REDIS_URI_ENV,
+)
 from ipinfo_geoip.exceptions import ValidationError
 from ipinfo_geoip.redis_config import RedisConfig
-from tests.conftest import TEST_REDIS_TTL_INT, TEST_REDIS_TTL_STR, TEST_REDIS_URI
+from tests.conftest import (
+    TEST_REDIS_NEGATIVE_TTL_INT,
+    TEST_REDIS_NEGATIVE_TTL_STR,
+    TEST_REDIS_TTL_INT,
+    TEST_REDIS_TTL_STR,
+    TEST_REDIS_URI,
+)
 
 
 class TestRedisConfig:
@@ -20,6 +49,22 @@ class TestRedisConfig:
 
         assert config.uri == TEST_REDIS_URI
         assert config.ttl == TEST_REDIS_TTL_INT
+        assert config.storage == REDIS_STORAGE_HASH
+        assert config.negative_ttl == NEGATIVE_CACHE_TTL
+        assert config.max_connections == REDIS_MAX_CONNECTIONS
+        assert config.socket_timeout == REDIS_SOCKET_TIMEOUT
+        assert config.connect_timeout == REDIS_CONNECT_TIMEOUT
+        assert config.health_check_interval == REDIS_HEALTH_CHECK_INTERVAL
+        assert config.keepalive is True
+        assert config.cluster is False
+        assert config.client_cache_size == 0
+        assert config.breaker_threshold == REDIS_BREAKER_THRESHOLD
+        assert config.breaker_reset_timeout == REDIS_BREAKER_RESET_TIMEOUT
+
+    def test_init_with_invalid_storage(self) -> None:
+        """保存形式が不正な場合の初期化テスト."""
+        with pytest.raises(ValidationError):
+            _ = RedisConfig(TEST_REDIS_URI, TEST_REDIS_TTL_STR, "invalid")
 
     @patch.dict(
         os.environ,
@@ -72,3 +117,149 @@ class TestRedisConfig:
         match = f"Missing environment variables: {REDIS_URI_ENV}, {REDIS_CACHE_TTL_ENV}"
         with pytest.raises(ValidationError, match=match):
             _ = RedisConfig.from_env()
+
+    @patch.dict(
+        os.environ,
+        {
+            REDIS_URI_ENV: TEST_REDIS_URI,
+            REDIS_CACHE_TTL_ENV: TEST_REDIS_TTL_STR,
+            REDIS_STORAGE_ENV: REDIS_STORAGE_NETWORK,
+        },
+        clear=True,
+    )
+    def test_from_env_with_storage(self) -> None:
+        """保存形式を指定した環境変数からの作成テスト."""
+        config = RedisConfig.from_env()
+
+        assert config.storage == REDIS_STORAGE_NETWORK
+
+    @patch.dict(
+        os.environ,
+        {
+            REDIS_URI_ENV: TEST_REDIS_URI,
+            REDIS_CACHE_TTL_ENV: TEST_REDIS_TTL_STR,
+            REDIS_NEGATIVE_CACHE_TTL_ENV: TEST_REDIS_NEGATIVE_TTL_STR,
+        },
+        clear=True,
+    )
+    def test_from_env_with_negative_ttl(self) -> None:
+        """存在しないことのキャッシュのTTLを指定した環境変数からの作成テスト."""
+        config = RedisConfig.from_env()
+
+        assert config.negative_ttl == TEST_REDIS_NEGATIVE_TTL_INT
+
+    @pytest.mark.parametrize(
+        ("ttl", "negative_ttl"),
+        [
+            ("abc", TEST_REDIS_NEGATIVE_TTL_STR),
+            ("0", TEST_REDIS_NEGATIVE_TTL_STR),
+            ("-1", TEST_REDIS_NEGATIVE_TTL_STR),
+            (TEST_REDIS_TTL_STR, "abc"),
+            (TEST_REDIS_TTL_STR, "0"),
+            (TEST_REDIS_TTL_STR, "-1"),
+        ],
+    )
+    def test_init_with_invalid_ttl(self, ttl: str, negative_ttl: str) -> None:
+        """TTLが不正な場合の初期化テスト."""
+        with pytest.raises(ValidationError):
+            _ = RedisConfig(TEST_REDIS_URI, ttl, negative_ttl=negative_ttl)
+
+    @patch.dict(
+        os.environ,
+        {REDIS_URI_ENV: TEST_REDIS_URI, REDIS_CACHE_TTL_ENV: "abc"},
+        clear=True,
+    )
+    def test_from_env_with_invalid_ttl(self) -> None:
+        """TTLが数値でない環境変数からの作成テスト."""
+        with pytest.raises(ValidationError):
+            _ = RedisConfig.from_env()
+
+    @pytest.mark.parametrize(
+        ("option", "value"),
+        [
+            ("max_connections", "0"),
+            ("max_connections", "many"),
+            ("socket_timeout", "0"),
+            ("connect_timeout", "-1"),
+            ("health_check_interval", "-1"),
+            ("keepalive", "maybe"),
+            ("cluster", "maybe"),
+            ("client_cache_size", "-1"),
+            ("breaker_threshold", "0"),
+            ("breaker_reset_timeout", "0"),
+        ],
+    )
+    def test_init_with_invalid_pool_option(self, option: str, value: str) -> None:
+        """コネクションプールの設定が不正な場合の初期化テスト."""
+        with pytest.raises(ValidationError):
+            _ = RedisConfig(TEST_REDIS_URI, TEST_REDIS_TTL_STR, **{option: value})
+
+    @patch.dict(
+        os.environ,
+        {
+            REDIS_URI_ENV: TEST_REDIS_URI,
+            REDIS_CACHE_TTL_ENV: TEST_REDIS_TTL_STR,
+            REDIS_MAX_CONNECTIONS_ENV: "8",
+            REDIS_SOCKET_TIMEOUT_ENV: "0.5",
+            REDIS_CONNECT_TIMEOUT_ENV: "0.25",
+            REDIS_HEALTH_CHECK_INTERVAL_ENV: "0",
+            REDIS_KEEPALIVE_ENV: "false",
+        },
+        clear=True,
+    )
+    def test_from_env_with_pool_options(self) -> None:
+        """コネクションプールの設定を指定した環境変数からの作成テスト."""
+        config = RedisConfig.from_env()
+
+        assert config.max_connections == 8  # noqa: PLR2004
+        assert config.socket_timeout == 0.5  # noqa: PLR2004
+        assert config.connect_timeout == 0.25  # noqa: PLR2004
+        assert config.health_check_interval == 0
+        assert config.keepalive is False
+
+    @patch.dict(
+        os.environ,
+        {
+            REDIS_URI_ENV: TEST_REDIS_URI,
+            REDIS_CACHE_TTL_ENV: TEST_REDIS_TTL_STR,
+            REDIS_CLUSTER_ENV: "yes",
+        },
+        clear=True,
+    )
+    def test_from_env_with_cluster(self) -> None:
+        """Redis Clusterを指定した環境変数からの作成テスト."""
+        config = RedisConfig.from_env()
+
+        assert config.cluster is True
+
+    @patch.dict(
+        os.environ,
+        {
+            REDIS_URI_ENV: TEST_REDIS_URI,
+            REDIS_CACHE_TTL_ENV: TEST_REDIS_TTL_STR,
+            REDIS_CLIENT_CACHE_SIZE_ENV: "1000",
+        },
+        clear=True,
+    )
+    def test_from_env_with_client_cache_size(self) -> None:
+        """クライアントサイドキャッシュを指定した環境変数からの作成テスト."""
+        config = RedisConfig.from_env()
+
+        assert config.client_cache_size == 1000  # noqa: PLR2004
+
+    @patch.dict(
+        os.environ,
+        {
+            REDIS_URI_ENV: TEST_REDIS_URI,
+            REDIS_CACHE_TTL_ENV: TEST_REDIS_TTL_STR,
+            REDIS_BREAKER_THRESHOLD_ENV: "3",
+            REDIS_BREAKER_RESET_TIMEOUT_ENV: "1.5",
+        },
+        clear=True,
+    )
+    def test_from_env_with_breaker(self) -> None:
+        """サーキットブレーカーの設定を指定した環境変数からの作成テスト."""
+        config = RedisConfig.from_env()
+
+        assert config.breaker_threshold == 3  # noqa: PLR2004
+        assert config.breaker_reset_timeout == 1.5  # noqa: PLR2004
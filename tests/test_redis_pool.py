@@ -0,0 +1,132 @@
+"""redis_poolモジュールのテスト."""
+
+from unittest.mock import Mock, patch
+
+import redis
+import redis.asyncio
+
+from ipinfo_geoip.redis_config import RedisConfig
+from ipinfo_geoip.redis_pool import _get_async_client, _get_breaker, _get_client, _get_pool
+from tests.conftest import TEST_REDIS_TTL_STR, TEST_REDIS_URI
+
+
+class TestRedisPool:
+    """_get_pool関数と_get_client関数のテストクラス."""
+
+    def test_get_pool_shared(self) -> None:
+        """同じ接続URIと設定でコネクションプールを共有するテスト."""
+        pool1 = _get_pool(RedisConfig(TEST_REDIS_URI, TEST_REDIS_TTL_STR), decode_responses=True)
+        pool2 = _get_pool(RedisConfig(TEST_REDIS_URI, TEST_REDIS_TTL_STR), decode_responses=True)
+
+        assert pool1 is pool2
+
+    def test_get_pool_per_settings(self) -> None:
+        """接続URIや設定が異なる場合は別のコネクションプールを使用するテスト."""
+        config = RedisConfig(TEST_REDIS_URI, TEST_REDIS_TTL_STR)
+        pool = _get_pool(config, decode_responses=True)
+
+        assert _get_pool(config, decode_responses=False) is not pool
+        assert _get_pool(RedisConfig(f"{TEST_REDIS_URI}/1", TEST_REDIS_TTL_STR), decode_responses=True) is not pool
+        assert (
+            _get_pool(RedisConfig(TEST_REDIS_URI, TEST_REDIS_TTL_STR, max_connections="2"), decode_responses=True) is not pool
+        )
+
+    def test_get_pool_options(self) -> None:
+        """設定がコネクションプールに反映されるテスト."""
+        config = RedisConfig(
+            TEST_REDIS_URI,
+            TEST_REDIS_TTL_STR,
+            max_connections="3",
+            socket_timeout="1.5",
+            connect_timeout="0.5",
+            health_check_interval="10",
+            keepalive="no",
+        )
+
+        pool = _get_pool(config, decode_responses=True)
+
+        assert pool.max_connections == 3  # noqa: PLR2004
+        assert pool.timeout == 1.5  # noqa: PLR2004
+        assert pool.connection_kwargs["socket_timeout"] == 1.5  # noqa: PLR2004
+        assert pool.connection_kwargs["socket_connect_timeout"] == 0.5  # noqa: PLR2004
+        assert pool.connection_kwargs["health_check_interval"] == 10  # noqa: PLR2004
+        assert pool.connection_kwargs["socket_keepalive"] is False
+        assert pool.connection_kwargs["decode_responses"] is True
+
+    def test_get_pool_client_cache(self) -> None:
+        """クライアントサイドキャッシュを使用するコネクションプールのテスト."""
+        config = RedisConfig(TEST_REDIS_URI, TEST_REDIS_TTL_STR, client_cache_size="100")
+
+        pool = _get_pool(config, decode_responses=True)
+
+        assert pool is not _get_pool(RedisConfig(TEST_REDIS_URI, TEST_REDIS_TTL_STR), decode_responses=True)
+        assert pool.connection_kwargs["protocol"] == 3  # noqa: PLR2004
+        assert pool.cache is not None
+        assert pool.cache.config.get_max_size() == 100  # noqa: PLR2004
+
+    def test_get_pool_without_client_cache(self) -> None:
+        """クライアントサイドキャッシュを使用しないコネクションプールのテスト."""
+        pool = _get_pool(RedisConfig(TEST_REDIS_URI, TEST_REDIS_TTL_STR), decode_responses=True)
+
+        assert pool.cache is None
+        assert "protocol" not in pool.connection_kwargs
+
+    def test_get_client(self) -> None:
+        """共有するコネクションプールを使用するクライアントのテスト."""
+        config = RedisConfig(TEST_REDIS_URI, TEST_REDIS_TTL_STR)
+
+        client1 = _get_client(config, decode_responses=True)
+        client2 = _get_client(config, decode_responses=True)
+
+        assert isinstance(client1, redis.Redis)
+        assert isinstance(client2, redis.Redis)
+        assert client1 is not client2
+        assert client1.connection_pool is client2.connection_pool
+
+    @patch("ipinfo_geoip.redis_pool.redis.cluster.RedisCluster.from_url")
+    def test_get_client_cluster(self, mock_cluster_from_url: Mock) -> None:
+        """Redis Clusterのクライアントを共有するテスト."""
+        # モック設定
+        config = RedisConfig(f"{TEST_REDIS_URI}/2", TEST_REDIS_TTL_STR, cluster="true")
+
+        # テスト実行
+        client1 = _get_client(config, decode_responses=False)
+        client2 = _get_client(config, decode_responses=False)
+
+        # 検証
+        assert client1 is client2
+        mock_cluster_from_url.assert_called_once()
+        assert mock_cluster_from_url.call_args.args == (f"{TEST_REDIS_URI}/2",)
+        assert mock_cluster_from_url.call_args.kwargs["decode_responses"] is False
+        assert mock_cluster_from_url.call_args.kwargs["socket_keepalive"] is True
+
+    def test_get_async_client(self) -> None:
+        """最大接続数で空きを待つコネクションプールを使用する非同期クライアントのテスト."""
+        config = RedisConfig(TEST_REDIS_URI, TEST_REDIS_TTL_STR, max_connections="3", socket_timeout="1.5")
+
+        client = _get_async_client(config, decode_responses=False)
+
+        assert isinstance(client, redis.asyncio.Redis)
+        pool = client.connection_pool
+        assert isinstance(pool, redis.asyncio.BlockingConnectionPool)
+        assert pool.max_connections == 3  # noqa: PLR2004
+        assert pool.timeout == 1.5  # noqa: PLR2004
+        assert pool.connection_kwargs["decode_responses"] is False
+
+    @patch("ipinfo_geoip.redis_pool.redis.asyncio.cluster.RedisCluster.from_url")
+    def test_get_async_client_cluster(self, mock_cluster_from_url: Mock) -> None:
+        """Redis Clusterの非同期クライアントのテスト."""
+        config = RedisConfig(TEST_REDIS_URI, TEST_REDIS_TTL_STR, cluster="true")
+
+        client = _get_async_client(config, decode_responses=True)
+
+        assert client is mock_cluster_from_url.return_value
+        assert mock_cluster_from_url.call_args.args == (TEST_REDIS_URI,)
+        assert mock_cluster_from_url.call_args.kwargs["decode_responses"] is True
+
+    def test_get_breaker_shared(self) -> None:
+        """同じ接続URIでサーキットブレーカーを共有するテスト."""
+        breaker = _get_breaker(RedisConfig(TEST_REDIS_URI, TEST_REDIS_TTL_STR))
+
+        assert _get_breaker(RedisConfig(TEST_REDIS_URI, TEST_REDIS_TTL_STR)) is breaker
+        assert _get_breaker(RedisConfig(f"{TEST_REDIS_URI}/1", TEST_REDIS_TTL_STR)) is not breaker
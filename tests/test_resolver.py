@@ -0,0 +1,183 @@
+"""ResolverChainクラスのテスト."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from ipinfo_geoip.constants import GEOIP_MAX_WORKERS
+from ipinfo_geoip.exceptions import GeoIPClientError, RateLimitError
+from ipinfo_geoip.ipdata import IPData
+from ipinfo_geoip.resolver import ResolverChain
+from tests.conftest import (
+    TEST_IP_ADDRESS_1,
+    TEST_IP_ADDRESS_2,
+    TEST_IPDATA,
+    TEST_IPDATA_2,
+    TEST_IPDATA_INCOMPLETE,
+)
+
+TEST_NOT_FOUND_1: IPData = IPData(TEST_IP_ADDRESS_1, "", "", "", "")
+TEST_NOT_FOUND_2: IPData = IPData(TEST_IP_ADDRESS_2, "", "", "", "")
+
+
+def make_resolver(found: dict[str, IPData]) -> Mock:
+    """指定されたIPアドレス情報を返す検索階層のモックを作成する."""
+    resolver = Mock()
+    resolver.get.side_effect = found.get
+    resolver.get_many.side_effect = lambda ip_addresses, _: {
+        ip_address: found[ip_address] for ip_address in ip_addresses if ip_address in found
+    }
+    return resolver
+
+
+class TestResolverChain:
+    """ResolverChainクラスのテストクラス."""
+
+    def test_get_from_first_resolver(self) -> None:
+        """最初の階層で見つかる場合のgetメソッドテスト."""
+        first = make_resolver({TEST_IP_ADDRESS_1: TEST_IPDATA})
+        second = make_resolver({})
+
+        result = ResolverChain([first, second]).get(TEST_IP_ADDRESS_1)
+
+        assert result == TEST_IPDATA
+        second.get.assert_not_called()
+        first.put.assert_not_called()
+        second.put.assert_not_called()
+
+    def test_get_writes_back(self) -> None:
+        """後の階層で見つかったIPアドレス情報が前の階層に保存されるgetメソッドテスト."""
+        first = make_resolver({})
+        second = make_resolver({})
+        third = make_resolver({TEST_IP_ADDRESS_1: TEST_IPDATA})
+
+        result = ResolverChain([first, second, third]).get(TEST_IP_ADDRESS_1)
+
+        assert result == TEST_IPDATA
+        first.put.assert_called_once_with(TEST_IP_ADDRESS_1, TEST_IPDATA)
+        second.put.assert_called_once_with(TEST_IP_ADDRESS_1, TEST_IPDATA)
+        third.put.assert_not_called()
+
+    def test_get_not_found(self) -> None:
+        """どの階層にも見つからない場合のgetメソッドテスト."""
+        first = make_resolver({})
+        second = make_resolver({})
+
+        result = ResolverChain([first, second]).get(TEST_IP_ADDRESS_1)
+
+        assert result.is_empty()
+        first.put.assert_called_once_with(TEST_IP_ADDRESS_1, TEST_NOT_FOUND_1)
+        second.put.assert_called_once_with(TEST_IP_ADDRESS_1, TEST_NOT_FOUND_1)
+
+    def test_get_cached_not_found(self) -> None:
+        """存在しないことが保存されている場合のgetメソッドテスト."""
+        first = make_resolver({})
+        second = make_resolver({TEST_IP_ADDRESS_1: TEST_NOT_FOUND_1})
+        third = make_resolver({TEST_IP_ADDRESS_1: TEST_IPDATA})
+
+        result = ResolverChain([first, second, third]).get(TEST_IP_ADDRESS_1)
+
+        assert result.is_empty()
+        first.put.assert_called_once_with(TEST_IP_ADDRESS_1, TEST_NOT_FOUND_1)
+        third.get.assert_not_called()
+
+    def test_get_incomplete(self) -> None:
+        """不備のあるIPアドレス情報が保存されないgetメソッドテスト."""
+        first = make_resolver({})
+        second = make_resolver({TEST_IP_ADDRESS_1: TEST_IPDATA_INCOMPLETE})
+
+        result = ResolverChain([first, second]).get(TEST_IP_ADDRESS_1)
+
+        assert result == TEST_IPDATA_INCOMPLETE
+        first.put.assert_not_called()
+
+    def test_get_many(self) -> None:
+        """前の階層で見つからなかったIPアドレスのみ問い合わせるget_manyメソッドテスト."""
+        first = make_resolver({TEST_IP_ADDRESS_1: TEST_IPDATA})
+        second = make_resolver({TEST_IP_ADDRESS_2: TEST_IPDATA_2})
+
+        result = ResolverChain([first, second]).get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2, TEST_IP_ADDRESS_1], 4)
+
+        assert result == {TEST_IP_ADDRESS_1: TEST_IPDATA, TEST_IP_ADDRESS_2: TEST_IPDATA_2}
+        first.get_many.assert_called_once_with([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2], 4)
+        second.get_many.assert_called_once_with([TEST_IP_ADDRESS_2], 4)
+        first.put_many.assert_called_once_with({TEST_IP_ADDRESS_2: TEST_IPDATA_2})
+        second.put_many.assert_not_called()
+
+    def test_get_many_not_found(self) -> None:
+        """どの階層にも見つからないIPアドレスを含むget_manyメソッドテスト."""
+        first = make_resolver({})
+        second = make_resolver({TEST_IP_ADDRESS_1: TEST_IPDATA})
+
+        result = ResolverChain([first, second]).get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])
+
+        assert result == {TEST_IP_ADDRESS_1: TEST_IPDATA, TEST_IP_ADDRESS_2: TEST_NOT_FOUND_2}
+        assert first.put_many.call_count == 2  # noqa: PLR2004
+        first.put_many.assert_any_call({TEST_IP_ADDRESS_1: TEST_IPDATA})
+        first.put_many.assert_any_call({TEST_IP_ADDRESS_2: TEST_NOT_FOUND_2})
+        second.put_many.assert_called_once_with({TEST_IP_ADDRESS_2: TEST_NOT_FOUND_2})
+
+    def test_get_many_stops_when_all_found(self) -> None:
+        """すべて見つかった場合に後の階層に問い合わせないget_manyメソッドテスト."""
+        first = make_resolver({TEST_IP_ADDRESS_1: TEST_IPDATA})
+        second = make_resolver({})
+
+        result = ResolverChain([first, second]).get_many([TEST_IP_ADDRESS_1])
+
+        assert result == {TEST_IP_ADDRESS_1: TEST_IPDATA}
+        second.get_many.assert_not_called()
+
+    def test_get_many_failed(self) -> None:
+        """取得に失敗したIPアドレスの存在しないことを保存せずに結果から除くget_manyメソッドテスト."""
+        first = make_resolver({})
+        second = make_resolver({})
+        second.get_many.side_effect = GeoIPClientError(
+            "GeoIP lookup failed",
+            {"ip_addresses": [TEST_IP_ADDRESS_2], "results": {TEST_IP_ADDRESS_1: TEST_IPDATA}},
+        )
+
+        result = ResolverChain([first, second]).get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])
+
+        assert result == {TEST_IP_ADDRESS_1: TEST_IPDATA}
+        first.put_many.assert_called_once_with({TEST_IP_ADDRESS_1: TEST_IPDATA})
+        second.put_many.assert_not_called()
+
+    def test_get_many_rate_limited(self) -> None:
+        """問い合わせ数の上限により検索できなかったIPアドレスの存在しないことを保存しないget_manyメソッドテスト."""
+        first = make_resolver({})
+        second = make_resolver({})
+        second.get_many.side_effect = RateLimitError(
+            "GeoIP query quota exhausted",
+            {"ip_addresses": [TEST_IP_ADDRESS_2], "results": {TEST_IP_ADDRESS_1: TEST_IPDATA}},
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            _ = ResolverChain([first, second]).get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])
+
+        assert exc_info.value.details == {
+            "ip_addresses": [TEST_IP_ADDRESS_2],
+            "results": {TEST_IP_ADDRESS_1: TEST_IPDATA},
+        }
+        first.put_many.assert_called_once_with({TEST_IP_ADDRESS_1: TEST_IPDATA})
+        second.put_many.assert_not_called()
+
+    def test_get_many_rate_limited_and_failed(self) -> None:
+        """取得に失敗したIPアドレスを問い合わせ数の上限により検索できなかったIPアドレスに含めないget_manyメソッドテスト."""
+        first = make_resolver({})
+        second = make_resolver({})
+        second.get_many.side_effect = GeoIPClientError(
+            "GeoIP lookup failed",
+            {"ip_addresses": [TEST_IP_ADDRESS_1], "results": {}},
+        )
+        third = make_resolver({})
+        third.get_many.side_effect = RateLimitError(
+            "GeoIP query quota exhausted",
+            {"ip_addresses": [TEST_IP_ADDRESS_2], "results": {}},
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            _ = ResolverChain([first, second, third]).get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])
+
+        assert exc_info.value.details == {"ip_addresses": [TEST_IP_ADDRESS_2], "results": {}}
+        third.get_many.assert_called_once_with([TEST_IP_ADDRESS_2], GEOIP_MAX_WORKERS)
+        first.put_many.assert_not_called()
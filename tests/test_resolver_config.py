@@ -0,0 +1,46 @@
+"""ResolverConfigクラスのテスト."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ipinfo_geoip.constants import (
+    RESOLVER_MEMORY,
+    RESOLVER_MMDB,
+    RESOLVER_REDIS,
+    RESOLVER_WEBSERVICE,
+    RESOLVERS_ENV,
+)
+from ipinfo_geoip.exceptions import ValidationError
+from ipinfo_geoip.resolver_config import ResolverConfig
+
+
+class TestResolverConfig:
+    """ResolverConfigクラスのテストクラス."""
+
+    def test_init(self) -> None:
+        """初期化のテスト."""
+        config = ResolverConfig(" mmdb, memory,redis,mmdb ")
+
+        assert config.resolvers == (RESOLVER_MMDB, RESOLVER_MEMORY, RESOLVER_REDIS)
+
+    @pytest.mark.parametrize("resolvers", ["", " , ", "mmdb,unknown"])
+    def test_init_with_invalid_value(self, resolvers: str) -> None:
+        """値が不正な場合の初期化テスト."""
+        with pytest.raises(ValidationError):
+            _ = ResolverConfig(resolvers)
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_from_env_defaults(self) -> None:
+        """環境変数が設定されていない場合の作成テスト."""
+        config = ResolverConfig.from_env()
+
+        assert config.resolvers == (RESOLVER_MEMORY, RESOLVER_REDIS, RESOLVER_WEBSERVICE)
+
+    @patch.dict(os.environ, {RESOLVERS_ENV: RESOLVER_MMDB}, clear=True)
+    def test_from_env(self) -> None:
+        """環境変数からの作成テスト."""
+        config = ResolverConfig.from_env()
+
+        assert config.resolvers == (RESOLVER_MMDB,)
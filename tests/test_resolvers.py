@@ -0,0 +1,169 @@
+"""検索階層の実装クラスのテスト."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from ipinfo_geoip.exceptions import AddressNotFoundError, GeoIPClientError, RateLimitError, RedisClientError
+from ipinfo_geoip.ipdata import IPData
+from ipinfo_geoip.network_index import NetworkIndex
+from ipinfo_geoip.resolvers import MemoryResolver, MMDBResolver, RedisResolver, WebServiceResolver
+from tests.conftest import TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2, TEST_IPDATA, TEST_IPDATA_2
+
+TEST_NOT_FOUND_2: IPData = IPData(TEST_IP_ADDRESS_2, "", "", "", "")
+
+
+class TestMemoryResolver:
+    """MemoryResolverクラスのテストクラス."""
+
+    def test_put_and_get(self) -> None:
+        """登録したネットワークから取得するテスト."""
+        resolver = MemoryResolver(NetworkIndex(10, 60))
+        resolver.put(TEST_IP_ADDRESS_1, TEST_IPDATA)
+
+        result = resolver.get(TEST_IP_ADDRESS_2)
+
+        assert result is not None
+        assert result.network == TEST_IPDATA.network
+
+    def test_put_many_and_get_many(self) -> None:
+        """複数のネットワークを登録して取得するテスト."""
+        resolver = MemoryResolver(NetworkIndex(10, 60))
+        resolver.put_many({TEST_IP_ADDRESS_1: TEST_IPDATA, TEST_IP_ADDRESS_2: TEST_NOT_FOUND_2})
+
+        result = resolver.get_many([TEST_IP_ADDRESS_1, "198.51.100.1"])
+
+        assert list(result) == [TEST_IP_ADDRESS_1]
+
+
+class TestMMDBResolver:
+    """MMDBResolverクラスのテストクラス."""
+
+    def test_get_many(self) -> None:
+        """見つかったIPアドレス情報のみを返すテスト."""
+        client = Mock()
+        client.get_many.return_value = {TEST_IP_ADDRESS_1: TEST_IPDATA, TEST_IP_ADDRESS_2: None}
+        resolver = MMDBResolver(client)
+
+        result = resolver.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])
+
+        assert result == {TEST_IP_ADDRESS_1: TEST_IPDATA}
+        client.get_many.assert_called_once_with([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])
+
+    def test_put(self) -> None:
+        """保存しないテスト."""
+        client = Mock()
+        resolver = MMDBResolver(client)
+
+        resolver.put(TEST_IP_ADDRESS_1, TEST_IPDATA)
+        resolver.put_many({TEST_IP_ADDRESS_1: TEST_IPDATA})
+
+        assert client.mock_calls == []
+
+
+class TestRedisResolver:
+    """RedisResolverクラスのテストクラス."""
+
+    def test_get(self) -> None:
+        """Redisから取得するテスト."""
+        client = Mock()
+        client.get = Mock(return_value=TEST_IPDATA)
+        resolver = RedisResolver(client)
+
+        assert resolver.get(TEST_IP_ADDRESS_1) == TEST_IPDATA
+        client.get.assert_called_once_with(TEST_IP_ADDRESS_1)
+
+    def test_put(self) -> None:
+        """IPアドレス情報と存在しないことを保存するテスト."""
+        client = Mock()
+        client.put = Mock()
+        resolver = RedisResolver(client)
+
+        resolver.put(TEST_IP_ADDRESS_1, TEST_IPDATA)
+        resolver.put(TEST_IP_ADDRESS_2, TEST_NOT_FOUND_2)
+
+        client.put.assert_called_once_with(TEST_IP_ADDRESS_1, TEST_IPDATA)
+        client.set_not_found.assert_called_once_with(TEST_IP_ADDRESS_2)
+
+    def test_put_many(self) -> None:
+        """1回のパイプラインで保存するテスト."""
+        client = Mock()
+        resolver = RedisResolver(client)
+
+        resolver.put_many({TEST_IP_ADDRESS_1: TEST_IPDATA, TEST_IP_ADDRESS_2: TEST_NOT_FOUND_2})
+
+        client.set_many.assert_called_once_with({TEST_IP_ADDRESS_1: TEST_IPDATA}, [TEST_IP_ADDRESS_2])
+
+    def test_fail_open(self) -> None:
+        """Redisが利用できない場合は見つからなかったものとして扱うテスト."""
+        error = RedisClientError("Redis circuit breaker is open")
+        client = Mock()
+        client.get = Mock(side_effect=error)
+        client.put = Mock(side_effect=error)
+        client.get_many.side_effect = error
+        client.set_many.side_effect = error
+        client.set_not_found.side_effect = error
+        resolver = RedisResolver(client)
+
+        assert resolver.get(TEST_IP_ADDRESS_1) is None
+        assert resolver.get_many([TEST_IP_ADDRESS_1]) == {}
+        resolver.put(TEST_IP_ADDRESS_1, TEST_IPDATA)
+        resolver.put(TEST_IP_ADDRESS_2, TEST_NOT_FOUND_2)
+        resolver.put_many({TEST_IP_ADDRESS_1: TEST_IPDATA})
+
+
+class TestWebServiceResolver:
+    """WebServiceResolverクラスのテストクラス."""
+
+    def test_get_with_address_not_found(self) -> None:
+        """IPアドレスが見つからない場合のテスト."""
+        client = Mock()
+        client.get = Mock(side_effect=AddressNotFoundError("Address not found"))
+        resolver = WebServiceResolver(client)
+
+        assert resolver.get(TEST_IP_ADDRESS_1) is None
+
+    def test_get_many(self) -> None:
+        """並列に取得するテスト."""
+        client = Mock()
+        client.get_many.return_value = {TEST_IP_ADDRESS_1: None, TEST_IP_ADDRESS_2: TEST_IPDATA_2}
+        resolver = WebServiceResolver(client)
+
+        result = resolver.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2], 4)
+
+        assert result == {TEST_IP_ADDRESS_2: TEST_IPDATA_2}
+        client.get_many.assert_called_once_with([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2], 4)
+
+    def test_get_with_rate_limit(self) -> None:
+        """問い合わせ数が上限に達した場合のテスト."""
+        client = Mock()
+        client.get = Mock(side_effect=RateLimitError("GeoIP rate limit exceeded"))
+        resolver = WebServiceResolver(client)
+
+        with pytest.raises(RateLimitError):
+            _ = resolver.get(TEST_IP_ADDRESS_1)
+
+    def test_get_many_with_rate_limit(self) -> None:
+        """問い合わせ数が上限に達した場合に見つかったIPアドレス情報を送出するテスト."""
+        client = Mock()
+        client.get_many.side_effect = RateLimitError(
+            "GeoIP query quota exhausted",
+            {"ip_addresses": [TEST_IP_ADDRESS_2], "results": {TEST_IP_ADDRESS_1: None}},
+        )
+        resolver = WebServiceResolver(client)
+
+        with pytest.raises(RateLimitError) as exc_info:
+            _ = resolver.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])
+
+        assert exc_info.value.details == {"ip_addresses": [TEST_IP_ADDRESS_2], "results": {}}
+
+    def test_get_many_with_failure(self) -> None:
+        """取得に失敗したIPアドレスと見つかったIPアドレス情報を送出するテスト."""
+        client = Mock()
+        client.get_many.return_value = {TEST_IP_ADDRESS_1: TEST_IPDATA}
+        resolver = WebServiceResolver(client)
+
+        with pytest.raises(GeoIPClientError) as exc_info:
+            _ = resolver.get_many([TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2])
+
+        assert exc_info.value.details == {"ip_addresses": [TEST_IP_ADDRESS_2], "results": {TEST_IP_ADDRESS_1: TEST_IPDATA}}
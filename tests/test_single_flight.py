@@ -0,0 +1,101 @@
+"""SingleFlightクラスのテスト."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ipinfo_geoip.single_flight import SingleFlight
+from tests.conftest import TEST_IP_ADDRESS_1, TEST_IP_ADDRESS_2
+
+TEST_CALLERS: int = 4
+
+
+class CountingLock:
+    """取得回数を数えるロック."""
+
+    def __init__(self) -> None:
+        """CountingLockインスタンスを初期化する."""
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def __enter__(self) -> None:
+        """ロックを取得する."""
+        self._lock.acquire()
+        self.count += 1
+
+    def __exit__(self, *args: object) -> None:
+        """ロックを解放する."""
+        self._lock.release()
+
+    def wait_for(self, count: int) -> None:
+        """指定された回数ロックが取得されるまで待つ."""
+        while self.count < count:
+            threading.Event().wait(0.001)
+
+
+class TestSingleFlight:
+    """SingleFlightクラスのテストクラス."""
+
+    def test_do(self) -> None:
+        """関数の戻り値を返すテスト."""
+        flight: SingleFlight[str, str] = SingleFlight()
+
+        assert flight.do(TEST_IP_ADDRESS_1, lambda: TEST_IP_ADDRESS_2) == TEST_IP_ADDRESS_2
+        assert flight.do(TEST_IP_ADDRESS_1, lambda: TEST_IP_ADDRESS_1) == TEST_IP_ADDRESS_1
+
+    def test_do_coalesces_concurrent_calls(self) -> None:
+        """同時の呼び出しが1回に集約されるテスト."""
+        flight: SingleFlight[str, int] = SingleFlight()
+        lock = CountingLock()
+        flight._lock = lock  # type: ignore[assignment]  # noqa: SLF001
+        started = threading.Event()
+        release = threading.Event()
+        calls: list[int] = []
+
+        def function() -> int:
+            calls.append(1)
+            started.set()
+            release.wait()
+            return len(calls)
+
+        with ThreadPoolExecutor(TEST_CALLERS) as executor:
+            leader = executor.submit(flight.do, TEST_IP_ADDRESS_1, function)
+            started.wait()
+            followers = [executor.submit(flight.do, TEST_IP_ADDRESS_1, function) for _ in range(TEST_CALLERS - 1)]
+            lock.wait_for(TEST_CALLERS)
+            release.set()
+
+            results = [leader.result()] + [follower.result() for follower in followers]
+
+        assert results == [1] * TEST_CALLERS
+        assert calls == [1]
+        assert TEST_IP_ADDRESS_1 not in flight._calls  # noqa: SLF001
+
+    def test_do_propagates_exception(self) -> None:
+        """関数の例外が待っている呼び出し元にも送出されるテスト."""
+        flight: SingleFlight[str, int] = SingleFlight()
+        lock = CountingLock()
+        flight._lock = lock  # type: ignore[assignment]  # noqa: SLF001
+        started = threading.Event()
+        release = threading.Event()
+        msg = "lookup failed"
+
+        def function() -> int:
+            started.set()
+            release.wait()
+            raise RuntimeError(msg)
+
+        with ThreadPoolExecutor(2) as executor:
+            leader = executor.submit(flight.do, TEST_IP_ADDRESS_1, function)
+            started.wait()
+            follower = executor.submit(flight.do, TEST_IP_ADDRESS_1, function)
+            lock.wait_for(2)
+            release.set()
+
+            with pytest.raises(RuntimeError, match=msg):
+                leader.result()
+            with pytest.raises(RuntimeError, match=msg):
+                follower.result()
+
+        assert TEST_IP_ADDRESS_1 not in flight._calls  # noqa: SLF001
@@ -0,0 +1,46 @@
+"""to_addressモジュールのテスト."""
+
+import ipaddress
+
+import pytest
+
+from ipinfo_geoip.to_address import _to_address, _to_network
+from tests.conftest import TEST_IP_ADDRESS_1, TEST_IP_NETWORK
+
+
+class TestToAddress:
+    """_to_address関数のテストクラス."""
+
+    def test_to_address(self) -> None:
+        """文字列をIPアドレスに変換するテスト."""
+        assert _to_address(TEST_IP_ADDRESS_1) == ipaddress.ip_address(TEST_IP_ADDRESS_1)
+
+    def test_to_address_reuses_result(self) -> None:
+        """同じ文字列の変換結果が再利用されるテスト."""
+        assert _to_address(TEST_IP_ADDRESS_1) is _to_address(TEST_IP_ADDRESS_1)
+
+    def test_to_address_invalid(self) -> None:
+        """不正な文字列を変換するテスト."""
+        with pytest.raises(ValueError, match="invalid"):
+            _ = _to_address("invalid")
+
+
+class TestToNetwork:
+    """_to_network関数のテストクラス."""
+
+    def test_to_network(self) -> None:
+        """文字列をIPネットワークに変換するテスト."""
+        assert _to_network(TEST_IP_NETWORK) == ipaddress.ip_network(TEST_IP_NETWORK)
+
+    def test_to_network_reuses_result(self) -> None:
+        """同じ文字列の変換結果が再利用されるテスト."""
+        assert _to_network(TEST_IP_NETWORK) is _to_network(TEST_IP_NETWORK)
+
+    def test_to_network_host_bits(self) -> None:
+        """ホスト部が0でない文字列を変換するテスト."""
+        assert _to_network("192.0.2.1/24") == ipaddress.ip_network("192.0.2.0/24")
+
+    def test_to_network_invalid(self) -> None:
+        """不正な文字列を変換するテスト."""
+        with pytest.raises(ValueError, match="invalid"):
+            _ = _to_network("invalid")
@@ -0,0 +1,25 @@
+"""_to_bool関数のテスト."""
+
+import pytest
+
+from ipinfo_geoip.exceptions import ValidationError
+from ipinfo_geoip.to_bool import _to_bool
+
+
+class TestToBool:
+    """_to_bool関数のテストクラス."""
+
+    @pytest.mark.parametrize("value", ["1", "true", "True", "yes", "ON"])
+    def test_to_bool_with_true(self, value: str) -> None:
+        """真を表す文字列の場合のテスト."""
+        assert _to_bool("Test option", value) is True
+
+    @pytest.mark.parametrize("value", ["0", "false", "False", "no", "OFF"])
+    def test_to_bool_with_false(self, value: str) -> None:
+        """偽を表す文字列の場合のテスト."""
+        assert _to_bool("Test option", value) is False
+
+    def test_to_bool_with_invalid_value(self) -> None:
+        """真偽値を表さない文字列の場合のテスト."""
+        with pytest.raises(ValidationError, match="Test option must be one of"):
+            _to_bool("Test option", "invalid")